@@ -8,7 +8,16 @@ from alembic import context
 
 # Import models for autogenerate to work
 from app.db.base import Base
-from app.models import User, Dialog, Phrase, Assessment
+from app.models import (
+    User,
+    Dialog,
+    Phrase,
+    Assessment,
+    AssessmentJob,
+    AudioUploadOutbox,
+    PronunciationResultCacheEntry,
+    IdempotencyKey,
+)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
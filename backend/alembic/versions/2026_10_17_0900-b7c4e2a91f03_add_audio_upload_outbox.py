@@ -0,0 +1,48 @@
+"""Add audio_upload_outbox table for deferred audio uploads.
+
+Revision ID: b7c4e2a91f03
+Revises: 90d5fe157880
+Create Date: 2026-10-17 09:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b7c4e2a91f03"
+down_revision = "90d5fe157880"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audio_upload_outbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("assessment_id", sa.Integer(), nullable=False),
+        sa.Column("spool_path", sa.String(length=500), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["assessment_id"], ["assessments.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_audio_upload_outbox_id"), "audio_upload_outbox", ["id"])
+    op.create_index(
+        op.f("ix_audio_upload_outbox_assessment_id"), "audio_upload_outbox", ["assessment_id"]
+    )
+    op.create_index(op.f("ix_audio_upload_outbox_status"), "audio_upload_outbox", ["status"])
+    op.create_index(
+        op.f("ix_audio_upload_outbox_next_attempt_at"), "audio_upload_outbox", ["next_attempt_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_audio_upload_outbox_next_attempt_at"), table_name="audio_upload_outbox")
+    op.drop_index(op.f("ix_audio_upload_outbox_status"), table_name="audio_upload_outbox")
+    op.drop_index(op.f("ix_audio_upload_outbox_assessment_id"), table_name="audio_upload_outbox")
+    op.drop_index(op.f("ix_audio_upload_outbox_id"), table_name="audio_upload_outbox")
+    op.drop_table("audio_upload_outbox")
@@ -0,0 +1,45 @@
+"""Add assessment_jobs table for asynchronous assessments.
+
+Revision ID: c3d9f1e6a2b4
+Revises: b7c4e2a91f03
+Create Date: 2026-10-17 10:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "c3d9f1e6a2b4"
+down_revision = "b7c4e2a91f03"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "assessment_jobs",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("user_id", sa.String(length=100), nullable=False),
+        sa.Column("phrase_id", sa.Integer(), nullable=False),
+        sa.Column("audio_spool_path", sa.String(length=500), nullable=False),
+        sa.Column("audio_size", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="queued"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("locked_at", sa.DateTime(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("assessment_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["phrase_id"], ["phrases.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["assessment_id"], ["assessments.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_assessment_jobs_user_id"), "assessment_jobs", ["user_id"])
+    op.create_index(op.f("ix_assessment_jobs_phrase_id"), "assessment_jobs", ["phrase_id"])
+    op.create_index(op.f("ix_assessment_jobs_status"), "assessment_jobs", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_assessment_jobs_status"), table_name="assessment_jobs")
+    op.drop_index(op.f("ix_assessment_jobs_phrase_id"), table_name="assessment_jobs")
+    op.drop_index(op.f("ix_assessment_jobs_user_id"), table_name="assessment_jobs")
+    op.drop_table("assessment_jobs")
@@ -0,0 +1,38 @@
+"""Add pronunciation_result_cache table.
+
+Revision ID: d4e8a7b2c5f1
+Revises: c3d9f1e6a2b4
+Create Date: 2026-10-17 11:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "d4e8a7b2c5f1"
+down_revision = "c3d9f1e6a2b4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pronunciation_result_cache",
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("result", sa.JSON(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    op.create_index(
+        op.f("ix_pronunciation_result_cache_expires_at"),
+        "pronunciation_result_cache",
+        ["expires_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_pronunciation_result_cache_expires_at"), table_name="pronunciation_result_cache"
+    )
+    op.drop_table("pronunciation_result_cache")
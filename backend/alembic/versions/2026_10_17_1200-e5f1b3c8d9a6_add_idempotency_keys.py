@@ -0,0 +1,34 @@
+"""Add idempotency_keys table for retried assessment submissions.
+
+Revision ID: e5f1b3c8d9a6
+Revises: d4e8a7b2c5f1
+Create Date: 2026-10-17 12:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "e5f1b3c8d9a6"
+down_revision = "d4e8a7b2c5f1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "idempotency_keys",
+        sa.Column("key", sa.String(length=255), nullable=False),
+        sa.Column("request_hash", sa.String(length=64), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="in_progress"),
+        sa.Column("response", sa.JSON(), nullable=True),
+        sa.Column("claimed_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index(op.f("ix_idempotency_keys_claimed_at"), "idempotency_keys", ["claimed_at"])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_idempotency_keys_claimed_at"), table_name="idempotency_keys")
+    op.drop_table("idempotency_keys")
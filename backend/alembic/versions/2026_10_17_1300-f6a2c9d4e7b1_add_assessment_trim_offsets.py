@@ -0,0 +1,24 @@
+"""Add trimmed speech offsets to assessments.
+
+Revision ID: f6a2c9d4e7b1
+Revises: e5f1b3c8d9a6
+Create Date: 2026-10-17 13:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "f6a2c9d4e7b1"
+down_revision = "e5f1b3c8d9a6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("assessments", sa.Column("trim_start_seconds", sa.Float(), nullable=True))
+    op.add_column("assessments", sa.Column("trim_end_seconds", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("assessments", "trim_end_seconds")
+    op.drop_column("assessments", "trim_start_seconds")
@@ -0,0 +1,24 @@
+"""Add assessment profiles to phrases and assessments.
+
+Revision ID: a7b3d0e5f8c2
+Revises: f6a2c9d4e7b1
+Create Date: 2026-10-17 14:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "a7b3d0e5f8c2"
+down_revision = "f6a2c9d4e7b1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("phrases", sa.Column("assessment_profile", sa.String(20), nullable=True))
+    op.add_column("assessments", sa.Column("assessment_profile", sa.String(20), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("assessments", "assessment_profile")
+    op.drop_column("phrases", "assessment_profile")
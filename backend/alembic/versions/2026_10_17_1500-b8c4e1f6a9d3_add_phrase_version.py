@@ -0,0 +1,22 @@
+"""Add a version counter to phrases.
+
+Revision ID: b8c4e1f6a9d3
+Revises: a7b3d0e5f8c2
+Create Date: 2026-10-17 15:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "b8c4e1f6a9d3"
+down_revision = "a7b3d0e5f8c2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("phrases", sa.Column("version", sa.Integer(), nullable=False, server_default="1"))
+
+
+def downgrade() -> None:
+    op.drop_column("phrases", "version")
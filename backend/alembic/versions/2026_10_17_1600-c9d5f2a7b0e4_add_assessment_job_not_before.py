@@ -0,0 +1,22 @@
+"""Add a retry time to assessment jobs.
+
+Revision ID: c9d5f2a7b0e4
+Revises: b8c4e1f6a9d3
+Create Date: 2026-10-17 16:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "c9d5f2a7b0e4"
+down_revision = "b8c4e1f6a9d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("assessment_jobs", sa.Column("not_before", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("assessment_jobs", "not_before")
@@ -0,0 +1,22 @@
+"""Add the requested assessment profile to assessment jobs.
+
+Revision ID: d0e6a3b8c1f5
+Revises: c9d5f2a7b0e4
+Create Date: 2026-10-17 17:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "d0e6a3b8c1f5"
+down_revision = "c9d5f2a7b0e4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("assessment_jobs", sa.Column("assessment_profile", sa.String(20), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("assessment_jobs", "assessment_profile")
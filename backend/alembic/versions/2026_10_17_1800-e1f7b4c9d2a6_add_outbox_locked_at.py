@@ -0,0 +1,22 @@
+"""Add a claim time to audio upload outbox rows.
+
+Revision ID: e1f7b4c9d2a6
+Revises: d0e6a3b8c1f5
+Create Date: 2026-10-17 18:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "e1f7b4c9d2a6"
+down_revision = "d0e6a3b8c1f5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("audio_upload_outbox", sa.Column("locked_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("audio_upload_outbox", "locked_at")
@@ -0,0 +1,52 @@
+"""Scope idempotency keys to the user that sent them.
+
+The primary key becomes (user_id, key). Existing keys can't be attributed to
+a user, so the table is recreated empty; they only matter for retries within
+IDEMPOTENCY_KEY_TTL_SECONDS.
+
+Revision ID: f2a8c5d0e3b7
+Revises: e1f7b4c9d2a6
+Create Date: 2026-10-17 19:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "f2a8c5d0e3b7"
+down_revision = "e1f7b4c9d2a6"
+branch_labels = None
+depends_on = None
+
+
+def _create_table(*user_columns: sa.Column, primary_key: tuple[str, ...]) -> None:
+    op.create_table(
+        "idempotency_keys",
+        *user_columns,
+        sa.Column("key", sa.String(length=255), nullable=False),
+        sa.Column("request_hash", sa.String(length=64), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="in_progress"),
+        sa.Column("response", sa.JSON(), nullable=True),
+        sa.Column("claimed_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint(*primary_key),
+    )
+    op.create_index(op.f("ix_idempotency_keys_claimed_at"), "idempotency_keys", ["claimed_at"])
+
+
+def _drop_table() -> None:
+    op.drop_index(op.f("ix_idempotency_keys_claimed_at"), table_name="idempotency_keys")
+    op.drop_table("idempotency_keys")
+
+
+def upgrade() -> None:
+    _drop_table()
+    _create_table(
+        sa.Column("user_id", sa.String(length=100), nullable=False),
+        primary_key=("user_id", "key"),
+    )
+
+
+def downgrade() -> None:
+    _drop_table()
+    _create_table(primary_key=("key",))
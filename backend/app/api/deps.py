@@ -3,25 +3,42 @@ API dependencies for dependency injection.
 Provides database sessions and service instances to endpoints.
 """
 
-from app.db.session import get_db
+from fastapi import Depends, Request
+
+from app.db.session import get_async_db, get_db
 from app.services.blob_service import BlobStorageService
 from app.services.encryption_service import EncryptionService
+from app.services.service_container import ServiceContainer
 from app.services.speech_service import SpeechAssessmentService
 
-# Re-export get_db for convenience
-__all__ = ["get_db", "get_speech_service", "get_blob_service", "get_encryption_service"]
+# Re-export get_db / get_async_db for convenience
+__all__ = [
+    "get_db",
+    "get_async_db",
+    "get_services",
+    "get_speech_service",
+    "get_blob_service",
+    "get_encryption_service",
+]
+
+
+def get_services(request: Request) -> ServiceContainer:
+    """Dependency to get the app-lifetime services (built by the lifespan in app.main)."""
+    return request.app.state.services
 
 
-def get_speech_service() -> SpeechAssessmentService:
-    """Dependency to get speech assessment service instance."""
-    return SpeechAssessmentService()
+def get_speech_service(
+    services: ServiceContainer = Depends(get_services),
+) -> SpeechAssessmentService:
+    """Dependency to get the shared speech assessment service."""
+    return services.speech_service
 
 
-def get_blob_service() -> BlobStorageService:
-    """Dependency to get blob storage service instance."""
-    return BlobStorageService()
+def get_blob_service(services: ServiceContainer = Depends(get_services)) -> BlobStorageService:
+    """Dependency to get the shared blob storage service."""
+    return services.blob_service
 
 
-def get_encryption_service() -> EncryptionService:
-    """Dependency to get encryption service instance."""
-    return EncryptionService()
+def get_encryption_service(services: ServiceContainer = Depends(get_services)) -> EncryptionService:
+    """Dependency to get the shared encryption service."""
+    return services.encryption_service
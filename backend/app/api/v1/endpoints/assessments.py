@@ -1,32 +1,110 @@
 """
 Assessment endpoints for pronunciation evaluation.
 Main endpoint: POST /assess - submits audio for assessment.
+Streaming variant: POST /assess/stream - raw audio/wav request body.
+Batch variant: POST /batch - every recording of a dialog in one request.
+Job mode: POST /jobs - queues the assessment and returns a job id to poll.
 """
 
+import asyncio
 import logging
+from collections.abc import Awaitable
+from typing import Any
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import ClientDisconnect
 
-from app.api.deps import get_blob_service, get_db, get_encryption_service, get_speech_service
+from app.api.deps import (
+    get_async_db,
+    get_blob_service,
+    get_encryption_service,
+    get_speech_service,
+)
+from app.core.config import settings
 from app.models.assessment import Assessment
+from app.models.assessment_job import AssessmentJob
+from app.models.audio_outbox import AudioUploadOutbox
 from app.models.phrase import Phrase
 from app.models.user import User
-from app.schemas.assessment import AssessmentResponse, AssessmentScores
+from app.schemas.assessment import (
+    AssessmentJobResponse,
+    AssessmentResponse,
+    BatchAssessmentItem,
+    BatchAssessmentResponse,
+)
+from app.services.admission_control import AdmissionRejectedError
+from app.services.assessment_pipeline import AssessmentPipeline, AudioTooLargeError
+from app.services.assessment_store import build_assessment, get_or_create_user
+from app.services.audio_outbox_service import AudioSpool
+from app.services.audio_preflight import (
+    AudioAnalysis,
+    AudioPreflightError,
+    StreamPreflight,
+    preflight_audio,
+)
 from app.services.blob_service import BlobStorageService
+from app.services.deadlines import (
+    ClientDisconnectedError,
+    DeadlineExceededError,
+    get_cancellation_stats,
+    request_deadline,
+)
 from app.services.encryption_service import EncryptionService
-from app.services.speech_service import SpeechAssessmentService
+from app.services.idempotency_service import (
+    IdempotencyKeyInProgressError,
+    IdempotencyKeyMismatchError,
+    idempotency_request_hash,
+    idempotency_service,
+)
+from app.services.phrase_cache import PreparedPhrase, get_phrase_cache
+from app.services.speech_service import (
+    PronunciationResult,
+    SpeechAssessmentService,
+    resolve_assessment_profile,
+)
+from app.services.voice_activity import SilenceTrim
+from app.services.wav_audio import WavFormatError
+from app.services.wav_decoders import decode_compact_wav
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+MAX_AUDIO_BYTES = 10 * 1024 * 1024  # 10MB limit
+WAV_CONTENT_TYPES = ["audio/wav", "audio/wave", "audio/x-wav"]
+DISCONNECT_POLL_SECONDS = 0.5
+PROFILE_PATTERN = "^(quick|full)$"
+PROFILE_DESCRIPTION = "Assessment profile: quick (words only) or full; defaults to the phrase's"
+
 
 @router.post("/assess", response_model=AssessmentResponse, status_code=200)
 async def create_assessment(
-    audio: UploadFile = File(..., description="Audio file (WAV format, max 10MB)"),
+    request: Request,
+    response: Response,
+    audio: UploadFile = File(
+        ..., description="Audio file (PCM, mu-law or IMA-ADPCM WAV, max 10MB)"
+    ),
     phrase_id: int = Form(..., description="ID of phrase being assessed"),
     user_id: str = Form(..., description="Anonymous user identifier (UUID)"),
-    db: Session = Depends(get_db),
+    profile: str | None = Form(None, pattern=PROFILE_PATTERN, description=PROFILE_DESCRIPTION),
+    idempotency_key: str | None = Header(
+        None, max_length=255, description="Client key making retries of this request safe"
+    ),
+    db: AsyncSession = Depends(get_async_db),
     speech_service: SpeechAssessmentService = Depends(get_speech_service),
     blob_service: BlobStorageService = Depends(get_blob_service),
     encryption_service: EncryptionService = Depends(get_encryption_service),
@@ -37,100 +115,759 @@ async def create_assessment(
     Process:
     1. Validate audio file (size, format)
     2. Get or create user
-    3. Fetch phrase from database
-    4. Assess pronunciation using Azure Speech SDK (or mock)
-    5. Encrypt audio file
-    6. Upload encrypted audio to blob storage
-    7. Save assessment results to database
-    8. Return scores and feedback
+    3. Fetch phrase (from the phrase cache; the database only on a miss)
+    4. Read audio bytes
+    5. Assess pronunciation using Azure Speech SDK (or mock) while encrypting
+       the audio and uploading it to blob storage
+    6. Save assessment results to database (once both branches succeed)
+    7. Return scores and feedback
+
+    With DEFERRED_AUDIO_UPLOAD enabled, step 5 spools the encrypted audio to
+    disk instead, and step 6 commits an outbox row alongside the scores. The
+    background outbox worker uploads the audio and sets audio_blob_url later.
+
+    If scoring, storage or the database insert fails, the other work is
+    cancelled and any uploaded blob is deleted. The same happens when steps
+    4-5 outlast ASSESSMENT_DEADLINE_SECONDS (504) or the client disconnects
+    (499, never seen by the client).
+
+    The profile ("quick": word-level scores, no prosody; "full": phoneme and
+    prosody scores) comes from the request, else the phrase, else
+    ASSESSMENT_DEFAULT_PROFILE, and is recorded on the assessment.
+
+    With an Idempotency-Key header, a retry of a completed request returns
+    the stored response (Idempotent-Replayed: true) without re-running the
+    assessment, and a retry of a request that is still running waits for it.
 
     Returns:
         Assessment results with scores and word-level feedback
     """
 
     # 1. Validate audio file
-    if audio.size and audio.size > 10 * 1024 * 1024:  # 10MB limit
+    if audio.size and audio.size > MAX_AUDIO_BYTES:
         raise HTTPException(status_code=400, detail="Audio file too large (maximum 10MB)")
 
-    if audio.content_type and audio.content_type not in ["audio/wav", "audio/wave", "audio/x-wav"]:
+    if audio.content_type and audio.content_type not in WAV_CONTENT_TYPES:
         logger.warning(f"Unexpected content type: {audio.content_type}. Proceeding anyway.")
 
-    # 2. Get or create user
-    user = db.query(User).filter(User.user_id == user_id).first()
-    if not user:
-        logger.info(f"Creating new user: {user_id}")
-        user = User(user_id=user_id)
-        db.add(user)
-        db.flush()  # Get user.id without committing
-
-    # 3. Get phrase
-    phrase = db.query(Phrase).filter(Phrase.id == phrase_id).first()
-    if not phrase:
-        raise HTTPException(status_code=404, detail=f"Phrase with ID {phrase_id} not found")
-
-    # 4. Read audio bytes
+    # 4. Read audio bytes (first, so an idempotent retry can be fingerprinted)
     audio_bytes = await audio.read()
     logger.info(f"Received audio: {len(audio_bytes)} bytes for phrase_id={phrase_id}")
 
-    try:
-        # 5. Assess pronunciation
-        logger.info("Starting pronunciation assessment...")
-        result = await speech_service.assess_pronunciation(audio_bytes, phrase.reference_text)
+    # Reject unusable recordings before any speech or storage work
+    audio_bytes, analysis = await _preflight(audio_bytes)
+
+    if idempotency_key:
+        stored = await _claim_idempotency_key(
+            db, user_id, idempotency_key, idempotency_request_hash(user_id, phrase_id, audio_bytes)
+        )
+        if stored is not None:
+            response.headers["Idempotent-Replayed"] = "true"
+            return AssessmentResponse.model_validate(stored)
 
-        logger.info(
-            f"Assessment complete: accuracy={result.accuracy_score:.1f}, "
-            f"prosody={result.prosody_score:.1f}, overall={result.overall_score:.1f}"
+    try:
+        return await _assess_and_save(
+            db,
+            user_id,
+            phrase_id,
+            audio_bytes,
+            AssessmentPipeline(speech_service, blob_service, encryption_service),
+            duration_seconds=analysis.duration_seconds if analysis else None,
+            idempotency_key=idempotency_key,
+            request=request,
+            profile=profile,
         )
+    except (Exception, asyncio.CancelledError):
+        if idempotency_key:
+            await idempotency_service.release(db, user_id, idempotency_key)
+        raise
+
+
+@router.post("/assess/stream", response_model=AssessmentResponse, status_code=200)
+async def create_assessment_stream(
+    request: Request,
+    phrase_id: int = Query(..., description="ID of phrase being assessed"),
+    user_id: str = Query(..., description="Anonymous user identifier (UUID)"),
+    profile: str | None = Query(None, pattern=PROFILE_PATTERN, description=PROFILE_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+    speech_service: SpeechAssessmentService = Depends(get_speech_service),
+    blob_service: BlobStorageService = Depends(get_blob_service),
+    encryption_service: EncryptionService = Depends(get_encryption_service),
+):
+    """
+    Submit audio for pronunciation assessment as a raw audio/wav request body.
+
+    The body is never buffered in full: each chunk is pushed into the speech
+    recognizer and into a streaming encrypt+upload sink as it arrives, so
+    memory per request is bounded by the chunk size. The 10MB limit is
+    enforced while streaming. The audio must be 16 kHz 16-bit mono PCM WAV,
+    since it can't be normalized on the way (415 otherwise). The preflight
+    checks the WAV header before recognition starts and measures levels on
+    each chunk as it passes. Scoring and storage run under the request
+    deadline (504 when exceeded); a client disconnect cancels both.
 
-        # 6. Encrypt audio
-        logger.info("Encrypting audio...")
-        encrypted_audio = encryption_service.encrypt_audio(audio_bytes)
+    Returns:
+        Assessment results with scores and word-level feedback
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type and content_type not in WAV_CONTENT_TYPES:
+        logger.warning(f"Unexpected content type: {content_type}. Proceeding anyway.")
 
-        # 7. Upload to blob storage
-        logger.info("Uploading to blob storage...")
-        blob_url = await blob_service.upload_audio(
-            encrypted_audio, file_extension="wav", user_id=user_id
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_AUDIO_BYTES:
+        raise HTTPException(status_code=400, detail="Audio file too large (maximum 10MB)")
+
+    user = await get_or_create_user(db, user_id)
+    phrase = await _get_phrase(db, phrase_id)
+    profile = resolve_assessment_profile(profile, phrase.assessment_profile)
+
+    pipeline = AssessmentPipeline(speech_service, blob_service, encryption_service)
+    preflight = StreamPreflight() if settings.AUDIO_PREFLIGHT_ENABLED else None
+    blob_url = None
+
+    try:
+        logger.info(f"Streaming pronunciation assessment for phrase_id={phrase_id}...")
+        async with request_deadline().scope():
+            result, blob_url, audio_size = await pipeline.score_and_store_stream(
+                request.stream(),
+                phrase.reference_text,
+                user_id=user_id,
+                max_bytes=MAX_AUDIO_BYTES,
+                profile=profile,
+                preflight=preflight,
+            )
+        logger.info(f"Received audio: {audio_size} bytes for phrase_id={phrase_id}")
+
+        return await _save_assessment(
+            db,
+            user,
+            phrase_id,
+            result,
+            blob_url,
+            audio_size,
+            duration_seconds=preflight.analysis.duration_seconds if preflight else None,
+            profile=profile,
         )
 
-        # 8. Save assessment to database
-        assessment = Assessment(
-            user_id=user.id,
-            phrase_id=phrase_id,
-            accuracy_score=result.accuracy_score,
-            prosody_score=result.prosody_score,
-            fluency_score=result.fluency_score,
-            completeness_score=result.completeness_score,
-            overall_score=result.overall_score,
-            recognized_text=result.recognized_text,
-            word_level_scores=result.word_level_scores,
-            audio_blob_url=blob_url,
-            assessment_duration_seconds=len(audio_bytes) / 16000,  # Approximate duration
+    except AudioTooLargeError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Audio file too large (maximum 10MB)")
+
+    except AudioPreflightError as e:
+        await db.rollback()
+        logger.info(f"Audio rejected by preflight: {str(e)}")
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+
+    except WavFormatError as e:
+        await db.rollback()
+        logger.info(f"Streamed audio format rejected: {str(e)}")
+        raise HTTPException(status_code=415, detail=str(e))
+
+    except (DeadlineExceededError, ClientDisconnect) as e:
+        # The pipeline already cancelled the outstanding work and removed its blob
+        await db.rollback()
+        raise _abandoned(e)
+
+    except AdmissionRejectedError as e:
+        await db.rollback()
+        raise _speech_at_capacity(e)
+
+    except Exception as e:
+        await db.rollback()
+        if blob_url:
+            await pipeline.discard_audio(blob_url)
+        logger.error(f"Assessment failed: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Assessment failed: {str(e)}")
+
+
+@router.post("/batch", response_model=BatchAssessmentResponse, status_code=200)
+async def create_batch_assessment(
+    audios: list[UploadFile] = File(
+        ..., description="Audio files (PCM, mu-law or IMA-ADPCM WAV, max 10MB each)"
+    ),
+    phrase_ids: list[int] = Form(..., description="Phrase ID for each audio file, in order"),
+    user_id: str = Form(..., description="Anonymous user identifier (UUID)"),
+    profile: str | None = Form(None, pattern=PROFILE_PATTERN, description=PROFILE_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+    speech_service: SpeechAssessmentService = Depends(get_speech_service),
+    blob_service: BlobStorageService = Depends(get_blob_service),
+    encryption_service: EncryptionService = Depends(get_encryption_service),
+):
+    """
+    Submit several recordings (e.g. every phrase of a dialog) for assessment.
+
+    The user and all phrases are loaded once, recordings are scored and
+    stored concurrently (at most BATCH_ASSESSMENT_CONCURRENCY at a time), and
+    all successful assessments are inserted in a single transaction.
+
+    A recording that fails (unknown phrase, too large, scoring error) is
+    reported as a failed item; the other recordings are still saved. The
+    profile, when given, applies to every recording; otherwise each uses its
+    phrase's.
+
+    Returns:
+        Per-recording results in request order
+    """
+    if len(audios) != len(phrase_ids):
+        raise HTTPException(
+            status_code=400, detail="Number of audio files must match number of phrase_ids"
+        )
+    if len(audios) > settings.BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many recordings (maximum {settings.BATCH_MAX_ITEMS} per batch)",
         )
 
-        db.add(assessment)
-        db.commit()
-        db.refresh(assessment)
+    user = await get_or_create_user(db, user_id)
+    phrases = {
+        phrase.id: get_phrase_cache().refresh(phrase)
+        for phrase in (await db.execute(select(Phrase).where(Phrase.id.in_(set(phrase_ids)))))
+        .scalars()
+        .all()
+    }
+
+    pipeline = AssessmentPipeline(speech_service, blob_service, encryption_service)
+    spool = AudioSpool()
+    semaphore = asyncio.Semaphore(settings.BATCH_ASSESSMENT_CONCURRENCY)
+
+    async def assess_item(audio: UploadFile, phrase_id: int) -> tuple:
+        """
+        Score and store one recording.
+
+        Returns (result, blob_url, spool_path, size, duration_seconds, trim, profile).
+        """
+        phrase = phrases.get(phrase_id)
+        if phrase is None:
+            raise HTTPException(status_code=404, detail=f"Phrase with ID {phrase_id} not found")
+        item_profile = resolve_assessment_profile(profile, phrase.assessment_profile)
+        if audio.size and audio.size > MAX_AUDIO_BYTES:
+            raise HTTPException(status_code=400, detail="Audio file too large (maximum 10MB)")
+
+        async with semaphore:
+            audio_bytes = await audio.read()
+            audio_bytes, analysis = await _preflight(audio_bytes)
+            duration = analysis.duration_seconds if analysis else None
+            prepared_audio, trim = await pipeline.prepare_audio(audio_bytes)
+
+            if settings.DEFERRED_AUDIO_UPLOAD:
+                result, spool_path = await pipeline.score_and_spool(
+                    prepared_audio, phrase.reference_text, spool, profile=item_profile
+                )
+                return result, None, spool_path, len(audio_bytes), duration, trim, item_profile
+
+            result, blob_url = await pipeline.score_and_store(
+                prepared_audio, phrase.reference_text, user_id=user_id, profile=item_profile
+            )
+            return result, blob_url, None, len(audio_bytes), duration, trim, item_profile
 
-        logger.info(f"Assessment saved: id={assessment.id}")
+    logger.info(f"Starting batch assessment of {len(audios)} recordings for user {user_id}")
+    outcomes = await asyncio.gather(
+        *(
+            assess_item(audio, phrase_id)
+            for audio, phrase_id in zip(audios, phrase_ids, strict=True)
+        ),
+        return_exceptions=True,
+    )
 
-        # 9. Return response
-        return AssessmentResponse(
-            id=assessment.id,
-            user_id=assessment.user_id,
+    items: list[BatchAssessmentItem | None] = [None] * len(outcomes)
+    saved: list[tuple[int, Assessment, str | None]] = []
+
+    for index, (phrase_id, outcome) in enumerate(zip(phrase_ids, outcomes, strict=True)):
+        if isinstance(outcome, BaseException):
+            error = outcome.detail if isinstance(outcome, HTTPException) else str(outcome)
+            logger.warning(f"Batch item {index} (phrase_id={phrase_id}) failed: {error}")
+            items[index] = BatchAssessmentItem(
+                index=index, phrase_id=phrase_id, status="failed", error=error
+            )
+        else:
+            result, blob_url, spool_path, audio_size, duration, trim, item_profile = outcome
+            assessment = build_assessment(
+                user,
+                phrase_id,
+                result,
+                blob_url,
+                audio_size,
+                duration_seconds=duration,
+                trim=trim,
+                profile=item_profile,
+            )
+            saved.append((index, assessment, spool_path))
+
+    await _save_batch(db, saved, pipeline, spool)
+
+    for index, assessment, _ in saved:
+        items[index] = BatchAssessmentItem(
+            index=index,
             phrase_id=assessment.phrase_id,
-            scores=AssessmentScores(
-                accuracy_score=assessment.accuracy_score,
-                prosody_score=assessment.prosody_score,
-                fluency_score=assessment.fluency_score,
-                completeness_score=assessment.completeness_score,
-                overall_score=assessment.overall_score,
-            ),
-            recognized_text=assessment.recognized_text,
-            word_level_scores=assessment.word_level_scores,
-            created_at=assessment.created_at,
+            status="succeeded",
+            assessment=AssessmentResponse.from_assessment(assessment),
+        )
+
+    logger.info(f"Batch assessment saved: {len(saved)} of {len(items)} recordings")
+
+    return BatchAssessmentResponse(
+        items=items, succeeded=len(saved), failed=len(items) - len(saved)
+    )
+
+
+@router.post("/jobs", response_model=AssessmentJobResponse, status_code=202)
+async def create_assessment_job(
+    request: Request,
+    response: Response,
+    audio: UploadFile = File(
+        ..., description="Audio file (PCM, mu-law or IMA-ADPCM WAV, max 10MB)"
+    ),
+    phrase_id: int = Form(..., description="ID of phrase being assessed"),
+    user_id: str = Form(..., description="Anonymous user identifier (UUID)"),
+    profile: str | None = Form(None, pattern=PROFILE_PATTERN, description=PROFILE_DESCRIPTION),
+    idempotency_key: str | None = Header(
+        None, max_length=255, description="Client key making retries of this request safe"
+    ),
+    db: AsyncSession = Depends(get_async_db),
+    encryption_service: EncryptionService = Depends(get_encryption_service),
+):
+    """
+    Queue audio for pronunciation assessment and return immediately.
+
+    The audio is encrypted and spooled, and a job row is committed; the
+    worker pool scores it at the rate the speech backend can sustain. Poll
+    GET /jobs/{job_id} or subscribe to the /jobs/{job_id}/ws WebSocket for
+    the result.
+
+    The profile is chosen as for /assess. With an Idempotency-Key header, a
+    retry returns the job queued by the original request (with its current
+    status) instead of queueing the audio again.
+
+    Returns:
+        The queued job (status "queued")
+    """
+    if audio.size and audio.size > MAX_AUDIO_BYTES:
+        raise HTTPException(status_code=400, detail="Audio file too large (maximum 10MB)")
+
+    await _get_phrase(db, phrase_id)
+
+    audio_bytes = await audio.read()
+    audio_bytes, _ = await _preflight(audio_bytes)
+
+    if idempotency_key:
+        stored = await _claim_idempotency_key(
+            db,
+            user_id,
+            idempotency_key,
+            idempotency_request_hash(user_id, phrase_id, audio_bytes, endpoint="jobs"),
+        )
+        if stored is not None:
+            response.headers["Idempotent-Replayed"] = "true"
+            return await get_assessment_job(stored["job_id"], db)
+
+    try:
+        job = await _queue_job(
+            db, user_id, phrase_id, audio_bytes, profile, idempotency_key, encryption_service
+        )
+    except (Exception, asyncio.CancelledError):
+        if idempotency_key:
+            await idempotency_service.release(db, user_id, idempotency_key)
+        raise
+
+    logger.info(f"Queued assessment job {job.id} for phrase_id={phrase_id}")
+
+    worker = getattr(request.app.state, "assessment_job_worker", None)
+    if worker is not None:
+        worker.notify()
+
+    return await _job_response(db, job)
+
+
+async def _queue_job(
+    db: AsyncSession,
+    user_id: str,
+    phrase_id: int,
+    audio_bytes: bytes,
+    profile: str | None,
+    idempotency_key: str | None,
+    encryption_service: EncryptionService,
+) -> AssessmentJob:
+    """
+    Spool the encrypted audio and commit the job row.
+
+    The job id stored for idempotency_key commits in the same transaction.
+    """
+    pending = (
+        await db.execute(
+            select(func.count())
+            .select_from(AssessmentJob)
+            .where(AssessmentJob.status.in_(("queued", "running")))
+        )
+    ).scalar()
+    if pending >= settings.ASSESSMENT_JOB_MAX_PENDING:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many pending assessment jobs. Please retry later.",
+            headers={"Retry-After": "30"},
         )
 
+    encrypted_audio = await asyncio.to_thread(encryption_service.encrypt_audio, audio_bytes)
+    spool = AudioSpool()
+    spool_path = await spool.write(encrypted_audio)
+
+    job = AssessmentJob(
+        user_id=user_id,
+        phrase_id=phrase_id,
+        audio_spool_path=spool_path,
+        audio_size=len(audio_bytes),
+        assessment_profile=profile,
+    )
+    db.add(job)
+    try:
+        await db.flush()  # Get job.id for the stored idempotent response
+        if idempotency_key:
+            await idempotency_service.complete(db, user_id, idempotency_key, {"job_id": job.id})
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        spool.remove(spool_path)
+        raise
+    await db.refresh(job)
+    if idempotency_key:
+        idempotency_service.notify(user_id, idempotency_key)
+
+    return job
+
+
+@router.get("/jobs/{job_id}", response_model=AssessmentJobResponse)
+async def get_assessment_job(job_id: str, db: AsyncSession = Depends(get_async_db)):
+    """Get the status of an assessment job, including the result once it succeeded."""
+    job = await db.get(AssessmentJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Assessment job {job_id} not found")
+
+    return await _job_response(db, job)
+
+
+@router.websocket("/jobs/{job_id}/ws")
+async def watch_assessment_job(
+    websocket: WebSocket, job_id: str, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Push job status updates until the job succeeds or fails.
+
+    Sends the current status on connect and on every change, then closes.
+    """
+    await websocket.accept()
+    worker = getattr(websocket.app.state, "assessment_job_worker", None)
+    last_status = None
+
+    try:
+        while True:
+            job = await db.get(AssessmentJob, job_id, populate_existing=True)
+            if not job:
+                await websocket.close(code=4404, reason="Assessment job not found")
+                return
+
+            finished = job.is_finished
+            if job.status != last_status:
+                last_status = job.status
+                response = await _job_response(db, job)
+                await websocket.send_json(response.model_dump(mode="json"))
+
+            # End the read transaction so the connection isn't held idle in one
+            await db.rollback()
+
+            if finished:
+                await websocket.close()
+                return
+
+            # The job may be processed by another API process, so also re-poll
+            if worker is not None:
+                await worker.wait_for_update(job_id, settings.ASSESSMENT_JOB_POLL_INTERVAL_SECONDS)
+            else:
+                await asyncio.sleep(settings.ASSESSMENT_JOB_POLL_INTERVAL_SECONDS)
+    except WebSocketDisconnect:
+        logger.info(f"Job watcher disconnected: {job_id}")
+
+
+async def _job_response(db: AsyncSession, job: AssessmentJob) -> AssessmentJobResponse:
+    """Build the job status response, embedding the assessment once available."""
+    assessment = None
+    if job.assessment_id is not None:
+        assessment_row = await db.get(Assessment, job.assessment_id)
+        if assessment_row is not None:
+            assessment = AssessmentResponse.from_assessment(assessment_row)
+
+    return AssessmentJobResponse(
+        job_id=job.id,
+        status=job.status,
+        phrase_id=job.phrase_id,
+        attempts=job.attempts,
+        error=job.error,
+        assessment=assessment,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
+
+
+async def _assess_and_save(
+    db: AsyncSession,
+    user_id: str,
+    phrase_id: int,
+    audio_bytes: bytes,
+    pipeline: AssessmentPipeline,
+    duration_seconds: float | None = None,
+    idempotency_key: str | None = None,
+    request: Request | None = None,
+    profile: str | None = None,
+) -> AssessmentResponse:
+    """
+    Run steps 2-7 of POST /assess for already-read audio.
+
+    Scoring and storage run under the request deadline and, given the
+    request, are cancelled if the client disconnects. The database insert
+    isn't: once the work is done, saving it is cheap and must not be torn.
+    """
+    # 2-3. Get or create user, get phrase
+    user = await get_or_create_user(db, user_id)
+    phrase = await _get_phrase(db, phrase_id)
+    profile = resolve_assessment_profile(profile, phrase.assessment_profile)
+
+    spool = AudioSpool()
+    blob_url = None
+    spool_path = None
+
+    async def score() -> tuple[PronunciationResult, str | None, str | None, SilenceTrim | None]:
+        # Normalize and trim silence so the same audio is scored and stored
+        prepared_audio, trim = await pipeline.prepare_audio(audio_bytes)
+
+        if settings.DEFERRED_AUDIO_UPLOAD:
+            # 5. Assess pronunciation while spooling the encrypted audio; the
+            # outbox worker uploads it and fills in audio_blob_url later
+            logger.info("Starting pronunciation assessment (deferred audio upload)...")
+            result, spool_path = await pipeline.score_and_spool(
+                prepared_audio, phrase.reference_text, spool, profile=profile
+            )
+            return result, None, spool_path, trim
+
+        # 5. Assess pronunciation while encrypting and uploading the audio
+        logger.info("Starting pronunciation assessment and audio upload...")
+        result, blob_url = await pipeline.score_and_store(
+            prepared_audio, phrase.reference_text, user_id=user_id, profile=profile
+        )
+        return result, blob_url, None, trim
+
+    try:
+        async with request_deadline().scope():
+            result, blob_url, spool_path, trim = await _cancel_on_disconnect(request, score())
+
+        # 6-7. Save assessment (and outbox row) to database and return response
+        return await _save_assessment(
+            db,
+            user,
+            phrase_id,
+            result,
+            blob_url,
+            len(audio_bytes),
+            duration_seconds=duration_seconds,
+            trim=trim,
+            spool_path=spool_path,
+            idempotency_key=idempotency_key,
+            profile=profile,
+        )
+
+    except AdmissionRejectedError as e:
+        # The pipeline already removed anything the storage branch produced
+        await db.rollback()
+        raise _speech_at_capacity(e)
+
+    except (DeadlineExceededError, ClientDisconnectedError) as e:
+        # Likewise for work cut short (the database insert never started)
+        await db.rollback()
+        raise _abandoned(e)
+
     except Exception as e:
-        db.rollback()
+        await db.rollback()
+        if blob_url:
+            await pipeline.discard_audio(blob_url)
+        if spool_path:
+            spool.remove(spool_path)
         logger.error(f"Assessment failed: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Assessment failed: {str(e)}")
+
+
+async def _preflight(audio_bytes: bytes) -> tuple[bytes, AudioAnalysis | None]:
+    """
+    Decode compact upload encodings to PCM and run the audio preflight.
+
+    Both run off the event loop; malformed or unusable audio becomes a 4xx.
+
+    Returns:
+        Tuple of (PCM audio, preflight analysis or None if disabled)
+    """
+    try:
+        return await asyncio.to_thread(_decode_and_check, audio_bytes)
+    except WavFormatError as e:
+        logger.info(f"Audio upload could not be decoded: {str(e)}")
+        raise HTTPException(status_code=415, detail=str(e))
+    except AudioPreflightError as e:
+        logger.info(f"Audio rejected by preflight: {str(e)}")
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+
+
+def _decode_and_check(audio_bytes: bytes) -> tuple[bytes, AudioAnalysis | None]:
+    audio_bytes = decode_compact_wav(audio_bytes)
+    if not settings.AUDIO_PREFLIGHT_ENABLED:
+        return audio_bytes, None
+    return audio_bytes, preflight_audio(audio_bytes)
+
+
+async def _cancel_on_disconnect(request: Request | None, work: Awaitable[Any]) -> Any:
+    """
+    Await work, cancelling it if the client disconnects first.
+
+    Only for requests whose body has been read in full (Starlette reports a
+    disconnect once the body is consumed).
+
+    Raises:
+        ClientDisconnectedError: If the client went away before work finished
+    """
+    task = asyncio.ensure_future(work)
+    if request is None:
+        return await task
+
+    watcher = asyncio.create_task(_wait_for_disconnect(request))
+    try:
+        await asyncio.wait((task, watcher), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    if task.cancelled():
+        raise ClientDisconnectedError("Client disconnected before the assessment finished")
+    return task.result()
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    while not await request.is_disconnected():
+        await asyncio.sleep(DISCONNECT_POLL_SECONDS)
+
+
+def _abandoned(error: Exception) -> HTTPException:
+    """Count an abandoned assessment and build its response (504, or 499 for a disconnect)."""
+    if isinstance(error, DeadlineExceededError):
+        get_cancellation_stats().record_request("deadline")
+        return HTTPException(status_code=504, detail=str(error))
+
+    get_cancellation_stats().record_request("client_disconnect")
+    return HTTPException(status_code=499, detail="Client closed request")
+
+
+def _speech_at_capacity(error: AdmissionRejectedError) -> HTTPException:
+    """429 response telling the client when to retry."""
+    return HTTPException(
+        status_code=429, detail=str(error), headers={"Retry-After": str(error.retry_after)}
+    )
+
+
+async def _claim_idempotency_key(
+    db: AsyncSession, user_id: str, idempotency_key: str, request_hash: str
+) -> dict[str, Any] | None:
+    """Claim the user's key, or return the stored response of the request that used it."""
+    try:
+        stored = await idempotency_service.claim(db, user_id, idempotency_key, request_hash)
+    except IdempotencyKeyMismatchError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except IdempotencyKeyInProgressError as e:
+        raise HTTPException(status_code=409, detail=str(e), headers={"Retry-After": "5"})
+
+    return stored
+
+
+async def _get_phrase(db: AsyncSession, phrase_id: int) -> PreparedPhrase:
+    """Get a phrase by ID (from the phrase cache when possible) or raise 404."""
+    phrase = await get_phrase_cache().get(db, phrase_id)
+    if not phrase:
+        raise HTTPException(status_code=404, detail=f"Phrase with ID {phrase_id} not found")
+    return phrase
+
+
+async def _save_batch(
+    db: AsyncSession,
+    saved: list[tuple[int, Assessment, str | None]],
+    pipeline: AssessmentPipeline,
+    spool: AudioSpool,
+) -> None:
+    """
+    Insert all batch assessments (and their outbox rows) in one transaction.
+
+    On failure, removes every uploaded blob and spooled file and raises 500.
+    """
+    try:
+        db.add_all([assessment for _, assessment, _ in saved])
+        spooled = [(assessment, path) for _, assessment, path in saved if path]
+        if spooled:
+            await db.flush()  # Get assessment ids for the outbox rows
+            db.add_all(
+                AudioUploadOutbox(assessment_id=assessment.id, spool_path=path)
+                for assessment, path in spooled
+            )
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        for _, assessment, spool_path in saved:
+            if assessment.audio_blob_url:
+                await pipeline.discard_audio(assessment.audio_blob_url)
+            if spool_path:
+                spool.remove(spool_path)
+        logger.error(f"Batch assessment failed: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Assessment failed: {str(e)}")
+
+
+async def _save_assessment(
+    db: AsyncSession,
+    user: User,
+    phrase_id: int,
+    result: PronunciationResult,
+    blob_url: str | None,
+    audio_size: int,
+    duration_seconds: float | None = None,
+    trim: SilenceTrim | None = None,
+    spool_path: str | None = None,
+    idempotency_key: str | None = None,
+    profile: str | None = None,
+) -> AssessmentResponse:
+    """
+    Persist the assessment row and build the API response.
+
+    If spool_path is given, an outbox row for the deferred upload is
+    committed in the same transaction as the assessment; likewise the
+    response stored for idempotency_key.
+    """
+    assessment = build_assessment(
+        user,
+        phrase_id,
+        result,
+        blob_url,
+        audio_size,
+        duration_seconds=duration_seconds,
+        trim=trim,
+        profile=profile,
+    )
+    db.add(assessment)
+    await db.flush()  # Get assessment.id for the outbox row and response
+
+    if spool_path:
+        db.add(AudioUploadOutbox(assessment_id=assessment.id, spool_path=spool_path))
+
+    response = AssessmentResponse.from_assessment(assessment)
+    if idempotency_key:
+        await idempotency_service.complete(
+            db, user.user_id, idempotency_key, response.model_dump(mode="json")
+        )
+
+    await db.commit()
+    if idempotency_key:
+        idempotency_service.notify(user.user_id, idempotency_key)
+
+    logger.info(f"Assessment saved: id={assessment.id}")
+
+    return response
@@ -9,6 +9,7 @@ from app.api.deps import get_db
 from app.models.category import Category
 from app.models.dialog import Dialog
 from app.schemas.dialog import DialogCreate, DialogResponse, DialogUpdate
+from app.services.phrase_cache import get_phrase_cache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -139,8 +140,10 @@ def delete_dialog(dialog_id: int, db: Session = Depends(get_db)):
     if not db_dialog:
         raise HTTPException(status_code=404, detail=f"Dialog {dialog_id} not found")
 
+    phrase_ids = [phrase.id for phrase in db_dialog.phrases]
     db.delete(db_dialog)
     db.commit()
+    get_phrase_cache().invalidate(*phrase_ids)
 
     logger.info(f"Deleted dialog: {db_dialog.title} (id={dialog_id})")
     return None
@@ -9,6 +9,7 @@ from app.api.deps import get_db
 from app.models.dialog import Dialog
 from app.models.phrase import Phrase
 from app.schemas.phrase import PhraseCreate, PhraseResponse, PhraseUpdate
+from app.services.phrase_cache import get_phrase_cache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -63,8 +64,11 @@ def update_phrase(phrase_id: int, phrase_update: PhraseUpdate, db: Session = Dep
     update_data = phrase_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_phrase, field, value)
+    # Incremented in SQL, so concurrent edits both count (last write wins)
+    db_phrase.version = Phrase.version + 1
 
     db.commit()
+    get_phrase_cache().invalidate(phrase_id)
     db.refresh(db_phrase)
 
     logger.info(f"Updated phrase (id={phrase_id})")
@@ -85,6 +89,7 @@ def delete_phrase(phrase_id: int, db: Session = Depends(get_db)):
 
     db.delete(db_phrase)
     db.commit()
+    get_phrase_cache().invalidate(phrase_id)
 
     logger.info(f"Deleted phrase (id={phrase_id})")
     return None
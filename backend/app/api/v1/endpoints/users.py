@@ -3,11 +3,12 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import get_async_db
 from app.models.assessment import Assessment
+from app.models.category import Category
 from app.models.dialog import Dialog
 from app.models.phrase import Phrase
 from app.models.user import User
@@ -17,13 +18,21 @@ from app.schemas.user import UserProgress
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Quick assessments have no prosody, so their overall_score is a 3-term mean and
+# not comparable with full ones; overall-score aggregates only count full ones
+# (rows stored before profiles existed were full)
+_FULL_PROFILE = or_(
+    Assessment.assessment_profile.is_(None), Assessment.assessment_profile != "quick"
+)
+_FULL_OVERALL_SCORE = case((_FULL_PROFILE, Assessment.overall_score))
+
 
 @router.get("/{user_id}/assessments", response_model=list[AssessmentListItem])
-def get_user_assessments(
+async def get_user_assessments(
     user_id: int,
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get assessment history for a specific user.
@@ -31,20 +40,21 @@ def get_user_assessments(
     Returns assessments ordered by creation date (newest first).
     """
     # Verify user exists
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail=f"User {user_id} not found")
 
     # Query assessments with phrase info
     assessments = (
-        db.query(Assessment, Phrase.reference_text)
-        .join(Phrase, Assessment.phrase_id == Phrase.id)
-        .filter(Assessment.user_id == user_id)
-        .order_by(Assessment.created_at.desc())
-        .limit(limit)
-        .offset(offset)
-        .all()
-    )
+        await db.execute(
+            select(Assessment, Phrase.reference_text)
+            .join(Phrase, Assessment.phrase_id == Phrase.id)
+            .where(Assessment.user_id == user_id)
+            .order_by(Assessment.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+    ).all()
 
     result = [
         AssessmentListItem(
@@ -65,7 +75,7 @@ def get_user_assessments(
 
 
 @router.get("/{user_id}/progress", response_model=UserProgress)
-def get_user_progress(user_id: int, db: Session = Depends(get_db)):
+async def get_user_progress(user_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Get aggregated progress statistics for a user.
 
@@ -73,39 +83,45 @@ def get_user_progress(user_id: int, db: Session = Depends(get_db)):
     - Total assessments
     - Average scores (overall, accuracy, prosody, fluency, completeness)
     - Best and worst scores
+    Overall-score statistics cover full-profile assessments only (see
+    quick_assessments); the other averages cover all assessments.
     - Category breakdown
     - Improvement rate (future enhancement)
     """
     # Verify user exists
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail=f"User {user_id} not found")
 
     # Get aggregated statistics
     stats = (
-        db.query(
-            func.count(Assessment.id).label("total"),
-            func.avg(Assessment.overall_score).label("avg_overall"),
-            func.avg(Assessment.accuracy_score).label("avg_accuracy"),
-            func.avg(Assessment.prosody_score).label("avg_prosody"),
-            func.avg(Assessment.fluency_score).label("avg_fluency"),
-            func.avg(Assessment.completeness_score).label("avg_completeness"),
-            func.max(Assessment.overall_score).label("best_score"),
-            func.min(Assessment.overall_score).label("worst_score"),
+        await db.execute(
+            select(
+                func.count(Assessment.id).label("total"),
+                func.count(Assessment.id).filter(~_FULL_PROFILE).label("quick"),
+                func.avg(_FULL_OVERALL_SCORE).label("avg_overall"),
+                func.avg(Assessment.accuracy_score).label("avg_accuracy"),
+                func.avg(Assessment.prosody_score).label("avg_prosody"),
+                func.avg(Assessment.fluency_score).label("avg_fluency"),
+                func.avg(Assessment.completeness_score).label("avg_completeness"),
+                func.max(_FULL_OVERALL_SCORE).label("best_score"),
+                func.min(_FULL_OVERALL_SCORE).label("worst_score"),
+            ).where(Assessment.user_id == user_id)
         )
-        .filter(Assessment.user_id == user_id)
-        .first()
-    )
+    ).first()
 
     # Get category breakdown
     category_counts = (
-        db.query(Dialog.category, func.count(Assessment.id).label("count"))
-        .join(Phrase, Assessment.phrase_id == Phrase.id)
-        .join(Dialog, Phrase.dialog_id == Dialog.id)
-        .filter(Assessment.user_id == user_id)
-        .group_by(Dialog.category)
-        .all()
-    )
+        await db.execute(
+            select(Category.name, func.count(Assessment.id).label("count"))
+            .select_from(Assessment)
+            .join(Phrase, Assessment.phrase_id == Phrase.id)
+            .join(Dialog, Phrase.dialog_id == Dialog.id)
+            .join(Category, Dialog.category_id == Category.id)
+            .where(Assessment.user_id == user_id)
+            .group_by(Category.name)
+        )
+    ).all()
 
     categories_practiced = {category: count for category, count in category_counts}
 
@@ -130,6 +146,7 @@ def get_user_progress(user_id: int, db: Session = Depends(get_db)):
     return UserProgress(
         user_id=user_id,
         total_assessments=stats.total,
+        quick_assessments=stats.quick,
         average_overall_score=float(stats.avg_overall or 0),
         average_accuracy=float(stats.avg_accuracy or 0),
         average_prosody=float(stats.avg_prosody or 0),
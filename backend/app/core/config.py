@@ -16,6 +16,7 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    ASYNC_DATABASE_URL: str | None = None  # Derived from DATABASE_URL when not set
 
     # Azure Services (optional in mock mode)
     MOCK_MODE: bool = True
@@ -23,6 +24,97 @@ class Settings(BaseSettings):
     SPEECH_REGION: str | None = "brazilsouth"
     BLOB_CONNECTION_STRING: str | None = None
     BLOB_CONTAINER_NAME: str = "audio-recordings"
+    # Blob client: one pooled async client per process; larger uploads go as parallel blocks
+    BLOB_MAX_CONNECTIONS: int = 20
+    BLOB_UPLOAD_CONCURRENCY: int = 4  # Blocks uploaded (or downloaded) at once per recording
+    BLOB_UPLOAD_BLOCK_SIZE: int = 1024 * 1024  # Bytes; larger payloads are split into blocks
+
+    # Deferred audio upload (outbox): respond after scoring, upload audio in background
+    DEFERRED_AUDIO_UPLOAD: bool = False
+    AUDIO_SPOOL_DIR: str = "./audio_spool"  # Must be durable storage shared by the worker
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 2.0
+    OUTBOX_BATCH_SIZE: int = 10
+    OUTBOX_MAX_ATTEMPTS: int = 8
+    OUTBOX_LEASE_SECONDS: float = 300.0  # Reclaim rows claimed by a worker that died mid-upload
+
+    # Assessment profile when neither the request nor the phrase sets one: "full" or "quick"
+    ASSESSMENT_DEFAULT_PROFILE: str = "full"
+
+    # Time allowed for an assessment request's scoring and storage before it is abandoned (504)
+    ASSESSMENT_DEADLINE_SECONDS: float = 90.0
+
+    # Asynchronous assessment jobs (POST /assessments/jobs)
+    ASSESSMENT_JOB_WORKERS: int = 4  # Concurrent jobs per API process (0 disables the pool)
+    ASSESSMENT_JOB_MAX_PENDING: int = 1000  # Reject new jobs with 503 beyond this backlog
+    ASSESSMENT_JOB_MAX_ATTEMPTS: int = 3
+    ASSESSMENT_JOB_LEASE_SECONDS: float = 300.0  # Reclaim running jobs from dead workers
+    ASSESSMENT_JOB_RETRY_BACKOFF_SECONDS: float = 5.0  # First retry delay, doubled per attempt
+    ASSESSMENT_JOB_POLL_INTERVAL_SECONDS: float = 1.0
+
+    # Audio preflight (rejects unusable recordings before any speech or storage work)
+    AUDIO_PREFLIGHT_ENABLED: bool = True
+    AUDIO_MIN_DURATION_SECONDS: float = 0.5
+    AUDIO_MIN_RMS_DBFS: float = -50.0  # Quieter recordings are treated as silent
+    AUDIO_MAX_CLIPPING_RATIO: float = 0.02  # Max fraction of samples at full scale
+    AUDIO_SPEECH_THRESHOLD_DBFS: float = -40.0  # 20ms frames louder than this count as speech
+    AUDIO_MIN_SPEECH_RATIO: float = 0.1  # Min fraction of speech frames
+
+    # Convert uploads to 16 kHz mono 16-bit PCM before scoring and storage
+    AUDIO_NORMALIZE_ENABLED: bool = True
+
+    # Trim leading/trailing silence (frames below AUDIO_SPEECH_THRESHOLD_DBFS) before scoring
+    AUDIO_TRIM_SILENCE_ENABLED: bool = True
+    AUDIO_TRIM_PADDING_SECONDS: float = 0.25  # Silence kept around the speech
+
+    # Store recordings losslessly compressed with a binary token (older formats still decrypt)
+    AUDIO_COMPACT_STORAGE_ENABLED: bool = True
+
+    # Speech admission control (concurrent recognitions across all worker processes)
+    SPEECH_MAX_CONCURRENT: int = 20  # Speech tier's concurrent recognition limit
+    SPEECH_ADMISSION_QUEUE_SIZE: int = 50  # Waiting recognitions per process before 429
+    SPEECH_ADMISSION_TIMEOUT_SECONDS: float = 15.0  # Max wait for a slot before 429
+    SPEECH_ADMISSION_BACKEND: str = "auto"  # auto, postgres (advisory locks) or local
+    # Threads for blocking Speech SDK calls per process (>= admitted recognitions per process)
+    SPEECH_EXECUTOR_THREADS: int = 20
+    # Speech backend: "sdk" (Speech SDK) or "rest" (short-audio REST endpoint, clips < 60s)
+    SPEECH_BACKEND: str = "sdk"
+    SPEECH_REST_HTTP2: bool = True  # Via httpx[http2]; HTTP/1.1 (with a warning) without h2
+    SPEECH_REST_MAX_CONNECTIONS: int = 20  # Pooled keep-alive connections per process
+    SPEECH_REST_TIMEOUT_SECONDS: float = 30.0
+    # Long-form mode: continuous recognition for recordings single-shot would truncate
+    SPEECH_LONG_FORM_ENABLED: bool = True
+    # Longer uploads use continuous recognition; streamed ones by their WAV header's length
+    # (streams whose header leaves the length unknown always do)
+    SPEECH_LONG_FORM_MIN_SECONDS: float = 25.0
+    # Failover regions ("region" or "region:key", comma-separated) hedged after SPEECH_REGION
+    SPEECH_FAILOVER_REGIONS: str = ""
+    SPEECH_CALL_BUDGET_SECONDS: float = 20.0  # A region call taking longer counts as failed
+    SPEECH_HEDGE_INITIAL_DELAY_SECONDS: float = 3.0  # Hedge delay until p95 latency is known
+    SPEECH_HEDGE_MIN_DELAY_SECONDS: float = 0.5
+    SPEECH_CIRCUIT_FAILURE_THRESHOLD: int = 3  # Consecutive failures that open a region's circuit
+    SPEECH_CIRCUIT_RESET_SECONDS: float = 30.0  # Open circuit duration before a trial call
+    # Recognizers kept connected to the speech service ahead of requests (0 disables pre-warming)
+    SPEECH_WARM_POOL_SIZE: int = 4
+    SPEECH_WARM_MAX_IDLE_SECONDS: float = 60.0  # Reconnect before the service drops idle ones
+
+    # Pronunciation result cache (identical audio + reference text skips recognition)
+    RESULT_CACHE_ENABLED: bool = True
+    RESULT_CACHE_MAX_ENTRIES: int = 1024  # In-memory LRU entries per process
+    RESULT_CACHE_DB_ENABLED: bool = False  # Also share results across processes via the DB
+    RESULT_CACHE_TTL_SECONDS: float = 7 * 24 * 3600
+
+    # Prepared phrases (reference text, words, assessment config) cached per process
+    PHRASE_CACHE_MAX_ENTRIES: int = 2048
+    PHRASE_CACHE_TTL_SECONDS: float = 300.0  # Bounds staleness of phrases edited by other processes
+
+    # Idempotency-Key support on POST /assessments/assess
+    IDEMPOTENCY_WAIT_SECONDS: float = 30.0  # How long a retry waits for the original request
+    IDEMPOTENCY_LOCK_TIMEOUT_SECONDS: float = 300.0  # In-progress keys older than this are retaken
+    IDEMPOTENCY_KEY_TTL_SECONDS: float = 24 * 3600  # Stored responses are replayed this long
+
+    # Batch assessment (POST /assessments/batch)
+    BATCH_MAX_ITEMS: int = 20  # Maximum recordings per batch request
+    BATCH_ASSESSMENT_CONCURRENCY: int = 4  # Recordings scored at the same time per request
 
     # Security
     ENCRYPTION_KEY: str
@@ -38,6 +130,35 @@ class Settings(BaseSettings):
         """Parse CORS_ORIGINS from comma-separated string to list."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
+    @property
+    def speech_failover_regions_list(self) -> list[tuple[str, str | None]]:
+        """Parse SPEECH_FAILOVER_REGIONS into (region, key) pairs (key None = SPEECH_KEY)."""
+        regions = []
+        for entry in self.SPEECH_FAILOVER_REGIONS.split(","):
+            region, _, key = entry.strip().partition(":")
+            if region:
+                regions.append((region, key or None))
+        return regions
+
+    @property
+    def async_database_url(self) -> str:
+        """
+        Database URL for the async engine.
+
+        Uses ASYNC_DATABASE_URL when set, otherwise swaps the sync driver in
+        DATABASE_URL for its async counterpart (asyncpg / aiosqlite).
+        """
+        if self.ASYNC_DATABASE_URL:
+            return self.ASYNC_DATABASE_URL
+
+        scheme, sep, rest = self.DATABASE_URL.partition("://")
+        dialect = scheme.split("+")[0]
+        async_drivers = {"postgresql": "asyncpg", "postgres": "asyncpg", "sqlite": "aiosqlite"}
+        if dialect in async_drivers:
+            dialect = "postgresql" if dialect == "postgres" else dialect
+            return f"{dialect}+{async_drivers[dialect]}{sep}{rest}"
+        return self.DATABASE_URL
+
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, extra="ignore")
 
     def validate_azure_config(self) -> None:
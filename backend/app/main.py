@@ -4,6 +4,7 @@ Entry point for the PronIELTS backend API.
 """
 
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,6 +12,11 @@ from fastapi.responses import JSONResponse
 
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.services.assessment_job_service import AssessmentJobWorker
+from app.services.audio_outbox_service import AudioOutboxWorker
+from app.services.deadlines import cancellation_stats
+from app.services.phrase_cache import phrase_cache
+from app.services.service_container import ServiceContainer
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +24,88 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+async def startup(app: FastAPI) -> None:
+    """
+    Startup handler.
+
+    Logs important configuration information, builds and warms the
+    app-lifetime services and starts the background workers.
+    """
+    logger.info("=" * 60)
+    logger.info(f"Starting {settings.PROJECT_NAME} v{settings.VERSION}")
+    logger.info("=" * 60)
+    logger.info(f"Mock Mode: {settings.MOCK_MODE}")
+    logger.info(f"Database URL: {settings.DATABASE_URL.split('@')[-1]}")  # Hide credentials
+    logger.info(f"CORS Origins: {settings.cors_origins_list}")
+
+    if settings.MOCK_MODE:
+        logger.info("ℹ️  Running in MOCK MODE - using mock Azure services")
+        logger.info("ℹ️  Speech assessments will return randomized scores")
+        logger.info("ℹ️  Audio files will be saved to ./mock_blob_storage/")
+    else:
+        logger.info("☁️  Running in AZURE MODE - using real Azure services")
+        logger.info(f"☁️  Speech Region: {settings.SPEECH_REGION}")
+        logger.info(f"☁️  Speech Backend: {settings.SPEECH_BACKEND}")
+
+    services = app.state.services = ServiceContainer()
+    if services.failover is not None:
+        regions = [region.name for region in services.failover.regions[1:]]
+        logger.info(f"☁️  Failover Regions: {regions}")
+    await services.start()
+
+    if settings.DEFERRED_AUDIO_UPLOAD:
+        logger.info("📤 Deferred audio upload enabled - starting outbox worker")
+        app.state.audio_outbox_worker = AudioOutboxWorker(blob_service=services.blob_service)
+        app.state.audio_outbox_worker.start()
+
+    if settings.ASSESSMENT_JOB_WORKERS > 0:
+        logger.info(f"🧵 Assessment job workers: {settings.ASSESSMENT_JOB_WORKERS}")
+        app.state.assessment_job_worker = AssessmentJobWorker(
+            speech_service=services.speech_service,
+            blob_service=services.blob_service,
+            encryption_service=services.encryption_service,
+        )
+        app.state.assessment_job_worker.start()
+
+    logger.info("=" * 60)
+    logger.info("API Documentation: http://localhost:8000/docs")
+    logger.info("Health Check: http://localhost:8000/health")
+    logger.info("=" * 60)
+
+
+async def shutdown(app: FastAPI) -> None:
+    """
+    Shutdown handler.
+
+    Stops background workers and releases the services when the application
+    is shutting down.
+    """
+    logger.info("Shutting down PronIELTS API...")
+
+    audio_outbox_worker = getattr(app.state, "audio_outbox_worker", None)
+    if audio_outbox_worker is not None:
+        await audio_outbox_worker.stop()
+
+    assessment_job_worker = getattr(app.state, "assessment_job_worker", None)
+    if assessment_job_worker is not None:
+        await assessment_job_worker.stop()
+
+    services = getattr(app.state, "services", None)
+    if services is not None:
+        await services.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: the services live from startup to shutdown."""
+    await startup(app)
+    try:
+        yield
+    finally:
+        await shutdown(app)
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -26,6 +114,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -46,54 +135,27 @@ def health_check():
     """
     Health check endpoint.
 
-    Returns basic information about the API status.
+    Returns basic information about the API status and the counters of the
+    app-lifetime services.
     """
+    services = app.state.services
+    audio_outbox_worker = getattr(app.state, "audio_outbox_worker", None)
     return {
         "status": "healthy",
         "version": settings.VERSION,
         "project": settings.PROJECT_NAME,
         "mock_mode": settings.MOCK_MODE,
+        "result_cache": services.result_cache.stats(),
+        "phrase_cache": phrase_cache.stats(),
+        "speech_admission": services.admission.stats(),
+        "speech_executor": services.executor.stats(),
+        "speech_client": services.speech_client.stats(),
+        "speech_failover": services.failover.stats() if services.failover else None,
+        "cancellations": cancellation_stats.stats(),
+        "audio_outbox": audio_outbox_worker.stats() if audio_outbox_worker else None,
     }
 
 
-@app.on_event("startup")
-async def startup_event():
-    """
-    Startup event handler.
-
-    Logs important configuration information when the application starts.
-    """
-    logger.info("=" * 60)
-    logger.info(f"Starting {settings.PROJECT_NAME} v{settings.VERSION}")
-    logger.info("=" * 60)
-    logger.info(f"Mock Mode: {settings.MOCK_MODE}")
-    logger.info(f"Database URL: {settings.DATABASE_URL.split('@')[-1]}")  # Hide credentials
-    logger.info(f"CORS Origins: {settings.cors_origins_list}")
-
-    if settings.MOCK_MODE:
-        logger.info("ℹ️  Running in MOCK MODE - using mock Azure services")
-        logger.info("ℹ️  Speech assessments will return randomized scores")
-        logger.info("ℹ️  Audio files will be saved to ./mock_blob_storage/")
-    else:
-        logger.info("☁️  Running in AZURE MODE - using real Azure services")
-        logger.info(f"☁️  Speech Region: {settings.SPEECH_REGION}")
-
-    logger.info("=" * 60)
-    logger.info("API Documentation: http://localhost:8000/docs")
-    logger.info("Health Check: http://localhost:8000/health")
-    logger.info("=" * 60)
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Shutdown event handler.
-
-    Logs when the application is shutting down.
-    """
-    logger.info("Shutting down PronIELTS API...")
-
-
 # Error handlers
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
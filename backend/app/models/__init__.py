@@ -1,8 +1,22 @@
 # Database models
 from app.models.assessment import Assessment
+from app.models.assessment_job import AssessmentJob
+from app.models.audio_outbox import AudioUploadOutbox
 from app.models.category import Category
 from app.models.dialog import Dialog
+from app.models.idempotency_key import IdempotencyKey
 from app.models.phrase import Phrase
+from app.models.result_cache import PronunciationResultCacheEntry
 from app.models.user import User
 
-__all__ = ["User", "Category", "Dialog", "Phrase", "Assessment"]
+__all__ = [
+    "User",
+    "Category",
+    "Dialog",
+    "Phrase",
+    "Assessment",
+    "AssessmentJob",
+    "AudioUploadOutbox",
+    "PronunciationResultCacheEntry",
+    "IdempotencyKey",
+]
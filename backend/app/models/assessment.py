@@ -28,7 +28,7 @@ class Assessment(Base, TimestampMixin):
 
     # Scores (0-100 scale, except prosody which is 0-5)
     accuracy_score = Column(Float, nullable=True)  # Phoneme/word accuracy
-    prosody_score = Column(Float, nullable=True)  # Rhythm/intonation (0-5)
+    prosody_score = Column(Float, nullable=True)  # Rhythm/intonation (0-5), None if quick
     fluency_score = Column(Float, nullable=True)  # Speaking pace
     completeness_score = Column(Float, nullable=True)  # % of reference text
     overall_score = Column(Float, nullable=True, index=True)  # Aggregated score
@@ -37,12 +37,18 @@ class Assessment(Base, TimestampMixin):
     word_level_scores = Column(
         JSON, nullable=True
     )  # {"word": {"accuracy": 85, "error_type": "None"}}
-    phoneme_level_scores = Column(JSON, nullable=True)  # Detailed phoneme scores (optional)
+    # Ordered word and phoneme scores with timings, packed (see services/score_packing)
+    phoneme_level_scores = Column(JSON, nullable=True)
     recognized_text = Column(Text, nullable=True)  # Speech-to-text result
 
     # Metadata
     audio_blob_url = Column(String(500), nullable=True)  # Encrypted audio in blob storage
     assessment_duration_seconds = Column(Float, nullable=True)  # Audio duration
+    # Region of the recording kept after silence trimming (seconds from its start)
+    trim_start_seconds = Column(Float, nullable=True)
+    trim_end_seconds = Column(Float, nullable=True)
+    # Assessment profile scored with: "full" (phonemes, prosody) or "quick" (words only)
+    assessment_profile = Column(String(20), nullable=True)
 
     # Relationships
     user = relationship("User")
@@ -66,5 +72,6 @@ class Assessment(Base, TimestampMixin):
             },
             "recognized_text": self.recognized_text,
             "word_level_scores": self.word_level_scores,
+            "assessment_profile": self.assessment_profile,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
@@ -0,0 +1,52 @@
+"""Assessment job model for asynchronous (queued) pronunciation assessments."""
+
+import uuid
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import relationship
+
+from app.db.base import Base, TimestampMixin
+
+
+class AssessmentJob(Base, TimestampMixin):
+    """
+    Queued pronunciation assessment.
+
+    The uploaded audio is spooled (encrypted) and the job row is committed
+    immediately; a worker pool claims queued jobs, runs the assessment and
+    links the resulting Assessment.
+
+    Status lifecycle: queued -> running -> succeeded | failed
+    """
+
+    __tablename__ = "assessment_jobs"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(String(100), nullable=False, index=True)  # Anonymous UUID of submitter
+    phrase_id = Column(
+        Integer, ForeignKey("phrases.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    audio_spool_path = Column(String(500), nullable=False)  # Encrypted audio awaiting scoring
+    audio_size = Column(Integer, nullable=False)
+    assessment_profile = Column(String(20), nullable=True)  # Requested profile, if any
+
+    status = Column(String(20), default="queued", nullable=False, index=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    locked_at = Column(DateTime, nullable=True)  # When a worker claimed the job
+    not_before = Column(DateTime, nullable=True)  # Queued retries wait until this time
+    error = Column(Text, nullable=True)
+
+    assessment_id = Column(
+        Integer, ForeignKey("assessments.id", ondelete="SET NULL"), nullable=True
+    )
+
+    # Relationships
+    assessment = relationship("Assessment")
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job reached a terminal status."""
+        return self.status in ("succeeded", "failed")
+
+    def __repr__(self) -> str:
+        return f"<AssessmentJob(id={self.id}, status={self.status}, phrase_id={self.phrase_id})>"
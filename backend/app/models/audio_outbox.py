@@ -0,0 +1,43 @@
+"""Outbox model for audio uploads deferred until after the assessment response."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import relationship
+
+from app.db.base import Base, TimestampMixin
+
+
+class AudioUploadOutbox(Base, TimestampMixin):
+    """
+    Pending upload of an assessment's encrypted audio to blob storage.
+
+    Committed in the same transaction as the Assessment, pointing at the
+    encrypted audio spooled on disk. A background worker claims it, uploads
+    it, fills in Assessment.audio_blob_url and deletes the row.
+
+    Status lifecycle:
+    pending -> uploading -> (deleted) | pending (retry) | failed | missing_audio
+    """
+
+    __tablename__ = "audio_upload_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    assessment_id = Column(
+        Integer, ForeignKey("assessments.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    spool_path = Column(String(500), nullable=False)  # Encrypted audio awaiting upload
+    status = Column(String(20), default="pending", nullable=False, index=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    locked_at = Column(DateTime, nullable=True)  # When a worker claimed the row for upload
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    last_error = Column(Text, nullable=True)
+
+    # Relationships
+    assessment = relationship("Assessment")
+
+    def __repr__(self) -> str:
+        return (
+            f"<AudioUploadOutbox(id={self.id}, assessment_id={self.assessment_id}, "
+            f"status={self.status}, attempts={self.attempts})>"
+        )
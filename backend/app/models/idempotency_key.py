@@ -0,0 +1,32 @@
+"""Idempotency key model for safely retried assessment submissions."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, String
+
+from app.db.base import Base, TimestampMixin
+
+
+class IdempotencyKey(Base, TimestampMixin):
+    """
+    Client-supplied Idempotency-Key and the response it produced.
+
+    Keys are scoped to the (anonymous) user that sent them. The primary key
+    makes claiming a key atomic: the first request inserts
+    an in_progress row, retries see the row and either wait for it or get the
+    stored response back once it is completed.
+
+    Status lifecycle: in_progress -> completed (row deleted if the request fails)
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    user_id = Column(String(100), primary_key=True)  # Anonymous UUID of the sender
+    key = Column(String(255), primary_key=True)
+    request_hash = Column(String(64), nullable=False)  # sha256 of user, phrase and audio
+    status = Column(String(20), default="in_progress", nullable=False)
+    response = Column(JSON, nullable=True)  # Stored response ({"job_id"} for /jobs) once completed
+    claimed_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"<IdempotencyKey(user_id={self.user_id}, key={self.key}, status={self.status})>"
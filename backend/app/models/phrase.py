@@ -24,6 +24,10 @@ class Phrase(Base):
     order = Column(Integer, default=0, nullable=False)  # Display order within dialog
     phonetic_transcription = Column(Text, nullable=True)  # IPA transcription (optional)
     difficulty = Column(String(50), default="Intermediate", nullable=False)
+    # Assessment profile for this phrase ("quick" or "full"); None uses the default
+    assessment_profile = Column(String(20), nullable=True)
+    # Incremented by the update endpoint; cached prepared phrases are per version
+    version = Column(Integer, nullable=False, default=1)
 
     # Relationships
     dialog = relationship("Dialog", back_populates="phrases")
@@ -0,0 +1,25 @@
+"""Cache model for pronunciation results keyed by audio content hash."""
+
+from sqlalchemy import JSON, Column, DateTime, String
+
+from app.db.base import Base, TimestampMixin
+
+
+class PronunciationResultCacheEntry(Base, TimestampMixin):
+    """
+    Stored pronunciation result for an exact (audio, reference text) pair.
+
+    Lets resubmissions of the same recording skip the speech backend across
+    processes and restarts. Rows past expires_at are ignored and evicted.
+    """
+
+    __tablename__ = "pronunciation_result_cache"
+
+    cache_key = Column(String(64), primary_key=True)  # sha256 of audio + reference text
+    result = Column(JSON, nullable=False)  # PronunciationResult.to_dict()
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<PronunciationResultCacheEntry(key={self.cache_key}, expires_at={self.expires_at})>"
+        )
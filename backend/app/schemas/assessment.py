@@ -5,17 +5,41 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from app.services.score_packing import unpack_words
+
 
 class AssessmentScores(BaseModel):
     """Scores from pronunciation assessment."""
 
     accuracy_score: float = Field(..., ge=0, le=100, description="Phoneme/word accuracy (0-100)")
-    prosody_score: float = Field(..., ge=0, le=5, description="Rhythm/intonation (0-5)")
+    prosody_score: float | None = Field(
+        ..., ge=0, le=5, description="Rhythm/intonation (0-5), null for quick assessments"
+    )
     fluency_score: float = Field(..., ge=0, le=100, description="Speaking pace (0-100)")
     completeness_score: float = Field(..., ge=0, le=100, description="% of reference text (0-100)")
     overall_score: float = Field(..., ge=0, le=100, description="Aggregated score (0-100)")
 
 
+class PhonemeDetail(BaseModel):
+    """Score and timing of one phoneme."""
+
+    phoneme: str
+    offset_ms: int
+    duration_ms: int
+    accuracy: float
+
+
+class WordDetail(BaseModel):
+    """Score and timing of one word, in speaking order."""
+
+    word: str
+    offset_ms: int
+    duration_ms: int
+    accuracy: float
+    error_type: str
+    phonemes: list[PhonemeDetail] = []
+
+
 class AssessmentCreate(BaseModel):
     """Schema for creating a new assessment (not used directly, multipart form used)."""
 
@@ -32,10 +56,35 @@ class AssessmentResponse(BaseModel):
     scores: AssessmentScores
     recognized_text: str | None = None
     word_level_scores: dict[str, Any] | None = None
+    words: list[WordDetail] | None = Field(
+        None, description="Every word in speaking order with timings and phonemes"
+    )
+    assessment_profile: str | None = Field(None, description="quick or full")
     created_at: datetime
 
     model_config = {"from_attributes": True}
 
+    @classmethod
+    def from_assessment(cls, assessment: Any) -> "AssessmentResponse":
+        """Build the response from an Assessment model instance."""
+        return cls(
+            id=assessment.id,
+            user_id=assessment.user_id,
+            phrase_id=assessment.phrase_id,
+            scores=AssessmentScores(
+                accuracy_score=assessment.accuracy_score,
+                prosody_score=assessment.prosody_score,
+                fluency_score=assessment.fluency_score,
+                completeness_score=assessment.completeness_score,
+                overall_score=assessment.overall_score,
+            ),
+            recognized_text=assessment.recognized_text,
+            word_level_scores=assessment.word_level_scores,
+            words=unpack_words(assessment.phoneme_level_scores),
+            assessment_profile=assessment.assessment_profile,
+            created_at=assessment.created_at,
+        )
+
 
 class AssessmentListItem(BaseModel):
     """Simplified assessment for list responses."""
@@ -45,8 +94,39 @@ class AssessmentListItem(BaseModel):
     phrase_text: str
     overall_score: float
     accuracy_score: float
-    prosody_score: float
+    prosody_score: float | None
     fluency_score: float
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class AssessmentJobResponse(BaseModel):
+    """Status of an asynchronous assessment job."""
+
+    job_id: str
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    phrase_id: int
+    attempts: int = 0
+    error: str | None = None
+    assessment: AssessmentResponse | None = None
+    created_at: datetime
+    updated_at: datetime | None = None
+
+
+class BatchAssessmentItem(BaseModel):
+    """Outcome of one recording in a batch assessment."""
+
+    index: int = Field(..., description="Position of the recording in the request")
+    phrase_id: int
+    status: str = Field(..., description="succeeded or failed")
+    assessment: AssessmentResponse | None = None
+    error: str | None = None
+
+
+class BatchAssessmentResponse(BaseModel):
+    """Response schema for a batch assessment (e.g. a whole dialog)."""
+
+    items: list[BatchAssessmentItem]
+    succeeded: int
+    failed: int
@@ -11,6 +11,7 @@ class PhraseCreate(BaseModel):
     order: int = Field(default=0, ge=0)
     phonetic_transcription: str | None = None
     difficulty: str = Field(default="Intermediate")
+    assessment_profile: str | None = Field(None, pattern="^(quick|full)$")
 
 
 class PhraseUpdate(BaseModel):
@@ -20,6 +21,7 @@ class PhraseUpdate(BaseModel):
     order: int | None = Field(None, ge=0)
     phonetic_transcription: str | None = None
     difficulty: str | None = None
+    assessment_profile: str | None = Field(None, pattern="^(quick|full)$")
 
 
 class PhraseResponse(BaseModel):
@@ -31,5 +33,6 @@ class PhraseResponse(BaseModel):
     order: int
     phonetic_transcription: str | None
     difficulty: str
+    assessment_profile: str | None = None
 
     model_config = {"from_attributes": True}
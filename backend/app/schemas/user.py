@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
 
 class UserBase(BaseModel):
@@ -34,6 +34,9 @@ class UserProgress(BaseModel):
 
     user_id: int
     total_assessments: int
+    quick_assessments: int = Field(
+        0, description="Quick-profile assessments, left out of the overall-score statistics"
+    )
     average_overall_score: float
     average_accuracy: float
     average_prosody: float
@@ -0,0 +1,306 @@
+"""
+Admission control for speech recognitions.
+Keeps the number of concurrent recognitions within the speech tier's limit
+across all worker processes, queueing briefly and rejecting when overloaded.
+"""
+
+import asyncio
+import logging
+import math
+import random
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Protocol
+
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core.config import settings
+from app.services.deadlines import time_left
+
+logger = logging.getLogger(__name__)
+
+# First key of the two-key advisory lock; the second key is the slot number
+ADVISORY_LOCK_NAMESPACE = 0x5052_4F4E  # "PRON"
+
+# How often waiters re-check shared slots released by other processes: the
+# interval starts short and doubles (with jitter) up to the maximum, since
+# each re-check probes every slot. Releases in this process wake waiters
+# immediately.
+SHARED_POLL_INTERVAL_SECONDS = 0.05
+SHARED_POLL_MAX_INTERVAL_SECONDS = 1.0
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a recognition can't be admitted (queue full or wait timed out)."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class SlotBackend(Protocol):
+    """Shared counter of recognition slots."""
+
+    shared: bool
+
+    async def try_acquire(self, timeout: float | None = None) -> Any | None:
+        """
+        Take a slot without queueing; returns a release token, or None if all are taken.
+
+        Backends that need a connection to probe wait at most timeout seconds
+        for it and report no slot when they can't get one in time.
+        """
+
+    async def release(self, token: Any) -> None:
+        """Give back a slot taken with try_acquire."""
+
+    async def close(self) -> None:
+        """Release the backend's connections."""
+
+
+class LocalSlots:
+    """In-process slots (fallback when there is no shared backend)."""
+
+    shared = False
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+
+    async def try_acquire(self, timeout: float | None = None) -> Any | None:
+        if self.in_use >= self.limit:
+            return None
+        self.in_use += 1
+        return True
+
+    async def release(self, token: Any) -> None:
+        self.in_use -= 1
+
+    async def close(self) -> None:
+        pass
+
+
+class AdvisoryLockSlots:
+    """
+    Slots shared by every process through Postgres session advisory locks.
+
+    Slot i is held by owning advisory lock (ADVISORY_LOCK_NAMESPACE, i) on a
+    dedicated connection; a crashed process releases its slots when its
+    connections drop. Only held slots keep their connections checked out:
+    the pool keeps one idle connection for probing and closes the rest
+    when they are returned.
+    """
+
+    shared = True
+
+    def __init__(self, limit: int, database_url: str | None = None):
+        self.limit = limit
+        self.database_url = database_url or settings.async_database_url
+        self._engine: AsyncEngine | None = None
+
+    async def try_acquire(self, timeout: float | None = None) -> Any | None:
+        try:
+            conn = await asyncio.wait_for(self._get_engine().connect(), timeout)
+        except (TimeoutError, exc.TimeoutError):
+            # Every connection is holding a slot or probing: treat as no free slot
+            return None
+        try:
+            # Random probe order keeps processes from contending on slot 0
+            for slot in random.sample(range(self.limit), self.limit):
+                locked = await conn.execute(
+                    text("SELECT pg_try_advisory_lock(:namespace, :slot)"),
+                    {"namespace": ADVISORY_LOCK_NAMESPACE, "slot": slot},
+                )
+                if locked.scalar():
+                    await conn.commit()  # Session lock outlives the transaction
+                    return conn, slot
+        except Exception:
+            await conn.invalidate()
+            raise
+        await conn.close()
+        return None
+
+    async def release(self, token: Any) -> None:
+        conn, slot = token
+        try:
+            await conn.execute(
+                text("SELECT pg_advisory_unlock(:namespace, :slot)"),
+                {"namespace": ADVISORY_LOCK_NAMESPACE, "slot": slot},
+            )
+            await conn.commit()
+            await conn.close()
+        except Exception as e:
+            # Dropping the connection releases the lock on the server
+            logger.warning(f"Could not unlock speech slot {slot}: {str(e)}")
+            await conn.invalidate()
+
+    async def close(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+    def _get_engine(self) -> AsyncEngine:
+        if self._engine is None:
+            # At most one connection per slot plus one for probing
+            self._engine = create_async_engine(
+                self.database_url, pool_size=1, max_overflow=self.limit, pool_pre_ping=True
+            )
+        return self._engine
+
+
+class AdmissionController:
+    """
+    Bounded-concurrency gate with a bounded wait queue.
+
+    Up to max_concurrent recognitions run at once (across processes when the
+    slot backend is shared). Up to max_queue callers per process wait for a
+    slot for at most queue_timeout seconds; beyond that they are rejected
+    immediately with AdmissionRejectedError so the API can answer 429.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int | None = None,
+        max_queue: int | None = None,
+        queue_timeout: float | None = None,
+        backend: SlotBackend | None = None,
+    ):
+        self.max_concurrent = max_concurrent or settings.SPEECH_MAX_CONCURRENT
+        self.max_queue = (
+            max_queue if max_queue is not None else settings.SPEECH_ADMISSION_QUEUE_SIZE
+        )
+        self.queue_timeout = (
+            queue_timeout
+            if queue_timeout is not None
+            else settings.SPEECH_ADMISSION_TIMEOUT_SECONDS
+        )
+        self.backend = backend or create_slot_backend(self.max_concurrent)
+
+        self._waiters: set[asyncio.Future] = set()
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Callers in this process currently waiting for a slot."""
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold a recognition slot for the duration of the block.
+
+        Raises:
+            AdmissionRejectedError: If the wait queue is full or the wait timed out
+        """
+        token = await self._acquire()
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            await self.backend.release(token)
+            self._wake_waiters()
+
+    async def close(self) -> None:
+        """Release the slot backend's connections."""
+        await self.backend.close()
+
+    def stats(self) -> dict:
+        """Queue depth, concurrency and wait-time metrics for monitoring."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "shared": self.backend.shared,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self._average_wait() * 1000, 1),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 1),
+        }
+
+    async def _acquire(self) -> Any:
+        # A full queue means no slot is free either: reject without probing
+        if self.max_queue and self.queue_depth >= self.max_queue:
+            self._reject("Speech service is at capacity. Please retry later.")
+
+        started = time.monotonic()
+        deadline = started + time_left(self.queue_timeout)  # Never past the request's deadline
+
+        token = await self.backend.try_acquire(timeout=max(deadline - started, 0.0))
+        if token is not None:
+            self._record_admission(time.monotonic() - started)
+            return token
+
+        if self.queue_depth >= self.max_queue:
+            self._reject("Speech service is at capacity. Please retry later.")
+
+        loop = asyncio.get_running_loop()
+        poll_interval = SHARED_POLL_INTERVAL_SECONDS
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._reject("Timed out waiting for speech service capacity.")
+
+            waiter = loop.create_future()
+            self._waiters.add(waiter)
+            try:
+                timeout = remaining
+                if self.backend.shared:
+                    timeout = min(remaining, poll_interval * random.uniform(0.5, 1.0))
+                    poll_interval = min(poll_interval * 2, SHARED_POLL_MAX_INTERVAL_SECONDS)
+                await asyncio.wait_for(waiter, timeout)
+            except TimeoutError:
+                pass
+            finally:
+                self._waiters.discard(waiter)
+
+            remaining = max(deadline - time.monotonic(), 0.0)
+            token = await self.backend.try_acquire(timeout=remaining)
+            if token is not None:
+                self._record_admission(time.monotonic() - started)
+                return token
+
+    def _wake_waiters(self) -> None:
+        for waiter in list(self._waiters):
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _record_admission(self, waited: float) -> None:
+        self.admitted += 1
+        self.total_wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def _reject(self, message: str) -> None:
+        self.rejected += 1
+        retry_after = math.ceil(max(self._average_wait(), 1.0))
+        logger.warning(f"Speech admission rejected ({self.queue_depth} waiting): {message}")
+        raise AdmissionRejectedError(message, retry_after=retry_after)
+
+    def _average_wait(self) -> float:
+        return self.total_wait_seconds / self.admitted if self.admitted else 0.0
+
+
+def create_slot_backend(limit: int) -> SlotBackend:
+    """
+    Pick the slot backend from SPEECH_ADMISSION_BACKEND.
+
+    "auto" shares slots through Postgres advisory locks when the database is
+    PostgreSQL and falls back to in-process slots otherwise.
+    """
+    backend = settings.SPEECH_ADMISSION_BACKEND
+    if backend == "auto":
+        backend = "postgres" if settings.async_database_url.startswith("postgresql") else "local"
+
+    if backend == "postgres":
+        return AdvisoryLockSlots(limit)
+    if backend == "local":
+        return LocalSlots(limit)
+    raise ValueError(f"Unknown SPEECH_ADMISSION_BACKEND: {settings.SPEECH_ADMISSION_BACKEND}")
@@ -0,0 +1,367 @@
+"""
+Asynchronous assessment jobs.
+Jobs are stored in the assessment_jobs table and processed by a bounded pool
+of in-process workers, so uploads are accepted at network speed while scoring
+runs at whatever rate the speech backend sustains.
+"""
+
+import asyncio
+import contextlib
+import logging
+from datetime import datetime, timedelta
+
+from cryptography.fernet import InvalidToken
+from sqlalchemy import ColumnElement, and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.assessment_job import AssessmentJob
+from app.models.phrase import Phrase
+from app.services.admission_control import AdmissionRejectedError
+from app.services.assessment_pipeline import AssessmentPipeline
+from app.services.assessment_store import build_assessment, get_or_create_user
+from app.services.audio_codec import AudioCodecError
+from app.services.audio_outbox_service import AudioSpool
+from app.services.audio_preflight import AudioPreflightError
+from app.services.blob_service import BlobStorageService
+from app.services.encryption_service import EncryptionService
+from app.services.phrase_cache import get_phrase_cache
+from app.services.speech_service import (
+    NoSpeechError,
+    SpeechAssessmentService,
+    resolve_assessment_profile,
+)
+from app.services.wav_audio import WavAudio, WavFormatError
+
+logger = logging.getLogger(__name__)
+
+
+class JobInputError(Exception):
+    """Raised when a job's phrase or spooled audio can't be used; retrying won't help."""
+
+
+# Failures that would repeat on every attempt (each a paid recognition): the
+# job fails on the first one instead of being retried
+PERMANENT_ERRORS = (
+    JobInputError,
+    NoSpeechError,
+    InvalidToken,
+    WavFormatError,
+    AudioCodecError,
+    AudioPreflightError,
+)
+
+
+class AssessmentJobWorker:
+    """
+    Pool of workers that claim and process queued assessment jobs.
+
+    Jobs are claimed with SELECT ... FOR UPDATE SKIP LOCKED plus a
+    conditional status update, so any number of API processes can share the
+    table. A running job whose worker died is reclaimed once its lease
+    (ASSESSMENT_JOB_LEASE_SECONDS) expires; live workers renew the lease
+    while they process a job. Failed attempts are retried with
+    exponential backoff, except PERMANENT_ERRORS, which fail the job at
+    once; a job turned away by speech admission control is
+    requeued for after its Retry-After without using up an attempt.
+
+    A worker only records the outcome of a job while it still holds the
+    claim (locked_at is the value it last wrote); a worker whose job was
+    reclaimed after its lease expired drops its result.
+    """
+
+    def __init__(
+        self,
+        concurrency: int | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        spool: AudioSpool | None = None,
+        speech_service: SpeechAssessmentService | None = None,
+        blob_service: BlobStorageService | None = None,
+        encryption_service: EncryptionService | None = None,
+    ):
+        self.concurrency = concurrency or settings.ASSESSMENT_JOB_WORKERS
+        self.session_factory = session_factory or AsyncSessionLocal
+        self.spool = spool or AudioSpool()
+        self.encryption_service = encryption_service or EncryptionService()
+        self.pipeline = AssessmentPipeline(
+            speech_service or SpeechAssessmentService(),
+            blob_service or BlobStorageService(),
+            self.encryption_service,
+        )
+        self.poll_interval = settings.ASSESSMENT_JOB_POLL_INTERVAL_SECONDS
+        self.max_attempts = settings.ASSESSMENT_JOB_MAX_ATTEMPTS
+        self.lease_seconds = settings.ASSESSMENT_JOB_LEASE_SECONDS
+        self.retry_backoff = settings.ASSESSMENT_JOB_RETRY_BACKOFF_SECONDS
+
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._listeners: dict[str, set[asyncio.Event]] = {}
+        # locked_at last written by this worker for each job it holds; the
+        # lock keeps a renewal from racing the claim check on the outcome
+        self._leases: dict[str, datetime] = {}
+        self._lease_lock = asyncio.Lock()
+
+    def start(self) -> None:
+        """Start the worker tasks."""
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._consume()) for _ in range(self.concurrency)]
+            logger.info(f"Assessment job worker pool started ({self.concurrency} workers)")
+
+    async def stop(self) -> None:
+        """Stop the worker tasks (claimed jobs are reclaimed after their lease)."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Assessment job worker pool stopped")
+
+    def notify(self) -> None:
+        """Wake idle workers because a new job was enqueued."""
+        self._wakeup.set()
+
+    async def wait_for_update(self, job_id: str, timeout: float) -> None:
+        """Wait until this process updates the job, or until timeout elapses."""
+        event = asyncio.Event()
+        self._listeners.setdefault(job_id, set()).add(event)
+        try:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(event.wait(), timeout)
+        finally:
+            listeners = self._listeners.get(job_id)
+            if listeners is not None:
+                listeners.discard(event)
+                if not listeners:
+                    del self._listeners[job_id]
+
+    async def run_once(self) -> bool:
+        """
+        Claim and process a single job.
+
+        Returns:
+            True if a job was processed, False if none was available
+        """
+        job_id = await self.claim_next()
+        if job_id is None:
+            return False
+        await self.process(job_id)
+        return True
+
+    async def claim_next(self) -> str | None:
+        """Atomically move the oldest available job to running and return its id."""
+        now = datetime.utcnow()
+        available = or_(
+            and_(
+                AssessmentJob.status == "queued",
+                or_(AssessmentJob.not_before.is_(None), AssessmentJob.not_before <= now),
+            ),
+            and_(
+                AssessmentJob.status == "running",
+                AssessmentJob.locked_at < now - timedelta(seconds=self.lease_seconds),
+            ),
+        )
+
+        async with self.session_factory() as db:
+            job_id = (
+                await db.execute(
+                    select(AssessmentJob.id)
+                    .where(available)
+                    .order_by(AssessmentJob.created_at)
+                    .limit(1)
+                    .with_for_update(skip_locked=True)
+                )
+            ).scalar()
+            if job_id is None:
+                return None
+
+            # Conditional update guards against a concurrent claim where
+            # SKIP LOCKED isn't available (e.g. SQLite)
+            claimed = await db.execute(
+                update(AssessmentJob)
+                .where(AssessmentJob.id == job_id, available)
+                .values(status="running", locked_at=now, attempts=AssessmentJob.attempts + 1)
+            )
+            await db.commit()
+
+        if claimed.rowcount != 1:
+            return None
+
+        self._leases[job_id] = now
+        self._publish(job_id)
+        return job_id
+
+    async def process(self, job_id: str) -> None:
+        """Run the assessment for a claimed job and record the outcome."""
+        renewal = asyncio.create_task(self._renew_lease(job_id))
+        try:
+            await self._process(job_id)
+        finally:
+            renewal.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await renewal
+            self._leases.pop(job_id, None)
+
+    def _holds(self, job_id: str) -> ColumnElement[bool]:
+        """Condition matching the job only while this worker still holds its claim."""
+        return and_(
+            AssessmentJob.id == job_id,
+            AssessmentJob.status == "running",
+            AssessmentJob.locked_at == self._leases.get(job_id),
+        )
+
+    async def _process(self, job_id: str) -> None:
+        async with self.session_factory() as db:
+            job = await db.get(AssessmentJob, job_id)
+            spool_path = job.audio_spool_path
+            blob_url = None
+
+            try:
+                phrase = await db.get(Phrase, job.phrase_id)
+                if phrase is None:
+                    raise JobInputError(f"Phrase with ID {job.phrase_id} not found")
+
+                audio_bytes = await self._read_audio(spool_path)
+
+                prepared = get_phrase_cache().refresh(phrase)
+                profile = resolve_assessment_profile(
+                    job.assessment_profile, prepared.assessment_profile
+                )
+                prepared_audio, trim = await self.pipeline.prepare_audio(audio_bytes)
+                result, blob_url = await self.pipeline.score_and_store(
+                    prepared_audio, prepared.reference_text, user_id=job.user_id, profile=profile
+                )
+
+                user = await get_or_create_user(db, job.user_id)
+                assessment = build_assessment(
+                    user,
+                    job.phrase_id,
+                    result,
+                    blob_url,
+                    job.audio_size,
+                    duration_seconds=_measured_duration(audio_bytes),
+                    trim=trim,
+                    profile=profile,
+                )
+                db.add(assessment)
+                await db.flush()
+
+                async with self._lease_lock:
+                    succeeded = await db.execute(
+                        update(AssessmentJob)
+                        .where(self._holds(job_id))
+                        .values(status="succeeded", assessment_id=assessment.id, error=None)
+                    )
+                    if succeeded.rowcount != 1:
+                        await db.rollback()
+                        if blob_url:
+                            await self.pipeline.discard_audio(blob_url)
+                        logger.warning(
+                            f"Assessment job {job_id} was reclaimed by another worker; "
+                            "dropping this result"
+                        )
+                        return
+                    await db.commit()
+
+            except Exception as e:
+                await db.rollback()
+                if blob_url:
+                    await self.pipeline.discard_audio(blob_url)
+                await self._record_failure(db, job_id, e)
+                return
+
+        self.spool.remove(spool_path)
+        logger.info(f"Assessment job {job_id} succeeded")
+        self._publish(job_id)
+
+    async def _read_audio(self, spool_path: str) -> bytes:
+        """
+        Read and decrypt the job's spooled audio.
+
+        Raises:
+            JobInputError: If the spool file is gone or can't be decrypted
+        """
+        try:
+            encrypted_audio = await self.spool.read(spool_path)
+        except FileNotFoundError as e:
+            raise JobInputError(f"Spooled audio is missing: {spool_path}") from e
+        try:
+            return await asyncio.to_thread(self.encryption_service.decrypt_audio, encrypted_audio)
+        except Exception as e:
+            raise JobInputError(f"Spooled audio can't be decrypted: {str(e)}") from e
+
+    async def _renew_lease(self, job_id: str) -> None:
+        """Keep moving locked_at forward so a long job isn't reclaimed by another worker."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                async with self._lease_lock, self.session_factory() as db:
+                    renewed_at = datetime.utcnow()
+                    renewed = await db.execute(
+                        update(AssessmentJob)
+                        .where(self._holds(job_id))
+                        .values(locked_at=renewed_at)
+                    )
+                    await db.commit()
+                    if renewed.rowcount != 1:
+                        logger.warning(f"Lost the lease of assessment job {job_id}")
+                        return
+                    self._leases[job_id] = renewed_at
+            except Exception as e:
+                logger.warning(f"Could not renew lease of assessment job {job_id}: {str(e)}")
+
+    async def _record_failure(self, db: AsyncSession, job_id: str, error: Exception) -> None:
+        """Requeue the job for a later attempt, or mark it failed."""
+        job = await db.get(AssessmentJob, job_id)
+        if job.status != "running" or job.locked_at != self._leases.get(job_id):
+            logger.warning(f"Assessment job {job_id} was reclaimed; not recording: {error}")
+            return
+        job.error = str(error)[:1000]
+        job.locked_at = None
+        now = datetime.utcnow()
+
+        if isinstance(error, AdmissionRejectedError):
+            # The speech backend was busy: not the job's fault, so not an attempt
+            job.attempts -= 1
+            job.status = "queued"
+            job.not_before = now + timedelta(seconds=error.retry_after)
+            logger.info(f"Assessment job {job_id} deferred {error.retry_after}s: {error}")
+        elif isinstance(error, PERMANENT_ERRORS) or job.attempts >= self.max_attempts:
+            job.status = "failed"
+            self.spool.remove(job.audio_spool_path)
+            logger.error(f"Assessment job {job_id} failed after {job.attempts} attempts: {error}")
+        else:
+            backoff = self.retry_backoff * 2 ** (job.attempts - 1)
+            job.status = "queued"
+            job.not_before = now + timedelta(seconds=backoff)
+            logger.warning(
+                f"Assessment job {job_id} attempt {job.attempts} failed, retrying in {backoff:.0f}s: {error}"
+            )
+
+        await db.commit()
+        self._publish(job_id)
+
+    async def _consume(self) -> None:
+        """Worker loop: process jobs until none are left, then wait for a wakeup."""
+        while True:
+            try:
+                if await self.run_once():
+                    continue
+            except Exception as e:
+                logger.error(f"Assessment job worker error: {str(e)}", exc_info=True)
+
+            self._wakeup.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+
+    def _publish(self, job_id: str) -> None:
+        """Wake anyone waiting on this job (e.g. WebSocket subscribers)."""
+        for event in self._listeners.get(job_id, ()):
+            event.set()
+
+
+def _measured_duration(audio_bytes: bytes) -> float | None:
+    """Duration from the WAV header, or None if it can't be parsed."""
+    try:
+        return WavAudio.parse(audio_bytes).duration_seconds
+    except WavFormatError:
+        return None
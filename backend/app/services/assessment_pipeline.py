@@ -0,0 +1,352 @@
+"""
+Assessment pipeline combining speech scoring with audio encryption and storage.
+Audio is first prepared (normalized to 16 kHz mono, silence trimmed); scoring
+and encrypt+upload are then independent, so they run concurrently.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from app.core.config import settings
+from app.services.audio_normalization import check_stream_format, normalize_audio
+from app.services.audio_outbox_service import AudioSpool
+from app.services.audio_preflight import StreamPreflight
+from app.services.blob_service import BlobStorageService
+from app.services.deadlines import get_cancellation_stats
+from app.services.encryption_service import EncryptionService
+from app.services.speech_service import (
+    STREAM_HEADER_PEEK_BYTES,
+    PronunciationResult,
+    SpeechAssessmentService,
+    peek_stream,
+)
+from app.services.voice_activity import SilenceTrim, trim_silence
+from app.services.wav_audio import WavAudio, WavFormatError
+
+logger = logging.getLogger(__name__)
+
+# Chunks buffered per branch before the body reader waits (bounds memory per request)
+STREAM_QUEUE_CHUNKS = 4
+
+
+class AudioTooLargeError(ValueError):
+    """Raised when a streamed upload exceeds the maximum allowed size."""
+
+
+class AssessmentPipeline:
+    """
+    Runs the scoring and storage branches of an assessment.
+
+    Latency is max(scoring, storage) instead of their sum. A failure in either
+    branch cancels the other and removes any blob that was already uploaded.
+    Cancelling the pipeline itself (deadline, client disconnect) does the
+    same, and records the recognition and storage work that was cut short.
+    """
+
+    def __init__(
+        self,
+        speech_service: SpeechAssessmentService,
+        blob_service: BlobStorageService,
+        encryption_service: EncryptionService,
+        normalize: bool | None = None,
+        trim_silence: bool | None = None,
+    ):
+        self.speech_service = speech_service
+        self.blob_service = blob_service
+        self.encryption_service = encryption_service
+        self.normalize = settings.AUDIO_NORMALIZE_ENABLED if normalize is None else normalize
+        self.trim_silence = (
+            settings.AUDIO_TRIM_SILENCE_ENABLED if trim_silence is None else trim_silence
+        )
+
+    async def score_and_store(
+        self,
+        audio_bytes: bytes,
+        reference_text: str,
+        user_id: str | None = None,
+        profile: str = "full",
+    ) -> tuple[PronunciationResult, str]:
+        """
+        Assess pronunciation and store the encrypted audio concurrently.
+
+        Args:
+            audio_bytes: Audio file content (WAV format, see prepare_audio)
+            reference_text: Expected text to be spoken
+            user_id: Optional user ID for organizing stored files
+            profile: Assessment profile ("quick" or "full")
+
+        Returns:
+            Tuple of (pronunciation result, blob URL)
+
+        Raises:
+            Exception: The error from whichever branch failed
+        """
+        scoring = asyncio.create_task(
+            self.speech_service.assess_pronunciation(audio_bytes, reference_text, profile)
+        )
+        storage = asyncio.create_task(self.encrypt_and_upload(audio_bytes, user_id))
+        await self._run_branches(scoring, storage, audio=audio_bytes)
+
+        return scoring.result(), storage.result()
+
+    async def score_and_store_stream(
+        self,
+        audio_chunks: AsyncIterator[bytes],
+        reference_text: str,
+        user_id: str | None = None,
+        max_bytes: int | None = None,
+        profile: str = "full",
+        preflight: StreamPreflight | None = None,
+    ) -> tuple[PronunciationResult, str, int]:
+        """
+        Assess and store audio while it is still being received.
+
+        Each incoming chunk is fanned out to the recognizer and to the
+        streaming encrypt+upload sink through small bounded queues, so memory
+        per request is bounded by the chunk size rather than the file size.
+        The audio must already be 16 kHz 16-bit mono PCM WAV (see
+        check_stream_format), checked from the header before either branch
+        starts. With a preflight, the header's declared length is checked
+        too and every chunk is measured on its way through; a recording that
+        fails the final checks is rejected before its end reaches the
+        branches, so nothing is scored or kept.
+
+        Args:
+            audio_chunks: Async iterator of audio chunks (e.g. the request body)
+            reference_text: Expected text to be spoken
+            user_id: Optional user ID for organizing stored files
+            max_bytes: Reject the upload once it grows beyond this many bytes
+            profile: Assessment profile ("quick" or "full")
+            preflight: Checks for the recording (its analysis is set once it passes)
+
+        Returns:
+            Tuple of (pronunciation result, blob URL, total audio bytes)
+
+        Raises:
+            AudioTooLargeError: If the stream exceeds max_bytes
+            AudioPreflightError: If the preflight rejects the recording
+            WavFormatError: If the audio isn't 16 kHz 16-bit mono PCM WAV
+            Exception: The error from whichever branch failed
+        """
+        header, audio_chunks = await peek_stream(audio_chunks, STREAM_HEADER_PEEK_BYTES)
+        check_stream_format(header)
+        if preflight is not None:
+            preflight.check_header(header)
+
+        speech_queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=STREAM_QUEUE_CHUNKS)
+        storage_queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=STREAM_QUEUE_CHUNKS)
+
+        reader = asyncio.create_task(
+            _fan_out(audio_chunks, (speech_queue, storage_queue), max_bytes, preflight)
+        )
+        scoring = asyncio.create_task(
+            self.speech_service.assess_pronunciation_stream(
+                _drain(speech_queue), reference_text, profile
+            )
+        )
+        storage = asyncio.create_task(
+            self.encrypt_and_upload_stream(_drain(storage_queue), user_id)
+        )
+        await self._run_branches(scoring, storage, reader)
+
+        return scoring.result(), storage.result(), reader.result()
+
+    async def prepare_audio(self, audio_bytes: bytes) -> tuple[bytes, SilenceTrim | None]:
+        """
+        Normalize audio to 16 kHz 16-bit mono and trim leading/trailing silence.
+
+        Runs off the event loop; each step is skipped when disabled. Call it
+        before score_and_store or score_and_spool so that what is scored is
+        also what is stored.
+
+        Returns:
+            Tuple of (prepared audio, kept region of the recording or None)
+        """
+        if not (self.normalize or self.trim_silence):
+            return audio_bytes, None
+        return await asyncio.to_thread(self._prepare_audio, audio_bytes)
+
+    def _prepare_audio(self, audio_bytes: bytes) -> tuple[bytes, SilenceTrim | None]:
+        if self.normalize:
+            audio_bytes = normalize_audio(audio_bytes)
+        if self.trim_silence:
+            return trim_silence(audio_bytes)
+        return audio_bytes, None
+
+    async def encrypt_and_upload(self, audio_bytes: bytes, user_id: str | None = None) -> str:
+        """
+        Encrypt audio off the event loop and upload it to blob storage.
+
+        Returns:
+            URL or path to the stored file
+        """
+        logger.info("Encrypting audio...")
+        encrypted_audio = await asyncio.to_thread(
+            self.encryption_service.encrypt_audio, audio_bytes
+        )
+
+        logger.info("Uploading to blob storage...")
+        return await self.blob_service.upload_audio(
+            encrypted_audio, file_extension="wav", user_id=user_id
+        )
+
+    async def score_and_spool(
+        self, audio_bytes: bytes, reference_text: str, spool: AudioSpool, profile: str = "full"
+    ) -> tuple[PronunciationResult, str]:
+        """
+        Assess pronunciation while encrypting the audio into the local spool.
+
+        Used by deferred upload mode: the blob upload happens later, from the
+        outbox, so only scoring and a local disk write are on the request path.
+
+        Returns:
+            Tuple of (pronunciation result, spool file path)
+        """
+        scoring = asyncio.create_task(
+            self.speech_service.assess_pronunciation(audio_bytes, reference_text, profile)
+        )
+        storage = asyncio.create_task(self.encrypt_and_spool(audio_bytes, spool))
+
+        async def discard_spooled(spool_path: str) -> None:
+            spool.remove(spool_path)
+
+        await self._run_branches(scoring, storage, discard=discard_spooled, audio=audio_bytes)
+
+        return scoring.result(), storage.result()
+
+    async def encrypt_and_spool(self, audio_bytes: bytes, spool: AudioSpool) -> str:
+        """
+        Encrypt audio off the event loop and write it to the spool.
+
+        Returns:
+            Path of the spooled file
+        """
+        encrypted_audio = await asyncio.to_thread(
+            self.encryption_service.encrypt_audio, audio_bytes
+        )
+        return await spool.write(encrypted_audio)
+
+    async def encrypt_and_upload_stream(
+        self, audio_chunks: AsyncIterator[bytes], user_id: str | None = None
+    ) -> str:
+        """
+        Encrypt and upload audio chunk by chunk.
+
+        Returns:
+            URL or path to the stored file
+        """
+        encrypted_chunks = self.encryption_service.encrypt_audio_stream(audio_chunks)
+        return await self.blob_service.upload_audio_stream(
+            encrypted_chunks, file_extension="wav", user_id=user_id
+        )
+
+    async def discard_audio(self, blob_url: str) -> None:
+        """Delete an uploaded blob that no assessment row will reference."""
+        try:
+            await self.blob_service.delete_audio(blob_url)
+            logger.info(f"Removed orphaned audio blob: {blob_url}")
+        except Exception as e:
+            logger.warning(f"Could not remove orphaned audio blob {blob_url}: {str(e)}")
+
+    async def _run_branches(
+        self,
+        scoring: asyncio.Task,
+        storage: asyncio.Task,
+        *others: asyncio.Task,
+        discard: Callable[[str], Awaitable[None]] | None = None,
+        audio: bytes | None = None,
+    ) -> None:
+        """
+        Wait for all branches; on the first failure cancel the rest and clean up.
+
+        Errors from the extra tasks (e.g. the body reader) take precedence,
+        since a broken input stream is usually what made a branch fail.
+        discard removes whatever the storage branch produced (default: blob).
+        audio (when known) sizes the recognition saved by a cancellation.
+        """
+        tasks = (*others, scoring, storage)
+        discard = discard or self.discard_audio
+
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        except asyncio.CancelledError:
+            get_cancellation_stats().record_abandoned_work(
+                recognition=not scoring.done(),
+                storage=not storage.done(),
+                audio_seconds=_audio_seconds(audio),
+            )
+            await self._cancel_and_cleanup(tasks, storage, discard)
+            raise
+
+        failed = [t for t in tasks if t.done() and not t.cancelled() and t.exception() is not None]
+        if failed:
+            if failed[0] in others:
+                # The input broke (e.g. client disconnect): the branches' work is abandoned
+                get_cancellation_stats().record_abandoned_work(
+                    recognition=not scoring.done(), storage=not storage.done()
+                )
+            await self._cancel_and_cleanup(tasks, storage, discard)
+            raise failed[0].exception()
+
+    async def _cancel_and_cleanup(
+        self,
+        tasks: tuple[asyncio.Task, ...],
+        storage: asyncio.Task,
+        discard: Callable[[str], Awaitable[None]],
+    ) -> None:
+        """Cancel unfinished branches and discard stored audio if storage already succeeded."""
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if not storage.cancelled() and storage.exception() is None:
+            await discard(storage.result())
+
+
+def _audio_seconds(audio_bytes: bytes | None) -> float:
+    """Duration of a WAV recording, or 0 when unknown."""
+    if audio_bytes is None:
+        return 0.0
+    try:
+        return WavAudio.parse(audio_bytes).duration_seconds
+    except WavFormatError:
+        return 0.0
+
+
+async def _fan_out(
+    audio_chunks: AsyncIterator[bytes],
+    queues: tuple[asyncio.Queue, ...],
+    max_bytes: int | None,
+    preflight: StreamPreflight | None = None,
+) -> int:
+    """
+    Copy each chunk into every queue, enforcing the size limit as bytes arrive.
+
+    The preflight (if any) measures each chunk and runs its final checks
+    before the end-of-stream marker is sent.
+    """
+    total = 0
+    async for chunk in audio_chunks:
+        if not chunk:
+            continue
+        total += len(chunk)
+        if max_bytes is not None and total > max_bytes:
+            raise AudioTooLargeError(f"Audio exceeds maximum size of {max_bytes} bytes")
+        if preflight is not None:
+            preflight.feed(chunk)
+        for queue in queues:
+            await queue.put(chunk)
+
+    if preflight is not None:
+        preflight.finish()
+    for queue in queues:
+        await queue.put(None)
+    return total
+
+
+async def _drain(queue: asyncio.Queue) -> AsyncIterator[bytes]:
+    """Yield chunks from a queue until the end-of-stream marker."""
+    while (chunk := await queue.get()) is not None:
+        yield chunk
@@ -0,0 +1,71 @@
+"""
+Persistence helpers shared by the assessment endpoints and background workers.
+"""
+
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.assessment import Assessment
+from app.models.user import User
+from app.services.speech_service import PronunciationResult
+from app.services.voice_activity import SilenceTrim
+
+logger = logging.getLogger(__name__)
+
+
+async def get_or_create_user(db: AsyncSession, user_id: str) -> User:
+    """Get a user by anonymous UUID, creating it (flushed, not committed) if missing."""
+    user = (await db.execute(select(User).where(User.user_id == user_id))).scalars().first()
+    if not user:
+        logger.info(f"Creating new user: {user_id}")
+        user = User(user_id=user_id)
+        db.add(user)
+        await db.flush()  # Get user.id without committing
+    return user
+
+
+def build_assessment(
+    user: User,
+    phrase_id: int,
+    result: PronunciationResult,
+    blob_url: str | None,
+    audio_size: int,
+    duration_seconds: float | None = None,
+    trim: SilenceTrim | None = None,
+    profile: str | None = None,
+) -> Assessment:
+    """
+    Create (but don't add) an Assessment row from a pronunciation result.
+
+    duration_seconds is the measured duration from the audio preflight;
+    without it the duration is estimated from the file size. trim is the
+    region of the recording that was scored, if silence trimming ran.
+    profile is the assessment profile the result was scored with.
+    """
+    prosody = f"{result.prosody_score:.1f}" if result.prosody_score is not None else "n/a"
+    logger.info(
+        f"Assessment complete ({profile or 'full'}): accuracy={result.accuracy_score:.1f}, "
+        f"prosody={prosody}, overall={result.overall_score:.1f}"
+    )
+
+    return Assessment(
+        user_id=user.id,
+        phrase_id=phrase_id,
+        accuracy_score=result.accuracy_score,
+        prosody_score=result.prosody_score,
+        fluency_score=result.fluency_score,
+        completeness_score=result.completeness_score,
+        overall_score=result.overall_score,
+        recognized_text=result.recognized_text,
+        word_level_scores=result.word_level_scores,
+        phoneme_level_scores=result.packed_scores,
+        audio_blob_url=blob_url,
+        assessment_duration_seconds=(
+            duration_seconds if duration_seconds is not None else audio_size / 16000
+        ),
+        trim_start_seconds=trim.start_seconds if trim else None,
+        trim_end_seconds=trim.end_seconds if trim else None,
+        assessment_profile=profile,
+    )
@@ -0,0 +1,120 @@
+"""
+Compact lossless at-rest encoding for stored recordings.
+
+Audio is wrapped in a small versioned container before encryption. 16-bit PCM
+WAV files are delta coded per channel, split into low/high byte planes and
+deflated (zlib), which roughly halves speech recordings; anything else is
+stored verbatim. Decoding restores the original file byte for byte.
+
+Container layout (little-endian):
+    magic (6) | version (1) | mode (1) | mode-specific body
+    MODE_STORED: the original bytes
+    MODE_PCM16_DELTA: channels (2) | prefix length (4) | PCM length (4) |
+        compressed length (4) | prefix | compressed PCM | suffix
+where prefix/suffix are the file bytes before/after the whole PCM frames.
+"""
+
+import struct
+import zlib
+
+import numpy as np
+
+from app.services.wav_audio import WavAudio, WavFormatError
+
+CODEC_MAGIC = b"PRNPCM"
+CODEC_VERSION = 1
+
+MODE_STORED = 0
+MODE_PCM16_DELTA = 1
+
+# Level 6 is within a few percent of level 9 on speech at several times the speed
+COMPRESSION_LEVEL = 6
+
+_HEADER = struct.Struct("<6sBB")
+_PCM16_HEADER = struct.Struct("<HIII")
+
+
+class AudioCodecError(ValueError):
+    """Raised when a stored container can't be decoded."""
+
+
+def encode_audio(audio_bytes: bytes) -> bytes:
+    """
+    Encode a recording into the compact container.
+
+    Args:
+        audio_bytes: Audio file content (any format; 16-bit PCM WAV is compressed)
+
+    Returns:
+        Container bytes, decodable with decode_audio
+    """
+    try:
+        wav = WavAudio.parse(audio_bytes)
+    except WavFormatError:
+        wav = None
+
+    if wav is None or wav.bits_per_sample != 16 or wav.num_frames == 0:
+        return _HEADER.pack(CODEC_MAGIC, CODEC_VERSION, MODE_STORED) + audio_bytes
+
+    pcm_length = wav.num_frames * wav.block_align
+    prefix = audio_bytes[: wav.data_offset]
+    suffix = audio_bytes[wav.data_offset + pcm_length :]
+
+    samples = np.frombuffer(wav.pcm_data[:pcm_length], dtype="<i2").reshape(-1, wav.channels)
+    # int16 arithmetic wraps, so the cumulative sum in decode restores samples exactly
+    deltas = np.diff(samples, axis=0, prepend=np.zeros((1, wav.channels), dtype="<i2"))
+    planes = deltas.astype("<i2").view(np.uint8).reshape(-1, 2).T.tobytes()
+    compressed = zlib.compress(planes, COMPRESSION_LEVEL)
+
+    return b"".join(
+        (
+            _HEADER.pack(CODEC_MAGIC, CODEC_VERSION, MODE_PCM16_DELTA),
+            _PCM16_HEADER.pack(wav.channels, len(prefix), pcm_length, len(compressed)),
+            prefix,
+            compressed,
+            suffix,
+        )
+    )
+
+
+def decode_audio(data: bytes) -> bytes:
+    """
+    Restore the original recording from a container.
+
+    Data without the container magic (recordings stored before the compact
+    format existed) is returned unchanged.
+
+    Raises:
+        AudioCodecError: If the container is corrupt or from a newer version
+    """
+    if not data.startswith(CODEC_MAGIC):
+        return data
+    if len(data) < _HEADER.size:
+        raise AudioCodecError("Audio container header is truncated")
+
+    _, version, mode = _HEADER.unpack_from(data)
+    if version != CODEC_VERSION:
+        raise AudioCodecError(f"Unsupported audio container version {version}")
+
+    body = data[_HEADER.size :]
+    if mode == MODE_STORED:
+        return body
+    if mode != MODE_PCM16_DELTA:
+        raise AudioCodecError(f"Unknown audio container mode {mode}")
+
+    try:
+        channels, prefix_length, pcm_length, compressed_length = _PCM16_HEADER.unpack_from(body)
+        offset = _PCM16_HEADER.size
+        prefix = body[offset : offset + prefix_length]
+        offset += prefix_length
+        planes = zlib.decompress(body[offset : offset + compressed_length])
+        suffix = body[offset + compressed_length :]
+    except (struct.error, zlib.error) as e:
+        raise AudioCodecError(f"Audio container is corrupt: {str(e)}") from e
+
+    if len(planes) != pcm_length or pcm_length % (2 * max(channels, 1)):
+        raise AudioCodecError("Audio container PCM length doesn't match its header")
+
+    deltas = np.frombuffer(planes, dtype=np.uint8).reshape(2, -1).T.copy().view("<i2")
+    samples = np.cumsum(deltas.reshape(-1, channels), axis=0, dtype="<i2")
+    return prefix + samples.tobytes() + suffix
@@ -0,0 +1,101 @@
+"""
+Audio normalization to the format the speech recognizer works with.
+Downmixes to mono and resamples to 16 kHz 16-bit PCM before scoring and
+storage, so 44.1/48 kHz stereo uploads aren't sent or stored at 3-6x the size.
+"""
+
+import logging
+
+import numpy as np
+
+from app.services.wav_audio import (
+    UnsupportedWavFormatError,
+    WavAudio,
+    WavFormatError,
+    encode_wav,
+    read_format_tag,
+    read_wav_chunks,
+)
+from app.services.wav_decoders import COMPACT_ENCODINGS
+
+logger = logging.getLogger(__name__)
+
+# Azure pronunciation assessment operates on 16 kHz mono audio
+TARGET_SAMPLE_RATE = 16000
+
+
+def resample(samples: np.ndarray, from_rate: int, to_rate: int) -> np.ndarray:
+    """
+    Resample mono samples by truncating or zero-padding their spectrum.
+
+    Downsampling drops everything above the new Nyquist frequency, which is
+    the anti-aliasing filter.
+    """
+    if from_rate == to_rate or len(samples) == 0:
+        return samples
+
+    num_out = max(1, round(len(samples) * to_rate / from_rate))
+    spectrum = np.fft.rfft(samples)
+    kept = spectrum[: num_out // 2 + 1]
+    return (np.fft.irfft(kept, num_out) * (num_out / len(samples))).astype(np.float32)
+
+
+def normalize_audio(audio_bytes: bytes) -> bytes:
+    """
+    Convert a WAV recording to 16 kHz 16-bit mono PCM.
+
+    Audio already in that format, and audio that isn't a readable PCM WAV
+    file, is returned unchanged.
+
+    Args:
+        audio_bytes: Audio file content (WAV format)
+
+    Returns:
+        WAV file bytes at 16 kHz 16-bit mono
+    """
+    try:
+        wav = WavAudio.parse(audio_bytes)
+    except WavFormatError:
+        return audio_bytes
+
+    if wav.sample_rate == TARGET_SAMPLE_RATE and wav.channels == 1 and wav.bits_per_sample == 16:
+        return audio_bytes
+
+    samples = resample(wav.mono(), wav.sample_rate, TARGET_SAMPLE_RATE)
+    normalized = encode_wav(samples, TARGET_SAMPLE_RATE)
+
+    logger.info(
+        f"Normalized audio {wav.sample_rate}Hz/{wav.channels}ch/{wav.bits_per_sample}bit "
+        f"to {TARGET_SAMPLE_RATE}Hz mono: {len(audio_bytes)} -> {len(normalized)} bytes"
+    )
+    return normalized
+
+
+def check_stream_format(header: bytes) -> None:
+    """
+    Require a streamed upload to be 16 kHz 16-bit mono PCM WAV already.
+
+    Streamed audio is pushed to the recognizer as it arrives, so unlike a
+    buffered upload it can't be normalized (or decoded from a compact
+    encoding) first.
+
+    Args:
+        header: Start of the stream (at least the bytes up to the data chunk)
+
+    Raises:
+        WavFormatError: If the stream doesn't start with a WAV header
+        UnsupportedWavFormatError: If it declares any other format
+    """
+    encoding = COMPACT_ENCODINGS.get(read_format_tag(read_wav_chunks(header)[0]))
+    if encoding:
+        raise UnsupportedWavFormatError(
+            f"{encoding} audio can't be streamed; upload it to /assessments/assess"
+        )
+
+    wav = WavAudio.parse(header)
+    if (wav.sample_rate, wav.channels, wav.bits_per_sample) != (TARGET_SAMPLE_RATE, 1, 16):
+        raise UnsupportedWavFormatError(
+            f"Streamed audio must be {TARGET_SAMPLE_RATE}Hz 16-bit mono PCM WAV "
+            f"(got {wav.sample_rate}Hz, {wav.channels}ch, {wav.bits_per_sample}-bit); "
+            "upload other formats to /assessments/assess"
+        )
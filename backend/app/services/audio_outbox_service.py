@@ -0,0 +1,282 @@
+"""
+Deferred audio upload via a transactional outbox.
+Encrypted audio is spooled to disk, and a background worker drains pending
+outbox rows into blob storage with retries.
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.assessment import Assessment
+from app.models.audio_outbox import AudioUploadOutbox
+from app.models.user import User
+from app.services.blob_service import BlobStorageService
+
+logger = logging.getLogger(__name__)
+
+# Retry backoff: 2, 4, 8, ... seconds, capped at 5 minutes
+MAX_BACKOFF_SECONDS = 300
+
+
+class AudioSpool:
+    """Local spool for encrypted audio awaiting upload."""
+
+    def __init__(self, spool_dir: str | None = None):
+        self.spool_dir = Path(spool_dir or settings.AUDIO_SPOOL_DIR)
+
+    async def write(self, encrypted_audio: bytes) -> str:
+        """Write encrypted audio to a new spool file and return its path."""
+        path = self.spool_dir / f"{uuid.uuid4()}.bin"
+        await asyncio.to_thread(self._write, path, encrypted_audio)
+        logger.info(f"Spooled {len(encrypted_audio)} bytes to {path}")
+        return str(path)
+
+    async def read(self, spool_path: str) -> bytes:
+        """Read spooled encrypted audio."""
+        return await asyncio.to_thread(Path(spool_path).read_bytes)
+
+    def remove(self, spool_path: str) -> None:
+        """Delete a spool file (missing files are ignored)."""
+        Path(spool_path).unlink(missing_ok=True)
+
+    def _write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+
+class AudioOutboxWorker:
+    """
+    Background worker that uploads spooled audio for pending outbox rows.
+
+    Rows are claimed with SELECT ... FOR UPDATE SKIP LOCKED plus a
+    conditional status update, and the claim is committed before any upload,
+    so several API workers can drain the same outbox without uploading a
+    recording twice or holding row locks and a transaction across uploads.
+    Rows claimed by a worker that died are reclaimed after
+    OUTBOX_LEASE_SECONDS. Failed uploads are retried with exponential backoff
+    until OUTBOX_MAX_ATTEMPTS, after which the row is marked as failed. A row
+    whose spooled audio is gone can never be uploaded and is marked
+    missing_audio right away.
+    """
+
+    def __init__(
+        self,
+        blob_service: BlobStorageService | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        spool: AudioSpool | None = None,
+    ):
+        self.blob_service = blob_service or BlobStorageService()
+        self.session_factory = session_factory or AsyncSessionLocal
+        self.spool = spool or AudioSpool()
+        self.poll_interval = settings.OUTBOX_POLL_INTERVAL_SECONDS
+        self.batch_size = settings.OUTBOX_BATCH_SIZE
+        self.max_attempts = settings.OUTBOX_MAX_ATTEMPTS
+        self.lease_seconds = settings.OUTBOX_LEASE_SECONDS
+        self._task: asyncio.Task | None = None
+
+        self.uploaded = 0
+        self.rescheduled = 0
+        self.failed = 0
+        self.missing_audio = 0
+        self.rows: dict[str, int] = {}
+
+    def start(self) -> None:
+        """Start draining the outbox in a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+            logger.info("Audio outbox worker started")
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+            logger.info("Audio outbox worker stopped")
+
+    async def run(self) -> None:
+        """Drain the outbox forever, sleeping when there is nothing to do."""
+        while True:
+            try:
+                processed = await self.drain_once()
+            except Exception as e:
+                logger.error(f"Audio outbox drain failed: {str(e)}", exc_info=True)
+                processed = 0
+
+            if processed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def drain_once(self) -> int:
+        """
+        Process one batch of due outbox rows.
+
+        Returns:
+            Number of rows processed (uploaded or rescheduled)
+        """
+        claimed = await self._claim()
+        for entry, user_uuid in claimed:
+            await self._deliver(entry, user_uuid)
+        await self._count_rows()
+        return len(claimed)
+
+    def stats(self) -> dict:
+        """Upload outcomes in this process, and outbox rows by status as of the last drain."""
+        return {
+            "uploaded": self.uploaded,
+            "rescheduled": self.rescheduled,
+            "failed": self.failed,
+            "missing_audio": self.missing_audio,
+            "rows": {
+                status: self.rows.get(status, 0)
+                for status in ("pending", "uploading", "failed", "missing_audio")
+            },
+        }
+
+    async def _count_rows(self) -> None:
+        async with self.session_factory() as db:
+            counts = await db.execute(
+                select(AudioUploadOutbox.status, func.count()).group_by(AudioUploadOutbox.status)
+            )
+            self.rows = dict(counts.all())
+
+    async def _claim(self) -> list[tuple[AudioUploadOutbox, str | None]]:
+        """
+        Mark a batch of due rows as uploading and commit.
+
+        Returns:
+            The claimed rows, each with its user's UUID (for the blob path)
+        """
+        now = datetime.utcnow()
+        due = or_(
+            and_(
+                AudioUploadOutbox.status == "pending",
+                AudioUploadOutbox.next_attempt_at <= now,
+            ),
+            and_(
+                AudioUploadOutbox.status == "uploading",
+                AudioUploadOutbox.locked_at < now - timedelta(seconds=self.lease_seconds),
+            ),
+        )
+
+        async with self.session_factory() as db:
+            ids = (
+                (
+                    await db.execute(
+                        select(AudioUploadOutbox.id)
+                        .where(due)
+                        .order_by(AudioUploadOutbox.id)
+                        .limit(self.batch_size)
+                        .with_for_update(skip_locked=True)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            if not ids:
+                return []
+
+            # Conditional update guards against a concurrent claim where
+            # SKIP LOCKED isn't available (e.g. SQLite)
+            await db.execute(
+                update(AudioUploadOutbox)
+                .where(AudioUploadOutbox.id.in_(ids), due)
+                .values(status="uploading", locked_at=now)
+            )
+            await db.commit()
+
+            claimed = await db.execute(
+                select(AudioUploadOutbox, User.user_id)
+                .outerjoin(Assessment, Assessment.id == AudioUploadOutbox.assessment_id)
+                .outerjoin(User, User.id == Assessment.user_id)
+                .where(
+                    AudioUploadOutbox.id.in_(ids),
+                    AudioUploadOutbox.status == "uploading",
+                    AudioUploadOutbox.locked_at == now,
+                )
+                .order_by(AudioUploadOutbox.id)
+            )
+            return [(entry, user_uuid) for entry, user_uuid in claimed.all()]
+
+    async def _deliver(self, entry: AudioUploadOutbox, user_uuid: str | None) -> None:
+        """Upload one claimed recording, then record the blob URL or the failure."""
+        try:
+            encrypted_audio = await self.spool.read(entry.spool_path)
+            blob_url = await self.blob_service.upload_audio(
+                encrypted_audio, file_extension="wav", user_id=user_uuid
+            )
+        except Exception as e:
+            async with self.session_factory() as db:
+                current = await db.get(AudioUploadOutbox, entry.id)
+                if current is not None and current.locked_at == entry.locked_at:
+                    self._reschedule(current, e)
+                    await db.commit()
+            return
+
+        async with self.session_factory() as db:
+            # Only if our claim still stands (not reclaimed after the lease)
+            released = await db.execute(
+                delete(AudioUploadOutbox).where(
+                    AudioUploadOutbox.id == entry.id,
+                    AudioUploadOutbox.locked_at == entry.locked_at,
+                )
+            )
+            if released.rowcount != 1:
+                await db.rollback()
+                await self.blob_service.delete_audio(blob_url)
+                logger.warning(f"Outbox: claim on assessment {entry.assessment_id} was lost")
+                return
+
+            await db.execute(
+                update(Assessment)
+                .where(Assessment.id == entry.assessment_id)
+                .values(audio_blob_url=blob_url)
+            )
+            await db.commit()
+
+        # Only drop spooled audio once the blob URL is durably recorded
+        self.spool.remove(entry.spool_path)
+        self.uploaded += 1
+        logger.info(f"Outbox: uploaded audio for assessment {entry.assessment_id}")
+
+    def _reschedule(self, entry: AudioUploadOutbox, error: Exception) -> None:
+        """Record a failed attempt and schedule a retry (or give up)."""
+        entry.attempts += 1
+        entry.last_error = str(error)[:1000]
+        entry.locked_at = None
+
+        if isinstance(error, FileNotFoundError):
+            # Retrying can't bring the recording back; the assessment keeps no audio
+            entry.status = "missing_audio"
+            self.missing_audio += 1
+            logger.error(
+                f"Outbox: spooled audio for assessment {entry.assessment_id} is missing "
+                f"({entry.spool_path}); its recording can't be uploaded"
+            )
+            return
+
+        if entry.attempts >= self.max_attempts:
+            entry.status = "failed"
+            self.failed += 1
+            logger.error(
+                f"Outbox: giving up on assessment {entry.assessment_id} "
+                f"after {entry.attempts} attempts: {str(error)}"
+            )
+            return
+
+        backoff = min(2**entry.attempts, MAX_BACKOFF_SECONDS)
+        entry.status = "pending"
+        self.rescheduled += 1
+        entry.next_attempt_at = datetime.utcnow() + timedelta(seconds=backoff)
+        logger.warning(
+            f"Outbox: upload for assessment {entry.assessment_id} failed "
+            f"(attempt {entry.attempts}), retrying in {backoff}s: {str(error)}"
+        )
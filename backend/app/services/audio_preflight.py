@@ -0,0 +1,278 @@
+"""
+Audio preflight checks run before any speech or storage work.
+Rejects recordings that can't produce a useful assessment (not PCM WAV,
+truncated, too short, silent, clipped, no speech) and measures the real
+duration of the ones that pass. Streamed uploads are checked by
+StreamPreflight as they arrive.
+"""
+
+import logging
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.wav_audio import WavAudio, WavFormatError, declared_data_size
+
+logger = logging.getLogger(__name__)
+
+# Analysis frame for level and speech detection
+FRAME_SECONDS = 0.02
+
+# Samples at or above this magnitude count as clipped
+CLIPPING_LEVEL = 0.999
+
+# Floor for dBFS conversion (digital silence)
+MIN_DBFS = -120.0
+
+
+class AudioPreflightError(ValueError):
+    """Raised when a recording is rejected by the preflight checks."""
+
+    def __init__(self, message: str, status_code: int = 422):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class AudioAnalysis:
+    """Measurements of a recording taken by the preflight stage."""
+
+    def __init__(
+        self,
+        sample_rate: int,
+        channels: int,
+        bits_per_sample: int,
+        duration_seconds: float,
+        rms_dbfs: float,
+        clipping_ratio: float,
+        speech_ratio: float,
+    ):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.bits_per_sample = bits_per_sample
+        self.duration_seconds = duration_seconds
+        self.rms_dbfs = rms_dbfs  # Overall level, dB relative to full scale
+        self.clipping_ratio = clipping_ratio  # Fraction of samples at full scale
+        self.speech_ratio = speech_ratio  # Fraction of frames above the speech threshold
+
+
+def to_dbfs(rms: np.ndarray | float) -> np.ndarray | float:
+    """Convert an RMS level in [0, 1] to dBFS."""
+    return np.maximum(20 * np.log10(np.maximum(rms, 1e-12)), MIN_DBFS)
+
+
+def frame_levels_dbfs(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """RMS level of each FRAME_SECONDS frame of mono samples, in dBFS."""
+    frame_length = min(max(1, int(sample_rate * FRAME_SECONDS)), max(1, len(samples)))
+    num_frames = len(samples) // frame_length
+    frames = samples[: num_frames * frame_length].reshape(num_frames, frame_length)
+    return to_dbfs(np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1)))
+
+
+def analyze_audio(wav: WavAudio) -> AudioAnalysis:
+    """Measure duration, level, clipping and speech fraction of a parsed WAV file."""
+    samples = wav.samples()
+    mono = wav.mono(samples)
+
+    if samples.size:
+        rms_dbfs = float(to_dbfs(np.sqrt(np.mean(np.square(mono, dtype=np.float64)))))
+        clipping_ratio = float(np.count_nonzero(np.abs(samples) >= CLIPPING_LEVEL) / samples.size)
+        levels = frame_levels_dbfs(mono, wav.sample_rate)
+        speech_ratio = float(np.mean(levels > settings.AUDIO_SPEECH_THRESHOLD_DBFS))
+    else:
+        rms_dbfs, clipping_ratio, speech_ratio = MIN_DBFS, 0.0, 0.0
+
+    return AudioAnalysis(
+        sample_rate=wav.sample_rate,
+        channels=wav.channels,
+        bits_per_sample=wav.bits_per_sample,
+        duration_seconds=wav.duration_seconds,
+        rms_dbfs=rms_dbfs,
+        clipping_ratio=clipping_ratio,
+        speech_ratio=speech_ratio,
+    )
+
+
+def preflight_audio(audio_bytes: bytes) -> AudioAnalysis:
+    """
+    Validate a recording before it is scored or stored.
+
+    Args:
+        audio_bytes: Audio file content (WAV format)
+
+    Returns:
+        AudioAnalysis with the measured duration and levels
+
+    Raises:
+        AudioPreflightError: If the recording is unusable (status_code 415 for
+            non-WAV/non-PCM audio, 422 for unusable content)
+    """
+    try:
+        wav = WavAudio.parse(audio_bytes)
+    except WavFormatError as e:
+        raise AudioPreflightError(str(e), status_code=415)
+
+    if wav.truncated:
+        raise AudioPreflightError("Audio file is truncated (incomplete upload?)")
+
+    analysis = analyze_audio(wav)
+    check_analysis(analysis)
+    return analysis
+
+
+def check_analysis(analysis: AudioAnalysis) -> None:
+    """
+    Reject a recording whose measurements make it unusable.
+
+    Raises:
+        AudioPreflightError: If it is too short, silent, clipped or has no speech
+    """
+    logger.info(
+        f"Audio preflight: {analysis.duration_seconds:.2f}s, {analysis.sample_rate}Hz, "
+        f"{analysis.channels}ch, rms={analysis.rms_dbfs:.1f}dBFS, "
+        f"clipping={analysis.clipping_ratio:.3f}, speech={analysis.speech_ratio:.2f}"
+    )
+
+    if analysis.duration_seconds < settings.AUDIO_MIN_DURATION_SECONDS:
+        raise AudioPreflightError(
+            f"Recording is too short ({analysis.duration_seconds:.2f}s; "
+            f"minimum {settings.AUDIO_MIN_DURATION_SECONDS}s)"
+        )
+    if analysis.rms_dbfs < settings.AUDIO_MIN_RMS_DBFS:
+        raise AudioPreflightError("Recording is silent or too quiet. Check the microphone.")
+    if analysis.clipping_ratio > settings.AUDIO_MAX_CLIPPING_RATIO:
+        raise AudioPreflightError(
+            "Recording is clipped (too loud). Move further from the microphone."
+        )
+    if analysis.speech_ratio < settings.AUDIO_MIN_SPEECH_RATIO:
+        raise AudioPreflightError("No speech detected in the recording.")
+
+
+class StreamPreflight:
+    """
+    Audio preflight for a recording that is still arriving.
+
+    check_header validates the WAV header (encoding, sample rate, channels,
+    declared length) before any speech work starts. Every chunk of the
+    stream, header included, then goes through feed, which accumulates the
+    level, clipping and speech measurements; finish applies the same checks
+    as preflight_audio once the stream ends. The recording is never held in
+    memory, only a partial sample frame and analysis frame between chunks.
+    """
+
+    def __init__(self):
+        self.analysis: AudioAnalysis | None = None  # Set by finish
+        self._format: WavAudio | None = None  # Parsed header (its pcm_data is unused)
+        self._skip = 0  # Header bytes still to pass over
+        self._remaining: int | None = None  # Declared data bytes not yet received
+        self._pending = b""  # Partial sample frame carried to the next chunk
+        self._tail = np.zeros(0, dtype=np.float32)  # Partial analysis frame (mono)
+        self._num_frames = 0
+        self._sum_squares = 0.0
+        self._clipped = 0
+        self._level_frames = 0
+        self._speech_frames = 0
+
+    def check_header(self, header: bytes) -> None:
+        """
+        Validate the start of the stream (at least the bytes up to the data chunk).
+
+        Raises:
+            AudioPreflightError: 415 if it isn't PCM WAV, 422 if the declared
+                length is too short
+        """
+        try:
+            wav = WavAudio.parse(header)
+        except WavFormatError as e:
+            raise AudioPreflightError(str(e), status_code=415)
+
+        self._format = wav
+        self._skip = wav.data_offset
+        self._remaining = declared_data_size(header)
+        if self._remaining is not None:
+            declared_seconds = self._remaining / wav.block_align / wav.sample_rate
+            if declared_seconds < settings.AUDIO_MIN_DURATION_SECONDS:
+                raise AudioPreflightError(
+                    f"Recording is too short ({declared_seconds:.2f}s; "
+                    f"minimum {settings.AUDIO_MIN_DURATION_SECONDS}s)"
+                )
+
+    def feed(self, chunk: bytes) -> None:
+        """Measure the audio in the next chunk of the stream."""
+        wav = self._format
+        if wav is None:
+            return
+
+        skipped = min(self._skip, len(chunk))
+        self._skip -= skipped
+        chunk = chunk[skipped:]
+        if self._remaining is not None:
+            chunk = chunk[: self._remaining]  # Ignore chunks after the data chunk
+            self._remaining -= len(chunk)
+
+        data = self._pending + chunk
+        usable = len(data) - len(data) % wav.block_align
+        self._pending = data[usable:]
+        if not usable:
+            return
+
+        samples = WavAudio(
+            wav.format_tag, wav.channels, wav.sample_rate, wav.bits_per_sample, data[:usable]
+        ).samples()
+        mono = wav.mono(samples)
+        self._num_frames += len(mono)
+        self._sum_squares += float(np.sum(np.square(mono, dtype=np.float64)))
+        self._clipped += int(np.count_nonzero(np.abs(samples) >= CLIPPING_LEVEL))
+
+        mono = np.concatenate((self._tail, mono))
+        frame_length = max(1, int(wav.sample_rate * FRAME_SECONDS))
+        whole = len(mono) - len(mono) % frame_length
+        if whole:
+            levels = frame_levels_dbfs(mono[:whole], wav.sample_rate)
+            self._level_frames += len(levels)
+            self._speech_frames += int(
+                np.count_nonzero(levels > settings.AUDIO_SPEECH_THRESHOLD_DBFS)
+            )
+        self._tail = mono[whole:]
+
+    def finish(self) -> AudioAnalysis:
+        """
+        Check the measurements once the whole stream has been fed.
+
+        Returns:
+            AudioAnalysis of the recording
+
+        Raises:
+            AudioPreflightError: If the recording is unusable
+        """
+        wav = self._format
+        if wav is None:
+            raise AudioPreflightError("Audio is not a WAV file", status_code=415)
+        if self._remaining:
+            raise AudioPreflightError("Audio file is truncated (incomplete upload?)")
+
+        if not self._level_frames and self._tail.size:
+            # Shorter than one analysis frame: measured as a single frame
+            levels = frame_levels_dbfs(self._tail, wav.sample_rate)
+            self._level_frames = len(levels)
+            self._speech_frames = int(
+                np.count_nonzero(levels > settings.AUDIO_SPEECH_THRESHOLD_DBFS)
+            )
+
+        if self._num_frames:
+            rms_dbfs = float(to_dbfs(np.sqrt(self._sum_squares / self._num_frames)))
+            clipping_ratio = self._clipped / (self._num_frames * wav.channels)
+            speech_ratio = self._speech_frames / self._level_frames
+        else:
+            rms_dbfs, clipping_ratio, speech_ratio = MIN_DBFS, 0.0, 0.0
+
+        self.analysis = AudioAnalysis(
+            sample_rate=wav.sample_rate,
+            channels=wav.channels,
+            bits_per_sample=wav.bits_per_sample,
+            duration_seconds=self._num_frames / wav.sample_rate,
+            rms_dbfs=rms_dbfs,
+            clipping_ratio=clipping_ratio,
+            speech_ratio=speech_ratio,
+        )
+        check_analysis(self.analysis)
+        return self.analysis
@@ -3,30 +3,45 @@ Blob storage service for storing audio files.
 Supports both mock mode (local filesystem) and Azure Blob Storage.
 """
 
+import asyncio
+import base64
 import logging
 import uuid
+from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import Any
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Azure Blob Storage import (optional, only needed when MOCK_MODE=false)
+# Azure Blob Storage async client import (optional, only needed when MOCK_MODE=false)
 try:
-    from azure.storage.blob import BlobServiceClient, ContentSettings
+    import aiohttp
+    from azure.core.pipeline.transport import AioHttpTransport
+    from azure.storage.blob import BlobBlock, ContentSettings
+    from azure.storage.blob.aio import BlobServiceClient
 
     AZURE_BLOB_AVAILABLE = True
 except ImportError:
     AZURE_BLOB_AVAILABLE = False
     logger.warning("Azure Blob Storage SDK not available. Only mock mode will work.")
 
+# Streamed uploads are staged as blocks of this size, bounding memory per upload
+STREAM_BLOCK_SIZE = 256 * 1024
+
 
 class BlobStorageService:
     """
     Service for storing audio files in blob storage.
 
     In mock mode: Saves to local filesystem (./mock_blob_storage/).
-    In Azure mode: Uploads to Azure Blob Storage.
+    In Azure mode: Uploads to Azure Blob Storage with the SDK's async client.
+    All blob calls share one client and its aiohttp transport, whose
+    connection pool holds up to BLOB_MAX_CONNECTIONS connections. The client
+    is created on first use (aiohttp binds it to the running event loop) and
+    released by close(). Payloads larger than BLOB_UPLOAD_BLOCK_SIZE are
+    uploaded as blocks, BLOB_UPLOAD_CONCURRENCY at a time.
     """
 
     def __init__(self):
@@ -36,27 +51,58 @@ class BlobStorageService:
             if not AZURE_BLOB_AVAILABLE:
                 raise RuntimeError(
                     "Azure Blob Storage SDK is not available. "
-                    "Install with: pip install azure-storage-blob"
+                    "Install with: pip install 'azure-storage-blob[aio]'"
                 )
 
+            self.container_name = settings.BLOB_CONTAINER_NAME
+            self.upload_concurrency = settings.BLOB_UPLOAD_CONCURRENCY
+            self.blob_service_client: BlobServiceClient | None = None
+            self._container_verified = False
+            self._container_lock = asyncio.Lock()
+
+    def _get_client(self) -> "BlobServiceClient":
+        """The shared async client, created on first use."""
+        if self.blob_service_client is None:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=settings.BLOB_MAX_CONNECTIONS)
+            )
             self.blob_service_client = BlobServiceClient.from_connection_string(
-                settings.BLOB_CONNECTION_STRING
+                settings.BLOB_CONNECTION_STRING,
+                transport=AioHttpTransport(session=session, session_owner=True),
+                max_single_put_size=settings.BLOB_UPLOAD_BLOCK_SIZE,
+                max_block_size=settings.BLOB_UPLOAD_BLOCK_SIZE,
             )
-            self.container_name = settings.BLOB_CONTAINER_NAME
-
-            # Ensure container exists
-            self._ensure_container_exists()
-
-    def _ensure_container_exists(self):
-        """Create container if it doesn't exist (Azure mode only)."""
-        try:
-            container_client = self.blob_service_client.get_container_client(self.container_name)
-            if not container_client.exists():
-                container_client.create_container()
-                logger.info(f"Created blob container: {self.container_name}")
-        except Exception as e:
-            logger.error(f"Failed to ensure container exists: {str(e)}")
-            raise
+        return self.blob_service_client
+
+    async def _get_blob_client(self, blob_name: str) -> Any:
+        """Client for one blob on the shared transport, once the container is verified."""
+        await self.verify_container()
+        return self._get_client().get_blob_client(container=self.container_name, blob=blob_name)
+
+    async def verify_container(self) -> None:
+        """Create the container if it doesn't exist, once per service (Azure mode only)."""
+        if self.mock_mode or self._container_verified:
+            return
+
+        async with self._container_lock:
+            if self._container_verified:
+                return
+            try:
+                container_client = self._get_client().get_container_client(self.container_name)
+                if not await container_client.exists():
+                    await container_client.create_container()
+                    logger.info(f"Created blob container: {self.container_name}")
+            except Exception as e:
+                logger.error(f"Failed to ensure container exists: {str(e)}")
+                raise
+            self._container_verified = True
+
+    async def close(self) -> None:
+        """Close the shared client and its connection pool (Azure mode only)."""
+        if not self.mock_mode and self.blob_service_client is not None:
+            await self.blob_service_client.close()
+            self.blob_service_client = None
+            logger.info("Blob storage client closed")
 
     async def upload_audio(
         self, audio_bytes: bytes, file_extension: str = "wav", user_id: str | None = None
@@ -80,6 +126,34 @@ class BlobStorageService:
 
         return await self._azure_upload(audio_bytes, file_extension, user_id)
 
+    async def upload_audio_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        file_extension: str = "wav",
+        user_id: str | None = None,
+    ) -> str:
+        """
+        Upload audio to storage from a stream of chunks.
+
+        The payload is never buffered in full: mock mode appends to the local
+        file, Azure mode stages blocks and commits the block list at the end.
+
+        Args:
+            chunks: Async iterator of file content (should already be encrypted)
+            file_extension: File extension (default: wav)
+            user_id: Optional user ID for organizing files
+
+        Returns:
+            URL or path to the stored file
+
+        Raises:
+            Exception: If upload fails
+        """
+        if self.mock_mode:
+            return await self._mock_upload_stream(chunks, file_extension, user_id)
+
+        return await self._azure_upload_stream(chunks, file_extension, user_id)
+
     def _mock_upload(self, audio_bytes: bytes, file_extension: str, user_id: str | None) -> str:
         """
         Save audio to local filesystem for development.
@@ -87,14 +161,8 @@ class BlobStorageService:
         Organizes files by user_id if provided.
         """
         try:
-            # Create unique filename
-            filename = f"{uuid.uuid4()}.{file_extension}"
-
-            # Organize by user if provided
-            if user_id:
-                local_path = Path("./mock_blob_storage") / user_id / filename
-            else:
-                local_path = Path("./mock_blob_storage") / filename
+            # Create unique path, organized by user if provided
+            local_path = self._mock_path(file_extension, user_id)
 
             # Ensure directory exists
             local_path.parent.mkdir(parents=True, exist_ok=True)
@@ -112,6 +180,46 @@ class BlobStorageService:
             logger.error(f"Mock upload failed: {str(e)}")
             raise Exception(f"File upload failed: {str(e)}")
 
+    async def _mock_upload_stream(
+        self, chunks: AsyncIterator[bytes], file_extension: str, user_id: str | None
+    ) -> str:
+        """Stream audio into a local file, removing the partial file on failure."""
+        local_path = self._mock_path(file_extension, user_id)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        total = 0
+
+        try:
+            with open(local_path, "wb") as f:
+                async for chunk in chunks:
+                    f.write(chunk)
+                    total += len(chunk)
+        except BaseException as e:
+            local_path.unlink(missing_ok=True)
+            if not isinstance(e, Exception):
+                raise
+            logger.error(f"Mock streaming upload failed: {str(e)}")
+            raise Exception(f"File upload failed: {str(e)}")
+
+        logger.info(f"Mock upload: Streamed {total} bytes to {local_path}")
+        return f"local://{local_path.relative_to('.')}"
+
+    def _mock_path(self, file_extension: str, user_id: str | None) -> Path:
+        """Build a unique local path, organized by user if provided."""
+        filename = f"{uuid.uuid4()}.{file_extension}"
+        if user_id:
+            return Path("./mock_blob_storage") / user_id / filename
+        return Path("./mock_blob_storage") / filename
+
+    def _blob_name(self, file_extension: str, user_id: str | None) -> str:
+        """Build a unique blob name organized by user_id and date."""
+        from datetime import datetime
+
+        timestamp = datetime.utcnow().strftime("%Y%m%d")
+
+        if user_id:
+            return f"assessments/{user_id}/{timestamp}/{uuid.uuid4()}.{file_extension}"
+        return f"assessments/anonymous/{timestamp}/{uuid.uuid4()}.{file_extension}"
+
     async def _azure_upload(
         self, audio_bytes: bytes, file_extension: str, user_id: str | None
     ) -> str:
@@ -122,24 +230,20 @@ class BlobStorageService:
         """
         try:
             # Create unique blob name
-            from datetime import datetime
-
-            timestamp = datetime.utcnow().strftime("%Y%m%d")
-
-            if user_id:
-                blob_name = f"assessments/{user_id}/{timestamp}/{uuid.uuid4()}.{file_extension}"
-            else:
-                blob_name = f"assessments/anonymous/{timestamp}/{uuid.uuid4()}.{file_extension}"
+            blob_name = self._blob_name(file_extension, user_id)
 
             # Get blob client
-            blob_client = self.blob_service_client.get_blob_client(
-                container=self.container_name, blob=blob_name
-            )
+            blob_client = await self._get_blob_client(blob_name)
 
-            # Upload with appropriate content type
+            # Upload with appropriate content type (as parallel blocks if large)
             content_settings = ContentSettings(content_type="audio/wav")
 
-            blob_client.upload_blob(audio_bytes, overwrite=True, content_settings=content_settings)
+            await blob_client.upload_blob(
+                audio_bytes,
+                overwrite=True,
+                content_settings=content_settings,
+                max_concurrency=self.upload_concurrency,
+            )
 
             # Return blob URL
             blob_url = blob_client.url
@@ -152,6 +256,62 @@ class BlobStorageService:
             logger.error(f"Azure upload failed: {str(e)}")
             raise Exception(f"File upload failed: {str(e)}")
 
+    async def _azure_upload_stream(
+        self, chunks: AsyncIterator[bytes], file_extension: str, user_id: str | None
+    ) -> str:
+        """
+        Stream audio to Azure Blob Storage as staged blocks.
+
+        Up to BLOB_UPLOAD_CONCURRENCY blocks are staged at once while the
+        stream is still being read. Blocks are only committed once the stream
+        completes, so a failed or cancelled upload never produces a visible
+        blob (Azure garbage-collects uncommitted blocks).
+        """
+        staging: set[asyncio.Task] = set()
+        try:
+            blob_name = self._blob_name(file_extension, user_id)
+            blob_client = await self._get_blob_client(blob_name)
+
+            block_ids: list[str] = []
+            buffer = bytearray()
+            total = 0
+
+            async def stage(data: bytes) -> None:
+                block_id = base64.b64encode(f"{len(block_ids):08d}".encode()).decode()
+                block_ids.append(block_id)
+                if len(staging) >= self.upload_concurrency:
+                    done, _ = await asyncio.wait(staging, return_when=asyncio.FIRST_COMPLETED)
+                    staging.difference_update(done)
+                    for task in done:
+                        task.result()  # Re-raise a failed block
+                staging.add(asyncio.create_task(blob_client.stage_block(block_id, data)))
+
+            async for chunk in chunks:
+                buffer += chunk
+                total += len(chunk)
+                if len(buffer) >= STREAM_BLOCK_SIZE:
+                    await stage(bytes(buffer))
+                    buffer.clear()
+
+            if buffer or not block_ids:
+                await stage(bytes(buffer))
+
+            await asyncio.gather(*staging)
+            await blob_client.commit_block_list(
+                [BlobBlock(block_id=block_id) for block_id in block_ids],
+                content_settings=ContentSettings(content_type="audio/wav"),
+            )
+
+            logger.info(f"Azure upload: Streamed {total} bytes to {blob_name}")
+            return blob_client.url
+
+        except Exception as e:
+            logger.error(f"Azure streaming upload failed: {str(e)}")
+            raise Exception(f"File upload failed: {str(e)}")
+        finally:
+            for task in staging:
+                task.cancel()
+
     async def download_audio(self, blob_url: str) -> bytes:
         """
         Download audio file from storage.
@@ -192,12 +352,11 @@ class BlobStorageService:
             # Extract blob name from URL
             blob_name = blob_url.split(f"{self.container_name}/")[-1]
 
-            blob_client = self.blob_service_client.get_blob_client(
-                container=self.container_name, blob=blob_name
-            )
+            blob_client = await self._get_blob_client(blob_name)
 
             # Download blob
-            audio_bytes = blob_client.download_blob().readall()
+            downloader = await blob_client.download_blob(max_concurrency=self.upload_concurrency)
+            audio_bytes = await downloader.readall()
 
             logger.info(f"Azure download: Downloaded {len(audio_bytes)} bytes from {blob_name}")
             return audio_bytes
@@ -246,11 +405,9 @@ class BlobStorageService:
         try:
             blob_name = blob_url.split(f"{self.container_name}/")[-1]
 
-            blob_client = self.blob_service_client.get_blob_client(
-                container=self.container_name, blob=blob_name
-            )
+            blob_client = await self._get_blob_client(blob_name)
 
-            blob_client.delete_blob()
+            await blob_client.delete_blob()
             logger.info(f"Azure delete: Removed {blob_name}")
             return True
 
@@ -0,0 +1,116 @@
+"""
+Per-request deadlines and accounting for assessment work cancelled early.
+
+An endpoint opens a Deadline for the request; it is stored in a context
+variable, so every task the request spawns (speech scoring, encryption,
+upload) sees it and can cap its own waits with time_left(). Work cut short
+by the deadline or by the client disconnecting is counted in
+cancellation_stats, including the speech audio that was never recognized.
+"""
+
+import asyncio
+import contextvars
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_current_deadline: contextvars.ContextVar["Deadline | None"] = contextvars.ContextVar(
+    "assessment_deadline", default=None
+)
+
+
+class DeadlineExceededError(Exception):
+    """The request ran out of time before its assessment finished."""
+
+
+class ClientDisconnectedError(Exception):
+    """The client went away before its assessment finished."""
+
+
+class Deadline:
+    """Point in (event loop) time by which a request's work must finish."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = asyncio.get_running_loop().time() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - asyncio.get_running_loop().time())
+
+    @asynccontextmanager
+    async def scope(self) -> AsyncIterator["Deadline"]:
+        """
+        Run the block under this deadline and make it current for its tasks.
+
+        Raises:
+            DeadlineExceededError: If the block is still running at the deadline
+        """
+        token = _current_deadline.set(self)
+        try:
+            async with asyncio.timeout_at(self.expires_at):
+                yield self
+        except TimeoutError:
+            raise DeadlineExceededError(
+                f"Assessment did not finish within {self.seconds:g} seconds"
+            ) from None
+        finally:
+            _current_deadline.reset(token)
+
+
+def request_deadline() -> Deadline:
+    """Deadline for a new assessment request (ASSESSMENT_DEADLINE_SECONDS)."""
+    return Deadline(settings.ASSESSMENT_DEADLINE_SECONDS)
+
+
+def time_left(default: float) -> float:
+    """default, capped by the time left before the current request's deadline."""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return default
+    return min(default, deadline.remaining())
+
+
+class CancellationStats:
+    """Counts assessments abandoned early and the work that was saved."""
+
+    def __init__(self):
+        self.requests = {"client_disconnect": 0, "deadline": 0}
+        self.recognitions_cancelled = 0
+        self.speech_seconds_saved = 0.0
+        self.storage_cancelled = 0
+
+    def record_request(self, reason: str) -> None:
+        """An assessment request was abandoned ("client_disconnect" or "deadline")."""
+        self.requests[reason] += 1
+        logger.info(f"Assessment abandoned ({reason})")
+
+    def record_abandoned_work(
+        self, recognition: bool, storage: bool, audio_seconds: float = 0.0
+    ) -> None:
+        """Recognition and/or storage (upload or spool) were outstanding when cancelled."""
+        if recognition:
+            self.recognitions_cancelled += 1
+            self.speech_seconds_saved += audio_seconds
+        if storage:
+            self.storage_cancelled += 1
+
+    def stats(self) -> dict:
+        return {
+            "requests": dict(self.requests),
+            "recognitions_cancelled": self.recognitions_cancelled,
+            "speech_seconds_saved": round(self.speech_seconds_saved, 1),
+            "storage_cancelled": self.storage_cancelled,
+        }
+
+
+# Process-wide counters
+cancellation_stats = CancellationStats()
+
+
+def get_cancellation_stats() -> CancellationStats:
+    """Return the shared cancellation counters."""
+    return cancellation_stats
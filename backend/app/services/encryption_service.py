@@ -1,16 +1,45 @@
 """
 Encryption service for securing audio files before storage.
-Uses Fernet (symmetric encryption) with AES-256.
+Uses Fernet (symmetric encryption) with AES-256; streamed uploads use
+AES-256-GCM frames that authenticate their order and the end of the stream.
 """
 
+import base64
 import logging
+import os
+import struct
+from collections.abc import AsyncIterator
 
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 from app.core.config import settings
+from app.services.audio_codec import decode_audio, encode_audio
 
 logger = logging.getLogger(__name__)
 
+# Chunked ciphertext: magic header and a random per-recording nonce prefix,
+# followed by length-prefixed AES-GCM frames. Each frame's nonce is the prefix,
+# the frame index and a final-frame flag, so frames can't be dropped, reordered
+# or moved between recordings, and a stream missing its final frame is rejected.
+# Plain Fernet tokens always start with b"gAAAAA", so the formats can't collide.
+STREAM_MAGIC = b"PRNSTRM2"
+_NONCE_PREFIX_SIZE = 7
+_FRAME_NONCE = struct.Struct(">7sIB")  # prefix, frame index, final-frame flag
+_FRAME_LENGTH = struct.Struct(">I")
+_MAX_FRAMES = 2**32
+
+# Earlier chunked format: length-prefixed Fernet tokens without frame
+# indexes. Still decrypted so recordings stored in it stay readable.
+LEGACY_STREAM_MAGIC = b"PRNSTRM1"
+
+# Compact ciphertext: magic header followed by the binary (base64-decoded)
+# Fernet token of an audio_codec container, avoiding base64's 33% overhead
+COMPACT_MAGIC = b"PRNCMP01"
+
 
 class EncryptionService:
     """
@@ -26,6 +55,7 @@ class EncryptionService:
         """Initialize encryption service with key from settings."""
         try:
             self.cipher = Fernet(settings.ENCRYPTION_KEY.encode())
+            self.stream_cipher = _stream_cipher(settings.ENCRYPTION_KEY)
         except Exception as e:
             raise ValueError(
                 "Invalid ENCRYPTION_KEY in settings. "
@@ -36,6 +66,9 @@ class EncryptionService:
         """
         Encrypt audio file bytes.
 
+        With AUDIO_COMPACT_STORAGE_ENABLED the audio is losslessly compressed
+        first and the token is stored in binary (the compact format).
+
         Args:
             audio_bytes: Raw audio file content
 
@@ -46,17 +79,60 @@ class EncryptionService:
             Exception: If encryption fails
         """
         try:
-            encrypted = self.cipher.encrypt(audio_bytes)
+            if settings.AUDIO_COMPACT_STORAGE_ENABLED:
+                token = self.cipher.encrypt(encode_audio(audio_bytes))
+                encrypted = COMPACT_MAGIC + base64.urlsafe_b64decode(token)
+            else:
+                encrypted = self.cipher.encrypt(audio_bytes)
             logger.info(f"Encrypted audio: {len(audio_bytes)} bytes -> {len(encrypted)} bytes")
             return encrypted
         except Exception as e:
             logger.error(f"Audio encryption failed: {str(e)}")
             raise Exception(f"Encryption failed: {str(e)}")
 
+    async def encrypt_audio_stream(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """
+        Encrypt an audio stream chunk by chunk.
+
+        Each input chunk becomes one authenticated frame, so memory use is
+        bounded by the chunk size. A chunk is held back until the next one
+        arrives, so the last frame can be marked final. The output can be
+        decrypted with decrypt_audio.
+
+        Args:
+            chunks: Async iterator of raw audio chunks
+
+        Yields:
+            Encrypted output (header first, then one frame per input chunk)
+        """
+        prefix = os.urandom(_NONCE_PREFIX_SIZE)
+        yield STREAM_MAGIC + prefix
+
+        index = 0
+        pending = None
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            if pending is not None:
+                yield self._encrypt_frame(prefix, index, pending, final=False)
+                index += 1
+            pending = chunk
+        yield self._encrypt_frame(prefix, index, pending or b"", final=True)
+
+    def _encrypt_frame(self, prefix: bytes, index: int, chunk: bytes, final: bool) -> bytes:
+        if index >= _MAX_FRAMES:
+            raise ValueError("Audio stream has too many chunks to encrypt")
+        nonce = _FRAME_NONCE.pack(prefix, index, final)
+        frame = self.stream_cipher.encrypt(nonce, chunk, STREAM_MAGIC)
+        return _FRAME_LENGTH.pack(len(frame)) + frame
+
     def decrypt_audio(self, encrypted_bytes: bytes) -> bytes:
         """
         Decrypt audio file bytes.
 
+        Accepts every stored format (single Fernet token, chunked stream and
+        compact) and returns the original audio.
+
         Args:
             encrypted_bytes: Encrypted audio content
 
@@ -68,7 +144,9 @@ class EncryptionService:
             Exception: For other decryption errors
         """
         try:
-            decrypted = self.cipher.decrypt(encrypted_bytes)
+            decrypted = decode_audio(
+                self._decrypt_payload(encrypted_bytes, self.cipher, self.stream_cipher)
+            )
             logger.info(f"Decrypted audio: {len(encrypted_bytes)} bytes -> {len(decrypted)} bytes")
             return decrypted
         except InvalidToken:
@@ -78,6 +156,51 @@ class EncryptionService:
             logger.error(f"Audio decryption failed: {str(e)}")
             raise Exception(f"Decryption failed: {str(e)}")
 
+    def _decrypt_payload(
+        self, encrypted_bytes: bytes, cipher: Fernet, stream_cipher: AESGCM
+    ) -> bytes:
+        """Decrypt any stored format to its plaintext (still codec-encoded if compact)."""
+        if encrypted_bytes.startswith(STREAM_MAGIC):
+            return self._decrypt_stream_frames(encrypted_bytes, stream_cipher)
+        if encrypted_bytes.startswith(LEGACY_STREAM_MAGIC):
+            return b"".join(
+                cipher.decrypt(frame)
+                for frame in _frames(encrypted_bytes, len(LEGACY_STREAM_MAGIC))
+            )
+        if encrypted_bytes.startswith(COMPACT_MAGIC):
+            token = base64.urlsafe_b64encode(encrypted_bytes[len(COMPACT_MAGIC) :])
+            return cipher.decrypt(token)
+        return cipher.decrypt(encrypted_bytes)
+
+    def _decrypt_stream_frames(
+        self, encrypted_bytes: bytes, stream_cipher: AESGCM | None = None
+    ) -> bytes:
+        """
+        Decrypt the chunked format produced by encrypt_audio_stream.
+
+        Raises:
+            InvalidToken: If a frame fails authentication (tampered, reordered,
+                from another recording or wrong key) or the final frame is missing
+        """
+        stream_cipher = stream_cipher or self.stream_cipher
+        header_size = len(STREAM_MAGIC) + _NONCE_PREFIX_SIZE
+        if len(encrypted_bytes) < header_size:
+            raise InvalidToken
+        prefix = encrypted_bytes[len(STREAM_MAGIC) : header_size]
+
+        frames = _frames(encrypted_bytes, header_size)
+        if not frames:
+            raise InvalidToken  # Even an empty stream has a final frame
+        parts = []
+        for index, frame in enumerate(frames):
+            final = index == len(frames) - 1
+            nonce = _FRAME_NONCE.pack(prefix, index, final)
+            try:
+                parts.append(stream_cipher.decrypt(nonce, frame, STREAM_MAGIC))
+            except InvalidTag:
+                raise InvalidToken
+        return b"".join(parts)
+
     def rotate_key(self, old_key: str, new_key: str, encrypted_data: bytes) -> bytes:
         """
         Re-encrypt data with a new key (for key rotation).
@@ -93,11 +216,41 @@ class EncryptionService:
         old_cipher = Fernet(old_key.encode())
         new_cipher = Fernet(new_key.encode())
 
-        # Decrypt with old key
-        decrypted = old_cipher.decrypt(encrypted_data)
+        # Decrypt with old key (chunked and compact data are re-encrypted as a
+        # single token; a compact payload stays codec-encoded, which decrypt_audio handles)
+        decrypted = self._decrypt_payload(encrypted_data, old_cipher, _stream_cipher(old_key))
 
         # Encrypt with new key
         re_encrypted = new_cipher.encrypt(decrypted)
 
         logger.info("Successfully rotated encryption key")
         return re_encrypted
+
+
+def _stream_cipher(key: str) -> AESGCM:
+    """AES-256-GCM cipher for the chunked format, with a key derived from a Fernet key."""
+    key_material = base64.urlsafe_b64decode(key.encode())
+    derived = HKDF(
+        algorithm=hashes.SHA256(), length=32, salt=None, info=b"pronielts audio stream v2"
+    ).derive(key_material)
+    return AESGCM(derived)
+
+
+def _frames(encrypted_bytes: bytes, offset: int) -> list[bytes]:
+    """
+    Split a chunked payload into its length-prefixed frames.
+
+    Raises:
+        InvalidToken: If a frame is cut short
+    """
+    frames = []
+    while offset < len(encrypted_bytes):
+        if offset + _FRAME_LENGTH.size > len(encrypted_bytes):
+            raise InvalidToken
+        (length,) = _FRAME_LENGTH.unpack_from(encrypted_bytes, offset)
+        offset += _FRAME_LENGTH.size
+        if offset + length > len(encrypted_bytes):
+            raise InvalidToken
+        frames.append(encrypted_bytes[offset : offset + length])
+        offset += length
+    return frames
@@ -0,0 +1,260 @@
+"""
+Idempotency-Key handling for assessment submissions.
+A retried request either waits for the original request to finish or gets
+its stored response back, so retries never run a second pipeline.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.idempotency_key import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+# How often a waiting retry re-reads the key (requests served by other processes)
+WAIT_POLL_INTERVAL_SECONDS = 0.5
+
+# How often a process deletes expired keys
+EVICTION_INTERVAL_SECONDS = 3600
+
+
+class IdempotencyKeyMismatchError(Exception):
+    """Raised when a key is reused for a different request."""
+
+
+class IdempotencyKeyInProgressError(Exception):
+    """Raised when the original request is still running after the wait timeout."""
+
+
+def idempotency_request_hash(
+    user_id: str, phrase_id: int, audio_bytes: bytes, endpoint: str | None = None
+) -> str:
+    """
+    Fingerprint of a request, used to detect a key reused for other content.
+
+    endpoint tells apart endpoints whose stored responses differ, so a key
+    used for /assess can't replay into /jobs.
+    """
+    digest = hashlib.sha256()
+    if endpoint is not None:
+        digest.update(f"{endpoint}\n".encode())
+    digest.update(f"{user_id}\n{phrase_id}\n".encode())
+    digest.update(audio_bytes)
+    return digest.hexdigest()
+
+
+class IdempotencyService:
+    """
+    Claims, completes and releases idempotency keys.
+
+    Keys are scoped to the user that sent them, so two users picking the same
+    key never see each other's requests. All methods operate on the caller's
+    session: claim() and release() commit on their own, while complete() only
+    stages the update so the stored response commits atomically with the
+    assessment. Waiters in this process are woken immediately; waiters
+    elsewhere notice on their next poll. Keys past their TTL are deleted by
+    evict_expired(), which claim() runs every EVICTION_INTERVAL_SECONDS.
+    """
+
+    def __init__(
+        self,
+        wait_seconds: float | None = None,
+        lock_timeout_seconds: float | None = None,
+        ttl_seconds: float | None = None,
+    ):
+        self.wait_seconds = (
+            wait_seconds if wait_seconds is not None else settings.IDEMPOTENCY_WAIT_SECONDS
+        )
+        self.lock_timeout_seconds = (
+            lock_timeout_seconds
+            if lock_timeout_seconds is not None
+            else settings.IDEMPOTENCY_LOCK_TIMEOUT_SECONDS
+        )
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.IDEMPOTENCY_KEY_TTL_SECONDS
+        )
+        self._events: dict[tuple[str, str], set[asyncio.Event]] = {}
+        self._last_eviction = time.monotonic()
+
+    async def claim(
+        self, db: AsyncSession, user_id: str, key: str, request_hash: str
+    ) -> dict[str, Any] | None:
+        """
+        Claim a key for this request, or get the response it already produced.
+
+        Waits (up to wait_seconds) while another request holding the key is
+        still running.
+
+        Returns:
+            None if the key was claimed and the request should run, otherwise
+            the stored response of the completed request
+
+        Raises:
+            IdempotencyKeyMismatchError: If the key was used for a different request
+            IdempotencyKeyInProgressError: If the original request is still running
+        """
+        deadline = time.monotonic() + self.wait_seconds
+
+        while True:
+            if await self._insert(db, user_id, key, request_hash):
+                await self._evict_periodically(db)
+                return None
+
+            record = await db.get(IdempotencyKey, (user_id, key), populate_existing=True)
+            if record is None:
+                continue  # Released between our insert and read; try again
+
+            status, stored_hash, response = record.status, record.request_hash, record.response
+            claimed_at = record.claimed_at
+            await db.rollback()  # End the read transaction before waiting
+
+            now = datetime.utcnow()
+            expired = claimed_at < now - timedelta(seconds=self.ttl_seconds)
+            abandoned = status == "in_progress" and claimed_at < now - timedelta(
+                seconds=self.lock_timeout_seconds
+            )
+            if expired or abandoned:
+                if await self._reclaim(db, user_id, key, request_hash, claimed_at):
+                    return None
+                continue
+
+            if stored_hash != request_hash:
+                raise IdempotencyKeyMismatchError(
+                    "Idempotency-Key was already used for a different request"
+                )
+            if status == "completed":
+                logger.info(f"Replaying stored response for idempotency key {key}")
+                return response
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise IdempotencyKeyInProgressError(
+                    "A request with this Idempotency-Key is still being processed"
+                )
+            await self._wait((user_id, key), min(remaining, WAIT_POLL_INTERVAL_SECONDS))
+
+    async def complete(
+        self, db: AsyncSession, user_id: str, key: str, response: dict[str, Any]
+    ) -> None:
+        """Stage the stored response in the caller's transaction (commit to publish)."""
+        await db.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+            .values(status="completed", response=response)
+        )
+
+    def notify(self, user_id: str, key: str) -> None:
+        """Wake requests in this process that are waiting on the key."""
+        for event in self._events.pop((user_id, key), ()):
+            event.set()
+
+    async def release(self, db: AsyncSession, user_id: str, key: str) -> None:
+        """Drop an in-progress key after a failed request so a retry can run."""
+        try:
+            await db.rollback()
+            await db.execute(
+                delete(IdempotencyKey).where(
+                    IdempotencyKey.user_id == user_id,
+                    IdempotencyKey.key == key,
+                    IdempotencyKey.status == "in_progress",
+                )
+            )
+            await db.commit()
+        except Exception as e:
+            logger.warning(f"Could not release idempotency key {key}: {str(e)}")
+        self.notify(user_id, key)
+
+    async def evict_expired(self, db: AsyncSession) -> int:
+        """
+        Delete keys that can no longer be replayed or are abandoned.
+
+        A key is kept for IDEMPOTENCY_KEY_TTL_SECONDS, or for
+        IDEMPOTENCY_LOCK_TIMEOUT_SECONDS if longer, so a request still
+        running is never dropped.
+
+        Returns:
+            Number of rows deleted
+        """
+        cutoff = datetime.utcnow() - timedelta(
+            seconds=max(self.ttl_seconds, self.lock_timeout_seconds)
+        )
+        deleted = await db.execute(delete(IdempotencyKey).where(IdempotencyKey.claimed_at < cutoff))
+        await db.commit()
+        return deleted.rowcount
+
+    async def _evict_periodically(self, db: AsyncSession) -> None:
+        if time.monotonic() - self._last_eviction < EVICTION_INTERVAL_SECONDS:
+            return
+        self._last_eviction = time.monotonic()
+        try:
+            deleted = await self.evict_expired(db)
+            logger.info(f"Evicted {deleted} expired idempotency keys")
+        except Exception as e:
+            await db.rollback()
+            logger.warning(f"Idempotency key eviction failed: {str(e)}")
+
+    async def _insert(self, db: AsyncSession, user_id: str, key: str, request_hash: str) -> bool:
+        try:
+            await db.execute(
+                insert(IdempotencyKey).values(
+                    user_id=user_id,
+                    key=key,
+                    request_hash=request_hash,
+                    status="in_progress",
+                    claimed_at=datetime.utcnow(),
+                )
+            )
+            await db.commit()
+            return True
+        except IntegrityError:
+            await db.rollback()
+            return False
+
+    async def _reclaim(
+        self, db: AsyncSession, user_id: str, key: str, request_hash: str, claimed_at: datetime
+    ) -> bool:
+        """Take over an expired or abandoned key (only if nobody else did first)."""
+        reclaimed = await db.execute(
+            update(IdempotencyKey)
+            .where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key,
+                IdempotencyKey.claimed_at == claimed_at,
+            )
+            .values(
+                status="in_progress",
+                request_hash=request_hash,
+                response=None,
+                claimed_at=datetime.utcnow(),
+            )
+        )
+        await db.commit()
+        return reclaimed.rowcount == 1
+
+    async def _wait(self, key: tuple[str, str], timeout: float) -> None:
+        event = asyncio.Event()
+        self._events.setdefault(key, set()).add(event)
+        try:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(event.wait(), timeout)
+        finally:
+            # Drop the key's entry once its last waiter leaves
+            events = self._events.get(key)
+            if events is not None:
+                events.discard(event)
+                if not events:
+                    del self._events[key]
+
+
+# Process-wide instance so concurrent retries in one process wake each other
+idempotency_service = IdempotencyService()
@@ -0,0 +1,193 @@
+"""
+Cache of phrases prepared for assessment.
+
+POST /assess needs three things from a phrase: its reference text, its
+default assessment profile and the pronunciation assessment configuration
+built from the text. They only change when the phrase does, so each phrase
+is prepared once per version (normalized text, its words, the serialized
+configuration per profile) and kept in a bounded in-memory LRU per process.
+The phrase endpoints invalidate entries on update and delete; entries also
+expire after PHRASE_CACHE_TTL_SECONDS, which bounds how long another
+process can keep serving a phrase edited elsewhere.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.phrase import Phrase
+from app.services.speech_rest import assessment_config_json
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_reference_text(text: str) -> str:
+    """Collapse whitespace so equivalent texts share a configuration."""
+    return " ".join(text.split())
+
+
+def normalize_word(word: str) -> str:
+    """Lowercase a word and strip punctuation for matching against the reference."""
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def reference_words(text: str) -> tuple[str, ...]:
+    """Normalized words of a reference text, in order (punctuation-only tokens dropped)."""
+    return tuple(word for word in map(normalize_word, text.split()) if word)
+
+
+class PreparedPhrase:
+    """What an assessment needs from one version of a phrase, computed once."""
+
+    def __init__(
+        self,
+        phrase_id: int,
+        version: int,
+        reference_text: str,
+        assessment_profile: str | None = None,
+    ):
+        self.phrase_id = phrase_id
+        self.version = version
+        self.reference_text = normalize_reference_text(reference_text)
+        self.words = reference_words(self.reference_text)
+        self.assessment_profile = assessment_profile
+        self.loaded_at = time.monotonic()
+        self._configs: dict[str, str] = {}
+
+    @classmethod
+    def from_phrase(cls, phrase: Phrase) -> "PreparedPhrase":
+        return cls(phrase.id, phrase.version, phrase.reference_text, phrase.assessment_profile)
+
+    def assessment_config(self, profile: str) -> str:
+        """Serialized pronunciation assessment configuration for a profile (memoized)."""
+        config = self._configs.get(profile)
+        if config is None:
+            config = self._configs[profile] = assessment_config_json(self.reference_text, profile)
+        return config
+
+
+class PhraseCache:
+    """
+    Bounded LRU of prepared phrases, keyed by phrase id and version.
+
+    Also indexes entries by normalized reference text, so the speech service
+    can reuse a phrase's configuration from the text it is given. Safe to
+    invalidate from the (threaded) sync phrase endpoints.
+    """
+
+    def __init__(self, max_entries: int | None = None, ttl_seconds: float | None = None):
+        self.max_entries = (
+            max_entries if max_entries is not None else settings.PHRASE_CACHE_MAX_ENTRIES
+        )
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.PHRASE_CACHE_TTL_SECONDS
+        )
+
+        self._entries: OrderedDict[int, PreparedPhrase] = OrderedDict()
+        self._by_text: dict[str, PreparedPhrase] = {}
+        self._lock = threading.Lock()
+        self._generation = 0  # Bumped by every invalidation
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def get(self, db: AsyncSession, phrase_id: int) -> PreparedPhrase | None:
+        """
+        Prepared phrase by id, loading it from the database on a miss.
+
+        Returns:
+            The prepared phrase, or None if no such phrase exists
+        """
+        with self._lock:
+            entry = self._entries.get(phrase_id)
+            if entry is not None and time.monotonic() - entry.loaded_at < self.ttl_seconds:
+                self._entries.move_to_end(phrase_id)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            generation = self._generation
+
+        phrase = (await db.execute(select(Phrase).where(Phrase.id == phrase_id))).scalars().first()
+        if phrase is None:
+            return None
+
+        prepared = PreparedPhrase.from_phrase(phrase)
+        with self._lock:
+            # An update or delete committed while loading may have made this row stale
+            if generation == self._generation:
+                self._remember(prepared)
+        return prepared
+
+    def refresh(self, phrase: Phrase) -> PreparedPhrase:
+        """Prepared form of a row loaded elsewhere; replaces a cached entry of another version."""
+        with self._lock:
+            entry = self._entries.get(phrase.id)
+            if entry is not None and entry.version == phrase.version:
+                return entry
+            prepared = PreparedPhrase.from_phrase(phrase)
+            self._remember(prepared)
+            return prepared
+
+    def lookup(self, reference_text: str) -> PreparedPhrase | None:
+        """A cached phrase with this (normalized) reference text, if any."""
+        return self._by_text.get(reference_text)
+
+    def invalidate(self, *phrase_ids: int) -> None:
+        """Drop phrases that were updated or deleted."""
+        with self._lock:
+            self._generation += 1
+            for phrase_id in phrase_ids:
+                entry = self._entries.pop(phrase_id, None)
+                if entry is not None:
+                    self._forget_text(entry)
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._by_text.clear()
+            self.hits = self.misses = self.invalidations = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def _remember(self, entry: PreparedPhrase) -> None:
+        if self.max_entries <= 0:
+            return
+        previous = self._entries.pop(entry.phrase_id, None)
+        if previous is not None:
+            self._forget_text(previous)
+        self._entries[entry.phrase_id] = entry
+        self._by_text[entry.reference_text] = entry
+        while len(self._entries) > self.max_entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._forget_text(evicted)
+
+    def _forget_text(self, entry: PreparedPhrase) -> None:
+        if self._by_text.get(entry.reference_text) is entry:
+            del self._by_text[entry.reference_text]
+
+
+# Process-wide cache shared by the assessment endpoints and the speech service
+phrase_cache = PhraseCache()
+
+
+def get_phrase_cache() -> PhraseCache:
+    """Return the shared phrase cache."""
+    return phrase_cache
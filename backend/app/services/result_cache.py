@@ -0,0 +1,173 @@
+"""
+Result cache for pronunciation assessments.
+Identical resubmissions (same audio bytes, reference text and assessment
+profile) reuse the stored PronunciationResult instead of running another
+recognition.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.result_cache import PronunciationResultCacheEntry
+from app.services.speech_service import PronunciationResult
+
+logger = logging.getLogger(__name__)
+
+# How often a process deletes expired rows from the database tier
+EVICTION_INTERVAL_SECONDS = 3600
+
+
+def result_cache_key(audio_bytes: bytes, reference_text: str, profile: str = "full") -> str:
+    """Cache key: sha256 over the audio digest, the profile and the reference text."""
+    audio_digest = hashlib.sha256(audio_bytes).digest()
+    return hashlib.sha256(audio_digest + f"{profile}\n{reference_text}".encode()).hexdigest()
+
+
+class PronunciationResultCache:
+    """
+    Two-tier cache of pronunciation results.
+
+    Tier 1 is a bounded in-memory LRU per process. Its entries are kept as
+    JSON, so every hit builds a result of its own: a caller mutating the word
+    or packed scores it got back can't change what later hits see. Tier 2
+    (optional) is the pronunciation_result_cache table, shared by all
+    processes, with entries expiring after RESULT_CACHE_TTL_SECONDS. Cache
+    failures are logged and treated as misses so they never fail an
+    assessment.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        use_database: bool | None = None,
+        ttl_seconds: float | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ):
+        self.max_entries = (
+            max_entries if max_entries is not None else settings.RESULT_CACHE_MAX_ENTRIES
+        )
+        self.use_database = (
+            use_database if use_database is not None else settings.RESULT_CACHE_DB_ENABLED
+        )
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.RESULT_CACHE_TTL_SECONDS
+        )
+        self.session_factory = session_factory or AsyncSessionLocal
+
+        self._entries: OrderedDict[str, str] = OrderedDict()  # Serialized results
+        self._last_eviction = time.monotonic()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(audio_bytes: bytes, reference_text: str, profile: str = "full") -> str:
+        """Cache key for an (audio, reference text, profile) triple."""
+        return result_cache_key(audio_bytes, reference_text, profile)
+
+    async def get(self, key: str) -> PronunciationResult | None:
+        """Look up a result, checking memory first and then the database."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.memory_hits += 1
+            return PronunciationResult.from_dict(json.loads(entry))
+
+        if self.use_database:
+            data = await self._db_get(key)
+            if data is not None:
+                self._remember(key, data)
+                self.db_hits += 1
+                return PronunciationResult.from_dict(data)
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, result: PronunciationResult) -> None:
+        """Store a result in memory and, if enabled, in the database."""
+        data = result.to_dict()
+        self._remember(key, data)
+        if self.use_database:
+            await self._db_set(key, data)
+            if time.monotonic() - self._last_eviction >= EVICTION_INTERVAL_SECONDS:
+                self._last_eviction = time.monotonic()
+                try:
+                    await self.evict_expired()
+                except Exception as e:
+                    logger.warning(f"Result cache eviction failed: {str(e)}")
+
+    async def evict_expired(self) -> int:
+        """
+        Delete expired database entries.
+
+        Returns:
+            Number of rows deleted
+        """
+        async with self.session_factory() as db:
+            deleted = await db.execute(
+                delete(PronunciationResultCacheEntry).where(
+                    PronunciationResultCacheEntry.expires_at <= datetime.utcnow()
+                )
+            )
+            await db.commit()
+        return deleted.rowcount
+
+    def clear(self) -> None:
+        """Drop the in-memory tier and reset the counters."""
+        self._entries.clear()
+        self.memory_hits = self.db_hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters for monitoring."""
+        hits = self.memory_hits + self.db_hits
+        lookups = hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def _remember(self, key: str, data: dict) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = json.dumps(data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _db_get(self, key: str) -> dict | None:
+        try:
+            async with self.session_factory() as db:
+                return (
+                    await db.execute(
+                        select(PronunciationResultCacheEntry.result).where(
+                            PronunciationResultCacheEntry.cache_key == key,
+                            PronunciationResultCacheEntry.expires_at > datetime.utcnow(),
+                        )
+                    )
+                ).scalar()
+        except Exception as e:
+            logger.warning(f"Result cache lookup failed: {str(e)}")
+            return None
+
+    async def _db_set(self, key: str, data: dict) -> None:
+        expires_at = datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
+        try:
+            async with self.session_factory() as db:
+                await db.merge(
+                    PronunciationResultCacheEntry(cache_key=key, result=data, expires_at=expires_at)
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Result cache write failed: {str(e)}")
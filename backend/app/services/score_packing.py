@@ -0,0 +1,126 @@
+"""
+Compact, ordered word and phoneme scores.
+
+Azure's detailed result nests every word and phoneme in verbose JSON.
+Assessments store it instead as parallel arrays (one entry per word or
+phoneme, in speaking order) in a versioned JSON array, which keeps repeated
+words apart, carries timings and is cheap to store and scan:
+
+    [version,
+     [words, offsets_ms, durations_ms, accuracies, error_codes],
+     [word_indexes, phonemes, offsets_ms, durations_ms, accuracies]]
+
+Error codes index ERROR_TYPES. Phoneme arrays are empty when the
+assessment was not phoneme-granular (quick profile).
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+PACKED_SCORES_VERSION = 1
+
+ERROR_TYPES = (
+    "None",
+    "Mispronunciation",
+    "Omission",
+    "Insertion",
+    "UnexpectedBreak",
+    "MissingBreak",
+    "Monotone",
+)
+_ERROR_CODES = {name: code for code, name in enumerate(ERROR_TYPES)}
+
+# Azure reports offsets and durations in 100-nanosecond ticks
+TICKS_PER_MS = 10_000
+
+
+class PackedScoresError(ValueError):
+    """Raised when packed scores have an unknown version or shape."""
+
+
+def pack_scores(words: Iterable[dict[str, Any]]) -> list:
+    """
+    Pack Azure word results (NBest[0]["Words"], possibly from several segments).
+
+    Scores may be nested under "PronunciationAssessment" (SDK) or sit on the
+    word/phoneme itself (REST); both are accepted.
+
+    Returns:
+        The packed form, decodable with unpack_words
+    """
+    word_text: list[str] = []
+    word_offsets: list[int] = []
+    word_durations: list[int] = []
+    word_accuracies: list[float] = []
+    error_codes: list[int] = []
+
+    phoneme_words: list[int] = []
+    phoneme_text: list[str] = []
+    phoneme_offsets: list[int] = []
+    phoneme_durations: list[int] = []
+    phoneme_accuracies: list[float] = []
+
+    for index, word in enumerate(words):
+        assessment = word.get("PronunciationAssessment", word)
+        word_text.append(word.get("Word", ""))
+        word_offsets.append(word.get("Offset", 0) // TICKS_PER_MS)
+        word_durations.append(word.get("Duration", 0) // TICKS_PER_MS)
+        word_accuracies.append(round(float(assessment.get("AccuracyScore", 0)), 1))
+        error_codes.append(_ERROR_CODES.get(assessment.get("ErrorType", "None"), 0))
+
+        for phoneme in word.get("Phonemes", ()):
+            phoneme_words.append(index)
+            phoneme_text.append(phoneme.get("Phoneme", ""))
+            phoneme_offsets.append(phoneme.get("Offset", 0) // TICKS_PER_MS)
+            phoneme_durations.append(phoneme.get("Duration", 0) // TICKS_PER_MS)
+            phoneme_accuracies.append(
+                round(
+                    float(phoneme.get("PronunciationAssessment", phoneme).get("AccuracyScore", 0)),
+                    1,
+                )
+            )
+
+    return [
+        PACKED_SCORES_VERSION,
+        [word_text, word_offsets, word_durations, word_accuracies, error_codes],
+        [phoneme_words, phoneme_text, phoneme_offsets, phoneme_durations, phoneme_accuracies],
+    ]
+
+
+def unpack_words(packed: list | None) -> list[dict[str, Any]] | None:
+    """
+    Decode packed scores into ordered word dicts, each with its phonemes.
+
+    Returns:
+        [{"word", "offset_ms", "duration_ms", "accuracy", "error_type",
+        "phonemes": [{"phoneme", "offset_ms", "duration_ms", "accuracy"}]}],
+        or None for None (assessments stored before scores were packed)
+
+    Raises:
+        PackedScoresError: If the version or shape is not recognized
+    """
+    if packed is None:
+        return None
+    try:
+        version, word_arrays, phoneme_arrays = packed
+    except (TypeError, ValueError):
+        raise PackedScoresError("Packed scores must be [version, words, phonemes]")
+    if version != PACKED_SCORES_VERSION:
+        raise PackedScoresError(f"Unsupported packed scores version: {version}")
+
+    words = [
+        {
+            "word": text,
+            "offset_ms": offset,
+            "duration_ms": duration,
+            "accuracy": accuracy,
+            "error_type": ERROR_TYPES[code] if code < len(ERROR_TYPES) else "None",
+            "phonemes": [],
+        }
+        for text, offset, duration, accuracy, code in zip(*word_arrays, strict=True)
+    ]
+    for index, phoneme, offset, duration, accuracy in zip(*phoneme_arrays, strict=True):
+        words[index]["phonemes"].append(
+            {"phoneme": phoneme, "offset_ms": offset, "duration_ms": duration, "accuracy": accuracy}
+        )
+    return words
@@ -0,0 +1,92 @@
+"""
+App-lifetime service instances.
+
+The assessment endpoints used to build their speech, blob and encryption
+services on every request; in Azure mode that meant a new BlobServiceClient
+and a container existence check (a network round trip) per /assess. The
+application lifespan now builds one ServiceContainer, warms it once and
+stores it on app.state; the Depends functions in app/api/deps.py hand out
+its instances, /health reports on them, and the background workers share
+them.
+"""
+
+import logging
+
+from app.core.config import settings
+from app.services.admission_control import AdmissionController
+from app.services.blob_service import BlobStorageService
+from app.services.encryption_service import EncryptionService
+from app.services.result_cache import PronunciationResultCache
+from app.services.speech_client import SpeechClient
+from app.services.speech_executor import SpeechExecutor
+from app.services.speech_failover import create_speech_failover
+from app.services.speech_rest import SpeechRestBackend
+from app.services.speech_service import SpeechAssessmentService
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceContainer:
+    """
+    Shared service instances for one application.
+
+    The container builds everything the speech service runs on (admission
+    controller, executor, warm client, REST backend, failover regions and
+    result cache), so close() only shuts down what this application created:
+    a second app, or another TestClient lifespan, gets fresh instances.
+
+    Tests can pass their own instances, or override the individual
+    dependencies in app/api/deps.py as before.
+    """
+
+    def __init__(
+        self,
+        speech_service: SpeechAssessmentService | None = None,
+        blob_service: BlobStorageService | None = None,
+        encryption_service: EncryptionService | None = None,
+    ):
+        self.result_cache = PronunciationResultCache()
+        self.admission = AdmissionController()
+        self.executor = SpeechExecutor()
+        self.speech_client = SpeechClient(executor=self.executor)
+        self.rest = SpeechRestBackend()
+        self.failover = create_speech_failover(self.speech_client, self.rest, self.executor)
+
+        self.speech_service = speech_service or SpeechAssessmentService(
+            result_cache=self.result_cache if settings.RESULT_CACHE_ENABLED else None,
+            admission=self.admission,
+            executor=self.executor,
+            client=self.speech_client,
+            rest=self.rest,
+            failover=self.failover,
+        )
+        self.blob_service = blob_service or BlobStorageService()
+        self.encryption_service = encryption_service or EncryptionService()
+
+    async def start(self) -> None:
+        """
+        Warm the services before the first request.
+
+        In Azure mode this verifies the blob container once and pre-connects
+        the speech recognizers (and failover regions).
+        """
+        if settings.MOCK_MODE:
+            return
+
+        await self.blob_service.verify_container()
+        logger.info(f"☁️  Blob container verified: {settings.BLOB_CONTAINER_NAME}")
+
+        if settings.SPEECH_BACKEND == "sdk":
+            await self.speech_client.start()
+        if self.failover is not None:
+            await self.failover.start()
+
+    async def close(self) -> None:
+        """Release the blob, speech and slot connections and the speech threads."""
+        await self.blob_service.close()
+        await self.speech_client.close()
+        await self.rest.close()
+        if self.failover is not None:
+            await self.failover.close()
+        await self.admission.close()
+        self.executor.shutdown()
@@ -0,0 +1,204 @@
+"""
+App-lifetime Azure Speech client with a pool of pre-connected recognizers.
+
+The SpeechConfig is built once per process. Because an SDK recognizer is
+bound to a single audio stream, the pool holds single-use recognizers whose
+service connection was opened ahead of time (Connection.open), so an
+assessment skips the TLS and WebSocket handshake; each one taken is replaced
+in the background.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from app.core.config import settings
+from app.services.speech_executor import SpeechExecutor
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Azure Speech SDK import (optional, only needed when MOCK_MODE=false)
+try:
+    import azure.cognitiveservices.speech as speechsdk
+
+    AZURE_SDK_AVAILABLE = True
+except ImportError:
+    AZURE_SDK_AVAILABLE = False
+
+
+class WarmRecognizer:
+    """A recognizer reading from its own push stream, possibly already connected."""
+
+    def __init__(self, recognizer: Any, stream: Any, connection: Any, connected: bool):
+        self.recognizer = recognizer
+        self.stream = stream
+        self.connection = connection
+        self.connected = connected
+        self.created_at = time.monotonic()
+
+    @property
+    def idle_seconds(self) -> float:
+        return time.monotonic() - self.created_at
+
+    def close(self) -> None:
+        """Close the service connection (best effort)."""
+        try:
+            self.connection.close()
+        except Exception as e:
+            logger.debug(f"Closing speech connection failed: {str(e)}")
+
+
+class SpeechClient:
+    """
+    Builds recognizers from a shared SpeechConfig and keeps some pre-connected.
+
+    acquire() hands out a pooled recognizer when one is available and fresh
+    (connected less than max_idle_seconds ago; the service drops idle
+    connections), otherwise builds one on the spot. Blocking SDK calls run
+    on the executor, or on the default thread pool without one.
+    """
+
+    def __init__(
+        self,
+        pool_size: int | None = None,
+        max_idle_seconds: float | None = None,
+        executor: SpeechExecutor | None = None,
+        region: str | None = None,
+        subscription_key: str | None = None,
+    ):
+        self.region = region or settings.SPEECH_REGION
+        self.subscription_key = subscription_key or settings.SPEECH_KEY
+        self.pool_size = settings.SPEECH_WARM_POOL_SIZE if pool_size is None else pool_size
+        self.max_idle_seconds = max_idle_seconds or settings.SPEECH_WARM_MAX_IDLE_SECONDS
+        self.executor = executor
+
+        self._speech_config: Any = None
+        self._pool: deque[WarmRecognizer] = deque()
+        self._warming = 0
+        self._tasks: set[asyncio.Task] = set()
+        self._refresher: asyncio.Task | None = None
+
+        self.warm_hits = 0
+        self.cold_starts = 0
+        self.expired = 0
+        self.warm_failures = 0
+
+    @property
+    def speech_config(self) -> Any:
+        """SpeechConfig shared by every recognizer this client builds."""
+        if self._speech_config is None:
+            self._speech_config = speechsdk.SpeechConfig(
+                subscription=self.subscription_key, region=self.region
+            )
+        return self._speech_config
+
+    async def start(self) -> None:
+        """Open the initial pool of connections and keep it fresh."""
+        if self.pool_size <= 0:
+            return
+        self._replenish()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._refresher is None:
+            self._refresher = asyncio.create_task(self._refresh_loop())
+        logger.info(f"Speech client ready ({len(self._pool)} warm connections)")
+
+    async def close(self) -> None:
+        """Stop warming and close pooled connections."""
+        tasks = [*self._tasks, *([self._refresher] if self._refresher else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refresher = None
+
+        while self._pool:
+            self._pool.popleft().close()
+
+    async def acquire(self, continuous: bool = False) -> WarmRecognizer:
+        """
+        Take a recognizer for one assessment and start warming its replacement.
+
+        Args:
+            continuous: Whether it's for continuous recognition; pooled
+                connections are opened for single-shot use, so such
+                recognizers are always built on the spot
+
+        Returns:
+            A connected recognizer from the pool, or a newly built one
+        """
+        if continuous:
+            return await self._run(self._build, False)
+
+        while self._pool:
+            item = self._pool.popleft()
+            if item.idle_seconds <= self.max_idle_seconds:
+                self.warm_hits += 1
+                self._replenish()
+                return item
+            self.expired += 1
+            item.close()
+
+        self.cold_starts += 1
+        self._replenish()
+        return await self._run(self._build, False)
+
+    def stats(self) -> dict:
+        """Pool size and warm/cold usage counters for monitoring."""
+        return {
+            "pool_size": self.pool_size,
+            "warm": len(self._pool),
+            "warming": self._warming,
+            "warm_hits": self.warm_hits,
+            "cold_starts": self.cold_starts,
+            "expired": self.expired,
+            "warm_failures": self.warm_failures,
+        }
+
+    def _replenish(self) -> None:
+        """Start warming recognizers until the pool (plus in-flight warmups) is full."""
+        while len(self._pool) + self._warming < self.pool_size:
+            self._warming += 1
+            task = asyncio.create_task(self._warm_one())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _warm_one(self) -> None:
+        try:
+            self._pool.append(await self._run(self._build, True))
+        except Exception as e:
+            self.warm_failures += 1
+            logger.warning(f"Could not pre-open speech connection: {str(e)}")
+        finally:
+            self._warming -= 1
+
+    async def _refresh_loop(self) -> None:
+        """Replace pooled connections before the service drops them as idle."""
+        while True:
+            await asyncio.sleep(self.max_idle_seconds / 2)
+            for item in [i for i in self._pool if i.idle_seconds > self.max_idle_seconds / 2]:
+                with contextlib.suppress(ValueError):
+                    self._pool.remove(item)
+                    item.close()
+            self._replenish()
+
+    def _build(self, connect: bool) -> WarmRecognizer:
+        """Blocking: create a recognizer on a new push stream, optionally connecting it."""
+        stream = speechsdk.audio.PushAudioInputStream()
+        audio_config = speechsdk.audio.AudioConfig(stream=stream)
+        recognizer = speechsdk.SpeechRecognizer(
+            speech_config=self.speech_config, audio_config=audio_config
+        )
+        connection = speechsdk.Connection.from_recognizer(recognizer)
+        if connect:
+            connection.open(False)  # Single-shot recognition
+        return WarmRecognizer(recognizer, stream, connection, connected=connect)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self.executor is None:
+            return await asyncio.to_thread(func, *args)
+        return await self.executor.run(func, *args)
@@ -0,0 +1,128 @@
+"""
+Dedicated thread pool for blocking Speech SDK calls.
+Recognitions block for seconds; running them here keeps the event loop free
+to serve other requests, and keeps them from starving the default executor
+used for encryption, audio decoding and file I/O.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SpeechExecutor:
+    """
+    Size-bounded thread pool with saturation and queue-time metrics.
+
+    Calls beyond max_workers wait in the pool's queue; the time they spend
+    there is recorded, so a pool that is too small for the admission limit
+    shows up as queue time rather than as unexplained latency.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers or settings.SPEECH_EXECUTOR_THREADS
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+        self.submitted = 0
+        self.started = 0
+        self.active = 0
+        self.completed = 0
+        self.total_queue_seconds = 0.0
+        self.max_queue_seconds = 0.0
+
+    @property
+    def queued(self) -> int:
+        """Calls waiting for a free thread."""
+        return self.submitted - self.started
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking function in the pool and await its result.
+
+        Args:
+            func: Blocking callable (e.g. an SDK call)
+            *args: Positional arguments for func
+
+        Returns:
+            Whatever func returns (its exception is re-raised here)
+        """
+        submitted_at = time.monotonic()
+        state = {"started": False, "abandoned": False}
+        with self._lock:
+            self.submitted += 1
+
+        def call() -> T:
+            with self._lock:
+                if state["abandoned"]:
+                    raise asyncio.CancelledError()
+                state["started"] = True
+            self._record_start(time.monotonic() - submitted_at)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.active -= 1
+                    self.completed += 1
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), call)
+        except asyncio.CancelledError:
+            # A call cancelled while queued never runs; one already running
+            # finishes in its thread (blocking SDK calls can't be interrupted)
+            with self._lock:
+                if not state["started"]:
+                    state["abandoned"] = True
+                    self.submitted -= 1
+            raise
+
+    def stats(self) -> dict:
+        """Pool saturation and queue-time metrics for monitoring."""
+        return {
+            "max_workers": self.max_workers,
+            "active": self.active,
+            "queued": self.queued,
+            "saturation": round(self.active / self.max_workers, 2),
+            "completed": self.completed,
+            "avg_queue_ms": round(self._average_queue_time() * 1000, 1),
+            "max_queue_ms": round(self.max_queue_seconds * 1000, 1),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the pool, dropping queued calls (a later run() starts a new one)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("Speech executor stopped")
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="speech"
+            )
+        return self._executor
+
+    def _record_start(self, queued_for: float) -> None:
+        with self._lock:
+            self.started += 1
+            self.active += 1
+            self.total_queue_seconds += queued_for
+            self.max_queue_seconds = max(self.max_queue_seconds, queued_for)
+        if queued_for > 1.0:
+            logger.warning(
+                f"Speech call waited {queued_for:.1f}s for a thread "
+                f"(pool of {self.max_workers} saturated)"
+            )
+
+    def _average_queue_time(self) -> float:
+        return self.total_queue_seconds / self.started if self.started else 0.0
@@ -0,0 +1,288 @@
+"""
+Hedged speech calls across regions, with a circuit breaker per region.
+
+A call goes to the first available region (SPEECH_REGION first). If it has
+not answered within that region's recent p95 latency, the same call is
+hedged to the next region; the first result wins and the other attempts
+are cancelled. A failed attempt fails over to the next region immediately.
+Regions that keep failing are taken out of rotation until a trial call
+succeeds.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.deadlines import time_left
+from app.services.speech_client import SpeechClient
+from app.services.speech_executor import SpeechExecutor
+from app.services.speech_rest import SpeechRestBackend
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Latencies kept per region for the hedge threshold, and needed before it's used
+LATENCY_WINDOW = 200
+MIN_LATENCY_SAMPLES = 20
+
+
+class SpeechRegion:
+    """A speech region: its clients, recent latencies and circuit breaker state."""
+
+    def __init__(
+        self,
+        name: str,
+        client: SpeechClient | None = None,
+        rest: SpeechRestBackend | None = None,
+    ):
+        self.name = name
+        self.client = client
+        self.rest = rest
+
+        self.latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.consecutive_failures = 0
+        self.opened_at: float | None = None
+        self.trial_in_flight = False
+
+        self.successes = 0
+        self.failures = 0
+
+    @property
+    def state(self) -> str:
+        """Circuit state: closed (in rotation), open (out of it) or half_open (trial due)."""
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= settings.SPEECH_CIRCUIT_RESET_SECONDS:
+            return "half_open"
+        return "open"
+
+    def acquire(self) -> bool:
+        """Whether a call may go to this region (reserving the trial call when half-open)."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return True
+        return False
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for this region before hedging: its p95 latency."""
+        if len(self.latencies) < MIN_LATENCY_SAMPLES:
+            delay = settings.SPEECH_HEDGE_INITIAL_DELAY_SECONDS
+        else:
+            delay = float(np.percentile(self.latencies, 95))
+        return min(
+            max(delay, settings.SPEECH_HEDGE_MIN_DELAY_SECONDS),
+            settings.SPEECH_CALL_BUDGET_SECONDS,
+        )
+
+    def record_success(self, latency: float) -> None:
+        self.latencies.append(latency)
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.trial_in_flight = False
+        if self.opened_at is not None:
+            logger.info(f"Speech region {self.name} recovered; back in rotation")
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.consecutive_failures += 1
+        if (
+            self.trial_in_flight
+            or self.consecutive_failures >= settings.SPEECH_CIRCUIT_FAILURE_THRESHOLD
+        ):
+            if self.opened_at is None or self.trial_in_flight:
+                logger.warning(f"Speech region {self.name} failing; taken out of rotation")
+            self.opened_at = time.monotonic()
+        self.trial_in_flight = False
+
+    def release(self) -> None:
+        """An attempt was cancelled (it lost a hedge): neither success nor failure."""
+        self.trial_in_flight = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "p95_ms": (
+                round(float(np.percentile(self.latencies, 95)) * 1000, 1)
+                if self.latencies
+                else None
+            ),
+            "hedge_delay_ms": round(self.hedge_delay() * 1000, 1),
+            "successes": self.successes,
+            "failures": self.failures,
+        }
+
+
+class SpeechFailover:
+    """Runs a per-region call with hedging and failover across regions."""
+
+    def __init__(self, regions: list[SpeechRegion], budget_seconds: float | None = None):
+        if not regions:
+            raise ValueError("SpeechFailover needs at least one region")
+        self.regions = regions
+        self.budget_seconds = budget_seconds or settings.SPEECH_CALL_BUDGET_SECONDS
+
+        self.calls = 0
+        self.hedged = 0
+        self.failed_over = 0
+
+    async def call(
+        self,
+        func: Callable[[SpeechRegion], Awaitable[T]],
+        final_errors: tuple[type[Exception], ...] = (),
+    ) -> T:
+        """
+        Run func in one region, hedging to others when it's slow or fails.
+
+        Args:
+            func: Coroutine function performing the call against a region
+            final_errors: Exceptions about the request itself (e.g. no speech
+                in the audio) that no other region would answer differently;
+                they are raised at once and don't count against the region
+
+        Returns:
+            The first successful result
+
+        Raises:
+            Exception: The last region's error when every region failed
+        """
+        self.calls += 1
+        candidates = [region for region in self.regions if region.acquire()]
+        if not candidates:
+            # Every circuit is open: trying the primary beats failing outright
+            candidates = [self.regions[0]]
+
+        pending: dict[asyncio.Task, SpeechRegion] = {}
+        last_error: BaseException | None = None
+
+        def launch() -> SpeechRegion:
+            region = candidates.pop(0)
+            task = asyncio.create_task(self._attempt(region, func, final_errors))
+            pending[task] = region
+            return region
+
+        hedge_at = time.monotonic() + launch().hedge_delay()
+        try:
+            while pending:
+                timeout = max(0.0, hedge_at - time.monotonic()) if candidates else None
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    self.hedged += 1
+                    slow = ", ".join(region.name for region in pending.values())
+                    region = launch()
+                    logger.info(f"Speech call slow in {slow}; hedging to {region.name}")
+                    hedge_at = time.monotonic() + region.hedge_delay()
+                    continue
+
+                for task in done:
+                    last_error = self._failure(task, pending.pop(task), final_errors)
+                    if last_error is None:
+                        return task.result()
+
+                if not pending and candidates:
+                    self.failed_over += 1
+                    hedge_at = time.monotonic() + launch().hedge_delay()
+
+            raise last_error or Exception("No speech region answered")
+        finally:
+            for task in pending:
+                task.cancel()
+            for region in candidates:
+                region.release()
+
+    def _failure(
+        self,
+        task: asyncio.Task,
+        region: SpeechRegion,
+        final_errors: tuple[type[Exception], ...],
+    ) -> BaseException | None:
+        """A finished attempt's error (None if it succeeded); final errors are raised."""
+        error = task.exception()
+        if error is not None:
+            if isinstance(error, final_errors):
+                raise error
+            logger.warning(f"Speech call failed in {region.name}: {str(error)}")
+        return error
+
+    async def _attempt(
+        self,
+        region: SpeechRegion,
+        func: Callable[[SpeechRegion], Awaitable[T]],
+        final_errors: tuple[type[Exception], ...],
+    ) -> T:
+        started = time.monotonic()
+        budget = time_left(self.budget_seconds)
+        try:
+            result = await asyncio.wait_for(func(region), budget)
+        except asyncio.CancelledError:
+            region.release()
+            raise
+        except final_errors:
+            region.record_success(time.monotonic() - started)
+            raise
+        except TimeoutError:
+            if budget < self.budget_seconds:
+                region.release()  # Cut short by the request's deadline, not the region's fault
+            else:
+                region.record_failure()
+            raise TimeoutError(f"No answer from {region.name} within {budget:g}s") from None
+        except Exception:
+            region.record_failure()
+            raise
+        region.record_success(time.monotonic() - started)
+        return result
+
+    async def start(self) -> None:
+        """Warm the secondary regions' SDK clients (the primary's is shared)."""
+        for region in self.regions[1:]:
+            if region.client is not None and settings.SPEECH_BACKEND == "sdk":
+                await region.client.start()
+
+    async def close(self) -> None:
+        """Close the secondary regions' clients."""
+        for region in self.regions[1:]:
+            if region.client is not None:
+                await region.client.close()
+            if region.rest is not None:
+                await region.rest.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Hedge/failover counters and per-region circuit state for monitoring."""
+        return {
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "failed_over": self.failed_over,
+            "regions": {region.name: region.stats() for region in self.regions},
+        }
+
+
+def create_speech_failover(
+    client: SpeechClient, rest: SpeechRestBackend, executor: SpeechExecutor | None = None
+) -> SpeechFailover | None:
+    """
+    Failover across SPEECH_REGION and SPEECH_FAILOVER_REGIONS, or None without any.
+
+    The primary region uses the given client and REST backend; each secondary
+    region gets its own, sharing the executor.
+    """
+    secondaries = settings.speech_failover_regions_list
+    if not secondaries:
+        return None
+
+    regions = [SpeechRegion(settings.SPEECH_REGION, client, rest)]
+    for name, key in secondaries:
+        secondary = SpeechClient(pool_size=1, executor=executor, region=name, subscription_key=key)
+        regions.append(SpeechRegion(name, secondary, SpeechRestBackend(name, key)))
+    return SpeechFailover(regions)
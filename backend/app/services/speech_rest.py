@@ -0,0 +1,151 @@
+"""
+Azure Speech short-audio REST backend for pronunciation assessment.
+
+One HTTP request per recording, over a shared httpx.AsyncClient whose
+keep-alive (and HTTP/2, from the httpx[http2] extra) connections are
+reused across assessments. The body is streamed chunked, so recognition
+starts while audio is still being sent. Suited to clips under 60 seconds,
+the endpoint's limit.
+"""
+
+import base64
+import importlib.util
+import json
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the h2 package, installed by the httpx[http2] extra
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+RECOGNITION_PATH = "/speech/recognition/conversation/cognitiveservices/v1"
+AUDIO_CONTENT_TYPE = "audio/wav; codecs=audio/pcm; samplerate=16000"
+CHUNK_SIZE = 32 * 1024
+
+
+class SpeechRestError(Exception):
+    """The REST endpoint returned an error status."""
+
+
+class SpeechRestBackend:
+    """
+    Sends recordings to the short-audio recognition endpoint.
+
+    The httpx client is created on first use and kept until close(), so the
+    connection pool outlives individual requests.
+    """
+
+    def __init__(
+        self,
+        region: str | None = None,
+        subscription_key: str | None = None,
+        language: str = "en-US",
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.region = region or settings.SPEECH_REGION
+        self.subscription_key = subscription_key or settings.SPEECH_KEY
+        self.language = language
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def url(self) -> str:
+        return f"https://{self.region}.stt.speech.microsoft.com{RECOGNITION_PATH}"
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client (keep-alive pool, HTTP/2 when available)."""
+        if self._client is None:
+            if settings.SPEECH_REST_HTTP2 and not HTTP2_AVAILABLE:
+                logger.warning(
+                    "SPEECH_REST_HTTP2 is set but the h2 package is missing; using HTTP/1.1. "
+                    'Install with: pip install "httpx[http2]"'
+                )
+            self._client = httpx.AsyncClient(
+                http2=settings.SPEECH_REST_HTTP2 and HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=settings.SPEECH_REST_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.SPEECH_REST_MAX_CONNECTIONS,
+                    keepalive_expiry=settings.SPEECH_WARM_MAX_IDLE_SECONDS,
+                ),
+                timeout=httpx.Timeout(settings.SPEECH_REST_TIMEOUT_SECONDS, connect=5.0),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def recognize(
+        self,
+        audio_chunks: AsyncIterator[bytes],
+        reference_text: str,
+        profile: str = "full",
+        config: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Recognize a recording with pronunciation assessment.
+
+        Args:
+            audio_chunks: Async iterator of audio file chunks (WAV format)
+            reference_text: Expected text to be spoken
+            profile: Assessment profile ("quick" or "full")
+            config: Precomputed assessment_config_json for the text and profile
+
+        Returns:
+            The endpoint's detailed JSON result
+
+        Raises:
+            SpeechRestError: If the endpoint rejects the request
+            httpx.HTTPError: If the request fails in transit
+        """
+        response = await self.client.post(
+            self.url,
+            params={"language": self.language, "format": "detailed"},
+            headers={
+                "Ocp-Apim-Subscription-Key": self.subscription_key or "",
+                "Content-Type": AUDIO_CONTENT_TYPE,
+                "Accept": "application/json",
+                "Pronunciation-Assessment": pronunciation_header(reference_text, profile, config),
+            },
+            content=audio_chunks,  # An async iterator is sent with chunked encoding
+        )
+        if response.status_code != 200:
+            raise SpeechRestError(f"HTTP {response.status_code}: {response.text[:200]}")
+        return response.json()
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def assessment_config_json(reference_text: str, profile: str = "full") -> str:
+    """Pronunciation assessment parameters as JSON (the SDK path is configured from it too)."""
+    params = {
+        "ReferenceText": reference_text,
+        "GradingSystem": "HundredMark",
+        "Granularity": "Phoneme" if profile == "full" else "Word",
+        "Dimension": "Comprehensive",
+        "EnableMiscue": True,
+        "EnableProsodyAssessment": profile == "full",
+    }
+    return json.dumps(params)
+
+
+def pronunciation_header(
+    reference_text: str, profile: str = "full", config: str | None = None
+) -> str:
+    """Base64 assessment parameters for the Pronunciation-Assessment header."""
+    config = config or assessment_config_json(reference_text, profile)
+    return base64.b64encode(config.encode("utf-8")).decode("ascii")
+
+
+async def iter_chunks(audio_bytes: bytes, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yield a complete recording in chunks for a streamed request body."""
+    for start in range(0, len(audio_bytes), chunk_size):
+        yield audio_bytes[start : start + chunk_size]
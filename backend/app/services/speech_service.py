@@ -3,14 +3,33 @@ Speech assessment service using Azure Cognitive Services Speech SDK.
 Supports both mock mode (for local development) and real Azure mode.
 """
 
+import asyncio
+import contextlib
+import json
 import logging
 import random
-from typing import Any
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from app.core.config import settings
+from app.services.deadlines import time_left
+from app.services.phrase_cache import get_phrase_cache, normalize_word, reference_words
+from app.services.score_packing import pack_scores
+from app.services.speech_rest import SpeechRestBackend, assessment_config_json, iter_chunks
+from app.services.wav_audio import WavAudio, WavFormatError, declared_duration_seconds
+
+if TYPE_CHECKING:
+    from app.services.admission_control import AdmissionController
+    from app.services.result_cache import PronunciationResultCache
+    from app.services.speech_client import SpeechClient, WarmRecognizer
+    from app.services.speech_executor import SpeechExecutor
+    from app.services.speech_failover import SpeechFailover, SpeechRegion
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Azure Speech SDK import (optional, only needed when MOCK_MODE=false)
 try:
     import azure.cognitiveservices.speech as speechsdk
@@ -20,6 +39,33 @@ except ImportError:
     AZURE_SDK_AVAILABLE = False
     logger.warning("Azure Speech SDK not available. Only mock mode will work.")
 
+# How long to wait for the last segments once all audio has been pushed
+LONG_FORM_DRAIN_TIMEOUT_SECONDS = 30.0
+
+# Streamed uploads are read this far before choosing a recognizer, to find the WAV header
+STREAM_HEADER_PEEK_BYTES = 4096
+
+# Assessment profiles: "full" scores phonemes and prosody; "quick" (drills where
+# only the word colors are shown) scores words only, which the service does faster
+ASSESSMENT_PROFILES = ("quick", "full")
+
+
+class NoSpeechError(Exception):
+    """The recording contains no recognizable speech."""
+
+
+def resolve_assessment_profile(requested: str | None, phrase_profile: str | None = None) -> str:
+    """
+    Profile for an assessment: the requested one, else the phrase's, else the default.
+
+    Raises:
+        ValueError: If the resulting profile is not one of ASSESSMENT_PROFILES
+    """
+    profile = requested or phrase_profile or settings.ASSESSMENT_DEFAULT_PROFILE
+    if profile not in ASSESSMENT_PROFILES:
+        raise ValueError(f"Unknown assessment profile: {profile}")
+    return profile
+
 
 class PronunciationResult:
     """Container for pronunciation assessment results."""
@@ -27,19 +73,41 @@ class PronunciationResult:
     def __init__(
         self,
         accuracy: float,
-        prosody: float,
+        prosody: float | None,
         fluency: float,
         completeness: float,
         recognized_text: str,
         word_scores: dict[str, Any],
+        packed_scores: list | None = None,
     ):
         self.accuracy_score = accuracy
-        self.prosody_score = prosody
+        self.prosody_score = prosody  # None when prosody was not assessed (quick profile)
         self.fluency_score = fluency
         self.completeness_score = completeness
-        self.overall_score = (accuracy + (prosody * 20) + fluency + completeness) / 4
+        if prosody is None:
+            self.overall_score = (accuracy + fluency + completeness) / 3
+        else:
+            self.overall_score = (accuracy + (prosody * 20) + fluency + completeness) / 4
         self.recognized_text = recognized_text
         self.word_level_scores = word_scores
+        self.packed_scores = packed_scores  # Ordered word/phoneme detail (see score_packing)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict (see from_dict)."""
+        return {
+            "accuracy": self.accuracy_score,
+            "prosody": self.prosody_score,
+            "fluency": self.fluency_score,
+            "completeness": self.completeness_score,
+            "recognized_text": self.recognized_text,
+            "word_scores": self.word_level_scores,
+            "packed_scores": self.packed_scores,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PronunciationResult":
+        """Rebuild a result serialized with to_dict (older entries lack packed_scores)."""
+        return cls(**data)
 
 
 class SpeechAssessmentService:
@@ -47,19 +115,53 @@ class SpeechAssessmentService:
     Service for pronunciation assessment.
 
     In mock mode: Returns randomized realistic scores.
-    In Azure mode: Uses Azure Speech SDK for real assessment.
+    In Azure mode: Uses Azure Speech for real assessment, through the SDK or
+    the short-audio REST endpoint (SPEECH_BACKEND); both yield the same result.
+    Recordings too long for single-shot recognition (for streamed uploads, as
+    declared by their WAV header) use SDK continuous recognition (long-form
+    mode, SPEECH_LONG_FORM_ENABLED).
+    With a failover, complete short recordings are hedged across regions.
+
+    Every call takes an assessment profile (see ASSESSMENT_PROFILES): "full"
+    assesses phonemes and prosody, "quick" words only, without prosody.
+
+    With a result_cache, resubmissions of identical audio for the same
+    reference text and profile return the cached result without calling the
+    backend.
+    With an admission controller, every recognition holds one of its slots.
+    Blocking SDK calls run on the executor (a dedicated SpeechExecutor pool),
+    or on the default thread pool without one, never on the event loop.
+    Recognizers come from the client (the app-lifetime SpeechClient, which
+    keeps pre-connected ones warm); without one, each is built on demand.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        result_cache: "PronunciationResultCache | None" = None,
+        admission: "AdmissionController | None" = None,
+        executor: "SpeechExecutor | None" = None,
+        client: "SpeechClient | None" = None,
+        rest: "SpeechRestBackend | None" = None,
+        failover: "SpeechFailover | None" = None,
+    ):
         self.mock_mode = settings.MOCK_MODE
-
-        if not self.mock_mode and not AZURE_SDK_AVAILABLE:
+        self.backend = settings.SPEECH_BACKEND
+        self.result_cache = result_cache
+        self.admission = admission
+        self.executor = executor
+        self._client = client
+        self._rest = rest
+        self.failover = failover
+
+        if self.backend not in ("sdk", "rest"):
+            raise ValueError(f"Unknown SPEECH_BACKEND: {self.backend}")
+        if not self.mock_mode and self.backend == "sdk" and not AZURE_SDK_AVAILABLE:
             raise RuntimeError(
                 "Azure Speech SDK is not available. Install with: pip install azure-cognitiveservices-speech"
             )
 
     async def assess_pronunciation(
-        self, audio_bytes: bytes, reference_text: str
+        self, audio_bytes: bytes, reference_text: str, profile: str = "full"
     ) -> PronunciationResult:
         """
         Assess pronunciation from audio bytes.
@@ -67,29 +169,53 @@ class SpeechAssessmentService:
         Args:
             audio_bytes: Audio file content (WAV format)
             reference_text: Expected text to be spoken
+            profile: Assessment profile ("quick" or "full")
 
         Returns:
             PronunciationResult with scores and detailed feedback
 
         Raises:
+            AdmissionRejectedError: If the speech backend is at capacity
             Exception: If assessment fails
         """
-        if self.mock_mode:
-            logger.info("Using mock pronunciation assessment")
-            return self._mock_assessment(reference_text)
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self.result_cache.key(audio_bytes, reference_text, profile)
+            cached = await self.result_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Using cached pronunciation assessment result")
+                return cached
+
+        async with self._admitted():
+            if self.mock_mode:
+                logger.info("Using mock pronunciation assessment")
+                result = self._mock_assessment(reference_text, profile)
+            else:
+                if self._is_long_form(_duration_seconds(audio_bytes)):
+                    logger.info("Using Azure Speech continuous recognition (long-form)")
+                    result = await self._azure_assessment_long_form(
+                        iter_chunks(audio_bytes), reference_text, profile
+                    )
+                else:
+                    logger.info(
+                        f"Using Azure Speech ({self.backend}) for {profile} pronunciation assessment"
+                    )
+                    result = await self._azure_assessment(audio_bytes, reference_text, profile)
 
-        logger.info("Using Azure Speech SDK for pronunciation assessment")
-        return await self._azure_assessment(audio_bytes, reference_text)
+        if cache_key is not None:
+            await self.result_cache.set(cache_key, result)
+        return result
 
-    def _mock_assessment(self, reference_text: str) -> PronunciationResult:
+    def _mock_assessment(self, reference_text: str, profile: str = "full") -> PronunciationResult:
         """
         Generate mock assessment scores for local development.
         Returns realistic randomized scores.
         """
         words = reference_text.split()
         word_scores = {}
+        mock_words = []
 
-        for word in words:
+        for index, word in enumerate(words):
             # Randomize accuracy for each word (70-100%)
             accuracy = random.uniform(70, 100)
             error_type = random.choice(
@@ -97,10 +223,20 @@ class SpeechAssessmentService:
             )
 
             word_scores[word] = {"accuracy": round(accuracy, 1), "error_type": error_type}
+            # Mock timings: 400 ms per word, in 100 ns ticks like Azure's
+            mock_words.append(
+                {
+                    "Word": word,
+                    "Offset": index * 4_000_000,
+                    "Duration": 4_000_000,
+                    "AccuracyScore": accuracy,
+                    "ErrorType": error_type,
+                }
+            )
 
         # Generate overall scores with some variation
         accuracy = random.uniform(75, 95)
-        prosody = random.uniform(3.5, 5.0)
+        prosody = random.uniform(3.5, 5.0) if profile == "full" else None
         fluency = random.uniform(70, 90)
         completeness = random.uniform(80, 100)
 
@@ -111,104 +247,499 @@ class SpeechAssessmentService:
             completeness=completeness,
             recognized_text=reference_text,  # Mock: return same text
             word_scores=word_scores,
+            packed_scores=pack_scores(mock_words),
         )
 
+    async def assess_pronunciation_stream(
+        self, audio_chunks: AsyncIterator[bytes], reference_text: str, profile: str = "full"
+    ) -> PronunciationResult:
+        """
+        Assess pronunciation from a stream of audio chunks.
+
+        Chunks are pushed into the recognizer as they arrive, so the full
+        recording is never held in memory.
+
+        Args:
+            audio_chunks: Async iterator of audio file chunks (WAV format)
+            reference_text: Expected text to be spoken
+            profile: Assessment profile ("quick" or "full")
+
+        Returns:
+            PronunciationResult with scores and detailed feedback
+
+        Raises:
+            AdmissionRejectedError: If the speech backend is at capacity
+            Exception: If assessment fails
+        """
+        async with self._admitted():
+            if self.mock_mode:
+                logger.info("Using mock pronunciation assessment (streaming)")
+                async for _ in audio_chunks:
+                    pass
+                return self._mock_assessment(reference_text, profile)
+
+            header, audio_chunks = await peek_stream(audio_chunks, STREAM_HEADER_PEEK_BYTES)
+            if self._is_long_form(declared_duration_seconds(header)):
+                logger.info("Using Azure Speech continuous recognition (long-form, streaming)")
+                return await self._azure_assessment_long_form(audio_chunks, reference_text, profile)
+
+            logger.info(
+                f"Using Azure Speech ({self.backend}) for streaming {profile} "
+                "pronunciation assessment"
+            )
+            return await self._azure_assessment_stream(audio_chunks, reference_text, profile)
+
+    def _is_long_form(self, duration_seconds: float | None) -> bool:
+        """
+        Whether to use continuous recognition for a recording of this length.
+
+        Single-shot recognition stops after the first utterance (about 30
+        seconds), so recordings longer than SPEECH_LONG_FORM_MIN_SECONDS go
+        long-form. So do recordings of unknown length (None), such as streams
+        whose recorder left the WAV data size unset: they may run for minutes.
+        """
+        if not settings.SPEECH_LONG_FORM_ENABLED or not AZURE_SDK_AVAILABLE:
+            return False
+        return duration_seconds is None or duration_seconds > settings.SPEECH_LONG_FORM_MIN_SECONDS
+
+    def _admitted(self) -> contextlib.AbstractAsyncContextManager:
+        """Slot from the admission controller, or a no-op without one."""
+        if self.admission is None:
+            return contextlib.nullcontext()
+        return self.admission.slot()
+
+    @property
+    def client(self) -> "SpeechClient":
+        """Speech client recognizers are taken from (a private, unpooled one by default)."""
+        if self._client is None:
+            # Imported here: the class is also used directly as a FastAPI dependency
+            from app.services.speech_client import SpeechClient
+
+            self._client = SpeechClient(pool_size=0, executor=self.executor)
+        return self._client
+
+    @property
+    def rest(self) -> "SpeechRestBackend":
+        """REST backend (one of its own unless given the app's)."""
+        if self._rest is None:
+            self._rest = SpeechRestBackend()
+        return self._rest
+
+    async def _run_blocking(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking SDK call off the event loop."""
+        if self.executor is None:
+            return await asyncio.to_thread(func, *args)
+        return await self.executor.run(func, *args)
+
     async def _azure_assessment(
-        self, audio_bytes: bytes, reference_text: str
+        self, audio_bytes: bytes, reference_text: str, profile: str = "full"
     ) -> PronunciationResult:
         """
         Perform real pronunciation assessment using Azure Speech SDK.
 
-        Uses IELTS-like grading system with phoneme-level granularity.
+        Uses IELTS-like grading system with phoneme-level granularity (word
+        level for the quick profile).
         """
         try:
-            # Configure Speech SDK
-            speech_config = speechsdk.SpeechConfig(
-                subscription=settings.SPEECH_KEY, region=settings.SPEECH_REGION
-            )
+            if self.failover is None:
+                return await self._assess_in(
+                    self.client, self.rest, audio_bytes, reference_text, profile
+                )
 
-            # Configure pronunciation assessment
-            pron_config = speechsdk.PronunciationAssessmentConfig(
-                reference_text=reference_text,
-                grading_system=speechsdk.PronunciationAssessmentGradingSystem.HundredMark,
-                granularity=speechsdk.PronunciationAssessmentGranularity.Phoneme,
-                enable_miscue=True,
-            )
+            async def assess_in_region(region: "SpeechRegion") -> PronunciationResult:
+                return await self._assess_in(
+                    region.client or self.client,
+                    region.rest or self.rest,
+                    audio_bytes,
+                    reference_text,
+                    profile,
+                )
 
-            # Enable prosody assessment
-            pron_config.enable_prosody_assessment()
+            return await self.failover.call(assess_in_region, final_errors=(NoSpeechError,))
 
-            # Create audio stream from bytes
-            stream = speechsdk.audio.PushAudioInputStream()
-            stream.write(audio_bytes)
-            stream.close()
+        except NoSpeechError:
+            raise
+        except Exception as e:
+            logger.error(f"Azure speech assessment failed: {str(e)}")
+            raise Exception(f"Speech assessment failed: {str(e)}")
 
-            audio_config = speechsdk.audio.AudioConfig(stream=stream)
+    async def _assess_in(
+        self,
+        client: "SpeechClient",
+        rest: "SpeechRestBackend",
+        audio_bytes: bytes,
+        reference_text: str,
+        profile: str = "full",
+    ) -> PronunciationResult:
+        """Single-shot assessment through the configured backend of one region."""
+        if self.backend == "rest":
+            return self._build_rest_result(
+                await rest.recognize(
+                    iter_chunks(audio_bytes),
+                    reference_text,
+                    profile,
+                    config=self._assessment_config(reference_text, profile),
+                ),
+                profile,
+            )
 
-            # Create recognizer and apply pronunciation config
-            recognizer = speechsdk.SpeechRecognizer(
-                speech_config=speech_config, audio_config=audio_config
+        warm = await client.acquire()
+        try:
+            result = await self._run_blocking(
+                self._recognize, warm, audio_bytes, reference_text, profile
             )
-            pron_config.apply_to(recognizer)
+        except asyncio.CancelledError:
+            warm.close()  # Aborts a recognition already running in its thread
+            raise
+        return self._build_result(result, profile)
+
+    def _recognize(
+        self, warm: "WarmRecognizer", audio_bytes: bytes, reference_text: str, profile: str
+    ) -> Any:
+        """Blocking single-shot recognition of a complete recording."""
+        try:
+            self._create_pronunciation_config(reference_text, profile).apply_to(warm.recognizer)
+            warm.stream.write(audio_bytes)
+            warm.stream.close()
 
             # Perform recognition
-            result = recognizer.recognize_once()
-
-            if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-                # Extract pronunciation assessment results
-                pron_result = speechsdk.PronunciationAssessmentResult(result)
-
-                # Extract word-level scores
-                word_scores = self._extract_word_scores(result)
-
-                return PronunciationResult(
-                    accuracy=pron_result.accuracy_score,
-                    prosody=pron_result.prosody_score / 20,  # Convert 0-100 to 0-5
-                    fluency=pron_result.fluency_score,
-                    completeness=pron_result.completeness_score,
-                    recognized_text=result.text,
-                    word_scores=word_scores,
+            return warm.recognizer.recognize_once()
+        finally:
+            warm.close()
+
+    async def _azure_assessment_stream(
+        self, audio_chunks: AsyncIterator[bytes], reference_text: str, profile: str = "full"
+    ) -> PronunciationResult:
+        """
+        Perform Azure pronunciation assessment while audio is still arriving.
+
+        Recognition starts before the first chunk is written; the stream is
+        closed once the input is exhausted (or fails) so the SDK can finish.
+        With the REST backend the chunks become the chunked request body.
+        """
+        try:
+            if self.backend == "rest":
+                return self._build_rest_result(
+                    await self.rest.recognize(
+                        audio_chunks,
+                        reference_text,
+                        profile,
+                        config=self._assessment_config(reference_text, profile),
+                    ),
+                    profile,
                 )
-            elif result.reason == speechsdk.ResultReason.NoMatch:
-                raise Exception("No speech could be recognized from the audio")
-            elif result.reason == speechsdk.ResultReason.Canceled:
-                cancellation = speechsdk.CancellationDetails(result)
-                raise Exception(f"Speech recognition canceled: {cancellation.reason}")
-            else:
-                raise Exception(f"Unexpected result reason: {result.reason}")
 
+            warm = await self.client.acquire()
+            try:
+                self._create_pronunciation_config(reference_text, profile).apply_to(warm.recognizer)
+                result_future = warm.recognizer.recognize_once_async()
+
+                try:
+                    async for chunk in audio_chunks:
+                        warm.stream.write(chunk)
+                finally:
+                    warm.stream.close()
+
+                # Waiting on the SDK future blocks, so keep it off the event loop
+                result = await self._run_blocking(result_future.get)
+            finally:
+                warm.close()
+
+            return self._build_result(result, profile)
+
+        except NoSpeechError:
+            raise
         except Exception as e:
-            logger.error(f"Azure speech assessment failed: {str(e)}")
+            logger.error(f"Azure streaming speech assessment failed: {str(e)}")
             raise Exception(f"Speech assessment failed: {str(e)}")
 
-    def _extract_word_scores(self, result: Any) -> dict[str, Any]:
+    async def _azure_assessment_long_form(
+        self, audio_chunks: AsyncIterator[bytes], reference_text: str, profile: str = "full"
+    ) -> PronunciationResult:
         """
-        Extract word-level scores from Azure Speech SDK result.
+        Assess a recording of any length with continuous recognition.
 
-        Returns dictionary mapping words to their accuracy and error type.
+        Recognition runs while audio is pushed; each utterance (segment) the
+        service recognizes is parsed as it arrives, so only the last one is
+        outstanding when the input ends. Segments are then combined by
+        _aggregate_segments.
         """
-        word_scores = {}
-
         try:
-            # Parse JSON result for detailed word scores
-            import json
+            loop = asyncio.get_running_loop()
+            segments: list[dict[str, Any]] = []
+            stopped: asyncio.Future[str | None] = loop.create_future()
+
+            def finish(error: str | None = None) -> None:
+                if not stopped.done():
+                    stopped.set_result(error)
+
+            # SDK callbacks run on SDK threads; hand results to the event loop
+            def on_recognized(evt: Any) -> None:
+                if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
+                    segment = json.loads(
+                        evt.result.properties.get(
+                            speechsdk.PropertyId.SpeechServiceResponse_JsonResult
+                        )
+                    )
+                    loop.call_soon_threadsafe(segments.append, segment)
+
+            def on_canceled(evt: Any) -> None:
+                details = evt.cancellation_details
+                error = None
+                if details.reason == speechsdk.CancellationReason.Error:
+                    error = f"{details.reason}: {details.error_details}"
+                loop.call_soon_threadsafe(finish, error)
+
+            warm = await self.client.acquire(continuous=True)
+            try:
+                recognizer = warm.recognizer
+                self._create_pronunciation_config(reference_text, profile).apply_to(recognizer)
+                recognizer.recognized.connect(on_recognized)
+                recognizer.canceled.connect(on_canceled)
+                recognizer.session_stopped.connect(
+                    lambda evt: loop.call_soon_threadsafe(finish, None)
+                )
+                await self._run_blocking(recognizer.start_continuous_recognition)
+
+                try:
+                    async for chunk in audio_chunks:
+                        warm.stream.write(chunk)
+                finally:
+                    warm.stream.close()
+
+                error = await asyncio.wait_for(stopped, time_left(LONG_FORM_DRAIN_TIMEOUT_SECONDS))
+                await self._run_blocking(recognizer.stop_continuous_recognition)
+            finally:
+                warm.close()
+
+            if error:
+                raise Exception(f"Speech recognition canceled: {error}")
+            logger.info(f"Long-form recognition finished with {len(segments)} segments")
+
+        except Exception as e:
+            logger.error(f"Azure long-form speech assessment failed: {str(e)}")
+            raise Exception(f"Speech assessment failed: {str(e)}")
+
+        return self._aggregate_segments(segments, reference_text, profile)
+
+    def _aggregate_segments(
+        self, segments: list[dict[str, Any]], reference_text: str, profile: str = "full"
+    ) -> PronunciationResult:
+        """
+        Combine continuous-recognition segments into one result.
+
+        Accuracy, fluency and prosody are averaged weighted by segment
+        duration. Each segment only covers part of the reference text, so
+        completeness is the share of reference words spoken across all
+        segments (duration-weighted segment scores without a reference).
+        Word scores are merged in speaking order; the packed scores keep
+        every word of every segment (offsets are from the start of the audio).
+        """
+        scored = [segment for segment in segments if segment.get("NBest")]
+        if not scored:
+            raise NoSpeechError("No speech could be recognized from the audio")
+
+        totals = {"AccuracyScore": 0.0, "FluencyScore": 0.0, "ProsodyScore": 0.0}
+        total_completeness = 0.0
+        total_weight = 0.0
+        word_scores: dict[str, Any] = {}
+        words: list[dict[str, Any]] = []
+        spoken: Counter[str] = Counter()
+
+        for segment in scored:
+            best = segment["NBest"][0]
+            scores = best.get("PronunciationAssessment", best)
+            weight = segment.get("Duration") or best.get("Duration") or 1
+            for name in totals:
+                totals[name] += scores.get(name, 0) * weight
+            total_completeness += scores.get("CompletenessScore", 0) * weight
+            total_weight += weight
+
+            word_scores.update(self._word_scores_from_json(segment))
+            words.extend(best.get("Words", []))
+            for word_info in best.get("Words", []):
+                assessment = word_info.get("PronunciationAssessment", word_info)
+                if assessment.get("ErrorType", "None") not in ("Omission", "Insertion"):
+                    spoken[normalize_word(word_info.get("Word", ""))] += 1
+
+        prepared = get_phrase_cache().lookup(reference_text)
+        reference = Counter(prepared.words if prepared else reference_words(reference_text))
+        if reference:
+            matched = sum(min(count, spoken[word]) for word, count in reference.items())
+            completeness = 100 * matched / sum(reference.values())
+        else:
+            completeness = total_completeness / total_weight
+
+        return PronunciationResult(
+            accuracy=totals["AccuracyScore"] / total_weight,
+            prosody=(
+                totals["ProsodyScore"] / total_weight / 20  # Convert 0-100 to 0-5
+                if profile == "full"
+                else None
+            ),
+            fluency=totals["FluencyScore"] / total_weight,
+            completeness=completeness,
+            recognized_text=" ".join(
+                segment.get("DisplayText", segment["NBest"][0].get("Display", ""))
+                for segment in scored
+            ),
+            word_scores=word_scores,
+            packed_scores=pack_scores(words),
+        )
+
+    def _assessment_config(self, reference_text: str, profile: str) -> str:
+        """
+        Serialized assessment settings for a reference text and profile.
 
-            result_json = json.loads(
+        Taken from the phrase cache when the text is a cached phrase's (the
+        usual case for /assess), otherwise built on the spot. Miscue stays on
+        for both profiles: omissions are part of the word colors.
+        """
+        prepared = get_phrase_cache().lookup(reference_text)
+        if prepared is not None:
+            return prepared.assessment_config(profile)
+        return assessment_config_json(reference_text, profile)
+
+    def _create_pronunciation_config(self, reference_text: str, profile: str = "full") -> Any:
+        """Pronunciation assessment settings for one reference text and profile."""
+        pron_config = speechsdk.PronunciationAssessmentConfig(
+            json_string=self._assessment_config(reference_text, profile)
+        )
+
+        if profile == "full":
+            pron_config.enable_prosody_assessment()
+        return pron_config
+
+    def _build_result(self, result: Any, profile: str = "full") -> PronunciationResult:
+        """Convert an Azure recognition result into a PronunciationResult."""
+        if result.reason == speechsdk.ResultReason.RecognizedSpeech:
+            # Extract pronunciation assessment results
+            pron_result = speechsdk.PronunciationAssessmentResult(result)
+
+            # Extract word- and phoneme-level scores
+            result_json = self._result_json(result)
+
+            return PronunciationResult(
+                accuracy=pron_result.accuracy_score,
+                prosody=(
+                    pron_result.prosody_score / 20  # Convert 0-100 to 0-5
+                    if profile == "full"
+                    else None
+                ),
+                fluency=pron_result.fluency_score,
+                completeness=pron_result.completeness_score,
+                recognized_text=result.text,
+                word_scores=self._word_scores_from_json(result_json),
+                packed_scores=self._packed_scores_from_json(result_json),
+            )
+        elif result.reason == speechsdk.ResultReason.NoMatch:
+            raise NoSpeechError("No speech could be recognized from the audio")
+        elif result.reason == speechsdk.ResultReason.Canceled:
+            cancellation = speechsdk.CancellationDetails(result)
+            raise Exception(f"Speech recognition canceled: {cancellation.reason}")
+        else:
+            raise Exception(f"Unexpected result reason: {result.reason}")
+
+    def _build_rest_result(
+        self, result_json: dict[str, Any], profile: str = "full"
+    ) -> PronunciationResult:
+        """Convert a REST detailed recognition result into a PronunciationResult."""
+        status = result_json.get("RecognitionStatus")
+        if status == "Success" and result_json.get("NBest"):
+            best = result_json["NBest"][0]
+            scores = best.get("PronunciationAssessment", best)
+
+            return PronunciationResult(
+                accuracy=scores.get("AccuracyScore", 0),
+                prosody=(
+                    scores.get("ProsodyScore", 0) / 20  # Convert 0-100 to 0-5
+                    if profile == "full"
+                    else None
+                ),
+                fluency=scores.get("FluencyScore", 0),
+                completeness=scores.get("CompletenessScore", 0),
+                recognized_text=result_json.get("DisplayText", best.get("Display", "")),
+                word_scores=self._word_scores_from_json(result_json),
+                packed_scores=self._packed_scores_from_json(result_json),
+            )
+        elif status in ("Success", "NoMatch", "InitialSilenceTimeout", "BabbleTimeout"):
+            raise NoSpeechError("No speech could be recognized from the audio")
+        else:
+            raise Exception(f"Speech recognition canceled: {status}")
+
+    def _result_json(self, result: Any) -> dict[str, Any]:
+        """
+        Detailed JSON result of an Azure Speech SDK result.
+
+        Returns an empty dict (no word-level scores) if it cannot be read.
+        """
+        try:
+            return json.loads(
                 result.properties.get(speechsdk.PropertyId.SpeechServiceResponse_JsonResult)
             )
+        except Exception as e:
+            logger.warning(f"Could not extract word-level scores: {str(e)}")
+            return {}
 
+    def _word_scores_from_json(self, result_json: dict[str, Any]) -> dict[str, Any]:
+        """Map words to accuracy and error type from a detailed JSON result (SDK or REST)."""
+        word_scores = {}
+
+        try:
             if "NBest" in result_json and len(result_json["NBest"]) > 0:
                 words = result_json["NBest"][0].get("Words", [])
 
                 for word_info in words:
                     word = word_info.get("Word", "")
-                    accuracy = word_info.get("PronunciationAssessment", {}).get("AccuracyScore", 0)
-                    error_type = word_info.get("PronunciationAssessment", {}).get(
-                        "ErrorType", "None"
-                    )
+                    # The REST endpoint may report scores on the word itself
+                    assessment = word_info.get("PronunciationAssessment", word_info)
+                    accuracy = assessment.get("AccuracyScore", 0)
+                    error_type = assessment.get("ErrorType", "None")
 
                     word_scores[word] = {"accuracy": accuracy, "error_type": error_type}
         except Exception as e:
             logger.warning(f"Could not extract word-level scores: {str(e)}")
 
         return word_scores
+
+    def _packed_scores_from_json(self, result_json: dict[str, Any]) -> list | None:
+        """Ordered word and phoneme scores from a detailed JSON result (SDK or REST)."""
+        try:
+            if result_json.get("NBest"):
+                return pack_scores(result_json["NBest"][0].get("Words", []))
+        except Exception as e:
+            logger.warning(f"Could not pack word-level scores: {str(e)}")
+        return None
+
+
+def _duration_seconds(audio_bytes: bytes) -> float | None:
+    """Duration of a complete WAV recording, or None if it can't be parsed."""
+    try:
+        return WavAudio.parse(audio_bytes).duration_seconds
+    except WavFormatError:
+        return None
+
+
+async def peek_stream(
+    audio_chunks: AsyncIterator[bytes], size: int
+) -> tuple[bytes, AsyncIterator[bytes]]:
+    """
+    Read at least size bytes (or the whole stream, if shorter) ahead.
+
+    Returns:
+        Tuple of (bytes read ahead, stream yielding them followed by the rest)
+    """
+    chunks = aiter(audio_chunks)
+    head = b""
+    async for chunk in chunks:
+        head += chunk
+        if len(head) >= size:
+            break
+
+    async def replay() -> AsyncIterator[bytes]:
+        if head:
+            yield head
+        async for chunk in chunks:
+            yield chunk
+
+    return head, replay()
@@ -0,0 +1,117 @@
+"""
+Energy-based voice activity detection for trimming silence.
+Learners usually start recording before they speak and stop late; cutting the
+leading and trailing silence shortens what is recognized, encrypted and stored.
+"""
+
+import logging
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.audio_preflight import FRAME_SECONDS, frame_levels_dbfs
+from app.services.wav_audio import WavAudio, WavFormatError
+
+logger = logging.getLogger(__name__)
+
+# Consecutive loud frames needed to count as speech (ignores clicks and pops)
+MIN_SPEECH_FRAMES = 3
+
+
+class SilenceTrim:
+    """Region of the original recording kept after trimming, in seconds."""
+
+    def __init__(self, start_seconds: float, end_seconds: float, original_duration: float):
+        self.start_seconds = start_seconds
+        self.end_seconds = end_seconds
+        self.original_duration = original_duration
+
+    @property
+    def trimmed(self) -> bool:
+        """True if any audio was removed."""
+        return self.start_seconds > 0 or self.end_seconds < self.original_duration
+
+
+def detect_speech_bounds(
+    samples: np.ndarray,
+    sample_rate: int,
+    threshold_dbfs: float,
+    padding_seconds: float = 0.0,
+) -> tuple[int, int] | None:
+    """
+    Find the first and last speech in mono samples.
+
+    A frame is speech when its RMS level is above threshold_dbfs and it
+    belongs to a run of at least MIN_SPEECH_FRAMES such frames.
+
+    Args:
+        samples: Mono float samples in [-1, 1]
+        sample_rate: Sample rate in Hz
+        threshold_dbfs: Frame level above which a frame counts as speech
+        padding_seconds: Silence kept before the first and after the last speech
+
+    Returns:
+        (start_sample, end_sample) of the padded speech region, or None if
+        the recording has no speech
+    """
+    levels = frame_levels_dbfs(samples, sample_rate)
+    if len(levels) < MIN_SPEECH_FRAMES:
+        return None
+
+    # Window sums equal MIN_SPEECH_FRAMES only where every frame is loud
+    loud = (levels > threshold_dbfs).astype(np.int32)
+    window_sums = np.convolve(loud, np.ones(MIN_SPEECH_FRAMES, dtype=np.int32), "valid")
+    runs = np.flatnonzero(window_sums == MIN_SPEECH_FRAMES)
+    if runs.size == 0:
+        return None
+
+    frame_length = min(max(1, int(sample_rate * FRAME_SECONDS)), len(samples))
+    padding = int(padding_seconds * sample_rate)
+    start = max(0, runs[0] * frame_length - padding)
+    end = (runs[-1] + MIN_SPEECH_FRAMES) * frame_length + padding
+    # Speech running into the final partial frame keeps the recording's tail
+    if end >= len(levels) * frame_length:
+        end = len(samples)
+    return int(start), int(min(end, len(samples)))
+
+
+def trim_silence(audio_bytes: bytes) -> tuple[bytes, SilenceTrim | None]:
+    """
+    Remove leading and trailing silence from a WAV recording.
+
+    The kept frames are copied in the original encoding, so trimming is
+    lossless. Recordings that aren't readable PCM WAV files, or in which no
+    speech is found, are returned unchanged.
+
+    Args:
+        audio_bytes: Audio file content (WAV format)
+
+    Returns:
+        Tuple of (trimmed WAV bytes, kept region or None if not analyzed)
+    """
+    try:
+        wav = WavAudio.parse(audio_bytes)
+    except WavFormatError:
+        return audio_bytes, None
+
+    duration = wav.duration_seconds
+    bounds = detect_speech_bounds(
+        wav.mono(),
+        wav.sample_rate,
+        settings.AUDIO_SPEECH_THRESHOLD_DBFS,
+        settings.AUDIO_TRIM_PADDING_SECONDS,
+    )
+    if bounds is None:
+        return audio_bytes, SilenceTrim(0.0, duration, duration)
+
+    start, end = bounds
+    trim = SilenceTrim(start / wav.sample_rate, end / wav.sample_rate, duration)
+    if not trim.trimmed:
+        return audio_bytes, trim
+
+    trimmed = wav.slice(start, end)
+    logger.info(
+        f"Trimmed silence: kept {trim.start_seconds:.2f}-{trim.end_seconds:.2f}s "
+        f"of {duration:.2f}s ({len(audio_bytes)} -> {len(trimmed)} bytes)"
+    )
+    return trimmed, trim
@@ -0,0 +1,235 @@
+"""
+WAV (RIFF) parsing and PCM sample conversion.
+Used by the audio preflight, normalization, silence trimming and storage codec.
+"""
+
+import struct
+
+import numpy as np
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Data chunk sizes written by recorders that stream without seeking back
+_UNKNOWN_DATA_SIZES = (0, 0xFFFFFFFF)
+
+_CHUNK_HEADER = struct.Struct("<4sI")
+_FMT_CHUNK = struct.Struct("<HHIIHH")
+
+
+class WavFormatError(ValueError):
+    """Raised when audio is not a well-formed WAV file."""
+
+
+class UnsupportedWavFormatError(WavFormatError):
+    """Raised for a well-formed WAV file whose encoding isn't integer PCM."""
+
+
+class WavAudio:
+    """Decoded RIFF/WAV header with a view of the PCM payload."""
+
+    def __init__(
+        self,
+        format_tag: int,
+        channels: int,
+        sample_rate: int,
+        bits_per_sample: int,
+        pcm_data: bytes,
+        truncated: bool = False,
+        data_offset: int = 0,
+    ):
+        self.format_tag = format_tag
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.bits_per_sample = bits_per_sample
+        self.pcm_data = pcm_data
+        self.truncated = truncated  # Data chunk shorter than its header declares
+        self.data_offset = data_offset  # Position of pcm_data in the parsed file
+
+    @property
+    def block_align(self) -> int:
+        """Bytes per frame (one sample for every channel)."""
+        return self.channels * (self.bits_per_sample // 8)
+
+    @property
+    def num_frames(self) -> int:
+        return len(self.pcm_data) // self.block_align
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.num_frames / self.sample_rate
+
+    def samples(self) -> np.ndarray:
+        """
+        PCM samples as float32 in [-1, 1], shaped (frames, channels).
+        """
+        data = self.pcm_data[: self.num_frames * self.block_align]
+        width = self.bits_per_sample // 8
+
+        if width == 1:  # 8-bit PCM is unsigned
+            raw = np.frombuffer(data, dtype=np.uint8).astype(np.float32)
+            samples = (raw - 128.0) / 128.0
+        elif width == 2:
+            samples = np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+        elif width == 3:
+            # Sign-extend 24-bit little-endian samples into int32
+            triples = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+            raw = triples[:, 0] | (triples[:, 1] << 8) | (triples[:, 2] << 16)
+            raw = np.where(raw & 0x800000, raw - 0x1000000, raw)
+            samples = raw.astype(np.float32) / 8388608.0
+        else:
+            samples = np.frombuffer(data, dtype="<i4").astype(np.float32) / 2147483648.0
+
+        return samples.reshape(-1, self.channels)
+
+    def slice(self, start_frame: int, end_frame: int) -> bytes:
+        """WAV file bytes holding frames [start_frame, end_frame) in the original encoding."""
+        pcm = self.pcm_data[start_frame * self.block_align : end_frame * self.block_align]
+        return encode_pcm_wav(pcm, self.sample_rate, self.channels, self.bits_per_sample)
+
+    def mono(self, samples: np.ndarray | None = None) -> np.ndarray:
+        """Samples averaged across channels, as float32 in [-1, 1]."""
+        samples = self.samples() if samples is None else samples
+        return samples[:, 0] if self.channels == 1 else samples.mean(axis=1, dtype=np.float32)
+
+    @classmethod
+    def parse(cls, audio_bytes: bytes) -> "WavAudio":
+        """
+        Parse a RIFF/WAV file.
+
+        Raises:
+            WavFormatError: If the bytes are not a readable WAV file
+            UnsupportedWavFormatError: If the WAV file isn't integer PCM
+        """
+        fmt_chunk, data_offset, data_length, truncated = read_wav_chunks(audio_bytes)
+        return cls(
+            *_parse_fmt(fmt_chunk),
+            pcm_data=audio_bytes[data_offset : data_offset + data_length],
+            truncated=truncated,
+            data_offset=data_offset,
+        )
+
+
+def read_wav_chunks(audio_bytes: bytes) -> tuple[bytes, int, int, bool]:
+    """
+    Locate the fmt and data chunks of a RIFF/WAV file.
+
+    Returns:
+        Tuple of (fmt chunk body, data offset, data length, truncated)
+
+    Raises:
+        WavFormatError: If the bytes are not a readable WAV file
+    """
+    if len(audio_bytes) < 12 or audio_bytes[:4] != b"RIFF" or audio_bytes[8:12] != b"WAVE":
+        raise WavFormatError("Audio is not a WAV file (missing RIFF/WAVE header)")
+
+    fmt_chunk = None
+    offset = 12
+    while offset + _CHUNK_HEADER.size <= len(audio_bytes):
+        chunk_id, chunk_size = _CHUNK_HEADER.unpack_from(audio_bytes, offset)
+        body = offset + _CHUNK_HEADER.size
+
+        if chunk_id == b"fmt ":
+            if chunk_size < _FMT_CHUNK.size or body + chunk_size > len(audio_bytes):
+                raise WavFormatError("WAV fmt chunk is truncated")
+            fmt_chunk = audio_bytes[body : body + chunk_size]
+
+        elif chunk_id == b"data":
+            if fmt_chunk is None:
+                raise WavFormatError("WAV data chunk appears before the fmt chunk")
+            available = len(audio_bytes) - body
+            truncated = chunk_size not in _UNKNOWN_DATA_SIZES and chunk_size > available
+            if chunk_size in _UNKNOWN_DATA_SIZES or truncated:
+                chunk_size = available
+            return fmt_chunk, body, chunk_size, truncated
+
+        offset = body + chunk_size + (chunk_size & 1)  # Chunks are word-aligned
+
+    raise WavFormatError("WAV file has no data chunk")
+
+
+def declared_data_size(header: bytes) -> int | None:
+    """
+    Size of the data chunk declared by the header of a WAV file that may still be arriving.
+
+    Only the bytes up to the data chunk header are needed.
+
+    Returns:
+        Bytes of audio data the header declares, or None if the bytes don't
+        hold a WAV header or the recorder left the data size unknown
+    """
+    try:
+        _, data_offset, _, _ = read_wav_chunks(header)
+    except WavFormatError:
+        return None
+    _, data_size = _CHUNK_HEADER.unpack_from(header, data_offset - _CHUNK_HEADER.size)
+    return None if data_size in _UNKNOWN_DATA_SIZES else data_size
+
+
+def declared_duration_seconds(header: bytes) -> float | None:
+    """
+    Duration declared by the header of a WAV file that may still be arriving.
+
+    Returns:
+        Seconds of audio the data chunk declares, or None if the bytes don't
+        hold a WAV header or the recorder left the data size unknown
+    """
+    data_size = declared_data_size(header)
+    if data_size is None:
+        return None
+    byte_rate = _FMT_CHUNK.unpack_from(read_wav_chunks(header)[0])[3]
+    return data_size / byte_rate if byte_rate else None
+
+
+def read_format_tag(fmt_chunk: bytes) -> int:
+    """Encoding of a fmt chunk, resolving WAVE_FORMAT_EXTENSIBLE to its SubFormat."""
+    format_tag = struct.unpack_from("<H", fmt_chunk)[0]
+    if format_tag == WAVE_FORMAT_EXTENSIBLE and len(fmt_chunk) >= 26:
+        # The real format is the first two bytes of the SubFormat GUID
+        format_tag = struct.unpack_from("<H", fmt_chunk, 24)[0]
+    return format_tag
+
+
+def _parse_fmt(chunk: bytes) -> tuple[int, int, int, int]:
+    """Validate a fmt chunk; returns (format_tag, channels, sample_rate, bits_per_sample)."""
+    _, channels, sample_rate, _, _, bits_per_sample = _FMT_CHUNK.unpack_from(chunk)
+    format_tag = read_format_tag(chunk)
+
+    if format_tag != WAVE_FORMAT_PCM:
+        raise UnsupportedWavFormatError(
+            f"Unsupported WAV encoding (format tag 0x{format_tag:04x}); expected PCM"
+        )
+    if bits_per_sample not in (8, 16, 24, 32):
+        raise UnsupportedWavFormatError(f"Unsupported PCM sample size: {bits_per_sample} bits")
+    if channels < 1 or sample_rate < 1:
+        raise WavFormatError("WAV header has an invalid channel count or sample rate")
+
+    return format_tag, channels, sample_rate, bits_per_sample
+
+
+def encode_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    """Encode mono float samples in [-1, 1] as a 16-bit PCM WAV file."""
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767.0).round().astype("<i2").tobytes()
+    return encode_pcm_wav(pcm, sample_rate, channels=1, bits_per_sample=16)
+
+
+def encode_pcm_wav(pcm: bytes, sample_rate: int, channels: int, bits_per_sample: int) -> bytes:
+    """Wrap raw little-endian PCM frames in a canonical 44-byte WAV header."""
+    block_align = channels * (bits_per_sample // 8)
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + len(pcm),  # ChunkSize
+        b"WAVE",
+        b"fmt ",
+        16,  # Subchunk1Size (PCM)
+        WAVE_FORMAT_PCM,
+        channels,
+        sample_rate,
+        sample_rate * block_align,  # ByteRate
+        block_align,
+        bits_per_sample,
+        b"data",
+        len(pcm),
+    )
+    return header + pcm
@@ -0,0 +1,191 @@
+"""
+Decoders for compact WAV encodings accepted from mobile clients.
+8-bit mu-law (G.711) and 4-bit IMA-ADPCM uploads are 2-4x smaller than 16-bit
+PCM; they are decoded to 16-bit PCM WAV on arrival so the rest of the
+pipeline (preflight, normalization, scoring, storage) only ever sees PCM.
+"""
+
+import logging
+import struct
+
+import numpy as np
+
+from app.services.wav_audio import (
+    UnsupportedWavFormatError,
+    WavFormatError,
+    encode_pcm_wav,
+    read_format_tag,
+    read_wav_chunks,
+)
+
+logger = logging.getLogger(__name__)
+
+WAVE_FORMAT_MULAW = 0x0007
+WAVE_FORMAT_IMA_ADPCM = 0x0011
+
+# Format tags decoded by decode_compact_wav, with their names
+COMPACT_ENCODINGS = {WAVE_FORMAT_MULAW: "mu-law", WAVE_FORMAT_IMA_ADPCM: "IMA-ADPCM"}
+
+_FMT_CHUNK = struct.Struct("<HHIIHH")
+
+
+def _mulaw_table() -> np.ndarray:
+    """16-bit sample for each of the 256 G.711 mu-law codes."""
+    codes = ~np.arange(256, dtype=np.int32) & 0xFF
+    exponent = (codes >> 4) & 0x07
+    mantissa = codes & 0x0F
+    magnitude = (((mantissa << 3) + 0x84) << exponent) - 0x84
+    return np.where(codes & 0x80, -magnitude, magnitude).astype(np.int16)
+
+
+MULAW_TABLE = _mulaw_table()
+
+IMA_INDEX_TABLE = np.array([-1, -1, -1, -1, 2, 4, 6, 8] * 2, dtype=np.int32)
+IMA_STEP_TABLE = np.array(
+    [
+        7, 8, 9, 10, 11, 12, 13, 14, 16, 17, 19, 21, 23, 25, 28, 31, 34, 37, 41, 45,
+        50, 55, 60, 66, 73, 80, 88, 97, 107, 118, 130, 143, 157, 173, 190, 209, 230,
+        253, 279, 307, 337, 371, 408, 449, 494, 544, 598, 658, 724, 796, 876, 963,
+        1060, 1166, 1282, 1411, 1552, 1707, 1878, 2066, 2272, 2499, 2749, 3024, 3327,
+        3660, 4026, 4428, 4871, 5358, 5894, 6484, 7132, 7845, 8630, 9493, 10442,
+        11487, 12635, 13899, 15289, 16818, 18500, 20350, 22385, 24623, 27086, 29794,
+        32767,
+    ],
+    dtype=np.int32,
+)  # fmt: skip
+
+
+def decode_mulaw(data: bytes) -> np.ndarray:
+    """Decode interleaved mu-law bytes to int16 samples."""
+    return MULAW_TABLE[np.frombuffer(data, dtype=np.uint8)]
+
+
+def decode_ima_adpcm(data: bytes, channels: int, block_align: int) -> np.ndarray:
+    """
+    Decode Microsoft/DVI IMA-ADPCM blocks to interleaved int16 samples.
+
+    Each block starts with a per-channel header (initial sample and step
+    index), so blocks are independent: the sample-by-sample recurrence runs
+    over all blocks and channels at once.
+
+    Raises:
+        WavFormatError: If the block layout is invalid
+    """
+    header_size = 4 * channels
+    if block_align <= header_size or (block_align - header_size) % header_size:
+        raise WavFormatError(f"Invalid IMA-ADPCM block size {block_align} for {channels} channels")
+
+    num_blocks = -(-len(data) // block_align)
+
+    # A short final block is padded; its extra samples are dropped at the end
+    last_block = len(data) - (num_blocks - 1) * block_align
+    if last_block < header_size:
+        num_blocks -= 1
+        last_block = block_align
+    if num_blocks == 0:
+        return np.zeros(0, dtype=np.int16)
+
+    padded = data[: num_blocks * block_align].ljust(num_blocks * block_align, b"\0")
+    blocks = np.frombuffer(padded, dtype=np.uint8).reshape(num_blocks, block_align)
+
+    headers = blocks[:, :header_size].reshape(num_blocks, channels, 4)
+    predictor = headers[:, :, 0].astype(np.int32) | (headers[:, :, 1].astype(np.int32) << 8)
+    predictor = np.where(predictor & 0x8000, predictor - 0x10000, predictor)
+    index = np.clip(headers[:, :, 2].astype(np.int32), 0, 88)
+
+    # Channel data is interleaved in 4-byte (8-sample) groups
+    body = blocks[:, header_size:].reshape(num_blocks, -1, channels, 4).transpose(0, 2, 1, 3)
+    body = body.reshape(num_blocks, channels, -1)
+    nibbles = np.stack((body & 0x0F, body >> 4), axis=-1).reshape(num_blocks, channels, -1)
+    nibbles = nibbles.astype(np.int32)
+
+    samples_per_block = nibbles.shape[2] + 1
+    output = np.empty((num_blocks, channels, samples_per_block), dtype=np.int16)
+    output[:, :, 0] = predictor
+
+    for i in range(nibbles.shape[2]):
+        nibble = nibbles[:, :, i]
+        step = IMA_STEP_TABLE[index]
+        diff = step >> 3
+        diff += np.where(nibble & 4, step, 0)
+        diff += np.where(nibble & 2, step >> 1, 0)
+        diff += np.where(nibble & 1, step >> 2, 0)
+        predictor = np.clip(np.where(nibble & 8, predictor - diff, predictor + diff), -32768, 32767)
+        index = np.clip(index + IMA_INDEX_TABLE[nibble], 0, 88)
+        output[:, :, i + 1] = predictor
+
+    interleaved = output.transpose(0, 2, 1).reshape(-1, channels)
+    samples_in_last = 1 + (last_block - header_size) * 2 // channels
+    num_frames = (num_blocks - 1) * samples_per_block + samples_in_last
+    return interleaved[:num_frames].reshape(-1)
+
+
+def decode_compact_wav(audio_bytes: bytes) -> bytes:
+    """
+    Convert a mu-law or IMA-ADPCM WAV file to 16-bit PCM WAV.
+
+    Anything else (PCM WAV, non-WAV data) is returned unchanged, leaving it
+    to the preflight to accept or reject. A file whose data chunk is shorter
+    than its header declares is decoded with the decoded size of the declared
+    data in its header, so the preflight still rejects it as truncated.
+
+    Args:
+        audio_bytes: Audio file content (WAV format)
+
+    Returns:
+        WAV file bytes in 16-bit PCM
+
+    Raises:
+        WavFormatError: If a mu-law or IMA-ADPCM file is malformed
+    """
+    try:
+        fmt_chunk, data_offset, data_length, truncated = read_wav_chunks(audio_bytes)
+    except WavFormatError:
+        return audio_bytes
+
+    format_tag = read_format_tag(fmt_chunk)
+    if format_tag not in COMPACT_ENCODINGS:
+        return audio_bytes
+
+    _, channels, sample_rate, _, block_align, bits_per_sample = _FMT_CHUNK.unpack_from(fmt_chunk)
+    if channels < 1 or sample_rate < 1:
+        raise WavFormatError("WAV header has an invalid channel count or sample rate")
+    data = audio_bytes[data_offset : data_offset + data_length]
+
+    if format_tag == WAVE_FORMAT_MULAW:
+        if bits_per_sample != 8:
+            raise UnsupportedWavFormatError(
+                f"Unsupported mu-law sample size: {bits_per_sample} bits"
+            )
+        samples = decode_mulaw(data[: len(data) - len(data) % channels])
+        samples_per_byte = 1.0
+    else:
+        if bits_per_sample != 4:
+            raise UnsupportedWavFormatError(
+                f"Unsupported IMA-ADPCM sample size: {bits_per_sample} bits"
+            )
+        samples = decode_ima_adpcm(data, channels, block_align)
+        samples_per_byte = 2.0
+
+    pcm = samples.astype("<i2").tobytes()
+    logger.info(
+        f"Decoded {COMPACT_ENCODINGS[format_tag]} upload ({sample_rate}Hz, {channels}ch): "
+        f"{len(audio_bytes)} -> {len(pcm) + 44} bytes"
+    )
+    wav = encode_pcm_wav(pcm, sample_rate, channels, bits_per_sample=16)
+    if truncated:
+        # An upper bound for IMA-ADPCM (block headers hold fewer samples than their
+        # size); what matters is that it exceeds the data that arrived
+        declared = struct.unpack_from("<I", audio_bytes, data_offset - 4)[0]
+        wav = _declare_data_size(wav, max(int(declared * samples_per_byte) * 2, len(pcm) + 2))
+    return wav
+
+
+def _declare_data_size(wav: bytes, data_size: int) -> bytes:
+    """Rewrite the sizes in a canonical 44-byte WAV header to declare data_size bytes."""
+    return (
+        struct.pack("<4sI", b"RIFF", 36 + data_size)
+        + wav[8:40]
+        + struct.pack("<I", data_size)
+        + wav[44:]
+    )
@@ -0,0 +1,84 @@
+"""
+Benchmark for the quick and full assessment profiles.
+
+Assesses the same recording against Azure Speech with the "full" profile
+(phoneme granularity, prosody) and the "quick" profile (word granularity,
+no prosody), alternating between them so both see the same network and
+service conditions, and reports p50/p95 latency of each. Uses the
+configured SPEECH_BACKEND through a pre-warmed client, so connection setup
+is not part of the comparison.
+
+Usage (from backend/, with SPEECH_KEY and SPEECH_REGION set):
+    poetry run python -m benchmarks.assessment_profiles [recording.wav] [--runs 20]
+
+Without a path, a synthetic speech-like recording is used (see
+benchmarks.speech_client); pass a real recording of the reference text
+for meaningful numbers.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+from cryptography.fernet import Fernet
+
+# Settings require these; the benchmark never touches the database
+os.environ.setdefault("DATABASE_URL", "sqlite:///./benchmark.db")
+os.environ.setdefault("ENCRYPTION_KEY", Fernet.generate_key().decode())
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from app.core.config import settings  # noqa: E402
+from app.services.speech_client import AZURE_SDK_AVAILABLE, SpeechClient  # noqa: E402
+from app.services.speech_service import (  # noqa: E402
+    ASSESSMENT_PROFILES,
+    SpeechAssessmentService,
+)
+from benchmarks.speech_client import REFERENCE_TEXT, report, synthetic_recording  # noqa: E402
+
+
+async def measure(
+    service: SpeechAssessmentService, audio: bytes, runs: int
+) -> dict[str, list[float]]:
+    """Latency in ms of each assessment per profile (failed recognitions count too)."""
+    latencies: dict[str, list[float]] = {profile: [] for profile in ASSESSMENT_PROFILES}
+    for _ in range(runs):
+        for profile in ASSESSMENT_PROFILES:
+            started = time.perf_counter()
+            try:
+                await service.assess_pronunciation(audio, REFERENCE_TEXT, profile)
+            except Exception as e:
+                print(f"  {profile} assessment failed: {e}")
+            latencies[profile].append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(0.5)  # Let the pool replenish
+    return latencies
+
+
+async def main(path: str | None, runs: int) -> None:
+    audio = Path(path).read_bytes() if path else synthetic_recording()
+
+    client = SpeechClient(pool_size=2)
+    if settings.SPEECH_BACKEND == "sdk":
+        await client.start()
+    service = SpeechAssessmentService(client=client)
+    service.mock_mode = False
+
+    print(f"{runs} sequential assessments per profile ({settings.SPEECH_BACKEND} backend)\n")
+    print(f"{'profile':<24}{'p50':>13}{'p95':>13}")
+    for profile, latencies in (await measure(service, audio, runs)).items():
+        report(profile, latencies)
+    await client.close()
+    await service.rest.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("path", nargs="?", help="WAV recording to assess")
+    parser.add_argument("--runs", type=int, default=20, help="Assessments per profile")
+    args = parser.parse_args()
+
+    if not settings.SPEECH_KEY or (settings.SPEECH_BACKEND == "sdk" and not AZURE_SDK_AVAILABLE):
+        sys.exit("This benchmark needs SPEECH_KEY/SPEECH_REGION (and the Speech SDK for sdk)")
+    asyncio.run(main(args.path, args.runs))
@@ -0,0 +1,130 @@
+"""
+Benchmark for 16 kHz mono audio normalization.
+
+Reports, for common device recording formats, the bytes saved by
+normalization and the end-to-end latency of AssessmentPipeline.score_and_store
+with normalization on vs off (mock speech and blob services, so the latency
+change reflects normalization cost against encryption/storage savings; with
+Azure, upload and recognition time also shrink with the byte count).
+
+Usage (from backend/):
+    poetry run python -m benchmarks.audio_normalization [--seconds 10] [--runs 5]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from cryptography.fernet import Fernet
+
+# Settings require these; the benchmark only uses mock services
+os.environ.setdefault("DATABASE_URL", "sqlite:///./benchmark.db")
+os.environ.setdefault("ENCRYPTION_KEY", Fernet.generate_key().decode())
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ["MOCK_MODE"] = "true"
+
+import numpy as np  # noqa: E402
+
+from app.services.assessment_pipeline import AssessmentPipeline  # noqa: E402
+from app.services.audio_normalization import normalize_audio  # noqa: E402
+from app.services.blob_service import BlobStorageService  # noqa: E402
+from app.services.encryption_service import EncryptionService  # noqa: E402
+from app.services.speech_service import SpeechAssessmentService  # noqa: E402
+from app.services.wav_audio import encode_wav  # noqa: E402
+
+FORMATS = [
+    # (sample rate, channels, bits per sample)
+    (16000, 1, 16),
+    (44100, 1, 16),
+    (44100, 2, 16),
+    (48000, 2, 16),
+    (48000, 2, 24),
+]
+
+
+def make_recording(seconds: float, sample_rate: int, channels: int, bits: int) -> bytes:
+    """Speech-like test signal encoded as a PCM WAV file."""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 4 * t))
+    signal = 0.3 * envelope * np.sin(2 * np.pi * 220 * t)
+
+    wav = encode_wav(signal, sample_rate)  # 16-bit mono
+    if channels == 1 and bits == 16:
+        return wav
+
+    scale = 2 ** (bits - 1) - 1
+    frames = np.repeat((signal * scale).astype("<i4")[:, None], channels, axis=1)
+    pcm = frames.view(np.uint8).reshape(-1, 4)[:, : bits // 8].tobytes()
+    header = bytearray(wav[:44])
+    block_align = channels * bits // 8
+    header[4:8] = (36 + len(pcm)).to_bytes(4, "little")
+    header[22:24] = channels.to_bytes(2, "little")
+    header[28:32] = (sample_rate * block_align).to_bytes(4, "little")
+    header[32:34] = block_align.to_bytes(2, "little")
+    header[34:36] = bits.to_bytes(2, "little")
+    header[40:44] = len(pcm).to_bytes(4, "little")
+    return bytes(header) + pcm
+
+
+def median_ms(durations: list[float]) -> float:
+    return statistics.median(durations) * 1000
+
+
+async def time_pipeline(audio: bytes, normalize: bool, runs: int) -> float:
+    pipeline = AssessmentPipeline(
+        SpeechAssessmentService(),
+        BlobStorageService(),
+        EncryptionService(),
+        normalize=normalize,
+        trim_silence=False,
+    )
+    durations = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        prepared_audio, _ = await pipeline.prepare_audio(audio)
+        await pipeline.score_and_store(prepared_audio, "Hello world", user_id="benchmark")
+        durations.append(time.perf_counter() - started)
+    return median_ms(durations)
+
+
+async def main(seconds: float, runs: int) -> None:
+    print(f"{seconds:.0f}s recording, median of {runs} runs\n")
+    print(
+        f"{'format':<16}{'input':>12}{'output':>12}{'saved':>8}"
+        f"{'normalize':>12}{'e2e off':>10}{'e2e on':>10}{'change':>9}"
+    )
+
+    for sample_rate, channels, bits in FORMATS:
+        audio = make_recording(seconds, sample_rate, channels, bits)
+
+        durations = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            normalized = normalize_audio(audio)
+            durations.append(time.perf_counter() - started)
+
+        e2e_off = await time_pipeline(audio, normalize=False, runs=runs)
+        e2e_on = await time_pipeline(audio, normalize=True, runs=runs)
+        saved = 1 - len(normalized) / len(audio)
+
+        print(
+            f"{f'{sample_rate // 1000}k/{channels}ch/{bits}bit':<16}"
+            f"{len(audio):>12,}{len(normalized):>12,}{saved:>8.0%}"
+            f"{median_ms(durations):>10.1f}ms{e2e_off:>8.1f}ms{e2e_on:>8.1f}ms"
+            f"{(e2e_on - e2e_off) / e2e_off:>+9.0%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--seconds", type=float, default=10.0, help="Recording length")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    # Mock blob storage writes under the working directory
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        asyncio.run(main(args.seconds, args.runs))
@@ -0,0 +1,95 @@
+"""
+Benchmark for the compact at-rest audio format.
+
+Reports, per recording, the stored size in the legacy format (Fernet token of
+the WAV) and the compact format (binary token of the compressed container),
+plus codec and end-to-end encrypt/decrypt throughput.
+
+Usage (from backend/):
+    poetry run python -m benchmarks.audio_storage [recording.wav ...] [--runs 5]
+
+Without paths, synthetic speech-like recordings are used; pass real
+recordings (e.g. decrypted samples from blob storage) for representative
+numbers.
+"""
+
+import argparse
+import os
+import statistics
+import time
+from pathlib import Path
+
+from cryptography.fernet import Fernet
+
+# Settings require these; the benchmark never touches the database
+os.environ.setdefault("DATABASE_URL", "sqlite:///./benchmark.db")
+os.environ.setdefault("ENCRYPTION_KEY", Fernet.generate_key().decode())
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+import numpy as np  # noqa: E402
+
+from app.services.audio_codec import decode_audio, encode_audio  # noqa: E402
+from app.services.encryption_service import EncryptionService  # noqa: E402
+from app.services.wav_audio import encode_wav  # noqa: E402
+
+
+def synthetic_recordings() -> dict[str, bytes]:
+    """Harmonic voiced signal with a syllable envelope over a room noise floor."""
+    rng = np.random.default_rng(0)
+    recordings = {}
+    for seconds, noise in ((3, 0.001), (10, 0.003), (30, 0.01)):
+        t = np.arange(seconds * 16000) / 16000
+        phase = 2 * np.pi * np.cumsum(120 + 30 * np.sin(2 * np.pi * 0.5 * t)) / 16000
+        voiced = sum((0.3 / k) * np.sin(k * phase) for k in range(1, 15))
+        envelope = (0.5 * (1 + np.sin(2 * np.pi * 3 * t))) ** 2
+        signal = envelope * voiced + noise * rng.standard_normal(len(t))
+        recordings[f"synthetic {seconds}s noise={noise}"] = encode_wav(signal, 16000)
+    return recordings
+
+
+def throughput(func, data: bytes, size: int, runs: int) -> float:
+    """Median throughput of func(data) in MB/s of original audio."""
+    durations = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func(data)
+        durations.append(time.perf_counter() - started)
+    return size / statistics.median(durations) / 1e6
+
+
+def main(paths: list[str], runs: int) -> None:
+    recordings = (
+        {Path(path).name: Path(path).read_bytes() for path in paths}
+        if paths
+        else synthetic_recordings()
+    )
+    service = EncryptionService()
+
+    print(f"median of {runs} runs\n")
+    print(
+        f"{'recording':<30}{'wav':>11}{'legacy':>11}{'compact':>11}{'ratio':>8}"
+        f"{'vs legacy':>11}{'encode':>13}{'decode':>13}{'encrypt':>13}{'decrypt':>13}"
+    )
+
+    for name, audio in recordings.items():
+        legacy = service.cipher.encrypt(audio)
+        container = encode_audio(audio)
+        compact = service.encrypt_audio(audio)
+        assert decode_audio(container) == audio and service.decrypt_audio(compact) == audio
+
+        print(
+            f"{name[:29]:<30}{len(audio):>11,}{len(legacy):>11,}{len(compact):>11,}"
+            f"{len(container) / len(audio):>8.3f}{len(compact) / len(legacy):>11.3f}"
+            f"{throughput(encode_audio, audio, len(audio), runs):>8.1f} MB/s"
+            f"{throughput(decode_audio, container, len(audio), runs):>8.1f} MB/s"
+            f"{throughput(service.encrypt_audio, audio, len(audio), runs):>8.1f} MB/s"
+            f"{throughput(service.decrypt_audio, compact, len(audio), runs):>8.1f} MB/s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("paths", nargs="*", help="WAV recordings to measure")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+    main(args.paths, args.runs)
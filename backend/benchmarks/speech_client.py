@@ -0,0 +1,104 @@
+"""
+Benchmark for the warm speech client.
+
+Assesses the same recording repeatedly against Azure Speech, once building
+the SpeechConfig and connection per request (the previous behaviour) and once
+through a pre-warmed SpeechClient, and reports p50/p95 latency of each.
+
+Usage (from backend/, with SPEECH_KEY and SPEECH_REGION set):
+    poetry run python -m benchmarks.speech_client [recording.wav] [--runs 20]
+
+Without a path, a synthetic speech-like recording is used; recognition may
+then find no speech, which still measures connection setup but scores
+nothing. Requests run one after another with a pause between them so every
+warm request finds a ready connection.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from cryptography.fernet import Fernet
+
+# Settings require these; the benchmark never touches the database
+os.environ.setdefault("DATABASE_URL", "sqlite:///./benchmark.db")
+os.environ.setdefault("ENCRYPTION_KEY", Fernet.generate_key().decode())
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+import numpy as np  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.services.speech_client import AZURE_SDK_AVAILABLE, SpeechClient  # noqa: E402
+from app.services.speech_service import SpeechAssessmentService  # noqa: E402
+from app.services.wav_audio import encode_wav  # noqa: E402
+
+REFERENCE_TEXT = "The quick brown fox jumps over the lazy dog"
+
+
+def synthetic_recording(seconds: float = 3.0) -> bytes:
+    """Harmonic voiced signal with a syllable envelope."""
+    t = np.arange(int(seconds * 16000)) / 16000
+    phase = 2 * np.pi * np.cumsum(120 + 30 * np.sin(2 * np.pi * 0.5 * t)) / 16000
+    voiced = sum((0.3 / k) * np.sin(k * phase) for k in range(1, 15))
+    return encode_wav((0.5 * (1 + np.sin(2 * np.pi * 3 * t))) ** 2 * voiced, 16000)
+
+
+class PerRequestClient(SpeechClient):
+    """Builds a new SpeechConfig for every recognizer and never pre-connects, as before."""
+
+    @property
+    def speech_config(self):
+        self._speech_config = None
+        return super().speech_config
+
+
+async def measure(service: SpeechAssessmentService, audio: bytes, runs: int) -> list[float]:
+    """Latency in ms of each assessment (failed recognitions count too)."""
+    latencies = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        try:
+            await service.assess_pronunciation(audio, REFERENCE_TEXT)
+        except Exception as e:
+            print(f"  assessment failed: {e}")
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.5)  # Let the pool replenish
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+    print(f"{name:<24}{statistics.median(latencies):>10.0f} ms{p95:>10.0f} ms")
+
+
+async def main(path: str | None, runs: int) -> None:
+    audio = Path(path).read_bytes() if path else synthetic_recording()
+
+    warm_client = SpeechClient(pool_size=2)
+    await warm_client.start()
+    cold = SpeechAssessmentService(client=PerRequestClient(pool_size=0))
+    warm = SpeechAssessmentService(client=warm_client)
+    for service in (cold, warm):
+        service.mock_mode = False
+
+    print(f"{runs} sequential assessments per mode\n")
+    print(f"{'mode':<24}{'p50':>13}{'p95':>13}")
+    report("per-request setup", await measure(cold, audio, runs))
+    report("warm client", await measure(warm, audio, runs))
+    print(f"\nwarm client: {warm_client.stats()}")
+    await warm_client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("path", nargs="?", help="WAV recording to assess")
+    parser.add_argument("--runs", type=int, default=20, help="Assessments per mode")
+    args = parser.parse_args()
+
+    if not AZURE_SDK_AVAILABLE or not settings.SPEECH_KEY:
+        sys.exit("This benchmark needs the Azure Speech SDK and SPEECH_KEY/SPEECH_REGION")
+    asyncio.run(main(args.path, args.runs))
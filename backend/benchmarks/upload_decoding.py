@@ -0,0 +1,75 @@
+"""
+Benchmark for decoding compact (mu-law / IMA-ADPCM) uploads.
+
+Reports, per encoding and recording length, the upload size against 16-bit
+PCM, the server-side decode time, and the upload time the smaller payload
+saves on typical mobile links, so decode cost can be compared to the saving.
+
+Usage (from backend/):
+    poetry run python -m benchmarks.upload_decoding [--runs 5]
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from cryptography.fernet import Fernet
+
+# Settings require these; the benchmark never touches the database
+os.environ.setdefault("DATABASE_URL", "sqlite:///./benchmark.db")
+os.environ.setdefault("ENCRYPTION_KEY", Fernet.generate_key().decode())
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+import numpy as np  # noqa: E402
+
+from app.services.wav_audio import encode_wav  # noqa: E402
+from app.services.wav_decoders import WAVE_FORMAT_MULAW, decode_compact_wav  # noqa: E402
+from tests.wav_encoders import ima_wav, mulaw_encode, wav_file  # noqa: E402
+
+# Uplink speeds in megabits per second
+LINKS_MBPS = (1.0, 5.0)
+
+
+def speech_like_samples(seconds: float, sample_rate: int = 16000) -> np.ndarray:
+    """Tone with a syllable-like on/off envelope."""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return 0.3 * 0.5 * (1 + np.sin(2 * np.pi * 4 * t)) * np.sin(2 * np.pi * 220 * t)
+
+
+def main(runs: int) -> None:
+    print(f"median of {runs} runs; saved = upload time saved vs 16-bit PCM\n")
+    header = f"{'encoding':<12}{'length':>8}{'upload':>11}{'pcm':>11}{'ratio':>7}{'decode':>11}"
+    header += "".join(f"{f'saved@{mbps:g}Mbps':>16}" for mbps in LINKS_MBPS)
+    print(header)
+
+    for seconds in (5, 15, 30):
+        samples = speech_like_samples(seconds)
+        pcm_size = len(encode_wav(samples, 16000))
+        uploads = {
+            "mu-law": wav_file(WAVE_FORMAT_MULAW, 1, 16000, 1, 8, mulaw_encode(samples)),
+            "ima-adpcm": ima_wav(samples)[0],
+        }
+
+        for encoding, audio in uploads.items():
+            durations = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                decode_compact_wav(audio)
+                durations.append(time.perf_counter() - started)
+            decode_ms = statistics.median(durations) * 1000
+
+            row = (
+                f"{encoding:<12}{seconds:>7}s{len(audio):>11,}{pcm_size:>11,}"
+                f"{pcm_size / len(audio):>6.1f}x{decode_ms:>9.1f}ms"
+            )
+            for mbps in LINKS_MBPS:
+                saved_ms = (pcm_size - len(audio)) * 8 / (mbps * 1e6) * 1000
+                row += f"{saved_ms:>14.0f}ms"
+            print(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement")
+    main(parser.parse_args().runs)
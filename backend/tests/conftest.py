@@ -1,40 +1,60 @@
 """
 Test configuration and fixtures for PronIELTS backend tests.
-Uses SQLite in-memory database for fast, isolated tests.
+Uses a SQLite database file shared by the sync (fixtures) and async (endpoints) engines.
 """
 
 import os
+from pathlib import Path
 
 # Set environment variables before importing the app
 os.environ["DATABASE_URL"] = "sqlite:///./test.db"
 os.environ["ENCRYPTION_KEY"] = "xad7-9FTK2MR2M9jXPJ5wKEkhcLZ9uO9KVHGGfaH9c4="
 os.environ["SECRET_KEY"] = "test-secret-key-for-testing-only"
 os.environ["MOCK_MODE"] = "true"
+os.environ["ASSESSMENT_JOB_WORKERS"] = "0"  # Tests drive the job worker explicitly
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
 from app.main import app
 from app.models.assessment import Assessment
+from app.models.category import Category
 from app.models.dialog import Dialog
 from app.models.phrase import Phrase
 from app.models.user import User
+from app.services.phrase_cache import phrase_cache
 
-# In-memory SQLite engine for testing
-SQLALCHEMY_DATABASE_URL = "sqlite://"
+# SQLite file engines for testing: fixtures use the sync engine, async endpoints
+# use aiosqlite against the same file so both see each other's committed data.
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_pronielts.db"
+SQLALCHEMY_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./test_pronielts.db"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+    poolclass=NullPool,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# NullPool: TestClient runs each app on its own event loop, so connections must not be reused
+async_engine = create_async_engine(SQLALCHEMY_ASYNC_DATABASE_URL, poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def remove_database_file():
+    """Remove the SQLite test database file after the test session."""
+    yield
+    Path("./test_pronielts.db").unlink(missing_ok=True)
+
 
 @pytest.fixture(autouse=True)
 def setup_database():
@@ -42,6 +62,7 @@ def setup_database():
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
+    phrase_cache.clear()  # The process-wide phrase cache must not leak between tests
 
 
 @pytest.fixture
@@ -58,14 +79,20 @@ def db():
 def client(db):
     """Provide a FastAPI TestClient with overridden database dependency.
 
-    Uses the same db session as the fixtures so committed data is visible
-    to endpoint handlers.
+    Sync endpoints use the same db session as the fixtures; async endpoints
+    open their own session on the same database file, so committed data is
+    visible to both.
     """
 
     def override_get_db():
         yield db
 
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as async_db:
+            yield async_db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
@@ -86,9 +113,15 @@ def create_dialog(db):
         description="A test dialog for unit testing",
         difficulty_level="Intermediate",
     ):
+        category_row = db.query(Category).filter(Category.name == category).first()
+        if not category_row:
+            category_row = Category(name=category)
+            db.add(category_row)
+            db.flush()
+
         dialog = Dialog(
             title=title,
-            category=category,
+            category_id=category_row.id,
             description=description,
             difficulty_level=difficulty_level,
         )
@@ -217,17 +250,24 @@ def sample_assessment(create_assessment, sample_user, sample_phrase):
     )
 
 
-@pytest.fixture
-def wav_audio_bytes():
-    """Minimal valid WAV file bytes for testing audio upload."""
-    # Minimal WAV header (44 bytes) + 1 second of silence at 16kHz mono 16-bit
+def make_wav_bytes(samples, sample_rate=16000, num_channels=1, bits_per_sample=16):
+    """
+    Build a PCM WAV file from float samples in [-1, 1].
+
+    samples is 1-D for mono or shaped (frames, channels) for multi-channel audio.
+    """
     import struct
 
-    sample_rate = 16000
-    num_channels = 1
-    bits_per_sample = 16
-    num_samples = sample_rate  # 1 second
-    data_size = num_samples * num_channels * (bits_per_sample // 8)
+    import numpy as np
+
+    samples = np.asarray(samples, dtype=np.float64).reshape(-1)
+    if bits_per_sample == 8:
+        audio_data = np.clip(samples * 127 + 128, 0, 255).astype(np.uint8).tobytes()
+    else:
+        scale = 2 ** (bits_per_sample - 1) - 1
+        audio_data = np.clip(samples * scale, -scale, scale).astype("<i4")
+        audio_data = audio_data.view(np.uint8).reshape(-1, 4)[:, : bits_per_sample // 8].tobytes()
+    data_size = len(audio_data)
 
     header = struct.pack(
         "<4sI4s4sIHHIIHH4sI",
@@ -245,6 +285,19 @@ def wav_audio_bytes():
         b"data",
         data_size,
     )
-    # Silence data
-    audio_data = b"\x00\x00" * num_samples
     return header + audio_data
+
+
+def speech_like_samples(seconds=1.0, sample_rate=16000):
+    """Tone with a syllable-like on/off envelope, loud enough to pass the preflight."""
+    import numpy as np
+
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 4 * t))  # ~4 syllables per second
+    return 0.3 * envelope * np.sin(2 * np.pi * 220 * t)
+
+
+@pytest.fixture
+def wav_audio_bytes():
+    """Valid WAV file bytes for testing audio upload: 1 second at 16kHz mono 16-bit."""
+    return make_wav_bytes(speech_like_samples())
@@ -0,0 +1,180 @@
+"""Tests for speech admission control."""
+
+import asyncio
+import io
+from pathlib import Path
+
+import pytest
+
+from app.api.deps import get_speech_service
+from app.core.config import settings
+from app.main import app
+from app.services.admission_control import (
+    AdmissionController,
+    AdmissionRejectedError,
+    AdvisoryLockSlots,
+    LocalSlots,
+    create_slot_backend,
+)
+from app.services.speech_service import SpeechAssessmentService
+
+
+class NoSlots:
+    """Backend whose slots are all held elsewhere."""
+
+    shared = True
+
+    def __init__(self):
+        self.probes = 0
+
+    async def try_acquire(self, timeout=None):
+        self.probes += 1
+        return None
+
+    async def release(self, token):
+        pass
+
+
+class TestAdmissionController:
+    @pytest.mark.asyncio
+    async def test_waiter_admitted_when_slot_released(self):
+        controller = AdmissionController(max_concurrent=1, max_queue=5, queue_timeout=5)
+        controller.backend = LocalSlots(1)
+        order = []
+
+        async def hold():
+            async with controller.slot():
+                order.append("first")
+                await asyncio.sleep(0.05)
+
+        async def wait():
+            await asyncio.sleep(0.01)
+            async with controller.slot():
+                order.append("second")
+
+        await asyncio.gather(hold(), wait())
+
+        assert order == ["first", "second"]
+        stats = controller.stats()
+        assert stats["admitted"] == 2
+        assert stats["max_wait_ms"] > 0
+        assert stats["in_flight"] == 0
+        assert stats["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        controller = AdmissionController(
+            max_concurrent=1, max_queue=0, queue_timeout=5, backend=NoSlots()
+        )
+
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            async with controller.slot():
+                pass
+
+        assert exc_info.value.retry_after >= 1
+        assert controller.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_after_wait_timeout(self):
+        controller = AdmissionController(
+            max_concurrent=1, max_queue=5, queue_timeout=0.1, backend=NoSlots()
+        )
+
+        with pytest.raises(AdmissionRejectedError):
+            async with controller.slot():
+                pass
+
+        assert controller.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_without_probing(self):
+        backend = NoSlots()
+        controller = AdmissionController(
+            max_concurrent=1, max_queue=1, queue_timeout=0.3, backend=backend
+        )
+
+        async def wait():
+            with pytest.raises(AdmissionRejectedError):
+                async with controller.slot():
+                    pass
+
+        waiting = asyncio.create_task(wait())
+        await asyncio.sleep(0.01)
+        probes = backend.probes
+
+        with pytest.raises(AdmissionRejectedError):
+            async with controller.slot():
+                pass
+
+        assert backend.probes == probes
+        await waiting
+
+    @pytest.mark.asyncio
+    async def test_shared_polling_backs_off(self):
+        backend = NoSlots()
+        controller = AdmissionController(
+            max_concurrent=1, max_queue=5, queue_timeout=0.5, backend=backend
+        )
+
+        with pytest.raises(AdmissionRejectedError):
+            async with controller.slot():
+                pass
+
+        # A fixed 50ms poll would probe about ten times
+        assert backend.probes <= 6
+
+
+class TestAdvisoryLockSlots:
+    @pytest.mark.asyncio
+    async def test_connection_checkout_is_bounded(self, monkeypatch):
+        class ExhaustedEngine:
+            async def connect(self):
+                await asyncio.sleep(30)
+
+        backend = AdvisoryLockSlots(2)
+        monkeypatch.setattr(backend, "_get_engine", lambda: ExhaustedEngine())
+
+        assert await backend.try_acquire(timeout=0.05) is None
+
+
+class TestSlotBackendSelection:
+    def test_auto_uses_local_slots_for_sqlite(self, monkeypatch):
+        monkeypatch.setattr(settings, "SPEECH_ADMISSION_BACKEND", "auto")
+        assert isinstance(create_slot_backend(3), LocalSlots)
+
+    def test_postgres_uses_advisory_locks(self, monkeypatch):
+        monkeypatch.setattr(settings, "SPEECH_ADMISSION_BACKEND", "postgres")
+        backend = create_slot_backend(3)
+        assert isinstance(backend, AdvisoryLockSlots)
+        assert backend.limit == 3
+
+    def test_unknown_backend(self, monkeypatch):
+        monkeypatch.setattr(settings, "SPEECH_ADMISSION_BACKEND", "redis")
+        with pytest.raises(ValueError):
+            create_slot_backend(3)
+
+
+class TestAssessAtCapacity:
+    def test_returns_429_with_retry_after(self, client, sample_phrase, wav_audio_bytes):
+        controller = AdmissionController(
+            max_concurrent=1, max_queue=0, queue_timeout=1, backend=NoSlots()
+        )
+        app.dependency_overrides[get_speech_service] = lambda: SpeechAssessmentService(
+            admission=controller
+        )
+        user_id = "test-user-capacity"
+
+        response = client.post(
+            "/api/v1/assessments/assess",
+            data={"phrase_id": str(sample_phrase.id), "user_id": user_id},
+            files={"audio": ("recording.wav", io.BytesIO(wav_audio_bytes), "audio/wav")},
+        )
+
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+        user_dir = Path("./mock_blob_storage") / user_id
+        assert not user_dir.exists() or list(user_dir.iterdir()) == []
+
+    def test_health_exposes_admission_metrics(self, client):
+        stats = client.get("/health").json()["speech_admission"]
+        assert {"in_flight", "queue_depth", "avg_wait_ms", "rejected"} <= stats.keys()
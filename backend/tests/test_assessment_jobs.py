@@ -0,0 +1,310 @@
+"""Tests for asynchronous assessment jobs."""
+
+import asyncio
+import io
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from app.core.config import settings
+from app.models.assessment import Assessment
+from app.models.assessment_job import AssessmentJob
+from app.services.admission_control import AdmissionRejectedError
+from app.services.assessment_job_service import AssessmentJobWorker
+from app.services.speech_service import NoSpeechError, SpeechAssessmentService
+from tests.conftest import TestingAsyncSessionLocal
+
+
+@pytest.fixture(autouse=True)
+def cleanup_mock_storage():
+    """Clean up mock blob storage after each test."""
+    yield
+    mock_dir = Path("./mock_blob_storage")
+    if mock_dir.exists():
+        shutil.rmtree(mock_dir)
+
+
+@pytest.fixture(autouse=True)
+def spool_dir(tmp_path, monkeypatch):
+    """Point the audio spool at a temporary directory."""
+    monkeypatch.setattr(settings, "AUDIO_SPOOL_DIR", str(tmp_path / "spool"))
+    return tmp_path / "spool"
+
+
+class FailingSpeechService(SpeechAssessmentService):
+    async def assess_pronunciation(self, audio_bytes, reference_text, profile="full"):
+        raise Exception("Pronunciation assessment failed: service unavailable")
+
+
+class BusySpeechService(SpeechAssessmentService):
+    async def assess_pronunciation(self, audio_bytes, reference_text, profile="full"):
+        raise AdmissionRejectedError("Speech service is at capacity.", retry_after=30)
+
+
+class SilentSpeechService(SpeechAssessmentService):
+    async def assess_pronunciation(self, audio_bytes, reference_text, profile="full"):
+        raise NoSpeechError("No speech could be recognized in the audio")
+
+
+class SlowSpeechService(SpeechAssessmentService):
+    async def assess_pronunciation(self, audio_bytes, reference_text, profile="full"):
+        await asyncio.sleep(0.3)
+        return await super().assess_pronunciation(audio_bytes, reference_text, profile)
+
+
+def make_worker(speech_service=None):
+    return AssessmentJobWorker(
+        concurrency=1,
+        session_factory=TestingAsyncSessionLocal,
+        speech_service=speech_service,
+    )
+
+
+def submit_job(client, phrase_id, wav_audio_bytes, user_id="job-user", headers=None, **form):
+    return client.post(
+        "/api/v1/assessments/jobs",
+        data={"phrase_id": str(phrase_id), "user_id": user_id, **form},
+        files={"audio": ("recording.wav", io.BytesIO(wav_audio_bytes), "audio/wav")},
+        headers=headers,
+    )
+
+
+class TestCreateJob:
+    """POST /assessments/jobs"""
+
+    def test_returns_queued_job(self, client, db, sample_phrase, wav_audio_bytes):
+        response = submit_job(client, sample_phrase.id, wav_audio_bytes)
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["status"] == "queued"
+        assert data["phrase_id"] == sample_phrase.id
+        assert data["assessment"] is None
+
+        job = db.get(AssessmentJob, data["job_id"])
+        assert job.audio_size == len(wav_audio_bytes)
+        assert Path(job.audio_spool_path).exists()
+        assert Path(job.audio_spool_path).read_bytes() != wav_audio_bytes
+
+    def test_unknown_phrase(self, client, wav_audio_bytes):
+        response = submit_job(client, 99999, wav_audio_bytes)
+        assert response.status_code == 404
+
+    def test_rejects_when_queue_full(self, client, sample_phrase, wav_audio_bytes, monkeypatch):
+        monkeypatch.setattr(settings, "ASSESSMENT_JOB_MAX_PENDING", 1)
+        assert submit_job(client, sample_phrase.id, wav_audio_bytes).status_code == 202
+
+        response = submit_job(client, sample_phrase.id, wav_audio_bytes)
+        assert response.status_code == 503
+        assert "Retry-After" in response.headers
+
+    def test_idempotent_retry_returns_the_same_job(
+        self, client, db, sample_phrase, wav_audio_bytes
+    ):
+        headers = {"Idempotency-Key": "job-key-1"}
+        first = submit_job(client, sample_phrase.id, wav_audio_bytes, headers=headers)
+        retry = submit_job(client, sample_phrase.id, wav_audio_bytes, headers=headers)
+
+        assert first.status_code == 202
+        assert retry.status_code == 202
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert retry.json()["job_id"] == first.json()["job_id"]
+        assert db.query(AssessmentJob).count() == 1
+
+    def test_idempotency_key_from_assess_is_not_replayed(
+        self, client, sample_phrase, wav_audio_bytes
+    ):
+        headers = {"Idempotency-Key": "shared-key"}
+        client.post(
+            "/api/v1/assessments/assess",
+            data={"phrase_id": str(sample_phrase.id), "user_id": "job-user"},
+            files={"audio": ("recording.wav", io.BytesIO(wav_audio_bytes), "audio/wav")},
+            headers=headers,
+        )
+
+        response = submit_job(client, sample_phrase.id, wav_audio_bytes, headers=headers)
+        assert response.status_code == 422
+
+
+class TestJobProcessing:
+    """AssessmentJobWorker and GET /assessments/jobs/{job_id}"""
+
+    @pytest.mark.asyncio
+    async def test_worker_completes_job(self, client, sample_phrase, wav_audio_bytes):
+        job = submit_job(client, sample_phrase.id, wav_audio_bytes).json()
+
+        assert await make_worker().run_once() is True
+
+        response = client.get(f"/api/v1/assessments/jobs/{job['job_id']}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "succeeded"
+        assert data["attempts"] == 1
+        assert data["assessment"]["phrase_id"] == sample_phrase.id
+        assert data["assessment"]["scores"]["overall_score"] is not None
+
+    @pytest.mark.asyncio
+    async def test_worker_uses_requested_profile(self, client, db, sample_phrase, wav_audio_bytes):
+        job_id = submit_job(client, sample_phrase.id, wav_audio_bytes, profile="quick").json()[
+            "job_id"
+        ]
+        assert db.get(AssessmentJob, job_id).assessment_profile == "quick"
+
+        await make_worker().run_once()
+
+        data = client.get(f"/api/v1/assessments/jobs/{job_id}").json()
+        assert data["assessment"]["assessment_profile"] == "quick"
+
+    def test_rejects_unknown_profile(self, client, sample_phrase, wav_audio_bytes):
+        response = submit_job(client, sample_phrase.id, wav_audio_bytes, profile="deep")
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_lease_is_renewed_while_processing(self, client, sample_phrase, wav_audio_bytes):
+        submit_job(client, sample_phrase.id, wav_audio_bytes)
+        worker = make_worker(SlowSpeechService())
+        worker.lease_seconds = 0.15
+        other = make_worker()
+        other.lease_seconds = 0.15
+
+        processing = asyncio.create_task(worker.run_once())
+        await asyncio.sleep(0.2)  # Past the first lease; renewed every 0.05s
+
+        assert await other.claim_next() is None
+        assert await processing is True
+
+    @pytest.mark.asyncio
+    async def test_reclaimed_job_result_is_dropped(
+        self, client, db, sample_phrase, wav_audio_bytes
+    ):
+        job_id = submit_job(client, sample_phrase.id, wav_audio_bytes).json()["job_id"]
+        worker = make_worker(SlowSpeechService())
+
+        processing = asyncio.create_task(worker.run_once())
+        await asyncio.sleep(0.1)
+        # Another worker reclaims the job after the lease expired
+        db.query(AssessmentJob).update({"locked_at": datetime.utcnow()})
+        db.commit()
+        await processing
+
+        db.expire_all()
+        job = db.get(AssessmentJob, job_id)
+        assert job.status == "running"
+        assert job.assessment_id is None
+        assert db.query(Assessment).count() == 0
+        assert Path(job.audio_spool_path).exists()
+
+    @pytest.mark.asyncio
+    async def test_no_jobs(self, client):
+        assert await make_worker().run_once() is False
+
+    @pytest.mark.asyncio
+    async def test_failed_job_is_retried_then_failed(
+        self, client, db, sample_phrase, wav_audio_bytes, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "ASSESSMENT_JOB_MAX_ATTEMPTS", 2)
+        monkeypatch.setattr(settings, "ASSESSMENT_JOB_RETRY_BACKOFF_SECONDS", 0)
+        job_id = submit_job(client, sample_phrase.id, wav_audio_bytes).json()["job_id"]
+        worker = make_worker(FailingSpeechService())
+
+        await worker.run_once()
+        db.expire_all()
+        job = db.get(AssessmentJob, job_id)
+        assert job.status == "queued"
+        assert "service unavailable" in job.error
+
+        await worker.run_once()
+        db.expire_all()
+        job = db.get(AssessmentJob, job_id)
+        assert job.status == "failed"
+        assert job.attempts == 2
+        assert not Path(job.audio_spool_path).exists()
+
+    @pytest.mark.asyncio
+    async def test_no_speech_fails_without_retry(self, client, db, sample_phrase, wav_audio_bytes):
+        job_id = submit_job(client, sample_phrase.id, wav_audio_bytes).json()["job_id"]
+
+        await make_worker(SilentSpeechService()).run_once()
+
+        db.expire_all()
+        job = db.get(AssessmentJob, job_id)
+        assert job.status == "failed"
+        assert job.attempts == 1
+        assert "No speech" in job.error
+        assert not Path(job.audio_spool_path).exists()
+
+    @pytest.mark.asyncio
+    async def test_missing_spool_fails_without_retry(
+        self, client, db, sample_phrase, wav_audio_bytes
+    ):
+        job_id = submit_job(client, sample_phrase.id, wav_audio_bytes).json()["job_id"]
+        Path(db.get(AssessmentJob, job_id).audio_spool_path).unlink()
+
+        await make_worker().run_once()
+
+        db.expire_all()
+        job = db.get(AssessmentJob, job_id)
+        assert job.status == "failed"
+        assert job.attempts == 1
+        assert "missing" in job.error
+
+    @pytest.mark.asyncio
+    async def test_retry_waits_for_backoff(self, client, db, sample_phrase, wav_audio_bytes):
+        job_id = submit_job(client, sample_phrase.id, wav_audio_bytes).json()["job_id"]
+        worker = make_worker(FailingSpeechService())
+
+        assert await worker.run_once() is True
+        assert await worker.run_once() is False
+
+        db.expire_all()
+        job = db.get(AssessmentJob, job_id)
+        assert job.status == "queued"
+        assert job.not_before > job.created_at
+
+    @pytest.mark.asyncio
+    async def test_admission_rejection_is_not_an_attempt(
+        self, client, db, sample_phrase, wav_audio_bytes, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "ASSESSMENT_JOB_MAX_ATTEMPTS", 1)
+        job_id = submit_job(client, sample_phrase.id, wav_audio_bytes).json()["job_id"]
+
+        assert await make_worker(BusySpeechService()).run_once() is True
+
+        db.expire_all()
+        job = db.get(AssessmentJob, job_id)
+        assert job.status == "queued"
+        assert job.attempts == 0
+        assert (job.not_before - job.created_at).total_seconds() >= 29
+        assert Path(job.audio_spool_path).exists()
+
+    def test_job_not_found(self, client):
+        response = client.get("/api/v1/assessments/jobs/missing")
+        assert response.status_code == 404
+
+
+class TestJobWebSocket:
+    """WS /assessments/jobs/{job_id}/ws"""
+
+    @pytest.mark.asyncio
+    async def test_sends_terminal_status_and_closes(self, client, sample_phrase, wav_audio_bytes):
+        job_id = submit_job(client, sample_phrase.id, wav_audio_bytes).json()["job_id"]
+        await make_worker().run_once()
+
+        with client.websocket_connect(f"/api/v1/assessments/jobs/{job_id}/ws") as websocket:
+            message = websocket.receive_json()
+            assert message["status"] == "succeeded"
+            assert message["assessment"] is not None
+
+            with pytest.raises(WebSocketDisconnect):
+                websocket.receive_json()
+
+    def test_unknown_job_closes(self, client):
+        with (
+            client.websocket_connect("/api/v1/assessments/jobs/missing/ws") as websocket,
+            pytest.raises(WebSocketDisconnect) as exc_info,
+        ):
+            websocket.receive_json()
+        assert exc_info.value.code == 4404
@@ -0,0 +1,150 @@
+"""Unit tests for the concurrent scoring + storage assessment pipeline."""
+
+import asyncio
+import shutil
+from pathlib import Path
+
+import pytest
+
+from app.services.assessment_pipeline import AssessmentPipeline
+from app.services.blob_service import BlobStorageService
+from app.services.encryption_service import EncryptionService
+from app.services.speech_service import PronunciationResult, SpeechAssessmentService
+from app.services.wav_audio import UnsupportedWavFormatError
+from tests.conftest import make_wav_bytes, speech_like_samples
+
+
+@pytest.fixture(autouse=True)
+def cleanup_mock_storage():
+    """Clean up mock blob storage after each test."""
+    yield
+    mock_dir = Path("./mock_blob_storage")
+    if mock_dir.exists():
+        shutil.rmtree(mock_dir)
+
+
+def stored_files(user_id):
+    user_dir = Path("./mock_blob_storage") / user_id
+    return list(user_dir.iterdir()) if user_dir.exists() else []
+
+
+class FailingSpeechService(SpeechAssessmentService):
+    async def assess_pronunciation(self, audio_bytes, reference_text, profile="full"):
+        # Let the storage branch finish first so its blob must be cleaned up
+        await asyncio.sleep(0.05)
+        raise Exception("Speech assessment failed: backend unavailable")
+
+
+class SlowSpeechService(SpeechAssessmentService):
+    cancelled = False
+
+    async def assess_pronunciation(self, audio_bytes, reference_text, profile="full"):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            SlowSpeechService.cancelled = True
+            raise
+
+
+class FailingBlobService(BlobStorageService):
+    async def upload_audio(self, audio_bytes, file_extension="wav", user_id=None):
+        raise Exception("File upload failed: storage unavailable")
+
+
+class TestAssessmentPipeline:
+    """Test suite for AssessmentPipeline.score_and_store."""
+
+    @pytest.mark.asyncio
+    async def test_returns_result_and_blob_url(self):
+        pipeline = AssessmentPipeline(
+            SpeechAssessmentService(), BlobStorageService(), EncryptionService()
+        )
+        result, blob_url = await pipeline.score_and_store(b"audio", "Hello world", "user-ok")
+
+        assert isinstance(result, PronunciationResult)
+        assert blob_url.startswith("local://")
+        assert len(stored_files("user-ok")) == 1
+
+    @pytest.mark.asyncio
+    async def test_stored_audio_is_encrypted(self):
+        encryption = EncryptionService()
+        blob_service = BlobStorageService()
+        pipeline = AssessmentPipeline(SpeechAssessmentService(), blob_service, encryption)
+
+        _, blob_url = await pipeline.score_and_store(b"raw audio", "Hello", "user-enc")
+
+        stored = await blob_service.download_audio(blob_url)
+        assert stored != b"raw audio"
+        assert encryption.decrypt_audio(stored) == b"raw audio"
+
+    @pytest.mark.asyncio
+    async def test_scoring_failure_deletes_uploaded_blob(self):
+        pipeline = AssessmentPipeline(
+            FailingSpeechService(), BlobStorageService(), EncryptionService()
+        )
+        with pytest.raises(Exception, match="backend unavailable"):
+            await pipeline.score_and_store(b"audio", "Hello", "user-orphan")
+
+        assert stored_files("user-orphan") == []
+
+    @pytest.mark.asyncio
+    async def test_storage_failure_cancels_scoring(self):
+        SlowSpeechService.cancelled = False
+        pipeline = AssessmentPipeline(
+            SlowSpeechService(), FailingBlobService(), EncryptionService()
+        )
+        with pytest.raises(Exception, match="storage unavailable"):
+            await asyncio.wait_for(pipeline.score_and_store(b"audio", "Hello", "u"), timeout=2)
+
+        assert SlowSpeechService.cancelled is True
+
+
+async def _chunks(data, size):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+class TestAssessmentPipelineStream:
+    """Test suite for AssessmentPipeline.score_and_store_stream."""
+
+    @pytest.mark.asyncio
+    async def test_stream_returns_result_url_and_size(self):
+        encryption = EncryptionService()
+        blob_service = BlobStorageService()
+        pipeline = AssessmentPipeline(SpeechAssessmentService(), blob_service, encryption)
+        audio = make_wav_bytes(speech_like_samples(0.5))
+
+        result, blob_url, size = await pipeline.score_and_store_stream(
+            _chunks(audio, 1024), "Hello world", "user-stream"
+        )
+
+        assert isinstance(result, PronunciationResult)
+        assert size == len(audio)
+        stored = await blob_service.download_audio(blob_url)
+        assert encryption.decrypt_audio(stored) == audio
+
+    @pytest.mark.asyncio
+    async def test_stream_too_large_cleans_up(self):
+        from app.services.assessment_pipeline import AudioTooLargeError
+
+        pipeline = AssessmentPipeline(
+            SpeechAssessmentService(), BlobStorageService(), EncryptionService()
+        )
+        with pytest.raises(AudioTooLargeError):
+            await pipeline.score_and_store_stream(
+                _chunks(make_wav_bytes([0.0] * 5000), 1000), "Hello", "user-big", max_bytes=5_000
+            )
+
+        assert stored_files("user-big") == []
+
+    @pytest.mark.asyncio
+    async def test_stream_rejects_audio_it_cannot_normalize(self):
+        pipeline = AssessmentPipeline(
+            SpeechAssessmentService(), BlobStorageService(), EncryptionService()
+        )
+        audio = make_wav_bytes(speech_like_samples(0.5, 48000), sample_rate=48000)
+
+        with pytest.raises(UnsupportedWavFormatError, match="16000Hz 16-bit mono"):
+            await pipeline.score_and_store_stream(_chunks(audio, 1024), "Hello", "user-48k")
+
+        assert stored_files("user-48k") == []
@@ -0,0 +1,109 @@
+"""Tests for quick and full assessment profiles."""
+
+import base64
+import io
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.models.assessment import Assessment
+from app.services.speech_rest import pronunciation_header
+from app.services.speech_service import SpeechAssessmentService, resolve_assessment_profile
+
+REST_RESULT = {
+    "RecognitionStatus": "Success",
+    "DisplayText": "Hello world.",
+    "NBest": [
+        {
+            "Display": "Hello world.",
+            "PronunciationAssessment": {
+                "AccuracyScore": 90.0,
+                "FluencyScore": 80.0,
+                "CompletenessScore": 100.0,
+            },
+            "Words": [],
+        }
+    ],
+}
+
+
+def decode_header(header):
+    return json.loads(base64.b64decode(header))
+
+
+class TestResolveProfile:
+    def test_request_overrides_phrase_and_default(self):
+        assert resolve_assessment_profile("quick", "full") == "quick"
+        assert resolve_assessment_profile(None, "quick") == "quick"
+
+    def test_falls_back_to_default(self, monkeypatch):
+        monkeypatch.setattr(settings, "ASSESSMENT_DEFAULT_PROFILE", "quick")
+        assert resolve_assessment_profile(None, None) == "quick"
+
+    def test_unknown_profile_is_rejected(self):
+        with pytest.raises(ValueError):
+            resolve_assessment_profile("detailed")
+
+
+class TestProfileConfiguration:
+    def test_full_header_assesses_phonemes_and_prosody(self):
+        params = decode_header(pronunciation_header("Hello"))
+        assert params["Granularity"] == "Phoneme"
+        assert params["EnableProsodyAssessment"] is True
+
+    def test_quick_header_assesses_words_without_prosody(self):
+        params = decode_header(pronunciation_header("Hello", "quick"))
+        assert params["Granularity"] == "Word"
+        assert params["EnableProsodyAssessment"] is False
+        assert params["EnableMiscue"] is True
+
+    def test_quick_result_has_no_prosody(self):
+        result = SpeechAssessmentService()._build_rest_result(REST_RESULT, "quick")
+
+        assert result.prosody_score is None
+        assert result.overall_score == pytest.approx((90 + 80 + 100) / 3)
+
+    @pytest.mark.asyncio
+    async def test_mock_quick_assessment_skips_prosody(self):
+        result = await SpeechAssessmentService().assess_pronunciation(b"audio", "Hi", "quick")
+
+        assert result.prosody_score is None
+        assert 0 <= result.overall_score <= 100
+
+
+class TestAssessProfile:
+    def submit(self, client, phrase, wav_audio_bytes, **data):
+        return client.post(
+            "/api/v1/assessments/assess",
+            data={"phrase_id": str(phrase.id), "user_id": "test-user-profile", **data},
+            files={"audio": ("recording.wav", io.BytesIO(wav_audio_bytes), "audio/wav")},
+        )
+
+    def test_requested_profile_is_recorded(self, client, db, sample_phrase, wav_audio_bytes):
+        response = self.submit(client, sample_phrase, wav_audio_bytes, profile="quick")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["assessment_profile"] == "quick"
+        assert data["scores"]["prosody_score"] is None
+        assert db.get(Assessment, data["id"]).assessment_profile == "quick"
+
+    def test_phrase_profile_is_used_by_default(self, client, db, sample_phrase, wav_audio_bytes):
+        sample_phrase.assessment_profile = "quick"
+        db.commit()
+
+        response = self.submit(client, sample_phrase, wav_audio_bytes)
+
+        assert response.json()["assessment_profile"] == "quick"
+
+    def test_default_profile_is_full(self, client, sample_phrase, wav_audio_bytes):
+        response = self.submit(client, sample_phrase, wav_audio_bytes)
+
+        assert response.json()["assessment_profile"] == "full"
+        assert response.json()["scores"]["prosody_score"] is not None
+
+    def test_unknown_profile_is_rejected(self, client, sample_phrase, wav_audio_bytes):
+        response = self.submit(client, sample_phrase, wav_audio_bytes, profile="detailed")
+
+        assert response.status_code == 422
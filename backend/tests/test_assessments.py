@@ -131,9 +131,7 @@ class TestSubmitAssessment:
         # Mock mode generates word scores for each word in reference text
         assert isinstance(data["word_level_scores"], dict)
 
-    def test_submit_multiple_assessments_same_phrase(
-        self, client, sample_phrase, wav_audio_bytes
-    ):
+    def test_submit_multiple_assessments_same_phrase(self, client, sample_phrase, wav_audio_bytes):
         user_id = "test-user-multiple"
 
         # Submit twice
@@ -244,3 +242,258 @@ class TestAssessmentIntegration:
         progress = client.get(f"/api/v1/users/{db_user_id}/progress").json()
         assert progress["total_assessments"] == 3
         assert progress["categories_practiced"]["Travel"] == 3
+
+
+class TestAssessmentFailureCleanup:
+    """Failures in the concurrent pipeline must not leave orphaned blobs."""
+
+    def test_scoring_failure_returns_500_without_orphaned_blob(
+        self, client, sample_phrase, wav_audio_bytes
+    ):
+        from pathlib import Path
+
+        from app.api.deps import get_speech_service
+        from app.main import app
+        from app.services.speech_service import SpeechAssessmentService
+
+        class FailingSpeechService(SpeechAssessmentService):
+            async def assess_pronunciation(self, audio_bytes, reference_text, profile="full"):
+                raise Exception("Speech assessment failed: backend unavailable")
+
+        user_id = "test-user-scoring-failure"
+        app.dependency_overrides[get_speech_service] = FailingSpeechService
+        response = client.post(
+            "/api/v1/assessments/assess",
+            data={"phrase_id": str(sample_phrase.id), "user_id": user_id},
+            files={"audio": ("recording.wav", io.BytesIO(wav_audio_bytes), "audio/wav")},
+        )
+        assert response.status_code == 500
+
+        user_dir = Path("./mock_blob_storage") / user_id
+        assert not user_dir.exists() or list(user_dir.iterdir()) == []
+
+
+class TestStreamAssessment:
+    """Test suite for POST /api/v1/assessments/assess/stream (raw audio body)."""
+
+    def test_stream_assessment_success(self, client, sample_phrase, wav_audio_bytes):
+        response = client.post(
+            "/api/v1/assessments/assess/stream",
+            params={"phrase_id": sample_phrase.id, "user_id": "test-user-stream"},
+            content=wav_audio_bytes,
+            headers={"Content-Type": "audio/wav"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["phrase_id"] == sample_phrase.id
+        assert 0 <= data["scores"]["overall_score"] <= 100
+
+    def test_stream_assessment_stores_encrypted_audio(
+        self, client, sample_phrase, wav_audio_bytes, db
+    ):
+        from pathlib import Path
+
+        from app.models.assessment import Assessment
+        from app.services.encryption_service import EncryptionService
+
+        def body():
+            for start in range(0, len(wav_audio_bytes), 4096):
+                yield wav_audio_bytes[start : start + 4096]
+
+        response = client.post(
+            "/api/v1/assessments/assess/stream",
+            params={"phrase_id": sample_phrase.id, "user_id": "test-user-stream-store"},
+            content=body(),
+            headers={"Content-Type": "audio/wav"},
+        )
+        assert response.status_code == 200
+
+        assessment = db.get(Assessment, response.json()["id"])
+        stored = Path(assessment.audio_blob_url.replace("local://", "")).read_bytes()
+        assert EncryptionService().decrypt_audio(stored) == wav_audio_bytes
+
+    def test_stream_assessment_too_large_while_streaming(self, client, sample_phrase):
+        from tests.conftest import make_wav_bytes
+
+        def body():
+            # No Content-Length: the limit must be enforced as chunks arrive
+            yield make_wav_bytes([])[:40] + b"\xff\xff\xff\xff"
+            chunk = b"\x00" * (1024 * 1024)
+            for _ in range(11):
+                yield chunk
+
+        user_id = "test-user-stream-too-large"
+        response = client.post(
+            "/api/v1/assessments/assess/stream",
+            params={"phrase_id": sample_phrase.id, "user_id": user_id},
+            content=body(),
+            headers={"Content-Type": "audio/wav"},
+        )
+        assert response.status_code == 400
+
+        from pathlib import Path
+
+        user_dir = Path("./mock_blob_storage") / user_id
+        assert not user_dir.exists() or list(user_dir.iterdir()) == []
+
+    @pytest.mark.parametrize(
+        "audio,status_code",
+        [(b"not audio at all", 415), ("silent", 422), ("truncated", 422)],
+        ids=["not-wav", "silent", "truncated"],
+    )
+    def test_stream_assessment_preflight_rejects(
+        self, client, sample_phrase, wav_audio_bytes, audio, status_code
+    ):
+        from pathlib import Path
+
+        from tests.conftest import make_wav_bytes
+
+        if audio == "silent":
+            audio = make_wav_bytes([0.0] * 16000)
+        elif audio == "truncated":
+            audio = wav_audio_bytes[:-1000]
+        user_id = "test-user-stream-preflight"
+
+        response = client.post(
+            "/api/v1/assessments/assess/stream",
+            params={"phrase_id": sample_phrase.id, "user_id": user_id},
+            content=audio,
+            headers={"Content-Type": "audio/wav"},
+        )
+
+        assert response.status_code == status_code
+        user_dir = Path("./mock_blob_storage") / user_id
+        assert not user_dir.exists() or list(user_dir.iterdir()) == []
+
+    def test_stream_assessment_rejects_audio_it_cannot_normalize(self, client, sample_phrase):
+        from tests.conftest import make_wav_bytes, speech_like_samples
+
+        stereo = [[sample, sample] for sample in speech_like_samples(1.0, 44100)]
+        response = client.post(
+            "/api/v1/assessments/assess/stream",
+            params={"phrase_id": sample_phrase.id, "user_id": "test-user-stream-stereo"},
+            content=make_wav_bytes(stereo, sample_rate=44100, num_channels=2),
+            headers={"Content-Type": "audio/wav"},
+        )
+
+        assert response.status_code == 415
+        assert "16000Hz 16-bit mono" in response.json()["detail"]
+
+    @pytest.mark.parametrize("encoding", ["mulaw", "ima_adpcm"])
+    def test_stream_assessment_rejects_compact_encodings(self, client, sample_phrase, encoding):
+        from app.services.wav_decoders import WAVE_FORMAT_MULAW
+        from tests.conftest import speech_like_samples
+        from tests.wav_encoders import ima_wav, mulaw_encode, wav_file
+
+        samples = speech_like_samples(1.0)
+        if encoding == "mulaw":
+            audio = wav_file(WAVE_FORMAT_MULAW, 1, 16000, 1, 8, mulaw_encode(samples))
+        else:
+            audio, _ = ima_wav(samples)
+
+        response = client.post(
+            "/api/v1/assessments/assess/stream",
+            params={"phrase_id": sample_phrase.id, "user_id": f"test-user-stream-{encoding}"},
+            content=audio,
+            headers={"Content-Type": "audio/wav"},
+        )
+
+        assert response.status_code == 415
+        assert "can't be streamed" in response.json()["detail"]
+
+    def test_stream_assessment_stores_measured_duration(self, client, db, sample_phrase):
+        from app.models.assessment import Assessment
+        from tests.conftest import make_wav_bytes, speech_like_samples
+
+        audio = make_wav_bytes(speech_like_samples(2.0))
+        # Data size left unknown by a recorder that streams without seeking back
+        audio = audio[:40] + b"\xff\xff\xff\xff" + audio[44:]
+
+        response = client.post(
+            "/api/v1/assessments/assess/stream",
+            params={"phrase_id": sample_phrase.id, "user_id": "test-user-stream-duration"},
+            content=audio,
+            headers={"Content-Type": "audio/wav"},
+        )
+
+        assert response.status_code == 200
+        assessment = db.get(Assessment, response.json()["id"])
+        assert assessment.assessment_duration_seconds == pytest.approx(2.0)
+
+    def test_stream_assessment_invalid_phrase(self, client, wav_audio_bytes):
+        response = client.post(
+            "/api/v1/assessments/assess/stream",
+            params={"phrase_id": 9999, "user_id": "test-user-stream-invalid"},
+            content=wav_audio_bytes,
+            headers={"Content-Type": "audio/wav"},
+        )
+        assert response.status_code == 404
+
+    def test_stream_assessment_missing_params(self, client, wav_audio_bytes):
+        response = client.post(
+            "/api/v1/assessments/assess/stream",
+            content=wav_audio_bytes,
+            headers={"Content-Type": "audio/wav"},
+        )
+        assert response.status_code == 422
+
+
+class TestBatchAssessment:
+    """Test suite for POST /api/v1/assessments/batch."""
+
+    @staticmethod
+    def submit_batch(client, phrase_ids, wav_audio_bytes, user_id="test-user-batch"):
+        return client.post(
+            "/api/v1/assessments/batch",
+            data={"phrase_ids": [str(pid) for pid in phrase_ids], "user_id": user_id},
+            files=[
+                ("audios", (f"recording{i}.wav", io.BytesIO(wav_audio_bytes), "audio/wav"))
+                for i in range(len(phrase_ids))
+            ],
+        )
+
+    def test_batch_assesses_dialog(self, client, db, create_phrase, sample_dialog, wav_audio_bytes):
+        from app.models.assessment import Assessment
+
+        phrases = [
+            create_phrase(dialog_id=sample_dialog.id, reference_text=f"Phrase {i}", order=i)
+            for i in range(3)
+        ]
+        response = self.submit_batch(client, [p.id for p in phrases], wav_audio_bytes)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["succeeded"] == 3
+        assert data["failed"] == 0
+        assert [item["phrase_id"] for item in data["items"]] == [p.id for p in phrases]
+        assert all(item["status"] == "succeeded" for item in data["items"])
+        assert db.query(Assessment).count() == 3
+
+    def test_batch_reports_partial_failure(self, client, db, sample_phrase, wav_audio_bytes):
+        from app.models.assessment import Assessment
+
+        response = self.submit_batch(client, [sample_phrase.id, 99999], wav_audio_bytes)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["succeeded"] == 1
+        assert data["failed"] == 1
+        assert data["items"][0]["assessment"]["phrase_id"] == sample_phrase.id
+        assert data["items"][1]["status"] == "failed"
+        assert "not found" in data["items"][1]["error"]
+        assert db.query(Assessment).count() == 1
+
+    def test_batch_mismatched_counts(self, client, sample_phrase, wav_audio_bytes):
+        response = client.post(
+            "/api/v1/assessments/batch",
+            data={"phrase_ids": [str(sample_phrase.id)] * 2, "user_id": "test-user-batch"},
+            files=[("audios", ("recording.wav", io.BytesIO(wav_audio_bytes), "audio/wav"))],
+        )
+        assert response.status_code == 400
+
+    def test_batch_too_many_items(self, client, sample_phrase, wav_audio_bytes, monkeypatch):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "BATCH_MAX_ITEMS", 1)
+        response = self.submit_batch(client, [sample_phrase.id] * 2, wav_audio_bytes)
+        assert response.status_code == 400
@@ -0,0 +1,72 @@
+"""Tests for the compact lossless at-rest audio container."""
+
+import numpy as np
+import pytest
+
+from app.services.audio_codec import (
+    CODEC_MAGIC,
+    MODE_PCM16_DELTA,
+    MODE_STORED,
+    AudioCodecError,
+    decode_audio,
+    encode_audio,
+)
+from tests.conftest import make_wav_bytes, speech_like_samples
+
+
+def noisy_speech(seconds=2.0, channels=1):
+    rng = np.random.default_rng(0)
+    samples = speech_like_samples(seconds) + 0.003 * rng.standard_normal(int(seconds * 16000))
+    return np.repeat(samples[:, None], channels, axis=1) if channels > 1 else samples
+
+
+class TestEncodeAudio:
+    def test_pcm16_roundtrip_is_byte_exact(self):
+        original = make_wav_bytes(noisy_speech())
+        encoded = encode_audio(original)
+
+        assert encoded[7] == MODE_PCM16_DELTA
+        assert decode_audio(encoded) == original
+
+    def test_compresses_speech(self):
+        original = make_wav_bytes(noisy_speech())
+        assert len(encode_audio(original)) < 0.75 * len(original)
+
+    def test_stereo_roundtrip(self):
+        original = make_wav_bytes(noisy_speech(channels=2), num_channels=2)
+        assert decode_audio(encode_audio(original)) == original
+
+    def test_full_scale_noise_roundtrip(self):
+        # Deltas between extreme samples overflow int16 and must wrap back exactly
+        rng = np.random.default_rng(1)
+        original = make_wav_bytes(rng.choice([-1.0, 1.0], 16000))
+        assert decode_audio(encode_audio(original)) == original
+
+    def test_extra_chunks_and_partial_frame_are_kept(self):
+        wav = make_wav_bytes(noisy_speech(0.5))
+        original = wav + b"\x01" + b"LIST\x04\x00\x00\x00info"  # odd trailing bytes
+        assert decode_audio(encode_audio(original)) == original
+
+    @pytest.mark.parametrize(
+        "audio",
+        [b"not a wav file", b"", make_wav_bytes(speech_like_samples(0.5), bits_per_sample=24)],
+    )
+    def test_other_audio_is_stored_verbatim(self, audio):
+        encoded = encode_audio(audio)
+
+        assert encoded[7] == MODE_STORED
+        assert decode_audio(encoded) == audio
+
+
+class TestDecodeAudio:
+    def test_legacy_plaintext_passes_through(self, wav_audio_bytes):
+        assert decode_audio(wav_audio_bytes) is wav_audio_bytes
+
+    def test_unknown_version_is_rejected(self):
+        with pytest.raises(AudioCodecError):
+            decode_audio(CODEC_MAGIC + bytes([99, MODE_STORED]) + b"data")
+
+    def test_corrupt_payload_is_rejected(self):
+        encoded = encode_audio(make_wav_bytes(noisy_speech()))
+        with pytest.raises(AudioCodecError):
+            decode_audio(encoded[:-100])
@@ -0,0 +1,113 @@
+"""Tests for 16 kHz mono audio normalization."""
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.services.assessment_pipeline import AssessmentPipeline
+from app.services.audio_normalization import TARGET_SAMPLE_RATE, normalize_audio, resample
+from app.services.blob_service import BlobStorageService
+from app.services.encryption_service import EncryptionService
+from app.services.speech_service import SpeechAssessmentService
+from app.services.wav_audio import WavAudio
+from tests.conftest import make_wav_bytes, speech_like_samples
+
+
+@pytest.fixture(autouse=True)
+def cleanup_mock_storage():
+    """Clean up mock blob storage after each test."""
+    yield
+    mock_dir = Path("./mock_blob_storage")
+    if mock_dir.exists():
+        shutil.rmtree(mock_dir)
+
+
+def tone(frequency, seconds, sample_rate):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return 0.5 * np.sin(2 * np.pi * frequency * t)
+
+
+def dominant_frequency(samples, sample_rate):
+    spectrum = np.abs(np.fft.rfft(samples))
+    return np.argmax(spectrum) * sample_rate / len(samples)
+
+
+class TestResample:
+    def test_preserves_tone_frequency(self):
+        out = resample(tone(1000, 1.0, 44100), 44100, TARGET_SAMPLE_RATE)
+
+        assert len(out) == TARGET_SAMPLE_RATE
+        assert dominant_frequency(out, TARGET_SAMPLE_RATE) == pytest.approx(1000, abs=2)
+        assert np.sqrt(np.mean(out**2)) == pytest.approx(0.5 / np.sqrt(2), rel=0.02)
+
+    def test_removes_content_above_new_nyquist(self):
+        # A 12 kHz tone would alias to 4 kHz without the low-pass
+        out = resample(tone(12000, 1.0, 48000), 48000, TARGET_SAMPLE_RATE)
+        assert np.max(np.abs(out)) < 0.01
+
+    def test_upsamples(self):
+        out = resample(tone(440, 0.5, 8000), 8000, TARGET_SAMPLE_RATE)
+        assert len(out) == 8000
+        assert dominant_frequency(out, TARGET_SAMPLE_RATE) == pytest.approx(440, abs=2)
+
+
+class TestNormalizeAudio:
+    def test_48k_stereo_becomes_16k_mono(self):
+        stereo = np.stack([speech_like_samples(2.0, 48000)] * 2, axis=1)
+        original = make_wav_bytes(stereo, sample_rate=48000, num_channels=2)
+
+        normalized = normalize_audio(original)
+        wav = WavAudio.parse(normalized)
+
+        assert (wav.sample_rate, wav.channels, wav.bits_per_sample) == (16000, 1, 16)
+        assert wav.duration_seconds == pytest.approx(2.0)
+        assert len(normalized) < len(original) / 5
+
+    def test_24bit_mono_becomes_16bit(self):
+        original = make_wav_bytes(speech_like_samples(), bits_per_sample=24)
+        wav = WavAudio.parse(normalize_audio(original))
+        assert wav.bits_per_sample == 16
+        assert wav.num_frames == 16000
+
+    def test_target_format_is_unchanged(self, wav_audio_bytes):
+        assert normalize_audio(wav_audio_bytes) is wav_audio_bytes
+
+    def test_non_wav_is_unchanged(self):
+        assert normalize_audio(b"not a wav file") == b"not a wav file"
+
+
+class TestPipelineNormalization:
+    @pytest.mark.asyncio
+    async def test_scores_and_stores_normalized_audio(self):
+        received = []
+
+        class RecordingSpeechService(SpeechAssessmentService):
+            async def assess_pronunciation(self, audio_bytes, reference_text, profile="full"):
+                received.append(audio_bytes)
+                return await super().assess_pronunciation(audio_bytes, reference_text)
+
+        encryption = EncryptionService()
+        blob_service = BlobStorageService()
+        pipeline = AssessmentPipeline(RecordingSpeechService(), blob_service, encryption)
+        original = make_wav_bytes(speech_like_samples(1.0, 44100), sample_rate=44100)
+
+        prepared, _ = await pipeline.prepare_audio(original)
+        _, blob_url = await pipeline.score_and_store(prepared, "Hello", "user-normalized")
+
+        stored = encryption.decrypt_audio(await blob_service.download_audio(blob_url))
+        assert stored == received[0]
+        assert WavAudio.parse(stored).sample_rate == TARGET_SAMPLE_RATE
+
+    @pytest.mark.asyncio
+    async def test_normalization_can_be_disabled(self):
+        pipeline = AssessmentPipeline(
+            SpeechAssessmentService(),
+            BlobStorageService(),
+            EncryptionService(),
+            normalize=False,
+            trim_silence=False,
+        )
+        original = make_wav_bytes(speech_like_samples(1.0, 44100), sample_rate=44100)
+        assert await pipeline.prepare_audio(original) == (original, None)
@@ -0,0 +1,233 @@
+"""Tests for deferred audio upload through the outbox."""
+
+import io
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.models.assessment import Assessment
+from app.models.audio_outbox import AudioUploadOutbox
+from app.services.audio_outbox_service import AudioOutboxWorker, AudioSpool
+from app.services.blob_service import BlobStorageService
+from app.services.encryption_service import EncryptionService
+from tests.conftest import TestingAsyncSessionLocal
+
+
+@pytest.fixture(autouse=True)
+def cleanup_mock_storage():
+    """Clean up mock blob storage after each test."""
+    yield
+    mock_dir = Path("./mock_blob_storage")
+    if mock_dir.exists():
+        shutil.rmtree(mock_dir)
+
+
+@pytest.fixture
+def spool_dir(tmp_path, monkeypatch):
+    """Point the audio spool at a temporary directory."""
+    monkeypatch.setattr(settings, "AUDIO_SPOOL_DIR", str(tmp_path / "spool"))
+    return tmp_path / "spool"
+
+
+@pytest.fixture
+def deferred_upload(monkeypatch, spool_dir):
+    """Enable deferred audio upload mode."""
+    monkeypatch.setattr(settings, "DEFERRED_AUDIO_UPLOAD", True)
+    return spool_dir
+
+
+class FailingBlobService(BlobStorageService):
+    async def upload_audio(self, audio_bytes, file_extension="wav", user_id=None):
+        raise Exception("File upload failed: storage unavailable")
+
+
+class ObservingBlobService(BlobStorageService):
+    """Records what other workers see while an upload is in flight."""
+
+    def __init__(self):
+        super().__init__()
+        self.statuses = []
+        self.concurrent_claims = []
+
+    async def upload_audio(self, audio_bytes, file_extension="wav", user_id=None):
+        async with TestingAsyncSessionLocal() as other:
+            self.statuses.append((await other.execute(select(AudioUploadOutbox.status))).scalar())
+        self.concurrent_claims.append(await make_worker().drain_once())
+        return await super().upload_audio(audio_bytes, file_extension, user_id)
+
+
+def make_worker(blob_service=None):
+    return AudioOutboxWorker(
+        blob_service=blob_service or BlobStorageService(),
+        session_factory=TestingAsyncSessionLocal,
+    )
+
+
+def submit(client, phrase_id, wav_audio_bytes, user_id="outbox-user"):
+    return client.post(
+        "/api/v1/assessments/assess",
+        data={"phrase_id": str(phrase_id), "user_id": user_id},
+        files={"audio": ("recording.wav", io.BytesIO(wav_audio_bytes), "audio/wav")},
+    )
+
+
+class TestDeferredAssessment:
+    """POST /assess with DEFERRED_AUDIO_UPLOAD enabled."""
+
+    def test_responds_before_upload_with_outbox_row(
+        self, client, db, sample_phrase, wav_audio_bytes, deferred_upload
+    ):
+        response = submit(client, sample_phrase.id, wav_audio_bytes)
+        assert response.status_code == 200
+
+        assessment = db.get(Assessment, response.json()["id"])
+        assert assessment.audio_blob_url is None
+
+        entry = db.query(AudioUploadOutbox).one()
+        assert entry.assessment_id == assessment.id
+        assert entry.status == "pending"
+        assert Path(entry.spool_path).exists()
+        assert not Path("./mock_blob_storage/outbox-user").exists()
+
+    def test_spooled_audio_is_encrypted(
+        self, client, db, sample_phrase, wav_audio_bytes, deferred_upload
+    ):
+        submit(client, sample_phrase.id, wav_audio_bytes)
+
+        entry = db.query(AudioUploadOutbox).one()
+        spooled = Path(entry.spool_path).read_bytes()
+        assert EncryptionService().decrypt_audio(spooled) == wav_audio_bytes
+
+
+class TestAudioOutboxWorker:
+    """Test suite for AudioOutboxWorker.drain_once."""
+
+    @pytest.mark.asyncio
+    async def test_drain_uploads_and_sets_blob_url(
+        self, client, db, sample_phrase, wav_audio_bytes, deferred_upload
+    ):
+        assessment_id = submit(client, sample_phrase.id, wav_audio_bytes).json()["id"]
+        spool_path = db.query(AudioUploadOutbox).one().spool_path
+
+        processed = await make_worker().drain_once()
+        assert processed == 1
+
+        db.expire_all()
+        assessment = db.get(Assessment, assessment_id)
+        assert assessment.audio_blob_url.startswith("local://")
+        assert "outbox-user" in assessment.audio_blob_url
+        assert db.query(AudioUploadOutbox).count() == 0
+        assert not Path(spool_path).exists()
+
+    @pytest.mark.asyncio
+    async def test_claim_is_committed_before_upload(
+        self, client, db, sample_phrase, wav_audio_bytes, deferred_upload
+    ):
+        submit(client, sample_phrase.id, wav_audio_bytes)
+        blob_service = ObservingBlobService()
+
+        assert await make_worker(blob_service).drain_once() == 1
+
+        assert blob_service.statuses == ["uploading"]
+        assert blob_service.concurrent_claims == [0]
+        assert db.query(AudioUploadOutbox).count() == 0
+
+    @pytest.mark.asyncio
+    async def test_claim_of_dead_worker_is_reclaimed(
+        self, client, db, sample_phrase, wav_audio_bytes, deferred_upload
+    ):
+        submit(client, sample_phrase.id, wav_audio_bytes)
+        db.query(AudioUploadOutbox).update(
+            {"status": "uploading", "locked_at": datetime.utcnow() - timedelta(hours=1)}
+        )
+        db.commit()
+
+        assert await make_worker().drain_once() == 1
+        assert db.query(AudioUploadOutbox).count() == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_is_rescheduled(
+        self, client, db, sample_phrase, wav_audio_bytes, deferred_upload
+    ):
+        submit(client, sample_phrase.id, wav_audio_bytes)
+
+        await make_worker(FailingBlobService()).drain_once()
+
+        db.expire_all()
+        entry = db.query(AudioUploadOutbox).one()
+        assert entry.status == "pending"
+        assert entry.locked_at is None
+        assert entry.attempts == 1
+        assert "storage unavailable" in entry.last_error
+        assert entry.next_attempt_at > datetime.utcnow()
+        assert Path(entry.spool_path).exists()
+
+    @pytest.mark.asyncio
+    async def test_rescheduled_entry_is_not_due(
+        self, client, db, sample_phrase, wav_audio_bytes, deferred_upload
+    ):
+        submit(client, sample_phrase.id, wav_audio_bytes)
+        await make_worker(FailingBlobService()).drain_once()
+
+        assert await make_worker().drain_once() == 0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(
+        self, client, db, sample_phrase, wav_audio_bytes, deferred_upload, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "OUTBOX_MAX_ATTEMPTS", 2)
+        submit(client, sample_phrase.id, wav_audio_bytes)
+        worker = make_worker(FailingBlobService())
+
+        for _ in range(2):
+            db.query(AudioUploadOutbox).update(
+                {"next_attempt_at": datetime.utcnow() - timedelta(seconds=1)}
+            )
+            db.commit()
+            await worker.drain_once()
+
+        db.expire_all()
+        entry = db.query(AudioUploadOutbox).one()
+        assert entry.status == "failed"
+        assert entry.attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_spool_file_is_reported(
+        self, client, db, sample_phrase, wav_audio_bytes, deferred_upload
+    ):
+        submit(client, sample_phrase.id, wav_audio_bytes)
+        Path(db.query(AudioUploadOutbox).one().spool_path).unlink()
+        worker = make_worker()
+
+        await worker.drain_once()
+
+        db.expire_all()
+        entry = db.query(AudioUploadOutbox).one()
+        assert entry.status == "missing_audio"
+        assert entry.attempts == 1
+        stats = worker.stats()
+        assert stats["missing_audio"] == 1
+        assert stats["rows"]["missing_audio"] == 1
+        assert stats["rows"]["pending"] == 0
+
+    def test_health_exposes_outbox_stats(self, client):
+        assert client.get("/health").json()["audio_outbox"] is None
+
+
+class TestAudioSpool:
+    """Test suite for AudioSpool."""
+
+    @pytest.mark.asyncio
+    async def test_write_read_remove(self, spool_dir):
+        spool = AudioSpool()
+        path = await spool.write(b"encrypted audio")
+
+        assert Path(path).parent == spool_dir
+        assert await spool.read(path) == b"encrypted audio"
+
+        spool.remove(path)
+        assert not Path(path).exists()
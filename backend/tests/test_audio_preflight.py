@@ -0,0 +1,188 @@
+"""Tests for the audio preflight stage and WAV parsing."""
+
+import io
+import struct
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.services.audio_preflight import AudioPreflightError, StreamPreflight, preflight_audio
+from app.services.wav_audio import UnsupportedWavFormatError, WavAudio, WavFormatError
+from tests.conftest import make_wav_bytes, speech_like_samples
+
+
+def float_wav_bytes():
+    """IEEE float WAV (format tag 3), which the preflight must reject."""
+    data = np.zeros(1600, dtype="<f4").tobytes()
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(data), b"WAVE", b"fmt ", 16, 3, 1, 16000, 64000, 4, 32,
+        b"data", len(data),
+    )  # fmt: skip
+    return header + data
+
+
+class TestWavAudio:
+    def test_parse_mono_16bit(self, wav_audio_bytes):
+        wav = WavAudio.parse(wav_audio_bytes)
+        assert (wav.sample_rate, wav.channels, wav.bits_per_sample) == (16000, 1, 16)
+        assert wav.duration_seconds == pytest.approx(1.0)
+        assert not wav.truncated
+
+    def test_parse_stereo_44k(self):
+        stereo = np.stack([speech_like_samples(0.5, 44100)] * 2, axis=1)
+        wav = WavAudio.parse(make_wav_bytes(stereo, sample_rate=44100, num_channels=2))
+
+        assert wav.samples().shape == (22050, 2)
+        assert wav.duration_seconds == pytest.approx(0.5)
+
+    @pytest.mark.parametrize("bits", [8, 16, 24, 32])
+    def test_sample_conversion(self, bits):
+        samples = np.array([0.0, 0.5, -0.5, 0.25])
+        wav = WavAudio.parse(make_wav_bytes(samples, bits_per_sample=bits))
+        np.testing.assert_allclose(wav.mono(), samples, atol=0.01)
+
+    def test_not_a_wav(self):
+        with pytest.raises(WavFormatError):
+            WavAudio.parse(b"ID3\x03 this is an mp3")
+
+    def test_non_pcm(self):
+        with pytest.raises(UnsupportedWavFormatError):
+            WavAudio.parse(float_wav_bytes())
+
+    def test_truncated_data_chunk(self, wav_audio_bytes):
+        wav = WavAudio.parse(wav_audio_bytes[:-1000])
+        assert wav.truncated
+
+
+class TestPreflight:
+    def test_accepts_speech(self, wav_audio_bytes):
+        analysis = preflight_audio(wav_audio_bytes)
+        assert analysis.duration_seconds == pytest.approx(1.0)
+        assert analysis.clipping_ratio == 0
+        assert analysis.speech_ratio > 0.5
+
+    @pytest.mark.parametrize(
+        "audio_bytes,status_code,message",
+        [
+            (b"not audio at all", 415, "not a WAV"),
+            (float_wav_bytes(), 415, "Unsupported WAV encoding"),
+            (make_wav_bytes(np.zeros(16000)), 422, "silent"),
+            (make_wav_bytes(speech_like_samples(0.2)), 422, "too short"),
+            (make_wav_bytes(np.clip(speech_like_samples() * 10, -1, 1)), 422, "clipped"),
+            (make_wav_bytes(np.full(16000, 0.006)), 422, "No speech"),
+        ],
+        ids=["not-wav", "non-pcm", "silent", "too-short", "clipped", "no-speech"],
+    )
+    def test_rejects_unusable_audio(self, audio_bytes, status_code, message):
+        with pytest.raises(AudioPreflightError) as exc_info:
+            preflight_audio(audio_bytes)
+        assert exc_info.value.status_code == status_code
+        assert message in str(exc_info.value)
+
+    def test_rejects_truncated_upload(self, wav_audio_bytes):
+        with pytest.raises(AudioPreflightError, match="truncated"):
+            preflight_audio(wav_audio_bytes[:-1000])
+
+
+def stream_preflight(audio_bytes, chunk_size=1001):
+    """Run StreamPreflight over audio split into odd-sized chunks."""
+    preflight = StreamPreflight()
+    preflight.check_header(audio_bytes[:4096])
+    for start in range(0, len(audio_bytes), chunk_size):
+        preflight.feed(audio_bytes[start : start + chunk_size])
+    return preflight.finish()
+
+
+def unknown_size(audio_bytes):
+    """The same WAV file with its data size left unset, as written by a streaming recorder."""
+    return audio_bytes[:40] + b"\xff\xff\xff\xff" + audio_bytes[44:]
+
+
+class TestStreamPreflight:
+    @pytest.mark.parametrize(
+        "audio_bytes",
+        [
+            make_wav_bytes(speech_like_samples()),
+            make_wav_bytes(np.stack([speech_like_samples(1.0, 44100)] * 2, axis=1), 44100, 2),
+            make_wav_bytes(speech_like_samples(), bits_per_sample=24),
+        ],
+        ids=["mono", "stereo-44k", "24-bit"],
+    )
+    def test_matches_buffered_preflight(self, audio_bytes):
+        streamed = stream_preflight(audio_bytes)
+        buffered = preflight_audio(audio_bytes)
+
+        assert streamed.duration_seconds == pytest.approx(buffered.duration_seconds)
+        assert streamed.rms_dbfs == pytest.approx(buffered.rms_dbfs, abs=0.01)
+        assert streamed.clipping_ratio == pytest.approx(buffered.clipping_ratio)
+        assert streamed.speech_ratio == pytest.approx(buffered.speech_ratio)
+
+    @pytest.mark.parametrize(
+        "audio_bytes,status_code,message",
+        [
+            (b"not audio at all", 415, "not a WAV"),
+            (float_wav_bytes(), 415, "Unsupported WAV encoding"),
+            (make_wav_bytes(np.zeros(16000)), 422, "silent"),
+            (make_wav_bytes(speech_like_samples(0.2)), 422, "too short"),
+            (unknown_size(make_wav_bytes(speech_like_samples(0.2))), 422, "too short"),
+            (make_wav_bytes(np.clip(speech_like_samples() * 10, -1, 1)), 422, "clipped"),
+            (make_wav_bytes(np.full(16000, 0.006)), 422, "No speech"),
+            (make_wav_bytes(speech_like_samples())[:-1000], 422, "truncated"),
+        ],
+        ids=[
+            "not-wav",
+            "non-pcm",
+            "silent",
+            "too-short",
+            "too-short-unknown-size",
+            "clipped",
+            "no-speech",
+            "truncated",
+        ],
+    )
+    def test_rejects_unusable_audio(self, audio_bytes, status_code, message):
+        with pytest.raises(AudioPreflightError) as exc_info:
+            stream_preflight(audio_bytes)
+        assert exc_info.value.status_code == status_code
+        assert message in str(exc_info.value)
+
+    def test_declared_length_is_checked_from_the_header(self):
+        header = make_wav_bytes(speech_like_samples(0.2))[:44]
+        with pytest.raises(AudioPreflightError, match="too short"):
+            StreamPreflight().check_header(header)
+
+    def test_unknown_size_is_measured(self, wav_audio_bytes):
+        analysis = stream_preflight(unknown_size(wav_audio_bytes))
+        assert analysis.duration_seconds == pytest.approx(1.0)
+
+
+class TestAssessPreflight:
+    def test_silent_recording_rejected_before_storage(self, client, sample_phrase):
+        user_id = "test-user-silent"
+        response = client.post(
+            "/api/v1/assessments/assess",
+            data={"phrase_id": str(sample_phrase.id), "user_id": user_id},
+            files={
+                "audio": ("recording.wav", io.BytesIO(make_wav_bytes(np.zeros(16000))), "audio/wav")
+            },
+        )
+
+        assert response.status_code == 422
+        assert "silent" in response.json()["detail"]
+        assert not (Path("./mock_blob_storage") / user_id).exists()
+
+    def test_measured_duration_is_stored(self, client, db, sample_phrase):
+        from app.models.assessment import Assessment
+
+        audio = make_wav_bytes(speech_like_samples(2.0, 44100), sample_rate=44100)
+        response = client.post(
+            "/api/v1/assessments/assess",
+            data={"phrase_id": str(sample_phrase.id), "user_id": "test-user-duration"},
+            files={"audio": ("recording.wav", io.BytesIO(audio), "audio/wav")},
+        )
+
+        assert response.status_code == 200
+        assessment = db.get(Assessment, response.json()["id"])
+        assert assessment.assessment_duration_seconds == pytest.approx(2.0)
@@ -1,4 +1,6 @@
-"""Unit tests for the blob storage service (mock mode)."""
+"""Unit tests for the blob storage service (mock mode, and Azure mode on fake clients)."""
+
+import asyncio
 
 import pytest
 from pathlib import Path
@@ -90,3 +92,169 @@ class TestBlobServiceMockDelete:
         service = BlobStorageService()
         result = await service.delete_audio("local://nonexistent.wav")
         assert result is False
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+async def _failing_chunks():
+    yield b"partial data"
+    raise Exception("client disconnected")
+
+
+class TestBlobServiceMockUploadStream:
+    """Test suite for mock streaming upload."""
+
+    @pytest.mark.asyncio
+    async def test_upload_stream_writes_all_chunks(self):
+        service = BlobStorageService()
+        url = await service.upload_audio_stream(_chunks(b"abc", b"def", b"ghi"), user_id="user-s")
+        assert "user-s" in url
+        assert Path(url.replace("local://", "")).read_bytes() == b"abcdefghi"
+
+    @pytest.mark.asyncio
+    async def test_upload_stream_failure_removes_partial_file(self):
+        service = BlobStorageService()
+        with pytest.raises(Exception, match="File upload failed"):
+            await service.upload_audio_stream(_failing_chunks(), user_id="user-partial")
+
+        user_dir = Path("./mock_blob_storage") / "user-partial"
+        assert not user_dir.exists() or list(user_dir.iterdir()) == []
+
+
+class FakeAsyncBlobClient:
+    """Async blob client recording calls and how many blocks are staged at once."""
+
+    def __init__(self, fail_block=None):
+        self.url = "https://account.blob.core.windows.net/audio-recordings/blob.wav"
+        self.fail_block = fail_block
+        self.staged = []
+        self.committed = None
+        self.uploads = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def stage_block(self, block_id, data):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if len(self.staged) == self.fail_block:
+            raise Exception("block rejected")
+        self.staged.append((block_id, data))
+
+    async def commit_block_list(self, blocks, content_settings=None):
+        self.committed = [block.block_id for block in blocks]
+
+    async def upload_blob(self, data, **kwargs):
+        self.uploads.append((data, kwargs))
+
+
+class FakeContainerClient:
+    def __init__(self):
+        self.exists_calls = 0
+        self.created = False
+
+    async def exists(self):
+        self.exists_calls += 1
+        return False
+
+    async def create_container(self):
+        self.created = True
+
+
+class FakeAsyncServiceClient:
+    def __init__(self, blob_client):
+        self.blob_client = blob_client
+        self.container = FakeContainerClient()
+        self.closed = False
+
+    def get_blob_client(self, container, blob):
+        return self.blob_client
+
+    def get_container_client(self, container):
+        return self.container
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def azure_service(monkeypatch):
+    """BlobStorageService in Azure mode on top of fake async clients."""
+    from types import SimpleNamespace
+
+    from app.core.config import settings
+    from app.services import blob_service as blob_module
+
+    monkeypatch.setattr(settings, "MOCK_MODE", False)
+    monkeypatch.setattr(settings, "BLOB_UPLOAD_CONCURRENCY", 2)
+    monkeypatch.setattr(blob_module, "AZURE_BLOB_AVAILABLE", True)
+    monkeypatch.setattr(blob_module, "BlobBlock", SimpleNamespace, raising=False)
+    monkeypatch.setattr(blob_module, "ContentSettings", SimpleNamespace, raising=False)
+    monkeypatch.setattr(blob_module, "STREAM_BLOCK_SIZE", 4)
+
+    def make(blob_client=None):
+        service = BlobStorageService()
+        service.blob_service_client = FakeAsyncServiceClient(blob_client or FakeAsyncBlobClient())
+        return service
+
+    return make
+
+
+class TestBlobServiceAzure:
+    """Test suite for the async Azure client (faked)."""
+
+    @pytest.mark.asyncio
+    async def test_container_is_verified_once(self, azure_service):
+        service = azure_service()
+        await service.upload_audio(b"one")
+        await service.upload_audio(b"two")
+
+        assert service.blob_service_client.container.exists_calls == 1
+        assert service.blob_service_client.container.created
+
+    @pytest.mark.asyncio
+    async def test_upload_uses_configured_concurrency(self, azure_service):
+        blob_client = FakeAsyncBlobClient()
+        await azure_service(blob_client).upload_audio(b"audio")
+
+        data, kwargs = blob_client.uploads[0]
+        assert data == b"audio"
+        assert kwargs["max_concurrency"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_stages_blocks_in_parallel_and_commits_in_order(self, azure_service):
+        blob_client = FakeAsyncBlobClient()
+        url = await azure_service(blob_client).upload_audio_stream(
+            _chunks(b"aaaa", b"bbbb", b"cccc", b"dddd", b"ee")
+        )
+
+        assert url == blob_client.url
+        assert blob_client.max_in_flight == 2
+        staged = dict(blob_client.staged)
+        assert b"".join(staged[block_id] for block_id in blob_client.committed) == (
+            b"aaaabbbbccccddddee"
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_failed_block_commits_nothing(self, azure_service):
+        blob_client = FakeAsyncBlobClient(fail_block=1)
+        with pytest.raises(Exception, match="File upload failed"):
+            await azure_service(blob_client).upload_audio_stream(
+                _chunks(b"aaaa", b"bbbb", b"cccc", b"dddd")
+            )
+
+        assert blob_client.committed is None
+
+    @pytest.mark.asyncio
+    async def test_close_releases_the_shared_client(self, azure_service):
+        service = azure_service()
+        client = service.blob_service_client
+
+        await service.close()
+
+        assert client.closed
+        assert service.blob_service_client is None
@@ -0,0 +1,117 @@
+"""Tests for request deadlines and client-disconnect cancellation."""
+
+import asyncio
+import io
+from pathlib import Path
+
+import pytest
+
+from app.api.deps import get_speech_service
+from app.api.v1.endpoints.assessments import _cancel_on_disconnect
+from app.core.config import settings
+from app.main import app
+from app.models.assessment import Assessment
+from app.services.assessment_pipeline import AssessmentPipeline
+from app.services.blob_service import BlobStorageService
+from app.services.deadlines import (
+    ClientDisconnectedError,
+    Deadline,
+    DeadlineExceededError,
+    cancellation_stats,
+    time_left,
+)
+from app.services.encryption_service import EncryptionService
+from app.services.speech_service import SpeechAssessmentService
+
+
+class StalledSpeechService(SpeechAssessmentService):
+    """Never answers, like a recognition stuck in the speech backend."""
+
+    async def assess_pronunciation(self, audio_bytes, reference_text, profile="full"):
+        await asyncio.sleep(30)
+
+
+class FakeRequest:
+    def __init__(self, disconnect_after):
+        self.disconnect_after = disconnect_after
+        self.polls = 0
+
+    async def is_disconnected(self):
+        self.polls += 1
+        return self.polls > self.disconnect_after
+
+
+def blob_files(user_id):
+    user_dir = Path("./mock_blob_storage") / user_id
+    return list(user_dir.iterdir()) if user_dir.exists() else []
+
+
+class TestDeadline:
+    @pytest.mark.asyncio
+    async def test_scope_raises_when_exceeded(self):
+        with pytest.raises(DeadlineExceededError):
+            async with Deadline(0.05).scope():
+                await asyncio.sleep(1)
+
+    @pytest.mark.asyncio
+    async def test_time_left_is_capped_in_spawned_tasks(self):
+        assert time_left(10.0) == 10.0
+
+        async with Deadline(1.0).scope():
+            left = await asyncio.create_task(_time_left())
+
+        assert 0 < left <= 1.0
+        assert time_left(10.0) == 10.0
+
+
+async def _time_left():
+    return time_left(10.0)
+
+
+class TestDisconnectCancellation:
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_work_and_removes_blob(self, wav_audio_bytes, monkeypatch):
+        monkeypatch.setattr("app.api.v1.endpoints.assessments.DISCONNECT_POLL_SECONDS", 0.01)
+        pipeline = AssessmentPipeline(
+            StalledSpeechService(), BlobStorageService(), EncryptionService()
+        )
+        recognitions = cancellation_stats.recognitions_cancelled
+
+        work = pipeline.score_and_store(wav_audio_bytes, "Hi", user_id="gone-user")
+        with pytest.raises(ClientDisconnectedError):
+            await _cancel_on_disconnect(FakeRequest(disconnect_after=5), work)
+
+        assert cancellation_stats.recognitions_cancelled == recognitions + 1
+        assert blob_files("gone-user") == []
+
+    @pytest.mark.asyncio
+    async def test_finished_work_is_returned(self):
+        async def work():
+            return "done"
+
+        assert await _cancel_on_disconnect(FakeRequest(disconnect_after=100), work()) == "done"
+
+
+class TestAssessmentDeadline:
+    def test_deadline_returns_504_and_saves_nothing(
+        self, client, db, sample_phrase, wav_audio_bytes, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "ASSESSMENT_DEADLINE_SECONDS", 0.2)
+        app.dependency_overrides[get_speech_service] = StalledSpeechService
+        deadlines = cancellation_stats.requests["deadline"]
+        user_id = "test-user-deadline"
+
+        response = client.post(
+            "/api/v1/assessments/assess",
+            data={"phrase_id": str(sample_phrase.id), "user_id": user_id},
+            files={"audio": ("recording.wav", io.BytesIO(wav_audio_bytes), "audio/wav")},
+        )
+
+        assert response.status_code == 504
+        assert db.query(Assessment).count() == 0
+        assert blob_files(user_id) == []
+        assert cancellation_stats.requests["deadline"] == deadlines + 1
+
+    def test_health_reports_cancellations(self, client):
+        stats = client.get("/health").json()["cancellations"]
+        assert set(stats) >= {"requests", "recognitions_cancelled", "speech_seconds_saved"}
@@ -3,7 +3,14 @@
 import pytest
 from cryptography.fernet import Fernet, InvalidToken
 
-from app.services.encryption_service import EncryptionService
+from app.core.config import settings
+from app.services.encryption_service import (
+    COMPACT_MAGIC,
+    LEGACY_STREAM_MAGIC,
+    STREAM_MAGIC,
+    EncryptionService,
+    _frames,
+)
 
 
 class TestEncryptionService:
@@ -75,3 +82,124 @@ class TestEncryptionService:
         encrypted = service.encrypt_audio(large_data)
         decrypted = service.decrypt_audio(encrypted)
         assert decrypted == large_data
+
+
+async def _chunks(data, size):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def _encrypted_frames(service, data):
+    """Header followed by the stream's frames, unframed (three 100-byte chunks)."""
+    encrypted = b"".join([part async for part in service.encrypt_audio_stream(_chunks(data, 100))])
+    header_size = len(STREAM_MAGIC) + 7
+    return [encrypted[:header_size]] + _frames(encrypted, header_size)
+
+
+def _join_frames(parts):
+    header, frames = parts[0], parts[1:]
+    return header + b"".join(len(frame).to_bytes(4, "big") + frame for frame in frames)
+
+
+class TestEncryptionServiceStream:
+    """Test suite for chunked (streaming) encryption."""
+
+    @pytest.mark.asyncio
+    async def test_stream_roundtrip(self):
+        service = EncryptionService()
+        original = bytes(range(256)) * 100
+        encrypted = b"".join(
+            [part async for part in service.encrypt_audio_stream(_chunks(original, 1000))]
+        )
+        assert service.decrypt_audio(encrypted) == original
+
+    @pytest.mark.asyncio
+    async def test_stream_output_is_not_plaintext(self):
+        service = EncryptionService()
+        original = b"plain audio bytes" * 50
+        encrypted = b"".join(
+            [part async for part in service.encrypt_audio_stream(_chunks(original, 64))]
+        )
+        assert original not in encrypted
+
+    @pytest.mark.asyncio
+    async def test_stream_truncated_raises(self):
+        service = EncryptionService()
+        encrypted = b"".join(
+            [part async for part in service.encrypt_audio_stream(_chunks(b"x" * 500, 100))]
+        )
+        with pytest.raises(InvalidToken):
+            service.decrypt_audio(encrypted[:-10])
+
+    @pytest.mark.asyncio
+    async def test_empty_stream_roundtrip(self):
+        service = EncryptionService()
+        encrypted = b"".join([part async for part in service.encrypt_audio_stream(_chunks(b"", 1))])
+        assert service.decrypt_audio(encrypted) == b""
+
+    @pytest.mark.asyncio
+    async def test_stream_tampering_is_rejected(self):
+        service = EncryptionService()
+        first = await _encrypted_frames(service, b"a" * 300)
+        other = await _encrypted_frames(service, b"b" * 300)
+
+        tampered = [
+            first[:-1],  # Final frame dropped at a frame boundary
+            [first[0], first[2], first[1], first[3]],  # Frames reordered
+            [first[0], other[1], first[2], first[3]],  # Frame from another recording
+            [first[0], first[1], first[2], first[3], first[3]],  # Frame after the final one
+            [first[0]],  # Header only
+        ]
+        for frames in tampered:
+            with pytest.raises(InvalidToken):
+                service.decrypt_audio(_join_frames(frames))
+
+    def test_legacy_chunked_format_still_decrypts(self):
+        service = EncryptionService()
+        frames = [service.cipher.encrypt(b"legacy "), service.cipher.encrypt(b"chunks")]
+        encrypted = _join_frames([LEGACY_STREAM_MAGIC] + frames)
+
+        assert service.decrypt_audio(encrypted) == b"legacy chunks"
+
+    def test_legacy_single_token_still_decrypts(self):
+        service = EncryptionService()
+        encrypted = service.encrypt_audio(b"legacy format")
+        assert service.decrypt_audio(encrypted) == b"legacy format"
+
+
+class TestCompactStorageFormat:
+    """Test suite for the compressed, binary-token storage format."""
+
+    def test_compact_wav_is_smaller_than_legacy_token(self, wav_audio_bytes):
+        service = EncryptionService()
+        encrypted = service.encrypt_audio(wav_audio_bytes)
+
+        assert encrypted.startswith(COMPACT_MAGIC)
+        assert len(encrypted) < len(service.cipher.encrypt(wav_audio_bytes)) * 0.75
+        assert service.decrypt_audio(encrypted) == wav_audio_bytes
+
+    def test_disabled_writes_legacy_token(self, monkeypatch, wav_audio_bytes):
+        monkeypatch.setattr(settings, "AUDIO_COMPACT_STORAGE_ENABLED", False)
+        service = EncryptionService()
+
+        encrypted = service.encrypt_audio(wav_audio_bytes)
+        assert service.cipher.decrypt(encrypted) == wav_audio_bytes
+
+    def test_compact_wrong_key(self):
+        encrypted = EncryptionService().encrypt_audio(b"secret audio")
+        other = EncryptionService()
+        other.cipher = Fernet(Fernet.generate_key())
+
+        with pytest.raises(InvalidToken):
+            other.decrypt_audio(encrypted)
+
+    def test_rotate_compact_key(self, monkeypatch, wav_audio_bytes):
+        old_key = Fernet.generate_key().decode()
+        new_key = Fernet.generate_key().decode()
+        monkeypatch.setattr(settings, "ENCRYPTION_KEY", old_key)
+        encrypted = EncryptionService().encrypt_audio(wav_audio_bytes)
+
+        re_encrypted = EncryptionService().rotate_key(old_key, new_key, encrypted)
+
+        monkeypatch.setattr(settings, "ENCRYPTION_KEY", new_key)
+        assert EncryptionService().decrypt_audio(re_encrypted) == wav_audio_bytes
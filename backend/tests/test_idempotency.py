@@ -0,0 +1,179 @@
+"""Tests for Idempotency-Key support on POST /api/v1/assessments/assess."""
+
+import asyncio
+import io
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api.deps import get_speech_service
+from app.main import app
+from app.models.assessment import Assessment
+from app.models.idempotency_key import IdempotencyKey
+from app.services.idempotency_service import (
+    EVICTION_INTERVAL_SECONDS,
+    idempotency_request_hash,
+    idempotency_service,
+)
+from app.services.speech_service import SpeechAssessmentService
+
+USER_ID = "idempotent-user"
+
+
+def submit(client, phrase_id, audio_bytes, key="retry-key-1", user_id=USER_ID):
+    return client.post(
+        "/api/v1/assessments/assess",
+        data={"phrase_id": str(phrase_id), "user_id": user_id},
+        files={"audio": ("recording.wav", io.BytesIO(audio_bytes), "audio/wav")},
+        headers={"Idempotency-Key": key},
+    )
+
+
+class TestIdempotentAssessment:
+    def test_retry_returns_stored_response(self, client, db, sample_phrase, wav_audio_bytes):
+        first = submit(client, sample_phrase.id, wav_audio_bytes)
+        second = submit(client, sample_phrase.id, wav_audio_bytes)
+
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json()
+        assert second.headers["Idempotent-Replayed"] == "true"
+        assert "Idempotent-Replayed" not in first.headers
+        assert db.query(Assessment).count() == 1
+
+        record = db.get(IdempotencyKey, (USER_ID, "retry-key-1"))
+        assert record.status == "completed"
+        assert record.response["id"] == first.json()["id"]
+
+    def test_different_keys_are_independent(self, client, db, sample_phrase, wav_audio_bytes):
+        submit(client, sample_phrase.id, wav_audio_bytes, key="a")
+        submit(client, sample_phrase.id, wav_audio_bytes, key="b")
+        assert db.query(Assessment).count() == 2
+
+    def test_keys_are_scoped_to_users(self, client, db, sample_phrase, wav_audio_bytes):
+        first = submit(client, sample_phrase.id, wav_audio_bytes)
+        other = submit(client, sample_phrase.id, wav_audio_bytes, user_id="another-user")
+
+        assert other.status_code == 200
+        assert "Idempotent-Replayed" not in other.headers
+        assert other.json()["id"] != first.json()["id"]
+        assert db.query(IdempotencyKey).count() == 2
+
+    def test_key_reused_for_different_audio(self, client, sample_phrase, wav_audio_bytes):
+        submit(client, sample_phrase.id, wav_audio_bytes)
+        response = submit(client, sample_phrase.id, wav_audio_bytes + b"\x00\x00")
+        assert response.status_code == 422
+
+    def test_failed_request_releases_key(self, client, db, sample_phrase, wav_audio_bytes):
+        class FailingSpeechService(SpeechAssessmentService):
+            async def assess_pronunciation(self, audio_bytes, reference_text, profile="full"):
+                raise Exception("Speech assessment failed: backend unavailable")
+
+        app.dependency_overrides[get_speech_service] = FailingSpeechService
+        assert submit(client, sample_phrase.id, wav_audio_bytes).status_code == 500
+        assert db.query(IdempotencyKey).count() == 0
+
+        del app.dependency_overrides[get_speech_service]
+        assert submit(client, sample_phrase.id, wav_audio_bytes).status_code == 200
+
+    def test_unknown_phrase_releases_key(self, client, db, wav_audio_bytes):
+        assert submit(client, 99999, wav_audio_bytes).status_code == 404
+        assert db.query(IdempotencyKey).count() == 0
+
+
+class TestInProgressKey:
+    @pytest.fixture
+    def short_wait(self, monkeypatch):
+        monkeypatch.setattr(idempotency_service, "wait_seconds", 0.2)
+
+    def add_in_progress(self, db, phrase_id, audio_bytes, claimed_at):
+        db.add(
+            IdempotencyKey(
+                user_id=USER_ID,
+                key="retry-key-1",
+                request_hash=idempotency_request_hash(USER_ID, phrase_id, audio_bytes),
+                status="in_progress",
+                claimed_at=claimed_at,
+            )
+        )
+        db.commit()
+
+    def test_running_request_times_out_with_409(
+        self, client, db, sample_phrase, wav_audio_bytes, short_wait
+    ):
+        self.add_in_progress(db, sample_phrase.id, wav_audio_bytes, datetime.utcnow())
+
+        response = submit(client, sample_phrase.id, wav_audio_bytes)
+
+        assert response.status_code == 409
+        assert "Retry-After" in response.headers
+        assert db.query(Assessment).count() == 0
+        assert (USER_ID, "retry-key-1") not in idempotency_service._events
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_woken_and_forgotten(self):
+        key = (USER_ID, "wake-key")
+        waiters = [asyncio.create_task(idempotency_service._wait(key, 5)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert len(idempotency_service._events[key]) == 3
+
+        idempotency_service.notify(*key)
+        await asyncio.wait_for(asyncio.gather(*waiters), 1)
+
+        assert key not in idempotency_service._events
+
+    def test_abandoned_request_is_taken_over(
+        self, client, db, sample_phrase, wav_audio_bytes, short_wait
+    ):
+        self.add_in_progress(
+            db, sample_phrase.id, wav_audio_bytes, datetime.utcnow() - timedelta(hours=1)
+        )
+
+        response = submit(client, sample_phrase.id, wav_audio_bytes)
+
+        assert response.status_code == 200
+        db.expire_all()
+        assert db.get(IdempotencyKey, (USER_ID, "retry-key-1")).status == "completed"
+
+
+class TestEviction:
+    def add_key(self, db, key, claimed_at):
+        db.add(
+            IdempotencyKey(
+                user_id=USER_ID,
+                key=key,
+                request_hash="0" * 64,
+                status="completed",
+                claimed_at=claimed_at,
+            )
+        )
+        db.commit()
+
+    def test_expired_keys_are_evicted_periodically(
+        self, client, db, sample_phrase, wav_audio_bytes, monkeypatch
+    ):
+        self.add_key(db, "old", datetime.utcnow() - timedelta(days=2))
+        self.add_key(db, "recent", datetime.utcnow() - timedelta(hours=1))
+        monkeypatch.setattr(
+            idempotency_service,
+            "_last_eviction",
+            idempotency_service._last_eviction - EVICTION_INTERVAL_SECONDS,
+        )
+
+        assert submit(client, sample_phrase.id, wav_audio_bytes).status_code == 200
+
+        db.expire_all()
+        assert db.get(IdempotencyKey, (USER_ID, "old")) is None
+        assert db.get(IdempotencyKey, (USER_ID, "recent")) is not None
+        assert db.get(IdempotencyKey, (USER_ID, "retry-key-1")) is not None
+
+    def test_keys_are_not_evicted_between_intervals(
+        self, client, db, sample_phrase, wav_audio_bytes, monkeypatch
+    ):
+        monkeypatch.setattr(idempotency_service, "_last_eviction", time.monotonic())
+        self.add_key(db, "old", datetime.utcnow() - timedelta(days=2))
+
+        submit(client, sample_phrase.id, wav_audio_bytes)
+
+        db.expire_all()
+        assert db.get(IdempotencyKey, (USER_ID, "old")) is not None
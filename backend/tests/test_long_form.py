@@ -0,0 +1,247 @@
+"""Tests for long-form (continuous recognition) pronunciation assessment."""
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import speech_service as speech_service_module
+from app.services.speech_client import WarmRecognizer
+from app.services.speech_rest import iter_chunks
+from app.services.speech_service import SpeechAssessmentService
+from app.services.wav_audio import declared_duration_seconds
+from tests.conftest import make_wav_bytes
+
+
+def segment(text, duration, accuracy, fluency, prosody, completeness, words):
+    return {
+        "DisplayText": text,
+        "Duration": duration,
+        "NBest": [
+            {
+                "PronunciationAssessment": {
+                    "AccuracyScore": accuracy,
+                    "FluencyScore": fluency,
+                    "ProsodyScore": prosody,
+                    "CompletenessScore": completeness,
+                },
+                "Words": [
+                    {
+                        "Word": word,
+                        "PronunciationAssessment": {"AccuracyScore": score, "ErrorType": error},
+                    }
+                    for word, score, error in words
+                ],
+            }
+        ],
+    }
+
+
+FIRST = segment(
+    "I live in Paris.",
+    30,
+    90,
+    80,
+    70,
+    100,
+    [("I", 95, "None"), ("live", 90, "None"), ("in", 85, "None"), ("Paris", 88, "None")],
+)
+SECOND = segment(
+    "It is big.",
+    10,
+    50,
+    40,
+    30,
+    100,
+    [("it", 60, "None"), ("is", 40, "None"), ("big", 0, "Omission")],
+)
+REFERENCE = "I live in Paris. It is big."
+
+
+class FakeSignal:
+    def __init__(self):
+        self.handlers = []
+
+    def connect(self, handler):
+        self.handlers.append(handler)
+
+    def fire(self, evt):
+        for handler in self.handlers:
+            handler(evt)
+
+
+class FakeContinuousRecognizer:
+    """Fires one recognized event per segment once the input stream closes."""
+
+    def __init__(self, segments, error=None):
+        self.segments = segments
+        self.error = error
+        self.recognized = FakeSignal()
+        self.canceled = FakeSignal()
+        self.session_stopped = FakeSignal()
+        self.written = bytearray()
+        self.stopped = False
+
+    def start_continuous_recognition(self):
+        pass
+
+    def stop_continuous_recognition(self):
+        self.stopped = True
+
+    def emit(self):
+        for payload in self.segments:
+            result = SimpleNamespace(reason="recognized", properties={"json": json.dumps(payload)})
+            self.recognized.fire(SimpleNamespace(result=result))
+        if self.error:
+            details = SimpleNamespace(reason="error", error_details=self.error)
+            self.canceled.fire(SimpleNamespace(cancellation_details=details))
+        self.session_stopped.fire(SimpleNamespace())
+
+    @property
+    def stream(self):
+        recognizer = self
+
+        class Stream:
+            def write(self, chunk):
+                recognizer.written.extend(chunk)
+
+            def close(self):
+                threading.Thread(target=recognizer.emit).start()
+
+        return Stream()
+
+
+@pytest.fixture
+def fake_sdk(monkeypatch):
+    sdk = SimpleNamespace(
+        ResultReason=SimpleNamespace(RecognizedSpeech="recognized"),
+        PropertyId=SimpleNamespace(SpeechServiceResponse_JsonResult="json"),
+        CancellationReason=SimpleNamespace(Error="error"),
+    )
+    monkeypatch.setattr(speech_service_module, "speechsdk", sdk, raising=False)
+    monkeypatch.setattr(speech_service_module, "AZURE_SDK_AVAILABLE", True)
+    return sdk
+
+
+def long_form_service(monkeypatch, recognizer):
+    service = SpeechAssessmentService()
+    service.mock_mode = False
+    warm = WarmRecognizer(recognizer, recognizer.stream, SimpleNamespace(close=lambda: None), False)
+
+    async def acquire(continuous=False):
+        assert continuous
+        return warm
+
+    monkeypatch.setattr(service.client, "acquire", acquire)
+    monkeypatch.setattr(
+        service,
+        "_create_pronunciation_config",
+        lambda text, profile: SimpleNamespace(apply_to=lambda r: None),
+    )
+    return service
+
+
+class TestAggregateSegments:
+    def test_scores_are_duration_weighted(self):
+        result = SpeechAssessmentService()._aggregate_segments([FIRST, SECOND], REFERENCE)
+
+        assert result.accuracy_score == pytest.approx((90 * 30 + 50 * 10) / 40)
+        assert result.fluency_score == pytest.approx((80 * 30 + 40 * 10) / 40)
+        assert result.prosody_score == pytest.approx((70 * 30 + 30 * 10) / 40 / 20)
+
+    def test_completeness_counts_reference_words_across_segments(self):
+        result = SpeechAssessmentService()._aggregate_segments([FIRST, SECOND], REFERENCE)
+
+        # "big" was omitted: 6 of 7 reference words spoken
+        assert result.completeness_score == pytest.approx(100 * 6 / 7)
+
+    def test_words_and_text_are_merged(self):
+        result = SpeechAssessmentService()._aggregate_segments([FIRST, SECOND], REFERENCE)
+
+        assert result.recognized_text == "I live in Paris. It is big."
+        assert list(result.word_level_scores) == ["I", "live", "in", "Paris", "it", "is", "big"]
+        assert result.word_level_scores["big"] == {"accuracy": 0, "error_type": "Omission"}
+
+    def test_no_segments_raises(self):
+        with pytest.raises(Exception, match="No speech"):
+            SpeechAssessmentService()._aggregate_segments([{"RecognitionStatus": "NoMatch"}], "Hi")
+
+
+class TestLongFormRecognition:
+    @pytest.mark.asyncio
+    async def test_long_recording_uses_continuous_recognition(self, fake_sdk, monkeypatch):
+        recognizer = FakeContinuousRecognizer([FIRST, SECOND])
+        service = long_form_service(monkeypatch, recognizer)
+        audio = make_wav_bytes([0.0] * 16000 * 40)
+
+        result = await service.assess_pronunciation(audio, REFERENCE)
+
+        assert bytes(recognizer.written) == audio
+        assert recognizer.stopped
+        assert result.recognized_text == "I live in Paris. It is big."
+
+    @pytest.mark.asyncio
+    async def test_streamed_upload_is_pushed_as_it_arrives(self, fake_sdk, monkeypatch):
+        recognizer = FakeContinuousRecognizer([FIRST])
+        service = long_form_service(monkeypatch, recognizer)
+        audio = make_wav_bytes([0.0] * 16000 * 40)
+
+        result = await service.assess_pronunciation_stream(
+            iter_chunks(audio, 64), "I live in Paris"
+        )
+
+        assert bytes(recognizer.written) == audio
+        assert result.completeness_score == 100
+
+    @pytest.mark.asyncio
+    async def test_streamed_upload_of_unknown_length_is_long_form(self, fake_sdk, monkeypatch):
+        recognizer = FakeContinuousRecognizer([FIRST])
+        service = long_form_service(monkeypatch, recognizer)
+        # Data size left unknown by a recorder that streams without seeking back
+        audio = make_wav_bytes([0.0] * 16000 * 40)[:40] + b"\x00" * 4 + b"\x00" * 16000
+
+        await service.assess_pronunciation_stream(iter_chunks(audio, 64), "I live in Paris")
+
+        assert bytes(recognizer.written) == audio
+
+    @pytest.mark.asyncio
+    async def test_cancellation_error_fails_assessment(self, fake_sdk, monkeypatch):
+        recognizer = FakeContinuousRecognizer([FIRST], error="quota exceeded")
+        service = long_form_service(monkeypatch, recognizer)
+
+        with pytest.raises(Exception, match="quota exceeded"):
+            await service.assess_pronunciation_stream(
+                iter_chunks(make_wav_bytes([0.0] * 16000 * 40)), REFERENCE
+            )
+
+    def test_short_recordings_stay_single_shot(self, fake_sdk):
+        service = SpeechAssessmentService()
+
+        assert not service._is_long_form(5.0)
+        assert service._is_long_form(30.0)
+        assert service._is_long_form(None)
+
+    @pytest.mark.asyncio
+    async def test_short_streamed_upload_uses_configured_backend(self, fake_sdk, monkeypatch):
+        audio = make_wav_bytes([0.0] * 16000 * 5)
+        service = SpeechAssessmentService()
+        service.mock_mode = False
+        received = []
+
+        async def single_shot(audio_chunks, reference_text, profile="full"):
+            received.extend([chunk async for chunk in audio_chunks])
+            return "single-shot"
+
+        monkeypatch.setattr(service, "_azure_assessment_stream", single_shot)
+
+        assert await service.assess_pronunciation_stream(iter_chunks(audio, 64), REFERENCE) == (
+            "single-shot"
+        )
+        assert b"".join(received) == audio
+
+    def test_declared_duration_from_header_only(self):
+        audio = make_wav_bytes([0.0] * 16000 * 40)
+
+        assert declared_duration_seconds(audio[:44]) == pytest.approx(40.0)
+        assert declared_duration_seconds(b"not a wav") is None
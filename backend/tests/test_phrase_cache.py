@@ -0,0 +1,119 @@
+"""Tests for the prepared phrase cache."""
+
+import io
+import json
+
+from app.models.phrase import Phrase
+from app.services.phrase_cache import PhraseCache, PreparedPhrase, phrase_cache
+from app.services.speech_service import SpeechAssessmentService
+from tests.conftest import TestingSessionLocal
+
+
+def submit(client, phrase_id, wav_audio_bytes):
+    return client.post(
+        "/api/v1/assessments/assess",
+        data={"phrase_id": str(phrase_id), "user_id": "test-user-phrase-cache"},
+        files={"audio": ("recording.wav", io.BytesIO(wav_audio_bytes), "audio/wav")},
+    )
+
+
+class TestPreparedPhrase:
+    def test_text_is_normalized_and_tokenized(self):
+        prepared = PreparedPhrase(1, 1, "  Hello,   how are\nyou today? ")
+
+        assert prepared.reference_text == "Hello, how are you today?"
+        assert prepared.words == ("hello", "how", "are", "you", "today")
+
+    def test_assessment_config_is_built_once_per_profile(self):
+        prepared = PreparedPhrase(1, 1, "Hello world")
+
+        full = prepared.assessment_config("full")
+        assert prepared.assessment_config("full") is full
+        assert json.loads(full)["ReferenceText"] == "Hello world"
+        assert json.loads(prepared.assessment_config("quick"))["Granularity"] == "Word"
+
+    def test_speech_service_uses_cached_config(self):
+        cache_entry = phrase_cache.refresh(Phrase(id=7, version=1, reference_text="Hello world"))
+
+        config = SpeechAssessmentService()._assessment_config("Hello world", "full")
+
+        assert config is cache_entry.assessment_config("full")
+
+
+class TestPhraseCache:
+    def test_refresh_replaces_other_versions_only(self):
+        cache = PhraseCache(max_entries=10)
+        first = cache.refresh(Phrase(id=1, version=1, reference_text="One"))
+
+        assert cache.refresh(Phrase(id=1, version=1, reference_text="One")) is first
+        second = cache.refresh(Phrase(id=1, version=2, reference_text="Uno"))
+        assert second.reference_text == "Uno"
+        assert cache.lookup("One") is None
+        assert cache.lookup("Uno") is second
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = PhraseCache(max_entries=1)
+        cache.refresh(Phrase(id=1, version=1, reference_text="One"))
+        cache.refresh(Phrase(id=2, version=1, reference_text="Two"))
+
+        assert cache.stats()["entries"] == 1
+        assert cache.lookup("One") is None
+
+
+class TestAssessHotPath:
+    def test_repeat_assessment_skips_phrase_query(self, client, sample_phrase, wav_audio_bytes):
+        assert submit(client, sample_phrase.id, wav_audio_bytes).status_code == 200
+        assert submit(client, sample_phrase.id, wav_audio_bytes).status_code == 200
+
+        stats = phrase_cache.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_phrase_update_invalidates_entry(self, client, sample_phrase, wav_audio_bytes):
+        submit(client, sample_phrase.id, wav_audio_bytes)
+
+        response = client.put(
+            f"/api/v1/phrases/{sample_phrase.id}", json={"reference_text": "Good morning"}
+        )
+        assert response.status_code == 200
+
+        # Mock scoring echoes the reference text it was given
+        response = submit(client, sample_phrase.id, wav_audio_bytes)
+        assert response.json()["recognized_text"] == "Good morning"
+        assert phrase_cache.stats()["invalidations"] == 1
+
+    def test_update_bumps_phrase_version(self, client, db, sample_phrase):
+        client.put(f"/api/v1/phrases/{sample_phrase.id}", json={"order": 3})
+
+        db.refresh(sample_phrase)
+        assert sample_phrase.version == 2
+
+    def test_concurrent_phrase_edits_both_succeed(self, client, db, sample_phrase):
+        assert sample_phrase.version == 1  # Loaded in the endpoint's session
+        other = TestingSessionLocal()
+        other.get(Phrase, sample_phrase.id).difficulty = "Advanced"
+        other.commit()
+        other.close()
+
+        response = client.put(f"/api/v1/phrases/{sample_phrase.id}", json={"order": 3})
+
+        assert response.status_code == 200
+        assert response.json()["order"] == 3
+        db.refresh(sample_phrase)
+        assert sample_phrase.version == 2
+
+    def test_phrase_delete_invalidates_entry(self, client, sample_phrase, wav_audio_bytes):
+        submit(client, sample_phrase.id, wav_audio_bytes)
+
+        assert client.delete(f"/api/v1/phrases/{sample_phrase.id}").status_code == 204
+
+        assert submit(client, sample_phrase.id, wav_audio_bytes).status_code == 404
+
+    def test_dialog_delete_invalidates_its_phrases(
+        self, client, sample_dialog, sample_phrase, wav_audio_bytes
+    ):
+        submit(client, sample_phrase.id, wav_audio_bytes)
+
+        assert client.delete(f"/api/v1/dialogs/{sample_dialog.id}").status_code == 204
+
+        assert submit(client, sample_phrase.id, wav_audio_bytes).status_code == 404
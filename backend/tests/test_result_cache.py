@@ -0,0 +1,133 @@
+"""Tests for the pronunciation result cache."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.result_cache import PronunciationResultCacheEntry
+from app.services.result_cache import PronunciationResultCache, result_cache_key
+from app.services.speech_service import PronunciationResult, SpeechAssessmentService
+from tests.conftest import TestingAsyncSessionLocal
+
+
+def make_result(accuracy=80.0):
+    return PronunciationResult(
+        accuracy=accuracy,
+        prosody=4.0,
+        fluency=80.0,
+        completeness=90.0,
+        recognized_text="hello world",
+        word_scores={"hello": {"accuracy": 85.0, "error_type": "None"}},
+    )
+
+
+class CountingSpeechService(SpeechAssessmentService):
+    calls = 0
+
+    def _mock_assessment(self, reference_text, profile="full"):
+        CountingSpeechService.calls += 1
+        return super()._mock_assessment(reference_text, profile)
+
+
+class TestResultCacheKey:
+    def test_same_input_same_key(self):
+        assert result_cache_key(b"audio", "hello") == result_cache_key(b"audio", "hello")
+
+    def test_key_depends_on_audio_and_text(self):
+        key = result_cache_key(b"audio", "hello")
+        assert result_cache_key(b"audio2", "hello") != key
+        assert result_cache_key(b"audio", "hello!") != key
+        assert result_cache_key(b"audio", "hello", "quick") != key
+
+
+class TestMemoryTier:
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self):
+        cache = PronunciationResultCache(max_entries=10, use_database=False)
+        assert await cache.get("k") is None
+
+        await cache.set("k", make_result())
+        cached = await cache.get("k")
+
+        assert cached.accuracy_score == 80.0
+        assert cached.overall_score == make_result().overall_score
+        assert cached.word_level_scores == make_result().word_level_scores
+        assert cache.stats()["memory_hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hits_do_not_share_scores(self):
+        cache = PronunciationResultCache(max_entries=10, use_database=False)
+        result = make_result()
+        await cache.set("k", result)
+
+        result.word_level_scores["hello"]["accuracy"] = 0.0
+        first = await cache.get("k")
+        first.word_level_scores["hello"]["accuracy"] = 1.0
+
+        assert (await cache.get("k")).word_level_scores["hello"]["accuracy"] == 85.0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache = PronunciationResultCache(max_entries=2, use_database=False)
+        await cache.set("a", make_result())
+        await cache.set("b", make_result())
+        await cache.get("a")  # a becomes most recently used
+        await cache.set("c", make_result())
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert await cache.get("c") is not None
+
+
+class TestDatabaseTier:
+    @pytest.mark.asyncio
+    async def test_shared_across_instances(self):
+        writer = PronunciationResultCache(
+            max_entries=10, use_database=True, session_factory=TestingAsyncSessionLocal
+        )
+        reader = PronunciationResultCache(
+            max_entries=10, use_database=True, session_factory=TestingAsyncSessionLocal
+        )
+        await writer.set("k", make_result(accuracy=77.0))
+
+        cached = await reader.get("k")
+        assert cached.accuracy_score == 77.0
+        assert reader.stats()["db_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_ignored_and_evicted(self, db):
+        cache = PronunciationResultCache(
+            max_entries=0, use_database=True, session_factory=TestingAsyncSessionLocal
+        )
+        db.add(
+            PronunciationResultCacheEntry(
+                cache_key="old",
+                result=make_result().to_dict(),
+                expires_at=datetime.utcnow() - timedelta(seconds=1),
+            )
+        )
+        db.commit()
+
+        assert await cache.get("old") is None
+        assert await cache.evict_expired() == 1
+
+
+class TestCachedSpeechService:
+    @pytest.mark.asyncio
+    async def test_repeated_audio_skips_backend(self):
+        cache = PronunciationResultCache(max_entries=10, use_database=False)
+        service = CountingSpeechService(result_cache=cache)
+        CountingSpeechService.calls = 0
+
+        first = await service.assess_pronunciation(b"same audio", "Hello world")
+        second = await service.assess_pronunciation(b"same audio", "Hello world")
+        await service.assess_pronunciation(b"other audio", "Hello world")
+
+        assert CountingSpeechService.calls == 2
+        assert second.overall_score == first.overall_score
+        assert cache.stats()["memory_hits"] == 1
+
+    def test_health_exposes_cache_stats(self, client):
+        stats = client.get("/health").json()["result_cache"]
+        assert {"memory_hits", "db_hits", "misses", "hit_rate"} <= stats.keys()
@@ -0,0 +1,109 @@
+"""Tests for packed word and phoneme scores."""
+
+import pytest
+
+from app.services.score_packing import PackedScoresError, pack_scores, unpack_words
+from app.services.speech_service import PronunciationResult, SpeechAssessmentService
+
+
+def word(text, offset_ms, duration_ms, accuracy, error="None", phonemes=()):
+    return {
+        "Word": text,
+        "Offset": offset_ms * 10_000,
+        "Duration": duration_ms * 10_000,
+        "PronunciationAssessment": {"AccuracyScore": accuracy, "ErrorType": error},
+        "Phonemes": [
+            {
+                "Phoneme": phoneme,
+                "Offset": p_offset * 10_000,
+                "Duration": p_duration * 10_000,
+                "PronunciationAssessment": {"AccuracyScore": p_accuracy},
+            }
+            for phoneme, p_offset, p_duration, p_accuracy in phonemes
+        ],
+    }
+
+
+# "the" is repeated: a dict keyed by word would keep only the second one
+WORDS = [
+    word("the", 100, 150, 95.0, phonemes=[("ð", 100, 70, 96.0), ("ə", 170, 80, 94.0)]),
+    word("cat", 250, 300, 60.0, "Mispronunciation"),
+    word("the", 600, 120, 40.0),
+    word("mat", 720, 0, 0.0, "Omission"),
+]
+
+
+class TestPackScores:
+    def test_round_trip_keeps_every_word_in_order(self):
+        words = unpack_words(pack_scores(WORDS))
+
+        assert [w["word"] for w in words] == ["the", "cat", "the", "mat"]
+        assert [w["accuracy"] for w in words] == [95.0, 60.0, 40.0, 0.0]
+        assert [w["error_type"] for w in words] == ["None", "Mispronunciation", "None", "Omission"]
+        assert words[1]["offset_ms"] == 250
+        assert words[1]["duration_ms"] == 300
+
+    def test_phonemes_belong_to_their_word(self):
+        words = unpack_words(pack_scores(WORDS))
+
+        assert words[0]["phonemes"] == [
+            {"phoneme": "ð", "offset_ms": 100, "duration_ms": 70, "accuracy": 96.0},
+            {"phoneme": "ə", "offset_ms": 170, "duration_ms": 80, "accuracy": 94.0},
+        ]
+        assert all(not w["phonemes"] for w in words[1:])
+
+    def test_packed_form_is_parallel_arrays(self):
+        version, word_arrays, phoneme_arrays = pack_scores(WORDS)
+
+        assert version == 1
+        assert word_arrays[0] == ["the", "cat", "the", "mat"]
+        assert word_arrays[4] == [0, 1, 0, 2]
+        assert phoneme_arrays[0] == [0, 0]
+
+    def test_flat_rest_scores_are_accepted(self):
+        packed = pack_scores(
+            [{"Word": "hi", "AccuracyScore": 80, "ErrorType": "Insertion", "Offset": 0}]
+        )
+
+        assert unpack_words(packed)[0]["accuracy"] == 80.0
+        assert unpack_words(packed)[0]["error_type"] == "Insertion"
+
+    def test_none_decodes_to_none(self):
+        assert unpack_words(None) is None
+
+    def test_unknown_version_is_rejected(self):
+        with pytest.raises(PackedScoresError):
+            unpack_words([99, [[], [], [], [], []], [[], [], [], [], []]])
+
+
+class TestResults:
+    def test_rest_result_is_packed(self):
+        result = SpeechAssessmentService()._build_rest_result(
+            {
+                "RecognitionStatus": "Success",
+                "DisplayText": "the cat the mat",
+                "NBest": [{"AccuracyScore": 80, "FluencyScore": 80, "Words": WORDS}],
+            }
+        )
+
+        assert len(unpack_words(result.packed_scores)) == 4
+        assert len(result.word_level_scores) == 3  # The legacy map loses the repeated word
+
+    def test_cached_results_without_packed_scores_still_load(self):
+        data = PronunciationResult(90, 4.0, 80, 100, "hi", {}).to_dict()
+        del data["packed_scores"]
+
+        assert PronunciationResult.from_dict(data).packed_scores is None
+
+
+def test_assessment_response_includes_words(client, sample_phrase, wav_audio_bytes):
+    response = client.post(
+        "/api/v1/assessments/assess",
+        data={"user_id": "packed-user", "phrase_id": str(sample_phrase.id)},
+        files={"audio": ("recording.wav", wav_audio_bytes, "audio/wav")},
+    )
+
+    assert response.status_code == 200
+    words = response.json()["words"]
+    assert [w["word"] for w in words] == sample_phrase.reference_text.split()
+    assert words[1]["offset_ms"] > words[0]["offset_ms"]
@@ -0,0 +1,101 @@
+"""Tests for the app-lifetime service container."""
+
+import io
+
+import pytest
+
+from app.api.deps import get_services
+from app.core.config import settings
+from app.main import app
+from app.services.blob_service import BlobStorageService
+from app.services.service_container import ServiceContainer
+
+
+class CountingBlobService(BlobStorageService):
+    """Mock-mode blob service that counts uploads and container checks."""
+
+    def __init__(self):
+        super().__init__()
+        self.uploads = 0
+        self.verifications = 0
+
+    async def upload_audio(self, audio_bytes, file_extension="wav", user_id=None):
+        self.uploads += 1
+        return await super().upload_audio(audio_bytes, file_extension, user_id)
+
+    async def verify_container(self):
+        self.verifications += 1
+
+
+def assess(client, phrase, wav_audio_bytes):
+    return client.post(
+        "/api/v1/assessments/assess",
+        data={"phrase_id": str(phrase.id), "user_id": "test-user-services"},
+        files={"audio": ("recording.wav", io.BytesIO(wav_audio_bytes), "audio/wav")},
+    )
+
+
+class TestServiceContainer:
+    def test_lifespan_builds_the_services_once(self, client):
+        services = app.state.services
+
+        assert isinstance(services, ServiceContainer)
+        client.get("/health")
+        assert app.state.services is services
+
+    def test_requests_share_the_services(self, client, sample_phrase, wav_audio_bytes):
+        blob_service = CountingBlobService()
+        services = ServiceContainer(blob_service=blob_service)
+        app.dependency_overrides[get_services] = lambda: services
+
+        assert assess(client, sample_phrase, wav_audio_bytes).status_code == 200
+        assert assess(client, sample_phrase, wav_audio_bytes).status_code == 200
+
+        assert blob_service.uploads == 2
+
+    @pytest.mark.asyncio
+    async def test_start_verifies_the_container_once_in_azure_mode(self, monkeypatch):
+        blob_service = CountingBlobService()
+        services = ServiceContainer(blob_service=blob_service)
+        monkeypatch.setattr(settings, "MOCK_MODE", False)
+        monkeypatch.setattr(settings, "SPEECH_BACKEND", "rest")
+
+        await services.start()
+
+        assert blob_service.verifications == 1
+
+    @pytest.mark.asyncio
+    async def test_start_skips_warmup_in_mock_mode(self):
+        blob_service = CountingBlobService()
+
+        await ServiceContainer(blob_service=blob_service).start()
+
+        assert blob_service.verifications == 0
+
+    def test_containers_build_their_own_speech_services(self):
+        first, second = ServiceContainer(), ServiceContainer()
+
+        assert first.admission is not second.admission
+        assert first.executor is not second.executor
+        assert first.speech_client is not second.speech_client
+        assert first.result_cache is not second.result_cache
+        assert first.speech_service.executor is first.executor
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_other_containers_running(self):
+        first, second = ServiceContainer(), ServiceContainer()
+        await first.executor.run(sum, [1])
+        await second.executor.run(sum, [1])
+
+        await first.close()
+
+        assert await second.executor.run(sum, [1, 2]) == 3
+        assert second.executor._executor is not None
+        await second.close()
+
+    def test_health_reports_the_app_services(self, client):
+        app.state.services.speech_client.warm_hits = 7
+
+        stats = client.get("/health").json()
+
+        assert stats["speech_client"]["warm_hits"] == 7
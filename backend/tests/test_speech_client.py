@@ -0,0 +1,131 @@
+"""Tests for the app-lifetime speech client and its warm recognizer pool."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import speech_client as speech_client_module
+from app.services.speech_client import SpeechClient
+
+
+class FakeSpeechSDK:
+    """Stand-in for the Speech SDK that records configs and connections."""
+
+    def __init__(self):
+        self.configs = 0
+        self.opened = []
+        self.closed = []
+        self.fail_open = False
+        sdk = self
+
+        class Connection:
+            def __init__(self):
+                self.is_open = False
+
+            @classmethod
+            def from_recognizer(cls, recognizer):
+                return cls()
+
+            def open(self, for_continuous_recognition):
+                if sdk.fail_open:
+                    raise RuntimeError("connection refused")
+                self.is_open = True
+                sdk.opened.append(self)
+
+            def close(self):
+                sdk.closed.append(self)
+
+        def speech_config(**kwargs):
+            sdk.configs += 1
+            return SimpleNamespace(**kwargs)
+
+        self.Connection = Connection
+        self.SpeechConfig = speech_config
+        self.SpeechRecognizer = SimpleNamespace
+        self.audio = SimpleNamespace(
+            PushAudioInputStream=lambda: SimpleNamespace(), AudioConfig=SimpleNamespace
+        )
+
+
+@pytest.fixture
+def sdk(monkeypatch):
+    fake = FakeSpeechSDK()
+    monkeypatch.setattr(speech_client_module, "speechsdk", fake, raising=False)
+    return fake
+
+
+class TestSpeechClient:
+    @pytest.mark.asyncio
+    async def test_start_opens_pool_with_one_config(self, sdk):
+        client = SpeechClient(pool_size=3)
+        await client.start()
+
+        assert len(sdk.opened) == 3
+        assert sdk.configs == 1
+        assert client.stats()["warm"] == 3
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_reuses_warm_connection_and_replenishes(self, sdk):
+        client = SpeechClient(pool_size=2)
+        await client.start()
+
+        warm = await client.acquire()
+        assert warm.connected and warm.connection.is_open
+        await asyncio.gather(*client._tasks)
+
+        stats = client.stats()
+        assert stats["warm_hits"] == 1
+        assert stats["cold_starts"] == 0
+        assert stats["warm"] == 2
+        assert sdk.configs == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_empty_pool_builds_cold_recognizer(self, sdk):
+        client = SpeechClient(pool_size=0)
+
+        warm = await client.acquire()
+
+        assert not warm.connected
+        assert sdk.opened == []
+        assert client.stats()["cold_starts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_connections_are_dropped(self, sdk, monkeypatch):
+        client = SpeechClient(pool_size=1, max_idle_seconds=10)
+        await client.start()
+        monkeypatch.setattr(client._pool[0], "created_at", client._pool[0].created_at - 11)
+
+        warm = await client.acquire()
+
+        assert not warm.connected
+        assert client.stats()["expired"] == 1
+        assert len(sdk.closed) == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_warmup_falls_back_to_cold(self, sdk):
+        sdk.fail_open = True
+        client = SpeechClient(pool_size=2)
+        await client.start()
+
+        assert client.stats()["warm_failures"] == 2
+        assert not (await client.acquire()).connected
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_pooled_connections(self, sdk):
+        client = SpeechClient(pool_size=2)
+        await client.start()
+
+        await client.close()
+
+        assert len(sdk.closed) == 2
+        assert client.stats()["warm"] == 0
+
+
+def test_health_reports_speech_client(client):
+    response = client.get("/health")
+    assert set(response.json()["speech_client"]) >= {"warm", "warm_hits", "cold_starts"}
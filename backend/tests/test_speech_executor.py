@@ -0,0 +1,114 @@
+"""Tests for the dedicated speech executor."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.speech_executor import SpeechExecutor
+from app.services.speech_service import PronunciationResult, SpeechAssessmentService
+
+
+@pytest.fixture
+def executor():
+    pool = SpeechExecutor(max_workers=1)
+    yield pool
+    pool.shutdown()
+
+
+class TestSpeechExecutor:
+    @pytest.mark.asyncio
+    async def test_returns_result_and_raises_errors(self, executor):
+        assert await executor.run(pow, 2, 10) == 1024
+
+        with pytest.raises(ZeroDivisionError):
+            await executor.run(lambda: 1 / 0)
+
+    @pytest.mark.asyncio
+    async def test_event_loop_keeps_running_during_blocking_call(self, executor):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await executor.run(time.sleep, 0.2)
+        task.cancel()
+
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_saturation_and_queue_time(self, executor):
+        release = threading.Event()
+        first = asyncio.create_task(executor.run(release.wait, 5))
+        second = asyncio.create_task(executor.run(lambda: None))
+        await asyncio.sleep(0.1)
+
+        stats = executor.stats()
+        assert stats["active"] == 1
+        assert stats["queued"] == 1
+        assert stats["saturation"] == 1.0
+
+        release.set()
+        await asyncio.gather(first, second)
+
+        stats = executor.stats()
+        assert stats["completed"] == 2
+        assert stats["queued"] == 0
+        assert stats["max_queue_ms"] >= 90
+
+    @pytest.mark.asyncio
+    async def test_cancelled_while_queued_never_runs(self, executor):
+        release = threading.Event()
+        ran = []
+        first = asyncio.create_task(executor.run(release.wait, 5))
+        second = asyncio.create_task(executor.run(ran.append, "second"))
+        await asyncio.sleep(0.05)
+
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        release.set()
+        await first
+        await executor.run(lambda: None)
+
+        assert ran == []
+        assert executor.stats()["queued"] == 0
+
+
+class TestSpeechServiceExecutor:
+    @pytest.mark.asyncio
+    async def test_recognition_runs_on_executor_threads(self, executor, monkeypatch):
+        service = SpeechAssessmentService(executor=executor)
+        service.mock_mode = False
+        threads = []
+
+        async def acquire():
+            return "recognizer"
+
+        def recognize(warm, audio_bytes, reference_text, profile):
+            threads.append(threading.current_thread().name)
+            return "sdk result"
+
+        monkeypatch.setattr(service.client, "acquire", acquire)
+        monkeypatch.setattr(service, "_recognize", recognize)
+        monkeypatch.setattr(
+            service,
+            "_build_result",
+            lambda result, profile: PronunciationResult(90, 4.5, 85, 100, "Hello", {}),
+        )
+
+        result = await service.assess_pronunciation(b"audio", "Hello")
+
+        assert result.recognized_text == "Hello"
+        assert threads[0].startswith("speech")
+        assert executor.stats()["completed"] == 1
+
+
+def test_health_reports_executor_metrics(client):
+    response = client.get("/health")
+    assert set(response.json()["speech_executor"]) >= {"active", "queued", "saturation"}
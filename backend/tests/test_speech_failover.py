@@ -0,0 +1,168 @@
+"""Tests for hedged, circuit-broken speech calls across regions."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.services.speech_failover import SpeechFailover, SpeechRegion
+from app.services.speech_service import NoSpeechError, PronunciationResult, SpeechAssessmentService
+
+
+class FakeBackend:
+    """Per-region fake: a fixed delay, or an error, for every call."""
+
+    def __init__(self, **regions):
+        self.regions = regions
+        self.calls = []
+        self.cancelled = []
+
+    async def __call__(self, region):
+        self.calls.append(region.name)
+        behaviour = self.regions[region.name]
+        try:
+            if isinstance(behaviour, Exception):
+                raise behaviour
+            await asyncio.sleep(behaviour)
+            return region.name
+        except asyncio.CancelledError:
+            self.cancelled.append(region.name)
+            raise
+
+
+@pytest.fixture
+def fast_hedging(monkeypatch):
+    monkeypatch.setattr(settings, "SPEECH_HEDGE_INITIAL_DELAY_SECONDS", 0.05)
+    monkeypatch.setattr(settings, "SPEECH_HEDGE_MIN_DELAY_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "SPEECH_CIRCUIT_FAILURE_THRESHOLD", 2)
+    monkeypatch.setattr(settings, "SPEECH_CIRCUIT_RESET_SECONDS", 0.2)
+
+
+def failover(*names, budget=1.0):
+    return SpeechFailover([SpeechRegion(name) for name in names], budget_seconds=budget)
+
+
+@pytest.mark.usefixtures("fast_hedging")
+class TestHedging:
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self):
+        backend = FakeBackend(primary=0.0, secondary=0.0)
+        router = failover("primary", "secondary")
+
+        assert await router.call(backend) == "primary"
+        assert backend.calls == ["primary"]
+        assert router.stats()["hedged"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stalled_primary_is_hedged_and_cancelled(self):
+        backend = FakeBackend(primary=5.0, secondary=0.01)
+        router = failover("primary", "secondary")
+
+        started = time.monotonic()
+        assert await router.call(backend) == "secondary"
+        await asyncio.sleep(0.01)
+
+        assert time.monotonic() - started < 0.5
+        assert backend.cancelled == ["primary"]
+        assert router.stats()["hedged"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_threshold_follows_p95_latency(self):
+        region = SpeechRegion("primary")
+        for _ in range(19):
+            region.record_success(0.1)
+        assert region.hedge_delay() == settings.SPEECH_HEDGE_INITIAL_DELAY_SECONDS
+
+        region.record_success(0.3)
+        assert region.hedge_delay() == pytest.approx(0.11)
+
+    @pytest.mark.asyncio
+    async def test_error_fails_over_immediately(self):
+        backend = FakeBackend(primary=RuntimeError("503"), secondary=0.0)
+        router = failover("primary", "secondary")
+
+        assert await router.call(backend) == "secondary"
+        assert router.stats()["failed_over"] == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_timeout_counts_as_failure(self):
+        backend = FakeBackend(primary=5.0)
+        router = failover("primary", budget=0.05)
+
+        with pytest.raises(TimeoutError):
+            await router.call(backend)
+        assert router.regions[0].failures == 1
+
+    @pytest.mark.asyncio
+    async def test_final_errors_are_not_retried(self):
+        backend = FakeBackend(primary=NoSpeechError("no speech"), secondary=0.0)
+        router = failover("primary", "secondary")
+
+        with pytest.raises(NoSpeechError):
+            await router.call(backend, final_errors=(NoSpeechError,))
+        assert backend.calls == ["primary"]
+        assert router.regions[0].state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_all_regions_failing_raises_last_error(self):
+        backend = FakeBackend(primary=RuntimeError("down"), secondary=RuntimeError("also down"))
+
+        with pytest.raises(RuntimeError, match="also down"):
+            await failover("primary", "secondary").call(backend)
+
+
+@pytest.mark.usefixtures("fast_hedging")
+class TestCircuitBreaker:
+    @pytest.mark.asyncio
+    async def test_failing_region_leaves_and_rejoins_rotation(self):
+        backend = FakeBackend(primary=RuntimeError("down"), secondary=0.0)
+        router = failover("primary", "secondary")
+
+        await router.call(backend)
+        await router.call(backend)
+        assert router.regions[0].state == "open"
+
+        backend.calls.clear()
+        await router.call(backend)
+        assert backend.calls == ["secondary"]
+
+        await asyncio.sleep(0.25)
+        backend.regions["primary"] = 0.0
+        assert await router.call(backend) == "primary"
+        assert router.regions[0].state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_failed_trial_reopens_circuit(self):
+        region = SpeechRegion("primary")
+        region.record_failure()
+        region.record_failure()
+        await asyncio.sleep(0.25)
+
+        assert region.acquire()
+        assert not region.acquire()  # One trial at a time
+        region.record_failure()
+        assert region.state == "open"
+
+
+@pytest.mark.usefixtures("fast_hedging")
+class TestSpeechServiceFailover:
+    @pytest.mark.asyncio
+    async def test_assessment_is_hedged_across_regions(self, monkeypatch):
+        router = failover("primary", "secondary")
+        service = SpeechAssessmentService(failover=router)
+        service.mock_mode = False
+        delays = {"primary": 5.0, "secondary": 0.0}
+
+        async def assess_in(client, rest, audio_bytes, reference_text, profile):
+            region = rest.region
+            await asyncio.sleep(delays[region])
+            return PronunciationResult(90, 4.5, 85, 100, region, {})
+
+        for region in router.regions:
+            region.rest = type("Rest", (), {"region": region.name})()
+        monkeypatch.setattr(service, "_assess_in", assess_in)
+
+        result = await service.assess_pronunciation(b"audio", "Hello")
+
+        assert result.recognized_text == "secondary"
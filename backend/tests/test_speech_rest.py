@@ -0,0 +1,130 @@
+"""Tests for the short-audio REST speech backend."""
+
+import base64
+import json
+
+import httpx
+import pytest
+
+from app.services.speech_rest import SpeechRestBackend, SpeechRestError, iter_chunks
+from app.services.speech_service import SpeechAssessmentService
+
+DETAILED_RESULT = {
+    "RecognitionStatus": "Success",
+    "DisplayText": "Hello world.",
+    "NBest": [
+        {
+            "Display": "Hello world.",
+            "PronunciationAssessment": {
+                "AccuracyScore": 92.0,
+                "FluencyScore": 88.0,
+                "CompletenessScore": 100.0,
+                "ProsodyScore": 80.0,
+                "PronScore": 90.1,
+            },
+            "Words": [
+                {
+                    "Word": "hello",
+                    "PronunciationAssessment": {"AccuracyScore": 95.0, "ErrorType": "None"},
+                },
+                {"Word": "world", "AccuracyScore": 60.0, "ErrorType": "Mispronunciation"},
+            ],
+        }
+    ],
+}
+
+
+def rest_service(handler, requests=None):
+    def record(request):
+        if requests is not None:
+            requests.append((request, request.read()))
+        return handler(request)
+
+    backend = SpeechRestBackend(
+        region="westeurope", subscription_key="key", transport=httpx.MockTransport(record)
+    )
+    service = SpeechAssessmentService(rest=backend)
+    service.mock_mode = False
+    service.backend = "rest"
+    return service
+
+
+class TestSpeechRestBackend:
+    @pytest.mark.asyncio
+    async def test_request_carries_assessment_header_and_chunked_body(self):
+        requests = []
+        service = rest_service(lambda r: httpx.Response(200, json=DETAILED_RESULT), requests)
+        audio = bytes(range(256)) * 300
+
+        await service.assess_pronunciation(audio, "Hello world")
+
+        request, body = requests[0]
+        assert request.url.host == "westeurope.stt.speech.microsoft.com"
+        assert request.url.params["format"] == "detailed"
+        assert request.headers["Ocp-Apim-Subscription-Key"] == "key"
+        assert request.headers["Transfer-Encoding"] == "chunked"
+        assert body == audio
+        params = json.loads(base64.b64decode(request.headers["Pronunciation-Assessment"]))
+        assert params["ReferenceText"] == "Hello world"
+        assert params["Granularity"] == "Phoneme"
+        assert params["EnableProsodyAssessment"] is True
+
+    @pytest.mark.asyncio
+    async def test_result_matches_sdk_result_shape(self):
+        service = rest_service(lambda r: httpx.Response(200, json=DETAILED_RESULT))
+
+        result = await service.assess_pronunciation(b"audio", "Hello world")
+
+        assert result.accuracy_score == 92.0
+        assert result.prosody_score == 4.0
+        assert result.fluency_score == 88.0
+        assert result.completeness_score == 100.0
+        assert result.recognized_text == "Hello world."
+        assert result.word_level_scores == {
+            "hello": {"accuracy": 95.0, "error_type": "None"},
+            "world": {"accuracy": 60.0, "error_type": "Mispronunciation"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_streamed_chunks_are_forwarded(self):
+        requests = []
+        service = rest_service(lambda r: httpx.Response(200, json=DETAILED_RESULT), requests)
+
+        await service.assess_pronunciation_stream(iter_chunks(b"a" * 100, 7), "Hello world")
+
+        assert requests[0][1] == b"a" * 100
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("response", "message"),
+        [
+            (httpx.Response(200, json={"RecognitionStatus": "NoMatch"}), "No speech"),
+            (httpx.Response(200, json={"RecognitionStatus": "Error"}), "canceled: Error"),
+            (httpx.Response(401, text="Unauthorized"), "HTTP 401"),
+        ],
+    )
+    async def test_failures_raise_assessment_errors(self, response, message):
+        service = rest_service(lambda r: response)
+
+        with pytest.raises(Exception, match=message):
+            await service.assess_pronunciation(b"audio", "Hello world")
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_until_closed(self):
+        backend = SpeechRestBackend(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, json=DETAILED_RESULT))
+        )
+        client = backend.client
+
+        await backend.recognize(iter_chunks(b"audio"), "Hello")
+        assert backend.client is client
+
+        await backend.close()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises_rest_error(self):
+        backend = SpeechRestBackend(transport=httpx.MockTransport(lambda r: httpx.Response(503)))
+
+        with pytest.raises(SpeechRestError):
+            await backend.recognize(iter_chunks(b"audio"), "Hello")
@@ -123,6 +123,23 @@ class TestUserProgress:
         assert data["best_score"] == 90.0
         assert data["worst_score"] == 80.0
 
+    def test_get_user_progress_leaves_quick_assessments_out_of_overall_scores(
+        self, client, db, sample_user, create_assessment, sample_phrase
+    ):
+        create_assessment(user_id=sample_user.id, phrase_id=sample_phrase.id, overall_score=80.0)
+        quick = create_assessment(
+            user_id=sample_user.id, phrase_id=sample_phrase.id, overall_score=95.0, prosody_score=None
+        )
+        quick.assessment_profile = "quick"
+        db.commit()
+
+        data = client.get(f"/api/v1/users/{sample_user.id}/progress").json()
+        assert data["total_assessments"] == 2
+        assert data["quick_assessments"] == 1
+        assert data["average_overall_score"] == 80.0
+        assert data["best_score"] == 80.0
+        assert data["average_prosody"] == 4.0
+
     def test_get_user_progress_categories_practiced(
         self, client, sample_user, create_dialog, create_phrase, create_assessment
     ):
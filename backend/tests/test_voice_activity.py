@@ -0,0 +1,139 @@
+"""Tests for energy-based silence trimming."""
+
+import io
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.models.assessment import Assessment
+from app.services.encryption_service import EncryptionService
+from app.services.voice_activity import detect_speech_bounds, trim_silence
+from app.services.wav_audio import WavAudio
+from tests.conftest import make_wav_bytes
+
+SAMPLE_RATE = 16000
+
+
+@pytest.fixture(autouse=True)
+def cleanup_mock_storage():
+    """Clean up mock blob storage after each test."""
+    yield
+    mock_dir = Path("./mock_blob_storage")
+    if mock_dir.exists():
+        shutil.rmtree(mock_dir)
+
+
+def padded_speech(lead=1.0, speech=1.0, tail=1.0, sample_rate=SAMPLE_RATE):
+    """A steady voiced tone surrounded by near-silent noise."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(speech * sample_rate)) / sample_rate
+    return np.concatenate(
+        [
+            0.0005 * rng.standard_normal(int(lead * sample_rate)),
+            0.3 * np.sin(2 * np.pi * 220 * t),
+            0.0005 * rng.standard_normal(int(tail * sample_rate)),
+        ]
+    )
+
+
+class TestDetectSpeechBounds:
+    def test_finds_speech_between_silences(self):
+        bounds = detect_speech_bounds(padded_speech(), SAMPLE_RATE, -40.0)
+
+        start, end = bounds
+        assert abs(start - SAMPLE_RATE) <= 320
+        assert abs(end - 2 * SAMPLE_RATE) <= 320
+
+    def test_padding_is_kept_and_clamped(self):
+        samples = padded_speech(lead=0.1)
+        start, end = detect_speech_bounds(samples, SAMPLE_RATE, -40.0, padding_seconds=0.25)
+
+        assert start == 0
+        assert abs(end - int(1.1 * SAMPLE_RATE) - SAMPLE_RATE // 4) <= 320
+
+    def test_ignores_isolated_click(self):
+        samples = padded_speech()
+        samples[4000:4160] = 0.8  # 10 ms click in the leading silence
+
+        start, _ = detect_speech_bounds(samples, SAMPLE_RATE, -40.0)
+        assert start >= SAMPLE_RATE - 320
+
+    def test_no_speech(self):
+        silence = np.zeros(SAMPLE_RATE, dtype=np.float32)
+        assert detect_speech_bounds(silence, SAMPLE_RATE, -40.0) is None
+
+
+class TestTrimSilence:
+    def test_trims_and_records_offsets(self, monkeypatch):
+        monkeypatch.setattr(settings, "AUDIO_TRIM_PADDING_SECONDS", 0.25)
+        original = make_wav_bytes(padded_speech())
+
+        trimmed, trim = trim_silence(original)
+
+        assert trim.trimmed
+        assert trim.original_duration == pytest.approx(3.0)
+        assert trim.start_seconds == pytest.approx(0.75, abs=0.02)
+        assert trim.end_seconds == pytest.approx(2.25, abs=0.02)
+        assert WavAudio.parse(trimmed).duration_seconds == pytest.approx(1.5, abs=0.02)
+
+    def test_trimming_is_lossless_and_keeps_format(self):
+        stereo = np.repeat(padded_speech()[:, None], 2, axis=1)
+        original = make_wav_bytes(stereo, num_channels=2, bits_per_sample=24)
+
+        trimmed, trim = trim_silence(original)
+
+        source, result = WavAudio.parse(original), WavAudio.parse(trimmed)
+        assert (result.channels, result.bits_per_sample) == (2, 24)
+        start = round(trim.start_seconds * SAMPLE_RATE) * source.block_align
+        assert result.pcm_data == source.pcm_data[start : start + len(result.pcm_data)]
+
+    def test_speech_throughout_is_unchanged(self, wav_audio_bytes):
+        trimmed, trim = trim_silence(wav_audio_bytes)
+
+        assert trimmed is wav_audio_bytes
+        assert not trim.trimmed
+        assert trim.end_seconds == pytest.approx(1.0)
+
+    def test_non_wav_is_unchanged(self):
+        assert trim_silence(b"not a wav file") == (b"not a wav file", None)
+
+
+class TestAssessmentTrimming:
+    def test_assessment_records_offsets_and_stores_trimmed_audio(
+        self, client, db, sample_phrase, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "AUDIO_TRIM_PADDING_SECONDS", 0.25)
+        original = make_wav_bytes(padded_speech())
+
+        response = client.post(
+            "/api/v1/assessments/assess",
+            data={"phrase_id": str(sample_phrase.id), "user_id": "trim-user"},
+            files={"audio": ("recording.wav", io.BytesIO(original), "audio/wav")},
+        )
+        assert response.status_code == 200
+
+        assessment = db.get(Assessment, response.json()["id"])
+        assert assessment.trim_start_seconds == pytest.approx(0.75, abs=0.02)
+        assert assessment.trim_end_seconds == pytest.approx(2.25, abs=0.02)
+        assert assessment.assessment_duration_seconds == pytest.approx(3.0)
+
+        stored_path = Path(assessment.audio_blob_url.removeprefix("local://"))
+        stored = EncryptionService().decrypt_audio(stored_path.read_bytes())
+        assert len(stored) < len(original) / 1.9
+
+    def test_trimming_can_be_disabled(self, client, db, sample_phrase, monkeypatch):
+        monkeypatch.setattr(settings, "AUDIO_TRIM_SILENCE_ENABLED", False)
+
+        response = client.post(
+            "/api/v1/assessments/assess",
+            data={"phrase_id": str(sample_phrase.id), "user_id": "trim-user"},
+            files={
+                "audio": ("recording.wav", io.BytesIO(make_wav_bytes(padded_speech())), "audio/wav")
+            },
+        )
+
+        assessment = db.get(Assessment, response.json()["id"])
+        assert assessment.trim_start_seconds is None
@@ -0,0 +1,134 @@
+"""Tests for mu-law and IMA-ADPCM upload decoding."""
+
+import io
+
+import numpy as np
+import pytest
+
+from app.services.wav_audio import WavAudio, WavFormatError
+from app.services.wav_decoders import WAVE_FORMAT_IMA_ADPCM, WAVE_FORMAT_MULAW, decode_compact_wav
+from tests.conftest import make_wav_bytes, speech_like_samples
+from tests.wav_encoders import ima_wav, mulaw_encode, wav_file
+
+
+class TestMulaw:
+    def test_decodes_to_16bit_pcm(self):
+        samples = speech_like_samples(1.0)
+        audio = wav_file(WAVE_FORMAT_MULAW, 1, 16000, 1, 8, mulaw_encode(samples))
+
+        wav = WavAudio.parse(decode_compact_wav(audio))
+
+        assert (wav.bits_per_sample, wav.sample_rate, wav.num_frames) == (16, 16000, 16000)
+        # mu-law keeps roughly 14 bits of precision near the signal level
+        assert np.max(np.abs(wav.mono() - samples)) < 0.01
+
+    def test_known_codes(self):
+        audio = wav_file(WAVE_FORMAT_MULAW, 1, 8000, 1, 8, bytes([0xFF, 0x7F, 0x80, 0x00]))
+        samples = np.frombuffer(WavAudio.parse(decode_compact_wav(audio)).pcm_data, "<i2")
+        assert samples.tolist() == [0, 0, 32124, -32124]
+
+
+class TestImaAdpcm:
+    def test_matches_reference_decoder(self):
+        audio, expected = ima_wav(speech_like_samples(1.0))
+
+        wav = WavAudio.parse(decode_compact_wav(audio))
+        decoded = np.frombuffer(wav.pcm_data, "<i2")
+
+        assert wav.bits_per_sample == 16
+        assert np.array_equal(decoded, expected)
+
+    def test_stereo_matches_reference_decoder(self):
+        samples = speech_like_samples(0.5)
+        stereo = np.stack((samples, -0.5 * samples), axis=1).reshape(-1)
+        audio, expected = ima_wav(stereo, channels=2, block_align=512)
+
+        wav = WavAudio.parse(decode_compact_wav(audio))
+
+        assert wav.channels == 2
+        assert np.array_equal(np.frombuffer(wav.pcm_data, "<i2"), expected)
+
+    def test_partial_final_block(self):
+        # 16000 samples don't fill a whole number of 505-sample blocks
+        audio, expected = ima_wav(speech_like_samples(1.0))
+        wav = WavAudio.parse(decode_compact_wav(audio))
+        assert wav.num_frames == len(expected) == 16000
+
+    def test_is_about_four_times_smaller(self):
+        samples = speech_like_samples(1.0)
+        audio, _ = ima_wav(samples)
+        assert len(audio) < len(make_wav_bytes(samples)) / 3.5
+
+    def test_invalid_block_size(self):
+        audio = wav_file(WAVE_FORMAT_IMA_ADPCM, 1, 16000, 3, 4, b"\0" * 30)
+        with pytest.raises(WavFormatError):
+            decode_compact_wav(audio)
+
+
+class TestTruncated:
+    @pytest.mark.parametrize("encoding", ["mulaw", "ima_adpcm"])
+    def test_truncation_is_kept(self, encoding):
+        samples = speech_like_samples(1.0)
+        if encoding == "mulaw":
+            audio = wav_file(WAVE_FORMAT_MULAW, 1, 16000, 1, 8, mulaw_encode(samples))
+        else:
+            audio, _ = ima_wav(samples)
+
+        wav = WavAudio.parse(decode_compact_wav(audio[: len(audio) // 2]))
+
+        assert wav.truncated
+        assert wav.bits_per_sample == 16
+
+    def test_complete_file_is_not_truncated(self):
+        audio, _ = ima_wav(speech_like_samples(1.0))
+        assert not WavAudio.parse(decode_compact_wav(audio)).truncated
+
+
+class TestPassThrough:
+    def test_pcm_is_unchanged(self, wav_audio_bytes):
+        assert decode_compact_wav(wav_audio_bytes) is wav_audio_bytes
+
+    def test_non_wav_is_unchanged(self):
+        assert decode_compact_wav(b"not a wav file") == b"not a wav file"
+
+
+class TestCompactUploads:
+    @pytest.mark.parametrize("encoding", ["mulaw", "ima_adpcm"])
+    def test_assess_accepts_compact_encodings(self, client, sample_phrase, encoding):
+        samples = speech_like_samples(1.0)
+        if encoding == "mulaw":
+            audio = wav_file(WAVE_FORMAT_MULAW, 1, 16000, 1, 8, mulaw_encode(samples))
+        else:
+            audio, _ = ima_wav(samples)
+
+        response = client.post(
+            "/api/v1/assessments/assess",
+            data={"phrase_id": str(sample_phrase.id), "user_id": f"{encoding}-user"},
+            files={"audio": ("recording.wav", io.BytesIO(audio), "audio/wav")},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["scores"]["overall_score"] >= 0
+
+    def test_malformed_adpcm_is_rejected(self, client, sample_phrase):
+        audio = wav_file(WAVE_FORMAT_IMA_ADPCM, 1, 16000, 3, 4, b"\0" * 30)
+
+        response = client.post(
+            "/api/v1/assessments/assess",
+            data={"phrase_id": str(sample_phrase.id), "user_id": "bad-adpcm-user"},
+            files={"audio": ("recording.wav", io.BytesIO(audio), "audio/wav")},
+        )
+
+        assert response.status_code == 415
+
+    def test_truncated_upload_is_rejected(self, client, sample_phrase):
+        audio, _ = ima_wav(speech_like_samples(1.0))
+
+        response = client.post(
+            "/api/v1/assessments/assess",
+            data={"phrase_id": str(sample_phrase.id), "user_id": "truncated-adpcm-user"},
+            files={"audio": ("recording.wav", io.BytesIO(audio[: len(audio) // 2]), "audio/wav")},
+        )
+
+        assert response.status_code == 422
+        assert "truncated" in response.json()["detail"]
@@ -0,0 +1,93 @@
+"""
+Reference encoders for the compact upload encodings (mu-law, IMA-ADPCM).
+Used to build test fixtures and benchmark inputs; kept free of conftest imports.
+"""
+
+import struct
+
+import numpy as np
+
+from app.services.wav_decoders import IMA_INDEX_TABLE, IMA_STEP_TABLE, WAVE_FORMAT_IMA_ADPCM
+
+
+def wav_file(format_tag, channels, sample_rate, block_align, bits, data, extra_fmt=b""):
+    fmt = struct.pack(
+        "<HHIIHH", format_tag, channels, sample_rate, sample_rate * block_align, block_align, bits
+    )
+    fmt += struct.pack("<H", len(extra_fmt)) + extra_fmt
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    body += b"data" + struct.pack("<I", len(data)) + data
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def mulaw_encode(samples):
+    """G.711 mu-law encoder (reference implementation)."""
+    pcm = np.clip(np.round(np.asarray(samples) * 32767), -32768, 32767).astype(np.int32)
+    sign = np.where(pcm < 0, 0x80, 0)
+    magnitude = np.minimum(np.abs(pcm), 32635) + 0x84
+    exponent = np.floor(np.log2(magnitude)).astype(np.int32) - 7
+    mantissa = (magnitude >> (exponent + 3)) & 0x0F
+    return (~(sign | (exponent << 4) | mantissa) & 0xFF).astype(np.uint8).tobytes()
+
+
+def ima_encode(samples, channels=1, block_align=256):
+    """
+    Sequential IMA-ADPCM encoder (reference implementation).
+
+    Returns (data, decoded) where decoded is what a conforming decoder must produce.
+    """
+    pcm = np.clip(np.round(np.asarray(samples) * 32767), -32768, 32767).astype(np.int32)
+    pcm = pcm.reshape(-1, channels)
+    per_block = (block_align - 4 * channels) * 2 // channels + 1
+    data, decoded = bytearray(), []
+
+    for start in range(0, len(pcm), per_block):
+        frames = pcm[start : start + per_block]
+        headers, nibbles, out = [], [], np.zeros_like(frames)
+        for ch in range(channels):
+            predictor, index = int(frames[0, ch]), 0
+            headers.append(struct.pack("<hBB", predictor, index, 0))
+            out[0, ch] = predictor
+            channel_nibbles = []
+            for i, sample in enumerate(frames[1:, ch], start=1):
+                step = int(IMA_STEP_TABLE[index])
+                delta = int(sample) - predictor
+                nibble = 8 if delta < 0 else 0
+                delta = abs(delta)
+                diff = step >> 3
+                for bit, part in ((4, step), (2, step >> 1), (1, step >> 2)):
+                    if delta >= part:
+                        nibble |= bit
+                        delta -= part
+                        diff += part
+                predictor = max(
+                    -32768, min(32767, predictor - diff if nibble & 8 else predictor + diff)
+                )
+                index = max(0, min(88, index + int(IMA_INDEX_TABLE[nibble])))
+                out[i, ch] = predictor
+                channel_nibbles.append(nibble)
+            channel_nibbles += [0] * (-len(channel_nibbles) % 8)
+            nibbles.append(channel_nibbles)
+        data += b"".join(headers)
+        for group in range(0, len(nibbles[0]), 8):
+            for ch in range(channels):
+                n = nibbles[ch][group : group + 8]
+                data += bytes(n[j] | (n[j + 1] << 4) for j in range(0, 8, 2))
+        decoded.append(out)
+
+    return bytes(data), np.concatenate(decoded).reshape(-1)
+
+
+def ima_wav(samples, channels=1, sample_rate=16000, block_align=256):
+    data, decoded = ima_encode(samples, channels, block_align)
+    per_block = (block_align - 4 * channels) * 2 // channels + 1
+    audio = wav_file(
+        WAVE_FORMAT_IMA_ADPCM,
+        channels,
+        sample_rate,
+        block_align,
+        4,
+        data,
+        struct.pack("<H", per_block),
+    )
+    return audio, decoded
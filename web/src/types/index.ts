@@ -54,7 +54,7 @@ export interface Assessment {
   phrase_text: string;
   overall_score: number;
   accuracy_score: number;
-  prosody_score: number;
+  prosody_score: number | null;
   fluency_score: number;
   created_at: string;
 }
@@ -62,6 +62,7 @@ export interface Assessment {
 export interface UserProgress {
   user_id: number;
   total_assessments: number;
+  quick_assessments: number;
   average_overall_score: number;
   average_accuracy: number;
   average_prosody: number;